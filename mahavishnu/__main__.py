@@ -1,6 +1,6 @@
 """Main entry point for mahavishnu CLI."""
 
-from ._main_cli import app
+from ._lazy_cli import app
 
 if __name__ == "__main__":
     app()
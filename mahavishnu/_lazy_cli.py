@@ -0,0 +1,235 @@
+"""Lazy entry point for the mahavishnu CLI.
+
+``mahavishnu._main_cli`` builds the complete Typer app eagerly: importing
+it pulls in every sub-CLI module, ``MahavishnuApp`` and worker capability
+probing. That is the right shape for embedding and tests, but it makes
+``mahavishnu --help`` (and every shell hook or cron job that calls the CLI)
+pay for pydantic settings, Prometheus and adapter imports.
+
+This module is the console-script entry point instead. It registers each
+top-level command from the static :data:`COMMAND_MANIFEST` (name, help
+text, import target) and imports the target only when that command is
+invoked:
+
+- A target naming a ``typer.Typer`` sub-app is mounted under the command
+  name.
+- A target naming an ``add_*_commands(app)`` function is called on a
+  scratch parent app and the named command is taken from it.
+- Commands defined in ``_main_cli`` itself resolve against its full app.
+
+The manifest must list the same top-level commands as ``_main_cli.app``;
+``tests/unit/test_lazy_cli.py`` enforces that.
+
+Usage:
+    mahavishnu --help              # imports typer only
+    mahavishnu metrics report      # imports mahavishnu.metrics_cli only
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+import typer
+from typer.core import TyperCommand, TyperGroup
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+MAIN_APP_TARGET = "mahavishnu._main_cli:app"
+
+
+class LazyCommandSpec(NamedTuple):
+    """Static description of a lazily imported top-level command."""
+
+    target: str  # "module:attribute"
+    help: str
+
+
+# Top-level commands in the order ``_main_cli.app`` lists them.
+COMMAND_MANIFEST: dict[str, LazyCommandSpec] = {
+    "validate": LazyCommandSpec(
+        "mahavishnu.cli.config_validator:add_config_validation_commands",
+        "Validate configuration files and runtime connectivity.",
+    ),
+    "list-agents": LazyCommandSpec(
+        "mahavishnu.cli.config_validator:add_config_inventory_commands",
+        "List all agents in .claude/agents/.",
+    ),
+    "list-skills": LazyCommandSpec(
+        "mahavishnu.cli.config_validator:add_config_inventory_commands",
+        "List all skills in .claude/skills/.",
+    ),
+    "list-mcp-servers": LazyCommandSpec(
+        "mahavishnu.cli.config_validator:add_config_inventory_commands",
+        "List MCP servers from .mcp.json.",
+    ),
+    "sync-from-global": LazyCommandSpec(
+        "mahavishnu.cli.config_validator:add_config_inventory_commands",
+        "Re-import agents/skills added to ~/.claude/ since last migration.",
+    ),
+    "rollback": LazyCommandSpec(
+        "mahavishnu.cli.rollback_cli:add_rollback_commands",
+        "Roll back Bodai Crow and Distilled Workflows artifacts to a prior version.",
+    ),
+    "sweep": LazyCommandSpec(
+        MAIN_APP_TARGET, "Perform an AI sweep across repositories with a specific tag."
+    ),
+    "health": LazyCommandSpec(MAIN_APP_TARGET, "Check the current Mahavishnu service health."),
+    "list-repos": LazyCommandSpec(MAIN_APP_TARGET, "List repositories in ecosystem.yaml."),
+    "list-roles": LazyCommandSpec(
+        MAIN_APP_TARGET, "List all available roles with their descriptions."
+    ),
+    "show-role": LazyCommandSpec(
+        MAIN_APP_TARGET, "Show detailed information about a specific role."
+    ),
+    "list-nicknames": LazyCommandSpec(MAIN_APP_TARGET, "List all repository nicknames."),
+    "generate-claude-token": LazyCommandSpec(
+        MAIN_APP_TARGET, "Generate a Claude Code subscription token."
+    ),
+    "generate-codex-token": LazyCommandSpec(
+        MAIN_APP_TARGET, "Generate a Codex subscription token."
+    ),
+    "shell": LazyCommandSpec(
+        MAIN_APP_TARGET, "Start the interactive admin shell for debugging and monitoring."
+    ),
+    "dashboard": LazyCommandSpec(
+        MAIN_APP_TARGET, "Launch the read-only ecosystem dashboard (Textual TUI)."
+    ),
+    "worktree": LazyCommandSpec(
+        "mahavishnu.worktree_cli:worktree_app", "Manage git worktrees across the ecosystem"
+    ),
+    "docs": LazyCommandSpec(
+        "mahavishnu.cli.docs_cli:add_docs_commands", "Ecosystem documentation health commands"
+    ),
+    "quality": LazyCommandSpec(
+        "mahavishnu.quality_cli:add_quality_commands", "Quality management commands"
+    ),
+    "workflow": LazyCommandSpec(MAIN_APP_TARGET, "Canonical orchestration workflow commands"),
+    "adapter": LazyCommandSpec(MAIN_APP_TARGET, "Adapter discovery and routing"),
+    "mcp": LazyCommandSpec(MAIN_APP_TARGET, "MCP server lifecycle management"),
+    "ecosystem": LazyCommandSpec(MAIN_APP_TARGET, "Ecosystem configuration and management"),
+    "ingest": LazyCommandSpec(
+        "mahavishnu.ingestion_cli:ingestion_app", "Content ingestion commands"
+    ),
+    "terminal": LazyCommandSpec(MAIN_APP_TARGET, "Terminal session management commands"),
+    "production": LazyCommandSpec(
+        "mahavishnu.production_cli:add_production_commands",
+        "Production readiness checks and benchmarks",
+    ),
+    "backup": LazyCommandSpec(
+        "mahavishnu.backup_cli:add_backup_commands", "Backup and disaster recovery operations"
+    ),
+    "monitor": LazyCommandSpec(
+        "mahavishnu.monitoring_cli:add_monitoring_commands", "Monitoring and alerting commands"
+    ),
+    "coord": LazyCommandSpec(
+        "mahavishnu.coordination_cli:add_coordination_commands",
+        "Cross-repository coordination and tracking",
+    ),
+    # _main_cli registers coordination's repo app first, then repo_cli's
+    # under the same name; the later registration is the one Typer keeps.
+    "repo": LazyCommandSpec(
+        "mahavishnu.repo_cli:repo_app", "Repository diff and PR creation commands"
+    ),
+    "metrics": LazyCommandSpec(
+        "mahavishnu.metrics_cli:add_metrics_commands",
+        "Metrics collection and reporting for the Mahavishnu ecosystem",
+    ),
+    "routing": LazyCommandSpec(
+        "mahavishnu.routing_cli:add_routing_commands", "Adaptive routing management"
+    ),
+    "team": LazyCommandSpec(
+        "mahavishnu.cli.team_cli:add_team_commands", "Goal-driven team management"
+    ),
+    "events": LazyCommandSpec(
+        "mahavishnu.cli.events:add_events_commands", "Event schema validation and export"
+    ),
+    "index": LazyCommandSpec(
+        "mahavishnu.cli.index_cli:add_index_commands", "Code graph indexing commands"
+    ),
+    "scaffold": LazyCommandSpec(
+        "mahavishnu.cli.scaffold_cli:app", "Pattern management and project scaffolding"
+    ),
+    "precommit": LazyCommandSpec(
+        "mahavishnu.cli.precommit_cli:precommit_app", "Precommitment hypothesis lock (Spec #2)"
+    ),
+    "sop": LazyCommandSpec(
+        "mahavishnu.cli.sop_cli:add_sop_commands", "Project-scoped SOP evolution (Spec #7)"
+    ),
+    "workers": LazyCommandSpec(MAIN_APP_TARGET, "Worker orchestration and management"),
+    "pool": LazyCommandSpec(MAIN_APP_TARGET, "Multi-pool orchestration and management"),
+}
+
+
+class _PendingCommand(TyperCommand):
+    """Placeholder carrying a lazy command's name and help until it is invoked."""
+
+
+def _import_target(target: str) -> Any:
+    module_name, _, attr = target.partition(":")
+    return getattr(import_module(module_name), attr)
+
+
+def load_command(name: str, spec: LazyCommandSpec, ctx: typer.Context) -> Any:
+    """Import ``spec.target`` and return the real click command for ``name``.
+
+    Raises:
+        RuntimeError: If the target does not provide a command named ``name``
+    """
+    target = _import_target(spec.target)
+    if spec.target == MAIN_APP_TARGET:
+        group = typer.main.get_group(target)
+    else:
+        parent = typer.Typer()
+        if isinstance(target, typer.Typer):
+            parent.add_typer(target, name=name, help=spec.help)
+        else:
+            register: Callable[[typer.Typer], None] = target
+            register(parent)
+        group = typer.main.get_group(parent)
+
+    command = group.get_command(ctx, name)
+    if command is None:
+        raise RuntimeError(f"{spec.target} did not register command {name!r}")
+    return command
+
+
+class LazyTyperGroup(TyperGroup):
+    """Typer group whose manifest commands are imported on first use.
+
+    Help listings and completion of command names only see placeholders;
+    resolving a command for invocation swaps in the real one.
+    """
+
+    def __init__(self, **attrs: Any) -> None:
+        super().__init__(**attrs)
+        for name, spec in COMMAND_MANIFEST.items():
+            if name not in self.commands:
+                self.commands[name] = _PendingCommand(name, help=spec.help)
+
+    def resolve_command(self, ctx: Any, args: list[str]) -> tuple[str | None, Any, list[str]]:
+        cmd_name, command, rest = super().resolve_command(ctx, args)
+        if isinstance(command, _PendingCommand) and cmd_name is not None:
+            command = load_command(cmd_name, COMMAND_MANIFEST[cmd_name], ctx)
+            self.commands[cmd_name] = command
+        return cmd_name, command, rest
+
+
+def _root() -> None:
+    # No-op group callback: every command comes from the manifest, and Typer
+    # only builds a group for apps with a callback or registered commands.
+    return None
+
+
+app = typer.Typer(name="mahavishnu", cls=LazyTyperGroup, callback=_root)
+
+
+__all__ = [
+    "COMMAND_MANIFEST",
+    "MAIN_APP_TARGET",
+    "LazyCommandSpec",
+    "LazyTyperGroup",
+    "app",
+    "load_command",
+]
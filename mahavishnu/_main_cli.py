@@ -488,13 +488,16 @@ async def _async_adapter_resolve(task_type: str, capabilities: list[str], domain
         )
         raise typer.Exit(code=1)
 
-    result = await router.route(
-        {
-            "task_type": task,
-            "additional_capabilities": capabilities,
-            "domain": domain,
-        }
-    )
+    try:
+        result = await router.route(
+            {
+                "task_type": task,
+                "additional_capabilities": capabilities,
+                "domain": domain,
+            }
+        )
+    finally:
+        router.close()
     return {
         "task_type": task_type,
         "selected_adapter": result.get("adapter") if isinstance(result, dict) else str(result),
@@ -642,23 +642,24 @@ class PgvectorAdapter:
         *,
         upsert: bool,
     ) -> list[str]:
-        """Write documents to collection."""
+        """Write documents to collection.
+
+        A single document is written with one ``INSERT ... VALUES``; larger
+        batches go through :meth:`_write_documents_bulk` so the whole batch
+        costs one round-trip instead of one per document.
+        """
+        if not documents:
+            return []
+
         table = self._qualified_table(collection)
+        if len(documents) > 1:
+            return await self._write_documents_bulk(table, documents, upsert=upsert)
 
         statement = f"""
             INSERT INTO {table} (id, embedding, metadata)
             VALUES ($1, $2::vector, $3::jsonb)
             """
-        if upsert:
-            statement += """
-                ON CONFLICT (id) DO UPDATE SET
-                    embedding = EXCLUDED.embedding,
-                    metadata = EXCLUDED.metadata,
-                    updated_at = NOW()
-                """
-        else:
-            statement += "ON CONFLICT (id) DO NOTHING "
-        statement += "RETURNING id"
+        statement += self._sql_conflict_clause(upsert)
 
         inserted: list[str] = []
         async with self._connection() as conn:
@@ -675,6 +676,61 @@ class PgvectorAdapter:
 
         return inserted
 
+    async def _write_documents_bulk(
+        self,
+        table: str,
+        documents: list[dict[str, Any]],
+        *,
+        upsert: bool,
+    ) -> list[str]:
+        """Write many documents with a single multi-row ``INSERT``.
+
+        Rows are shipped as three parallel text arrays and expanded
+        server-side with ``unnest``, so the statement shape does not depend
+        on the batch size. Duplicate ids within the batch keep the last
+        document (PostgreSQL rejects an upsert touching the same row twice).
+        """
+        rows: dict[str, tuple[str, str]] = {}
+        for doc in documents:
+            doc_id = doc.get("id") or str(uuid4())
+            vector = doc.get("vector", doc.get("embedding"))
+            rows[doc_id] = (
+                self._vector_literal(vector),
+                json.dumps(doc.get("metadata", {})),
+            )
+
+        statement = f"""
+            INSERT INTO {table} (id, embedding, metadata)
+            SELECT id, embedding::vector, metadata::jsonb
+            FROM unnest($1::text[], $2::text[], $3::text[]) AS t(id, embedding, metadata)
+            """
+        statement += self._sql_conflict_clause(upsert)
+
+        async with self._connection() as conn:
+            records = await conn.fetch(
+                statement,
+                list(rows),
+                [vector for vector, _ in rows.values()],
+                [metadata for _, metadata in rows.values()],
+            )
+
+        return [record["id"] for record in records if record.get("id")]
+
+    def _sql_conflict_clause(self, upsert: bool) -> str:
+        if upsert:
+            return """
+                ON CONFLICT (id) DO UPDATE SET
+                    embedding = EXCLUDED.embedding,
+                    metadata = EXCLUDED.metadata,
+                    updated_at = NOW()
+                RETURNING id"""
+        return "ON CONFLICT (id) DO NOTHING RETURNING id"
+
+    @staticmethod
+    def _vector_literal(vector: Any) -> str:
+        """Render a vector in pgvector's text input format (``[x,y,...]``)."""
+        return "[" + ",".join(str(float(value)) for value in vector) + "]"
+
 
 __all__ = [
     "HNSWConfig",
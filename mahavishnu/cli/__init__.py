@@ -12,19 +12,25 @@ This package contains modular CLI components:
 Note: The main CLI app is defined in mahavishnu/_main_cli.py (separate module).
 """
 
-from .docs_cli import add_docs_commands
-from .events import add_events_commands
-from .help_cli import help_group, show_all_help, show_command_help, show_general_help
-from .team_cli import (
-    add_team_commands,
-    create_team,
-    list_skills,
-    list_teams,
-    parse_goal_cmd,
-)
-from .team_cli import (
-    app as team_app,
-)
+from importlib import import_module
+from typing import Any
+
+# Re-exports resolve on first access so importing one CLI submodule (for
+# example from the lazy entry point) does not import all of its siblings.
+_LAZY_EXPORTS: dict[str, tuple[str, str]] = {
+    "add_docs_commands": (".docs_cli", "add_docs_commands"),
+    "add_events_commands": (".events", "add_events_commands"),
+    "help_group": (".help_cli", "help_group"),
+    "show_all_help": (".help_cli", "show_all_help"),
+    "show_command_help": (".help_cli", "show_command_help"),
+    "show_general_help": (".help_cli", "show_general_help"),
+    "add_team_commands": (".team_cli", "add_team_commands"),
+    "create_team": (".team_cli", "create_team"),
+    "list_skills": (".team_cli", "list_skills"),
+    "list_teams": (".team_cli", "list_teams"),
+    "parse_goal_cmd": (".team_cli", "parse_goal_cmd"),
+    "team_app": (".team_cli", "app"),
+}
 
 __all__ = [
     "MahavishnuApp",
@@ -48,8 +54,13 @@ __all__ = [
 ]
 
 
-def __getattr__(name: str):
+def __getattr__(name: str) -> Any:
     """Lazily expose the main CLI app and related public objects."""
+    if name in _LAZY_EXPORTS:
+        module_name, attr = _LAZY_EXPORTS[name]
+        value = getattr(import_module(module_name, __name__), attr)
+        globals()[name] = value
+        return value
     if name == "app":
         from .._main_cli import app
 
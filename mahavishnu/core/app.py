@@ -57,7 +57,9 @@ from .control_surface import (
 )
 from .dependency_waiter import wait_for_dependencies as _wait_for_dependencies_helper
 from .errors import AdapterError
+from .lifecycle import close_http_clients as _close_http_clients_helper
 from .lifecycle import initialize_worktree_coordinator as _initialize_worktree_coordinator_helper
+from .lifecycle import start_http_clients as _start_http_clients_helper
 from .lifecycle import start_learning_pipeline as _start_learning_pipeline_helper
 from .lifecycle import start_poller as _start_poller_helper
 from .lifecycle import stop_learning_pipeline as _stop_learning_pipeline_helper
@@ -289,6 +291,29 @@ class MahavishnuApp:
         """
         await _stop_learning_pipeline_helper(self)
 
+    async def start_http_clients(self) -> None:
+        """Create the shared keep-alive HTTP clients for ecosystem services.
+
+        This method should be called after the async event loop is running.
+        It's safe to call multiple times (idempotent).
+
+        Example:
+            >>> app = MahavishnuApp()
+            >>> await app.start_http_clients()
+        """
+        await _start_http_clients_helper(self)
+
+    async def close_http_clients(self) -> None:
+        """Close the shared keep-alive HTTP clients.
+
+        This method should be called before shutting down the application.
+        It's safe to call multiple times (idempotent).
+
+        Example:
+            >>> await app.close_http_clients()
+        """
+        await _close_http_clients_helper(self)
+
     async def initialize_worktree_coordinator(self) -> None:
         """Initialize WorktreeCoordinator after async event loop is running.
 
@@ -728,6 +753,7 @@ class MahavishnuApp:
         workflow_id: str,
         validated_repos: list[str],
         progress_callback=None,
+        stream_qc: bool = False,
     ) -> tuple[float, list[Any], list[dict[str, Any]]]:
         """Execute workflow across repos in parallel with observability.
 
@@ -738,6 +764,7 @@ class MahavishnuApp:
             workflow_id: Workflow identifier
             validated_repos: List of validated repository paths
             progress_callback: Optional progress callback
+            stream_qc: Gate each repo on its own streamed pre-execution QC result
 
         Returns:
             Tuple of (execution_time, successful_results, errors)
@@ -750,6 +777,7 @@ class MahavishnuApp:
             workflow_id=workflow_id,
             validated_repos=validated_repos,
             progress_callback=progress_callback,
+            stream_qc=stream_qc,
         )
 
     async def _finalize_workflow_execution(
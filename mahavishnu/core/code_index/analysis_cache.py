@@ -0,0 +1,664 @@
+"""Commit-keyed, on-disk cache of ``CodeGraphAnalyzer`` repository analyses.
+
+Sweeps used to build a fresh analyzer and re-parse every repository on every
+run, even when nothing had changed. This cache keys an analysis by the
+repository path, its HEAD commit, a hash of the dirty working tree and the
+version of the package that provides the analyzer:
+
+- Same key: the analyzer is rebuilt from the cached state without parsing.
+- Different commit or tree: the cached analyzer is restored, everything
+  belonging to files changed since the cached commit (the same ``git diff``
+  as :func:`~mahavishnu.core.code_index.parser.filter_changed_files`, plus
+  untracked, deleted and previously dirty files) is pruned from its state,
+  and only those files are re-parsed with ``_analyze_python_file``, as
+  :func:`~mahavishnu.core.code_index.parser.parse_file` does.
+- No usable entry (first run, analyzer upgrade, rewritten history) or more
+  than ``INCREMENTAL_MAX_FRACTION`` of the files changed: full
+  ``analyze_repository``, which replaces the entry.
+- Non-git directories are never cached.
+
+An entry holds the analyzer's whole graph state, not just ``nodes``: every
+instance attribute that encodes (edges, lookup tables, ...) is restored, so
+``find_related_files`` and ``get_function_context`` answer the same on a
+rebuilt analyzer as on the one that parsed the repository. Objects are
+encoded once per identity, with one field list per class, which keeps
+entries for large repositories small and preserves shared references.
+Nodes map to files through their ``file_id`` (a path, absolute or relative
+to the repository); analyzers whose ids are not paths simply never take the
+incremental path.
+
+Entries only name classes; decoding resolves them among the already
+imported modules of the analyzer's own package and refuses anything else,
+so a tampered entry cannot make the cache import or call arbitrary code.
+
+Entries are JSON files under ``~/.mahavishnu/code-graph-cache``; an in-memory
+LRU keeps the encoded state of recently used repositories. Each call decodes
+its own copy, so callers may mutate the analyzer they get back.
+
+Analyzer classes are passed in by the caller, so call sites that patch their
+own ``CodeGraphAnalyzer`` keep working; anything that is not a class (e.g. a
+mock) bypasses the cache.
+
+Usage:
+    from mahavishnu.core.code_index.analysis_cache import get_code_graph_cache
+
+    analysis = await get_code_graph_cache().analyze(repo_path, CodeGraphAnalyzer)
+    related = await analysis.analyzer.find_related_files(file_path)
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+import dataclasses
+from dataclasses import dataclass
+import enum
+import functools
+import hashlib
+import importlib.metadata
+import json
+import logging
+import os
+from pathlib import Path, PurePath
+import subprocess
+import sys
+import tempfile
+from typing import Any, Literal
+
+from mahavishnu.core.code_index.parser import SKIP_DIRS, filter_changed_files
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = Path.home() / ".mahavishnu" / "code-graph-cache"
+
+# Bump when the entry layout changes; older entries are ignored.
+CACHE_FORMAT_VERSION = 3
+
+# Re-analyze from scratch when more than this fraction of files changed.
+INCREMENTAL_MAX_FRACTION = 0.5
+
+# Stats keys recomputed from nodes after an incremental update.
+_NODE_COUNT_KEYS = {
+    "FunctionNode": "functions_indexed",
+    "ClassNode": "classes_indexed",
+    "ImportNode": "imports_indexed",
+}
+
+CacheStatus = Literal["hit", "incremental", "miss", "uncached"]
+
+_SEQUENCE_TYPES: dict[str, type] = {"tuple": tuple, "set": set, "frozenset": frozenset}
+
+
+@dataclass
+class CachedAnalysis:
+    """Result of :meth:`CodeGraphAnalysisCache.analyze`.
+
+    Attributes:
+        analyzer: Analyzer holding the repository graph
+        stats: ``analyze_repository()`` statistics (a copy per call)
+        status: ``hit``, ``incremental``, ``miss`` or ``uncached``
+        commit: HEAD commit the analysis corresponds to (None outside git)
+        reanalyzed_files: Files parsed for this call (0 on a hit)
+    """
+
+    analyzer: Any
+    stats: dict[str, Any]
+    status: CacheStatus
+    commit: str | None = None
+    reanalyzed_files: int = 0
+
+
+@dataclass
+class _Entry:
+    analyzer_class: str
+    analyzer_version: str | None
+    head: str
+    dirty: str
+    dirty_files: list[str]
+    stats: dict[str, Any]
+    state: dict[str, Any]
+
+
+def _git(repo: Path, *args: str) -> str | None:
+    result = subprocess.run(
+        ["git", "-C", str(repo), *args],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    return result.stdout if result.returncode == 0 else None
+
+
+def _tree_state(repo: Path) -> tuple[str, str, list[str]] | None:
+    """Return (HEAD commit, dirty-tree hash, dirty files), or None outside a git work tree."""
+    head = _git(repo, "rev-parse", "HEAD")
+    if head is None:
+        return None
+    status = _git(repo, "status", "--porcelain", "--untracked-files=all") or ""
+    digest = hashlib.sha256(status.encode())
+    dirty_files = []
+    # Status only says a file is dirty; fold in mtimes so further edits to
+    # an already-dirty file still change the key.
+    for line in sorted(status.splitlines()):
+        path = repo / line[3:].split(" -> ")[-1]
+        dirty_files.append(str(path))
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        digest.update(f"{line}:{stat.st_mtime_ns}:{stat.st_size}".encode())
+    return head.strip(), digest.hexdigest(), dirty_files
+
+
+def _class_name(cls: type) -> str:
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+def _package(cls: type) -> str:
+    return cls.__module__.split(".")[0]
+
+
+@functools.cache
+def _package_version(package: str) -> str | None:
+    for dist in importlib.metadata.packages_distributions().get(package, []):
+        try:
+            return importlib.metadata.version(dist)
+        except importlib.metadata.PackageNotFoundError:
+            continue
+    return getattr(sys.modules.get(package), "__version__", None)
+
+
+def _analyzer_version(cls: type) -> str | None:
+    """Version of the distribution providing ``cls`` (None if unknown)."""
+    return _package_version(_package(cls))
+
+
+def _node_file(repo: Path, node: Any) -> str | None:
+    file_id = getattr(node, "file_id", None)
+    return os.path.normpath(repo / str(file_id)) if file_id else None
+
+
+class _StateEncoder:
+    """Encode analyzer state into JSON values.
+
+    Dataclass instances and objects of classes from the analyzer's own
+    package become ``{"__ref__": n}`` references into one object table, so
+    an object reachable from several attributes is stored once. Anything
+    else that is not plain data (including classes and enums from other
+    packages, which decoding would refuse) raises ``TypeError``.
+    """
+
+    def __init__(self, package: str | None = None) -> None:
+        self._package = package
+        self.schemas: list[list[Any]] = []
+        self.objects: list[list[Any]] = []
+        self._schema_index: dict[type, int] = {}
+        self._object_index: dict[int, int] = {}
+        # Keeps encoded objects alive so their ids stay unique.
+        self._seen: list[Any] = []
+
+    def mark(self) -> tuple[int, int]:
+        """Return a checkpoint for :meth:`rollback`."""
+        return len(self.schemas), len(self.objects)
+
+    def rollback(self, mark: tuple[int, int]) -> None:
+        """Forget schemas and objects added since ``mark`` (after a failed encode)."""
+        schemas, objects = mark
+        del self.schemas[schemas:], self.objects[objects:], self._seen[objects:]
+        self._schema_index = {c: i for c, i in self._schema_index.items() if i < schemas}
+        self._object_index = {o: i for o, i in self._object_index.items() if i < objects}
+
+    def _in_package(self, cls: type) -> bool:
+        return self._package is None or _package(cls) == self._package
+
+    def _is_graph_object(self, value: Any) -> bool:
+        cls = type(value)
+        if not self._in_package(cls):
+            return False
+        if dataclasses.is_dataclass(value) and not isinstance(value, type):
+            return True
+        return self._package is not None and hasattr(value, "__dict__")
+
+    def encode(self, value: Any) -> Any:
+        if value is None or isinstance(value, (bool, int, float, str)):
+            return value
+        if isinstance(value, list):
+            return [self.encode(v) for v in value]
+        if isinstance(value, dict):
+            if all(isinstance(k, str) and not k.startswith("__") for k in value):
+                return {k: self.encode(v) for k, v in value.items()}
+            return {"__map__": [[self.encode(k), self.encode(v)] for k, v in value.items()]}
+        if isinstance(value, tuple(_SEQUENCE_TYPES.values())):
+            name = next(n for n, t in _SEQUENCE_TYPES.items() if isinstance(value, t))
+            return {"__seq__": name, "items": [self.encode(v) for v in value]}
+        if isinstance(value, PurePath):
+            return {"__path__": str(value)}
+        if isinstance(value, enum.Enum) and self._in_package(type(value)):
+            cls = type(value)
+            return {"__enum__": [cls.__module__, cls.__qualname__, self.encode(value.value)]}
+        if self._is_graph_object(value):
+            return {"__ref__": self._encode_object(value)}
+        raise TypeError(f"cannot encode {type(value).__qualname__}")
+
+    def _encode_object(self, obj: Any) -> int:
+        index = self._object_index.get(id(obj))
+        if index is not None:
+            return index
+        cls = type(obj)
+        if cls not in self._schema_index:
+            if dataclasses.is_dataclass(obj):
+                fields = [f.name for f in dataclasses.fields(obj)]
+            else:
+                fields = sorted(vars(obj))
+            self._schema_index[cls] = len(self.schemas)
+            self.schemas.append([cls.__module__, cls.__qualname__, fields])
+        schema = self._schema_index[cls]
+        # Reserve the slot before encoding fields so cycles resolve to it.
+        index = len(self.objects)
+        self._object_index[id(obj)] = index
+        self._seen.append(obj)
+        row: list[Any] = [schema, []]
+        self.objects.append(row)
+        row[1] = [self.encode(getattr(obj, name)) for name in self.schemas[schema][2]]
+        return index
+
+
+class _StateDecoder:
+    """Rebuild values written by :class:`_StateEncoder`.
+
+    Classes named in the state are only looked up among the loaded modules
+    of ``package`` and must be defined there; anything else raises
+    ``ValueError`` instead of being imported.
+    """
+
+    def __init__(self, schemas: list[list[Any]], objects: list[list[Any]], package: str) -> None:
+        self._package = package
+        classes = [
+            (self._resolve_class(module_name, qualname), fields)
+            for module_name, qualname, fields in schemas
+        ]
+        # Bypass __init__/__post_init__: the field values are already final.
+        self._objects = [classes[schema][0].__new__(classes[schema][0]) for schema, _ in objects]
+        # Encoding numbers children after their parents; filling them first
+        # lets a parent hash its children (set members, dict keys).
+        for obj, (schema, values) in reversed(list(zip(self._objects, objects, strict=True))):
+            for name, value in zip(classes[schema][1], values, strict=True):
+                object.__setattr__(obj, name, self.decode(value))
+
+    def _resolve_class(self, module_name: str, qualname: str) -> type:
+        module = sys.modules.get(module_name)
+        if module is None or module_name.split(".")[0] != self._package:
+            raise ValueError(f"refusing to decode class from module {module_name!r}")
+        cls: Any = module
+        for part in qualname.split("."):
+            cls = getattr(cls, part, None)
+        if (
+            not isinstance(cls, type)
+            or cls.__module__ != module_name
+            or cls.__qualname__ != qualname
+        ):
+            raise ValueError(f"{module_name}.{qualname} is not a class of {module_name}")
+        return cls
+
+    def decode(self, value: Any) -> Any:
+        if isinstance(value, list):
+            return [self.decode(v) for v in value]
+        if not isinstance(value, dict):
+            return value
+        if "__ref__" in value:
+            return self._objects[value["__ref__"]]
+        if "__map__" in value:
+            return {self.decode(k): self.decode(v) for k, v in value["__map__"]}
+        if "__seq__" in value:
+            return _SEQUENCE_TYPES[value["__seq__"]](self.decode(v) for v in value["items"])
+        if "__path__" in value:
+            return Path(value["__path__"])
+        if "__enum__" in value:
+            module_name, qualname, raw = value["__enum__"]
+            cls = self._resolve_class(module_name, qualname)
+            if not issubclass(cls, enum.Enum):
+                raise ValueError(f"{module_name}.{qualname} is not an enum")
+            return cls(self.decode(raw))
+        return {k: self.decode(v) for k, v in value.items()}
+
+
+def serialize_analyzer(analyzer: Any) -> dict[str, Any]:
+    """Encode an analyzer's instance attributes for :func:`restore_analyzer`.
+
+    Attributes that cannot be encoded (locks, clients, loggers) are left out
+    and keep whatever the analyzer's ``__init__`` sets on restore.
+
+    Raises:
+        TypeError: If ``nodes`` itself cannot be encoded
+    """
+    encoder = _StateEncoder(_package(type(analyzer)))
+    attributes: dict[str, Any] = {}
+    for name, value in vars(analyzer).items():
+        mark = encoder.mark()
+        try:
+            attributes[name] = encoder.encode(value)
+        except TypeError as e:
+            encoder.rollback(mark)
+            if name == "nodes":
+                raise
+            logger.debug(f"Not caching analyzer attribute {name}: {e}")
+    return {"schemas": encoder.schemas, "objects": encoder.objects, "attributes": attributes}
+
+
+def restore_analyzer(analyzer: Any, state: dict[str, Any]) -> Any:
+    """Apply :func:`serialize_analyzer` output to a freshly built ``analyzer``.
+
+    Raises:
+        ValueError: If the state names a class outside the analyzer's package
+    """
+    decoder = _StateDecoder(state["schemas"], state["objects"], _package(type(analyzer)))
+    for name, value in state["attributes"].items():
+        setattr(analyzer, name, decoder.decode(value))
+    return analyzer
+
+
+_DROP = object()
+
+
+def _prune(value: Any, ids: set[str], objects: set[int]) -> Any:
+    """Return ``value`` without anything that refers to a dropped node.
+
+    A reference is a dropped node object, one of ``ids`` (node and file
+    ids), or a graph object (e.g. an edge) with such a field. Containers are
+    filtered rather than dropped, except dict values emptied by the pruning.
+    """
+
+    def refers(item: Any) -> bool:
+        return id(item) in objects or (isinstance(item, str) and item in ids)
+
+    if refers(value):
+        return _DROP
+    if isinstance(value, list | tuple | set | frozenset):
+        kept = [v for v in (_prune(item, ids, objects) for item in value) if v is not _DROP]
+        return kept if isinstance(value, list) else type(value)(kept)
+    if isinstance(value, dict):
+        pruned = {}
+        for key, item in value.items():
+            if refers(key):
+                continue
+            new = _prune(item, ids, objects)
+            emptied = isinstance(new, list | tuple | set | frozenset | dict) and item and not new
+            if new is not _DROP and not emptied:
+                pruned[key] = new
+        return pruned
+    fields = (
+        [getattr(value, f.name) for f in dataclasses.fields(value)]
+        if dataclasses.is_dataclass(value) and not isinstance(value, type)
+        else []
+    )
+    return _DROP if any(refers(field) for field in fields) else value
+
+
+class CodeGraphAnalysisCache:
+    """Shared analysis cache: in-memory LRU in front of per-repo JSON entries.
+
+    Example:
+        cache = CodeGraphAnalysisCache()
+        analysis = await cache.analyze("/path/to/repo", CodeGraphAnalyzer)
+    """
+
+    def __init__(self, cache_dir: Path | None = None, max_memory_entries: int = 32) -> None:
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory for entry files (default: ``CACHE_DIR``)
+            max_memory_entries: Repositories kept in memory
+        """
+        self._cache_dir = cache_dir or CACHE_DIR
+        self._max_memory_entries = max_memory_entries
+        self._memory: OrderedDict[str, _Entry] = OrderedDict()
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._counts = {"hit": 0, "incremental": 0, "miss": 0, "uncached": 0}
+
+    def stats(self) -> dict[str, int]:
+        """Return per-status call counts and the number of entries in memory."""
+        return {**self._counts, "memory_entries": len(self._memory)}
+
+    def invalidate(self, repo_path: str | Path) -> None:
+        """Drop the entry for ``repo_path`` from memory and disk."""
+        key = self._repo_key(Path(repo_path).resolve())
+        self._memory.pop(key, None)
+        self._entry_path(key).unlink(missing_ok=True)
+
+    async def analyze(self, repo_path: str | Path, analyzer_factory: Any) -> CachedAnalysis:
+        """Return the analysis of ``repo_path``, reusing the cached one when unchanged.
+
+        Args:
+            repo_path: Repository to analyze
+            analyzer_factory: ``CodeGraphAnalyzer`` class (called with the repo ``Path``)
+
+        Returns:
+            CachedAnalysis with the analyzer, its stats and how it was produced
+        """
+        if not isinstance(analyzer_factory, type):
+            return await self._analyze_full(Path(repo_path), analyzer_factory, "uncached", None)
+
+        repo = Path(repo_path).resolve()
+        state = await asyncio.to_thread(_tree_state, repo)
+        if state is None:
+            return await self._analyze_full(Path(repo_path), analyzer_factory, "uncached", None)
+
+        key = self._repo_key(repo)
+        async with self._locks.setdefault(key, asyncio.Lock()):
+            return await self._analyze_cached(repo, analyzer_factory, key, *state)
+
+    async def _analyze_cached(
+        self,
+        repo: Path,
+        factory: type,
+        key: str,
+        head: str,
+        dirty: str,
+        dirty_files: list[str],
+    ) -> CachedAnalysis:
+        version = _analyzer_version(factory)
+        entry = self._memory.get(key) or await asyncio.to_thread(self._load, key)
+        if entry is not None and (entry.analyzer_class, entry.analyzer_version) != (
+            _class_name(factory),
+            version,
+        ):
+            entry = None
+
+        analyzer = None
+        if entry is not None:
+            try:
+                analyzer = await asyncio.to_thread(restore_analyzer, factory(repo), entry.state)
+            except Exception as e:  # noqa: BLE001 - a bad entry only costs a full analysis
+                logger.warning(f"Discarding code graph cache entry for {repo}: {e}")
+                entry = None
+
+        if entry is not None and (entry.head, entry.dirty) == (head, dirty):
+            self._remember(key, entry)
+            self._counts["hit"] += 1
+            return CachedAnalysis(analyzer, dict(entry.stats), "hit", head)
+
+        result = None
+        if entry is not None:
+            changed = await asyncio.to_thread(self._changed_files, repo, entry, analyzer)
+            if changed is not None:
+                try:
+                    result = await self._update(repo, analyzer, entry, changed, head)
+                except Exception as e:  # noqa: BLE001 - fall back to a full analysis
+                    logger.warning(f"Incremental code graph update of {repo} failed: {e}")
+        if result is None:
+            result = await self._analyze_full(repo, factory, "miss", head)
+
+        try:
+            state = await asyncio.to_thread(serialize_analyzer, result.analyzer)
+        except (TypeError, ValueError) as e:
+            logger.debug(f"Code graph analysis of {repo} is not cacheable: {e}")
+            return result
+        entry = _Entry(
+            _class_name(factory), version, head, dirty, dirty_files, dict(result.stats), state
+        )
+        self._remember(key, entry)
+        await asyncio.to_thread(self._persist, key, entry)
+        return result
+
+    async def _analyze_full(
+        self,
+        repo: Path,
+        factory: Any,
+        status: CacheStatus,
+        head: str | None,
+    ) -> CachedAnalysis:
+        self._counts[status] += 1
+        analyzer = factory(repo)
+        stats = dict(await analyzer.analyze_repository(str(repo)) or {})
+        return CachedAnalysis(analyzer, stats, status, head, int(stats.get("files_indexed", 0)))
+
+    def _changed_files(self, repo: Path, entry: _Entry, analyzer: Any) -> list[str] | None:
+        """Files to re-parse since ``entry``; None when a full analysis is due.
+
+        Runs in a worker thread. Covers files changed since the cached
+        commit, untracked files, files that were dirty when the entry was
+        made, and files of cached nodes that no longer exist.
+        """
+        if _git(repo, "cat-file", "-e", f"{entry.head}^{{commit}}") is None:
+            return None
+        changed = set(filter_changed_files(str(repo), entry.head))
+        untracked = _git(repo, "ls-files", "--others", "--exclude-standard") or ""
+        changed.update(str(repo / f) for f in untracked.splitlines() if f.endswith(".py"))
+        changed.update(f for f in entry.dirty_files if f.endswith(".py"))
+
+        known_files = {_node_file(repo, node) for node in analyzer.nodes.values()}
+        known_files.discard(None)
+        changed.update(path for path in known_files if not Path(path).exists())
+        changed = {p for p in changed if not SKIP_DIRS.intersection(Path(p).parts)}
+        if len(changed) > INCREMENTAL_MAX_FRACTION * max(len(known_files), 1):
+            return None
+        return sorted(changed)
+
+    async def _update(
+        self,
+        repo: Path,
+        analyzer: Any,
+        entry: _Entry,
+        changed: list[str],
+        head: str,
+    ) -> CachedAnalysis:
+        """Prune ``changed`` files from a restored analyzer and re-parse them."""
+        changed_set = set(changed)
+        previous_files = {_node_file(repo, node) for node in analyzer.nodes.values()}
+        dropped = {
+            node_id: node
+            for node_id, node in analyzer.nodes.items()
+            if _node_file(repo, node) in changed_set
+        }
+        ids = set(dropped) | {str(node.file_id) for node in dropped.values()}
+        objects = {id(node) for node in dropped.values()}
+        for node_id in dropped:
+            del analyzer.nodes[node_id]
+        for name in entry.state["attributes"]:
+            if name != "nodes":
+                setattr(analyzer, name, _prune(getattr(analyzer, name), ids, objects))
+
+        reparsed = [Path(path) for path in changed if Path(path).exists()]
+        for path in reparsed:
+            await analyzer._analyze_python_file(path)
+
+        current_files = {_node_file(repo, node) for node in analyzer.nodes.values()}
+        stats = dict(entry.stats)
+        for class_name, stat_key in _NODE_COUNT_KEYS.items():
+            if stat_key in stats:
+                stats[stat_key] = sum(
+                    1 for node in analyzer.nodes.values() if type(node).__name__ == class_name
+                )
+        if "total_nodes" in stats:
+            stats["total_nodes"] = len(analyzer.nodes)
+        if "files_indexed" in stats:
+            added = len(current_files - previous_files)
+            removed = sum(1 for path in previous_files - current_files if not Path(path).exists())
+            stats["files_indexed"] = max(0, stats["files_indexed"] + added - removed)
+
+        self._counts["incremental"] += 1
+        return CachedAnalysis(analyzer, stats, "incremental", head, len(reparsed))
+
+    def _repo_key(self, repo: Path) -> str:
+        return hashlib.sha256(str(repo).encode()).hexdigest()[:24]
+
+    def _entry_path(self, key: str) -> Path:
+        return self._cache_dir / f"{key}.json"
+
+    def _remember(self, key: str, entry: _Entry) -> None:
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self._max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def _persist(self, key: str, entry: _Entry) -> None:
+        """Write ``entry`` atomically; runs in a worker thread."""
+        try:
+            payload = json.dumps(
+                {
+                    "version": CACHE_FORMAT_VERSION,
+                    "analyzer_class": entry.analyzer_class,
+                    "analyzer_version": entry.analyzer_version,
+                    "head": entry.head,
+                    "dirty": entry.dirty,
+                    "dirty_files": entry.dirty_files,
+                    "stats": entry.stats,
+                    "state": entry.state,
+                },
+                separators=(",", ":"),
+            )
+        except (TypeError, ValueError) as e:
+            # The in-memory entry still serves this process.
+            logger.debug(f"Code graph cache entry {key} is not serializable: {e}")
+            return
+
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self._cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(payload)
+            os.replace(tmp, self._entry_path(key))
+        except OSError as e:
+            logger.warning(f"Failed to persist code graph cache entry {key}: {e}")
+
+    def _load(self, key: str) -> _Entry | None:
+        path = self._entry_path(key)
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+            if payload.get("version") != CACHE_FORMAT_VERSION:
+                return None
+            return _Entry(
+                payload["analyzer_class"],
+                payload["analyzer_version"],
+                payload["head"],
+                payload["dirty"],
+                payload["dirty_files"],
+                payload["stats"],
+                payload["state"],
+            )
+        except FileNotFoundError:
+            return None
+        except Exception as e:  # noqa: BLE001 - a corrupt entry only costs a full analysis
+            logger.warning(f"Ignoring unreadable code graph cache entry {path}: {e}")
+            return None
+
+
+_cache: CodeGraphAnalysisCache | None = None
+
+
+def get_code_graph_cache() -> CodeGraphAnalysisCache:
+    """Return the process-wide analysis cache."""
+    global _cache
+    if _cache is None:
+        _cache = CodeGraphAnalysisCache()
+    return _cache
+
+
+__all__ = [
+    "CACHE_DIR",
+    "CachedAnalysis",
+    "CodeGraphAnalysisCache",
+    "get_code_graph_cache",
+    "restore_analyzer",
+    "serialize_analyzer",
+]
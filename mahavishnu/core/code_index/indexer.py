@@ -1,21 +1,50 @@
-"""Orchestrates code graph indexing: detect changes, parse, upsert to Session-Buddy."""
+"""Orchestrates code graph indexing: detect changes, parse, upsert to Session-Buddy.
+
+Pipeline:
+  1. Changed files are filtered through a per-repo content-hash cache
+     (``.git/mahavishnu-index-hashes.json``, git blob hashes). Files whose
+     content is unchanged since they were last delivered are skipped, even
+     on ``--full``.
+  2. Remaining files are parsed across a process pool (in-process for
+     small batches), so wall time scales with cores.
+  3. Parsed nodes and edges stream to Session-Buddy in bounded chunks as
+     results arrive. When Session-Buddy is unavailable, each chunk is
+     written to its own file in the local queue.
+"""
 
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor
 from datetime import UTC, datetime
+import hashlib
 import json
 import logging
+import os
 from pathlib import Path
 import subprocess
+from typing import TYPE_CHECKING, Any
 
 from mahavishnu.core.code_index.lock import RepoIndexLock
 from mahavishnu.core.code_index.models import IndexWorkItem
 from mahavishnu.core.code_index.parser import filter_changed_files, parse_file
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
 logger = logging.getLogger(__name__)
 
 QUEUE_DIR = Path.home() / ".claude" / "data" / "mahavishnu-index-queue"
 
+SESSION_BUDDY_MCP_URL = "http://localhost:8678/mcp"
+
+# Maximum nodes + edges per Session-Buddy request / queue file.
+CHUNK_MAX_ITEMS = 2000
+
+# Below this many files, parse in-process; pool start-up would dominate.
+PARALLEL_MIN_FILES = 32
+
+HASH_CACHE_NAME = "mahavishnu-index-hashes.json"
+
 
 def get_last_indexed_commit(repo_path: str) -> str | None:
     """Get the last commit hash that was indexed for a repo."""
@@ -44,15 +73,186 @@ def get_current_commit(repo_path: str) -> str:
     return result.stdout.strip()
 
 
+def _hash_cache_file(repo_path: str) -> Path:
+    return Path(repo_path) / ".git" / HASH_CACHE_NAME
+
+
+def load_content_hashes(repo_path: str) -> dict[str, str]:
+    """Load the per-repo ``{relative_path: blob_hash}`` cache."""
+    try:
+        data = json.loads(_hash_cache_file(repo_path).read_text())
+    except (OSError, ValueError):
+        return {}
+    return {str(k): str(v) for k, v in data.items()} if isinstance(data, dict) else {}
+
+
+def save_content_hashes(repo_path: str, hashes: dict[str, str]) -> None:
+    """Atomically persist the content-hash cache."""
+    cache_file = _hash_cache_file(repo_path)
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp = cache_file.with_suffix(".tmp")
+    tmp.write_text(json.dumps(hashes, sort_keys=True))
+    os.replace(tmp, cache_file)
+
+
+def blob_hash(file_path: str) -> str | None:
+    """Return the git blob hash of a file's content, or None if unreadable.
+
+    Matches ``git hash-object`` so cache entries line up with git's view.
+    """
+    try:
+        data = Path(file_path).read_bytes()
+    except OSError:
+        return None
+    digest = hashlib.sha1(b"blob %d\0" % len(data), usedforsecurity=False)
+    digest.update(data)
+    return digest.hexdigest()
+
+
+def _cache_key(file_path: str, repo_path: str) -> str:
+    try:
+        return str(Path(file_path).relative_to(repo_path))
+    except ValueError:
+        return file_path
+
+
+def _dump(items: list[Any]) -> list[dict[str, Any]]:
+    return [i.model_dump(mode="json") if hasattr(i, "model_dump") else i for i in items]
+
+
+def _parse_to_payload(
+    file_path: str,
+    repo_path: str,
+    commit_hash: str,
+) -> tuple[str, list[dict[str, Any]], list[dict[str, Any]], str | None]:
+    """Parse one file into JSON-ready nodes/edges.
+
+    Module-level so it can run in a worker process. Failures are returned
+    rather than raised so one bad file never aborts the pool.
+
+    Returns:
+        ``(file_path, nodes, edges, error)``
+    """
+    try:
+        result = parse_file(file_path, repo_path, commit_hash)
+    except Exception as e:  # noqa: BLE001 - parse failures are counted, not fatal
+        return file_path, [], [], f"{type(e).__name__}: {e}"
+    if result is None:
+        return file_path, [], [], None
+    nodes, edges = result
+    return file_path, _dump(nodes), _dump(edges), None
+
+
+def _parse_files(
+    files: list[str],
+    repo_path: str,
+    commit_hash: str,
+    workers: int | None,
+) -> Iterator[tuple[str, list[dict[str, Any]], list[dict[str, Any]], str | None]]:
+    """Yield parse results, fanning out across processes for large batches."""
+    max_workers = workers or os.cpu_count() or 1
+    if max_workers <= 1 or len(files) < PARALLEL_MIN_FILES:
+        for file_path in files:
+            yield _parse_to_payload(file_path, repo_path, commit_hash)
+        return
+
+    chunksize = max(1, len(files) // (max_workers * 4))
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        yield from pool.map(
+            _parse_to_payload,
+            files,
+            [repo_path] * len(files),
+            [commit_hash] * len(files),
+            chunksize=chunksize,
+        )
+
+
+class _ChunkSink:
+    """Streams bounded node/edge chunks to Session-Buddy or the local queue."""
+
+    def __init__(self, repo_path: str, commit_hash: str, max_items: int = CHUNK_MAX_ITEMS):
+        self.repo_path = repo_path
+        self.commit_hash = commit_hash
+        self.max_items = max(1, max_items)
+        self.nodes: list[dict[str, Any]] = []
+        self.edges: list[dict[str, Any]] = []
+        self.chunks_sent = 0
+        self.chunks_queued = 0
+        self.total_nodes = 0
+        self.total_edges = 0
+        self._remote_available = True
+        self._timestamp = datetime.now(UTC).strftime("%Y%m%dT%H%M%SZ")
+        self._client: Any = None
+
+    def add(self, nodes: list[dict[str, Any]], edges: list[dict[str, Any]]) -> None:
+        self.nodes.extend(nodes)
+        self.edges.extend(edges)
+        self.total_nodes += len(nodes)
+        self.total_edges += len(edges)
+        while len(self.nodes) + len(self.edges) >= self.max_items:
+            self._flush_chunk()
+
+    def _take_chunk(self) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        node_count = min(len(self.nodes), self.max_items)
+        nodes, self.nodes = self.nodes[:node_count], self.nodes[node_count:]
+        edge_count = min(len(self.edges), self.max_items - node_count)
+        edges, self.edges = self.edges[:edge_count], self.edges[edge_count:]
+        return nodes, edges
+
+    def _flush_chunk(self) -> None:
+        nodes, edges = self._take_chunk()
+        if not nodes and not edges:
+            return
+        chunk_index = self.chunks_sent + self.chunks_queued
+        if self._remote_available:
+            if self._client is None:
+                self._client = _open_client()
+            self._remote_available = _upsert_to_session_buddy(
+                self.repo_path,
+                nodes,
+                edges,
+                commit_hash=self.commit_hash,
+                chunk_index=chunk_index,
+                client=self._client,
+            )
+            if self._remote_available:
+                self.chunks_sent += 1
+                return
+        _queue_locally(
+            self.repo_path,
+            self.commit_hash,
+            nodes,
+            edges,
+            chunk_index=chunk_index,
+            timestamp=self._timestamp,
+        )
+        self.chunks_queued += 1
+
+    def close(self) -> None:
+        while self.nodes or self.edges:
+            self._flush_chunk()
+        # The client is the shared Session-Buddy pool; release the reference only.
+        self._client = None
+
+
 def index_repo(
     repo_path: str,
     trigger: str = "manual",
     full: bool = False,
+    workers: int | None = None,
 ) -> IndexWorkItem:
     """Index a single repository.
 
-    Detects changed files, parses them, and upserts to Session-Buddy.
-    Falls back to filesystem queue if Session-Buddy MCP is unavailable.
+    Detects changed files, skips those whose content hash is unchanged,
+    parses the rest (in parallel for large batches) and streams the graph
+    to Session-Buddy in chunks. Falls back to the filesystem queue, one
+    file per chunk, if Session-Buddy MCP is unavailable.
+
+    Args:
+        repo_path: Repository to index
+        trigger: What triggered indexing (for logging)
+        full: Ignore the last indexed commit and consider every file
+        workers: Parser processes (default: CPU count)
     """
     lock = RepoIndexLock(repo_path)
     if not lock.acquire():
@@ -86,40 +286,47 @@ def index_repo(
             logger.info("No changes detected for %s", repo_path)
             return work_item
 
-        all_nodes = []
-        all_edges = []
-        parse_failures = 0
-
+        cached_hashes = load_content_hashes(repo_path)
+        new_hashes: dict[str, str] = {}
+        to_parse: list[str] = []
         for file_path in changed_files:
-            try:
-                result = parse_file(file_path, repo_path, current_commit)
-                if result is not None:
-                    nodes, edges = result
-                    all_nodes.extend(nodes)
-                    all_edges.extend(edges)
-            except (OSError, SyntaxError, ValueError) as e:
-                parse_failures += 1
-                logger.warning("Failed to parse %s: %s", file_path, e)
+            key = _cache_key(file_path, repo_path)
+            content_hash = blob_hash(file_path)
+            if content_hash is not None and cached_hashes.get(key) == content_hash:
+                continue
+            if content_hash is not None:
+                new_hashes[key] = content_hash
+            to_parse.append(file_path)
+        work_item.files_skipped = len(changed_files) - len(to_parse)
+
+        parse_failures = 0
+        sink = _ChunkSink(repo_path, current_commit)
+        work_item.status = "upserting"
+        try:
+            for file_path, nodes, edges, error in _parse_files(
+                to_parse, repo_path, current_commit, workers
+            ):
+                if error is not None:
+                    parse_failures += 1
+                    new_hashes.pop(_cache_key(file_path, repo_path), None)
+                    logger.warning("Failed to parse %s: %s", file_path, error)
+                    continue
+                sink.add(nodes, edges)
+        finally:
+            sink.close()
 
         work_item.parse_failures = parse_failures
 
-        if (
-            parse_failures > 0
-            and len(changed_files) > 0
-            and parse_failures / len(changed_files) > 0.25
-        ):
+        if parse_failures > 0 and len(to_parse) > 0 and parse_failures / len(to_parse) > 0.25:
             logger.warning(
                 "High parse failure rate for %s: %d/%d files failed",
                 repo_path,
                 parse_failures,
-                len(changed_files),
+                len(to_parse),
             )
 
-        work_item.status = "upserting"
-        success = _upsert_to_session_buddy(repo_path, all_nodes, all_edges)
-
-        if not success:
-            _queue_locally(repo_path, current_commit, all_nodes, all_edges)
+        if new_hashes:
+            save_content_hashes(repo_path, {**cached_hashes, **new_hashes})
 
         work_item.status = "complete"
         work_item.completed_at = datetime.now(UTC)
@@ -127,12 +334,16 @@ def index_repo(
         set_last_indexed_commit(repo_path, current_commit)
 
         logger.info(
-            "Indexed %s: %d files, %d nodes, %d edges, %d failures",
+            "Indexed %s: %d files (%d unchanged), %d nodes, %d edges, %d failures, "
+            "%d chunks sent, %d queued",
             repo_path,
             len(changed_files),
-            len(all_nodes),
-            len(all_edges),
+            work_item.files_skipped,
+            sink.total_nodes,
+            sink.total_edges,
             parse_failures,
+            sink.chunks_sent,
+            sink.chunks_queued,
         )
 
         return work_item
@@ -141,30 +352,38 @@ def index_repo(
         lock.release()
 
 
+def _open_client() -> Any:
+    from mahavishnu.core.http_clients import SESSION_BUDDY, get_sync_http_client
+
+    return get_sync_http_client(SESSION_BUDDY)
+
+
 def _upsert_to_session_buddy(
     repo_path: str,
-    nodes: list,
-    edges: list,
+    nodes: list[dict[str, Any]],
+    edges: list[dict[str, Any]],
+    *,
+    commit_hash: str,
+    chunk_index: int = 0,
+    client: Any = None,
 ) -> bool:
-    """Try to upsert to Session-Buddy via MCP. Returns True on success."""
-    try:
-        import httpx
+    """Try to upsert one chunk to Session-Buddy via MCP. Returns True on success."""
+    import httpx
 
-        resp = httpx.post(
-            "http://localhost:8678/mcp",
+    try:
+        resp = (client if client is not None else _open_client()).post(
+            SESSION_BUDDY_MCP_URL,
             json={
                 "method": "tools/call",
                 "params": {
                     "name": "store_code_graph_from_mahavishnu",
                     "arguments": {
                         "repo_path": repo_path,
-                        "commit_hash": get_current_commit(repo_path),
+                        "commit_hash": commit_hash,
                         "indexed_at": datetime.now(UTC).isoformat(),
+                        "chunk_index": chunk_index,
                         "nodes_count": len(nodes),
-                        "graph_data": {
-                            "nodes": [n.model_dump(mode="json") for n in nodes],
-                            "edges": [e.model_dump(mode="json") for e in edges],
-                        },
+                        "graph_data": {"nodes": nodes, "edges": edges},
                     },
                 },
             },
@@ -179,23 +398,28 @@ def _upsert_to_session_buddy(
 def _queue_locally(
     repo_path: str,
     commit_hash: str,
-    nodes: list,
-    edges: list,
-) -> None:
-    """Fallback: write parsed data to local filesystem queue."""
+    nodes: list[dict[str, Any]],
+    edges: list[dict[str, Any]],
+    *,
+    chunk_index: int = 0,
+    timestamp: str | None = None,
+) -> Path:
+    """Fallback: write one parsed chunk to the local filesystem queue."""
     QUEUE_DIR.mkdir(parents=True, exist_ok=True)
-    timestamp = datetime.now(UTC).strftime("%Y%m%dT%H%M%SZ")
+    timestamp = timestamp or datetime.now(UTC).strftime("%Y%m%dT%H%M%SZ")
     repo_name = Path(repo_path).name
-    queue_file = QUEUE_DIR / f"{repo_name}_{timestamp}.json"
+    queue_file = QUEUE_DIR / f"{repo_name}_{timestamp}_{chunk_index:05d}.json"
     queue_file.write_text(
         json.dumps(
             {
                 "repo_path": repo_path,
                 "commit_hash": commit_hash,
-                "nodes": [n.model_dump(mode="json") for n in nodes],
-                "edges": [e.model_dump(mode="json") for e in edges],
+                "chunk_index": chunk_index,
+                "nodes": nodes,
+                "edges": edges,
             },
             default=str,
         )
     )
     logger.info("Queued %d nodes to %s", len(nodes), queue_file)
+    return queue_file
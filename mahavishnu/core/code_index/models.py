@@ -130,6 +130,9 @@ class IndexWorkItem(BaseModel):
     started_at: datetime | None = None
     completed_at: datetime | None = None
     parse_failures: int = 0
+    files_skipped: int = Field(
+        default=0, description="Changed files skipped because their content hash was unchanged"
+    )
 
 
 class CodeGraphUnavailable(BaseModel):
@@ -740,6 +740,21 @@ class DLQConfig(BaseModel):
         ),
     )
 
+    max_concurrent_retries: int = Field(
+        default=16,
+        ge=1,
+        le=1024,
+        description="Maximum DLQ retry callbacks running concurrently across all adapters.",
+    )
+
+    adapter_concurrency: dict[str, int] = Field(
+        default_factory=dict,
+        description=(
+            "Optional per-adapter retry concurrency limits keyed by adapter name "
+            "(e.g. ``{prefect: 4}``). Unlisted adapters share the global limit."
+        ),
+    )
+
     model_config = {"extra": "forbid"}
 
 
@@ -888,6 +903,25 @@ class QualityControlConfig(BaseModel):
         default="http://localhost:8676/mcp",
         description="Crackerjack MCP server URL",
     )
+    max_concurrent_checks: int = Field(
+        default=8,
+        ge=1,
+        le=128,
+        description="Maximum repositories checked concurrently (1-128)",
+    )
+    cache_size: int = Field(
+        default=1024,
+        ge=0,
+        description="QC results cached by repository tree hash (0 disables the cache)",
+    )
+    stream_pre_checks: bool = Field(
+        default=False,
+        description=(
+            "Start each repository as soon as its own pre-execution QC passes, "
+            "so a failing repository no longer stops the others; by default "
+            "the whole workflow is gated on every repository passing"
+        ),
+    )
 
     model_config = {"extra": "forbid"}
 
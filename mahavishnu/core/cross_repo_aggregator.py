@@ -6,6 +6,11 @@ Aggregates tasks across multiple repositories for unified views:
 - Filter tasks across repositories
 - Provide cross-repo summaries
 
+Counts and summaries are pushed down to the database: one grouped
+``TaskStore.count_by_repository`` query per call instead of listing tasks
+and bucketing them in Python. With a ``TaskRollup`` (kept current from
+``EventStore`` events) they are served from memory without any query.
+
 Usage:
     from mahavishnu.core.cross_repo_aggregator import CrossRepoAggregator
 
@@ -19,20 +24,33 @@ Usage:
 
     # Get repo statistics
     stats = await aggregator.get_repo_stats("mahavishnu")
+
+    # Serve summaries from an event-maintained rollup
+    aggregator = CrossRepoAggregator(task_store, repo_manager, rollup=TaskRollup())
 """
 
 from __future__ import annotations
 
-from collections import defaultdict
+from collections import Counter, defaultdict
 from dataclasses import dataclass, field
 import logging
-from typing import TYPE_CHECKING, Any
-
-from mahavishnu.core.task_store import Task, TaskListFilter, TaskPriority, TaskStatus, TaskStore
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from mahavishnu.core.event_store import EventStore
+from mahavishnu.core.task_store import (
+    RepositoryTaskCounts,
+    Task,
+    TaskListFilter,
+    TaskPriority,
+    TaskStatus,
+    TaskStore,
+)
 
 if TYPE_CHECKING:
     from datetime import datetime
 
+    from mahavishnu.core.task_rollup import TaskRollup
+
 logger = logging.getLogger(__name__)
 
 
@@ -65,7 +83,9 @@ class AggregationFilter:
     def to_task_filter(self) -> TaskListFilter:
         """Convert to TaskListFilter for TaskStore queries."""
         return TaskListFilter(
+            repositories=self.repo_names,
             status=self.status,
+            exclude_statuses=[TaskStatus.COMPLETED] if self.exclude_completed else None,
             priority=self.priority,
             tags=self.tags,
             limit=self.limit,
@@ -113,6 +133,20 @@ class RepoTaskStats:
         blocked = self.status_counts.get(TaskStatus.BLOCKED, 0)
         return blocked / self.total_tasks
 
+    @classmethod
+    def from_counts(cls, counts: RepositoryTaskCounts) -> RepoTaskStats:
+        """Create from grouped counts (SQL aggregation or rollup)."""
+        return cls(
+            repo_name=counts.repository,
+            total_tasks=counts.total,
+            status_counts=dict(counts.status_counts),
+            priority_counts=dict(counts.priority_counts),
+            tag_counts=dict(counts.tag_counts),
+            blocked_tasks=list(counts.blocked_task_ids),
+            oldest_pending=counts.oldest_pending,
+            newest_task=counts.newest_task,
+        )
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
         return {
@@ -134,7 +168,7 @@ class AggregatedTasks:
     """Container for aggregated tasks across repositories.
 
     Attributes:
-        tasks: List of all tasks
+        tasks: List of all tasks (empty for counts-only aggregation)
         total_count: Total number of tasks
         repo_counts: Count of tasks per repository
         status_counts: Count of tasks per status
@@ -230,26 +264,86 @@ class CrossRepoAggregator:
         summary = await aggregator.get_summary()
     """
 
+    # Page size used when loading tasks into a rollup.
+    ROLLUP_PAGE_SIZE: ClassVar[int] = 5000
+
     def __init__(
         self,
         task_store: TaskStore,
         repo_manager: Any,  # RepositoryManager type
+        rollup: TaskRollup | None = None,
     ) -> None:
         """Initialize the aggregator.
 
         Args:
             task_store: TaskStore instance for task queries
             repo_manager: RepositoryManager for repo metadata
+            rollup: Optional event-maintained rollup that serves counts and
+                summaries from memory (loaded lazily from task_store)
         """
         self.task_store = task_store
         self.repo_manager = repo_manager
+        self.rollup = rollup
+        self._subscribed_store: EventStore | None = None
+
+    async def refresh_rollup(self) -> None:
+        """Reload the rollup from the task store and follow task events.
 
-    async def aggregate_all(self) -> AggregatedTasks:
+        Only needed when task changes bypass the ``EventStore``; otherwise
+        the rollup is maintained incrementally from appended events.
+        """
+        if self.rollup is None:
+            return
+
+        tasks: list[Task] = []
+        after: tuple[datetime, str] | None = None
+        while True:
+            page = await self.task_store.list(
+                TaskListFilter(limit=self.ROLLUP_PAGE_SIZE, after=after)
+            )
+            tasks.extend(page)
+            if len(page) < self.ROLLUP_PAGE_SIZE:
+                break
+            last = page[-1]
+            if last.created_at is None:  # tasks.created_at is NOT NULL
+                break
+            after = (last.created_at, last.id)
+        self.rollup.rebuild(tasks)
+
+        event_store = getattr(self.task_store, "event_store", None)
+        if isinstance(event_store, EventStore) and event_store is not self._subscribed_store:
+            event_store.subscribe(self.rollup.apply_event)
+            self._subscribed_store = event_store
+        logger.debug(f"Built task rollup with {len(self.rollup)} tasks")
+
+    def close(self) -> None:
+        """Stop following task events."""
+        if self._subscribed_store is not None and self.rollup is not None:
+            self._subscribed_store.unsubscribe(self.rollup.apply_event)
+            self._subscribed_store = None
+
+    async def _repository_counts(
+        self, repositories: list[str] | None = None
+    ) -> dict[str, RepositoryTaskCounts]:
+        """Grouped counts from the rollup if configured, else one SQL query."""
+        if self.rollup is None:
+            return await self.task_store.count_by_repository(repositories)
+        if not self.rollup.loaded:
+            await self.refresh_rollup()
+        return self.rollup.repository_counts(repositories)
+
+    async def aggregate_all(self, include_tasks: bool = True) -> AggregatedTasks:
         """Aggregate all tasks across all repositories.
 
+        Args:
+            include_tasks: Load the tasks themselves (up to 10,000). When
+                False only the counts are returned, from one grouped query.
+
         Returns:
             AggregatedTasks with all tasks and counts
         """
+        if not include_tasks:
+            return self._aggregate_counts(await self._repository_counts())
         tasks = await self.task_store.list(TaskListFilter(limit=10000))
         return self._build_aggregated_tasks(tasks)
 
@@ -262,35 +356,9 @@ class CrossRepoAggregator:
         Returns:
             AggregatedTasks with filtered tasks and counts
         """
-        task_filter = filter.to_task_filter()
-
-        # If filtering by repo names, we need to query each repo separately
-        if filter.repo_names:
-            all_tasks: list[Task] = []
-            for repo in filter.repo_names:
-                repo_filter = TaskListFilter(
-                    repository=repo,
-                    status=filter.status,
-                    priority=filter.priority,
-                    tags=filter.tags,
-                    limit=filter.limit,
-                    offset=filter.offset,
-                )
-                tasks = await self.task_store.list(repo_filter)
-                all_tasks.extend(tasks)
-
-            # Apply exclude_completed if needed
-            if filter.exclude_completed:
-                all_tasks = [t for t in all_tasks if t.status != TaskStatus.COMPLETED]
-
-            return self._build_aggregated_tasks(all_tasks[: filter.limit])
-
-        tasks = await self.task_store.list(task_filter)
-
-        # Apply exclude_completed if needed
-        if filter.exclude_completed:
-            tasks = [t for t in tasks if t.status != TaskStatus.COMPLETED]
-
+        # Repository names and exclude_completed are part of the query, so
+        # any number of repositories costs one round trip.
+        tasks = await self.task_store.list(filter.to_task_filter())
         return self._build_aggregated_tasks(tasks)
 
     async def aggregate_by_repository(self) -> dict[str, RepoTaskStats]:
@@ -299,8 +367,8 @@ class CrossRepoAggregator:
         Returns:
             Dictionary mapping repository name to RepoTaskStats
         """
-        tasks = await self.task_store.list(TaskListFilter(limit=10000))
-        return self._group_by_repository(tasks)
+        counts = await self._repository_counts()
+        return {repo: RepoTaskStats.from_counts(c) for repo, c in counts.items()}
 
     async def aggregate_by_status(self) -> dict[TaskStatus, list[Task]]:
         """Aggregate tasks grouped by status across repositories.
@@ -378,8 +446,10 @@ class CrossRepoAggregator:
         Returns:
             RepoTaskStats with detailed statistics
         """
-        tasks = await self.task_store.list(TaskListFilter(repository=repo_name, limit=10000))
-        return self._build_repo_stats(repo_name, tasks)
+        counts = (await self._repository_counts([repo_name])).get(repo_name)
+        if counts is None:
+            return RepoTaskStats(repo_name=repo_name, total_tasks=0)
+        return RepoTaskStats.from_counts(counts)
 
     async def get_summary(self) -> CrossRepoSummary:
         """Get a summary of tasks across all repositories.
@@ -387,25 +457,17 @@ class CrossRepoAggregator:
         Returns:
             CrossRepoSummary with overall statistics
         """
-        tasks = await self.task_store.list(TaskListFilter(limit=10000))
-        repo_stats = self._group_by_repository(tasks)
-
-        # Count by status
-        status_counts: dict[TaskStatus, int] = defaultdict(int)
-        priority_counts: dict[TaskPriority, int] = defaultdict(int)
-        critical_count = 0
-
-        for task in tasks:
-            status_counts[task.status] += 1
-            priority_counts[task.priority] += 1
+        counts = await self._repository_counts()
+        repo_stats = {repo: RepoTaskStats.from_counts(c) for repo, c in counts.items()}
 
-            # Critical = high priority + (blocked or in_progress)
-            if task.priority == TaskPriority.HIGH or task.priority == TaskPriority.CRITICAL:
-                if task.status in (TaskStatus.BLOCKED, TaskStatus.IN_PROGRESS):
-                    critical_count += 1
+        status_counts: Counter[TaskStatus] = Counter()
+        for repo_counts in counts.values():
+            status_counts.update(repo_counts.status_counts)
+        # Critical = high priority + (blocked or in_progress)
+        critical_count = sum(c.critical_count for c in counts.values())
 
         return CrossRepoSummary(
-            total_tasks=len(tasks),
+            total_tasks=sum(c.total for c in counts.values()),
             total_repos=len(repo_stats),
             pending_count=status_counts.get(TaskStatus.PENDING, 0),
             in_progress_count=status_counts.get(TaskStatus.IN_PROGRESS, 0),
@@ -472,50 +534,22 @@ class CrossRepoAggregator:
             tag_counts=dict(tag_counts),
         )
 
-    def _group_by_repository(self, tasks: list[Task]) -> dict[str, RepoTaskStats]:
-        """Group tasks by repository and build stats."""
-        repo_tasks: dict[str, list[Task]] = defaultdict(list)
-
-        for task in tasks:
-            repo_tasks[task.repository].append(task)
-
-        return {repo: self._build_repo_stats(repo, tasks) for repo, tasks in repo_tasks.items()}
+    def _aggregate_counts(self, counts: dict[str, RepositoryTaskCounts]) -> AggregatedTasks:
+        """Build a counts-only AggregatedTasks from grouped repository counts."""
+        status_counts: Counter[TaskStatus] = Counter()
+        priority_counts: Counter[TaskPriority] = Counter()
+        tag_counts: Counter[str] = Counter()
+        for repo_counts in counts.values():
+            status_counts.update(repo_counts.status_counts)
+            priority_counts.update(repo_counts.priority_counts)
+            tag_counts.update(repo_counts.tag_counts)
 
-    def _build_repo_stats(self, repo_name: str, tasks: list[Task]) -> RepoTaskStats:
-        """Build RepoTaskStats from a list of tasks for a repository."""
-        status_counts: dict[TaskStatus, int] = defaultdict(int)
-        priority_counts: dict[TaskPriority, int] = defaultdict(int)
-        tag_counts: dict[str, int] = defaultdict(int)
-        blocked_tasks: list[str] = []
-        oldest_pending: datetime | None = None
-        newest_task: datetime | None = None
-
-        for task in tasks:
-            status_counts[task.status] += 1
-            priority_counts[task.priority] += 1
-            for tag in task.tags:
-                tag_counts[tag] += 1
-
-            if task.status == TaskStatus.BLOCKED:
-                blocked_tasks.append(task.id)
-
-            if task.status == TaskStatus.PENDING and task.created_at:
-                if oldest_pending is None or task.created_at < oldest_pending:
-                    oldest_pending = task.created_at
-
-            if task.created_at:
-                if newest_task is None or task.created_at > newest_task:
-                    newest_task = task.created_at
-
-        return RepoTaskStats(
-            repo_name=repo_name,
-            total_tasks=len(tasks),
+        return AggregatedTasks(
+            total_count=sum(c.total for c in counts.values()),
+            repo_counts={repo: c.total for repo, c in counts.items()},
             status_counts=dict(status_counts),
             priority_counts=dict(priority_counts),
             tag_counts=dict(tag_counts),
-            blocked_tasks=blocked_tasks,
-            oldest_pending=oldest_pending,
-            newest_task=newest_task,
         )
 
 
@@ -6,6 +6,14 @@ Provides search capabilities across multiple repositories:
 - Combined filtering with search
 - Search result ranking and highlighting
 
+Text search runs against an in-memory ``TaskSearchIndex`` (inverted index
+with BM25F ranking and a prefix trie). The index is built from
+``TaskStore`` once and then kept current from ``EventStore`` task events:
+events appended in this process arrive through a subscription, and a
+catch-up poll of ``task_events`` picks up those appended by other
+processes. Returned tasks are hydrated from ``TaskStore`` so they carry
+the full row (metadata, due date, assignee) rather than the index copy.
+
 Usage:
     from mahavishnu.core.cross_repo_search import CrossRepoSearch, SearchCriteria
 
@@ -27,11 +35,16 @@ Usage:
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
 from enum import StrEnum
 import logging
 import re
+import time
 from typing import Any, ClassVar
 
+from mahavishnu.core.errors import ValidationError
+from mahavishnu.core.event_store import EventStore
+from mahavishnu.core.task_search_index import INDEXED_FIELDS, TaskSearchIndex, tokenize
 from mahavishnu.core.task_store import Task, TaskListFilter, TaskPriority, TaskStatus, TaskStore
 
 logger = logging.getLogger(__name__)
@@ -56,7 +69,8 @@ class SearchCriteria:
         statuses: Filter to specific statuses
         priorities: Filter to specific priorities
         tags: Filter to tasks with these tags
-        search_fields: Fields to search in (default: all text fields)
+        search_fields: Fields to search in, a subset of title, description
+            and tags (default: all three)
         limit: Maximum number of results
         min_score: Minimum relevance score (0.0 to 1.0)
     """
@@ -159,19 +173,112 @@ class CrossRepoSearch:
         "description": 1.0,  # Description matches are baseline
     }
 
+    # Upper bound on tasks loaded when the index is first built
+    INDEX_LOAD_LIMIT: ClassVar[int] = 10000
+
+    # Raw BM25F scores are unbounded; map them onto 0.0-1.0 via
+    # score / (score + SCORE_SATURATION) so min_score stays meaningful.
+    SCORE_SATURATION: ClassVar[float] = 1.0
+
+    # Seconds between catch-up polls of task_events made by searches
+    CATCH_UP_INTERVAL: ClassVar[float] = 5.0
+    # Polls re-read this window before the newest seen event, so events
+    # committed late with an earlier timestamp are not skipped
+    CATCH_UP_OVERLAP: ClassVar[timedelta] = timedelta(seconds=30)
+    CATCH_UP_BATCH: ClassVar[int] = 1000
+
     def __init__(
         self,
         task_store: TaskStore,
         vector_search: Any = None,  # Optional VectorSearch for semantic search
+        index: TaskSearchIndex | None = None,
     ) -> None:
         """Initialize the search.
 
         Args:
             task_store: TaskStore instance for task queries
             vector_search: Optional VectorSearch for semantic search
+            index: Optional pre-built index (built lazily from task_store
+                otherwise)
         """
         self.task_store = task_store
         self.vector_search = vector_search
+        self.index = index or TaskSearchIndex(field_weights=self.FIELD_WEIGHTS)
+        self._subscribed_store: EventStore | None = None
+        self._loaded_at: datetime | None = None
+        self._last_poll = 0.0
+
+    def _event_store(self) -> EventStore | None:
+        event_store = getattr(self.task_store, "event_store", None)
+        return event_store if isinstance(event_store, EventStore) else None
+
+    async def _ensure_index(self) -> TaskSearchIndex:
+        """Build the index on first use, then poll for other processes' events."""
+        if not self.index.loaded:
+            await self.refresh_index()
+        elif time.monotonic() - self._last_poll >= self.CATCH_UP_INTERVAL:
+            try:
+                await self.catch_up()
+            except Exception as e:  # noqa: BLE001 - a failed poll leaves the index usable
+                logger.warning(f"Task search index catch-up failed: {e}")
+        return self.index
+
+    async def refresh_index(self) -> None:
+        """Rebuild the index from the task store.
+
+        Only needed when task changes bypass the ``EventStore``; otherwise
+        the index is maintained incrementally from appended events.
+        """
+        loaded_at = datetime.now(UTC)
+        tasks = await self.task_store.list(TaskListFilter(limit=self.INDEX_LOAD_LIMIT))
+        self.index.rebuild(tasks)
+        self._loaded_at = loaded_at
+        self._last_poll = time.monotonic()
+
+        event_store = self._event_store()
+        if event_store is not None and event_store is not self._subscribed_store:
+            event_store.subscribe(self.index.apply_event)
+            self._subscribed_store = event_store
+        logger.debug(f"Built task search index with {len(self.index)} tasks")
+
+    async def catch_up(self) -> int:
+        """Apply task events appended since the newest one the index has seen.
+
+        Reads ``task_events`` from ``CATCH_UP_OVERLAP`` before that event (or
+        before the index load) in replay order; events the index already
+        applied are skipped by id.
+
+        Returns:
+            Number of events that were new to the index
+        """
+        self._last_poll = time.monotonic()
+        event_store = self._event_store()
+        if event_store is None or self._loaded_at is None:
+            return 0
+
+        since = self._loaded_at
+        if self.index.last_event is not None:
+            since = max(since, self.index.last_event[0])
+        occurred_at, event_id = since - self.CATCH_UP_OVERLAP, None
+
+        applied = 0
+        while True:
+            events = await event_store.get_events_after(
+                occurred_at, event_id, limit=self.CATCH_UP_BATCH
+            )
+            applied += sum(self.index.apply_event(event) for event in events)
+            if len(events) < self.CATCH_UP_BATCH:
+                break
+            occurred_at, event_id = events[-1].occurred_at, events[-1].id
+        if applied:
+            logger.debug(f"Task search index caught up on {applied} events")
+        return applied
+
+    def close(self) -> None:
+        """Stop following task events."""
+        if self._subscribed_store is not None:
+            self._subscribed_store.unsubscribe(self.index.apply_event)
+            self._subscribed_store = None
 
     async def search(self, criteria: SearchCriteria) -> list[SearchResult]:
         """Search for tasks matching the criteria.
@@ -181,17 +288,26 @@ class CrossRepoSearch:
 
         Returns:
             List of SearchResult ranked by relevance
+
+        Raises:
+            ValidationError: If ``search_fields`` names a field that is not indexed
         """
-        # Fetch candidate tasks
-        tasks = await self._fetch_candidate_tasks(criteria)
+        unknown = sorted(set(criteria.search_fields or ()) - set(INDEXED_FIELDS))
+        if unknown:
+            raise ValidationError(
+                f"Unsupported search fields: {', '.join(unknown)}",
+                details={"fields": unknown, "supported": list(INDEXED_FIELDS)},
+            )
+
+        await self._ensure_index()
 
         # Apply search
         if criteria.search_type == SearchType.SEMANTIC and self.vector_search:
-            results = await self._semantic_search(tasks, criteria)
+            results = await self._semantic_search(criteria)
         elif criteria.search_type == SearchType.HYBRID and self.vector_search:
-            results = await self._hybrid_search(tasks, criteria)
+            results = await self._hybrid_search(criteria)
         else:
-            results = await self._text_search(tasks, criteria)
+            results = await self._text_search(criteria)
 
         # Apply post-search filters
         results = self._apply_filters(results, criteria)
@@ -203,32 +319,32 @@ class CrossRepoSearch:
         if criteria.min_score > 0:
             results = [r for r in results if r.overall_score >= criteria.min_score]
 
-        # Apply limit
-        return results[: criteria.limit]
-
-    async def _fetch_candidate_tasks(self, criteria: SearchCriteria) -> list[Task]:
-        """Fetch candidate tasks for searching."""
-        # For now, fetch all tasks and filter in-memory
-        # In production, this would use more efficient queries
-        task_filter = TaskListFilter(limit=10000)
-
-        if criteria.statuses and len(criteria.statuses) == 1:
-            task_filter.status = criteria.statuses[0]
-
-        if criteria.priorities and len(criteria.priorities) == 1:
-            task_filter.priority = criteria.priorities[0]
-
-        if criteria.tags and len(criteria.tags) == 1:
-            task_filter.tags = criteria.tags
-
-        return await self.task_store.list(task_filter)
+        # Apply limit, then hydrate and highlight only what is returned
+        results = await self._hydrate(results[: criteria.limit], criteria)
+        self._attach_matches(results, criteria)
+        return results
 
-    async def _text_search(
-        self,
-        tasks: list[Task],
-        criteria: SearchCriteria,
+    async def _hydrate(
+        self, results: list[SearchResult], criteria: SearchCriteria
     ) -> list[SearchResult]:
-        """Perform full-text search."""
+        """Swap index copies for the stored tasks, dropping tasks deleted meanwhile."""
+        if not results:
+            return results
+        ids = [result.task.id for result in results]
+        stored = {
+            task.id: task
+            for task in await self.task_store.list(TaskListFilter(ids=ids, limit=len(ids)))
+        }
+        hydrated = []
+        for result in results:
+            task = stored.get(result.task.id)
+            if task is not None:
+                result.task = task
+                hydrated.append(result)
+        return self._apply_filters(hydrated, criteria)
+
+    async def _text_search(self, criteria: SearchCriteria) -> list[SearchResult]:
+        """Perform full-text search against the inverted index."""
         if not criteria.query:
             # Empty query returns all tasks with neutral score
             return [
@@ -238,59 +354,51 @@ class CrossRepoSearch:
                     overall_score=0.5,
                     search_type=SearchType.TEXT,
                 )
-                for task in tasks
+                for task in self.index.tasks()
             ]
 
-        results: list[SearchResult] = []
+        hits = self.index.search(
+            criteria.query,
+            fields=criteria.search_fields or self.DEFAULT_SEARCH_FIELDS,
+        )
+        return [
+            SearchResult(
+                task=hit.task,
+                matches=[],
+                overall_score=hit.score / (hit.score + self.SCORE_SATURATION),
+                search_type=SearchType.TEXT,
+            )
+            for hit in hits
+        ]
+
+    def _attach_matches(self, results: list[SearchResult], criteria: SearchCriteria) -> None:
+        """Fill in highlighted field matches for the returned results."""
+        terms = self._parse_query(criteria.query) if criteria.query else []
+        if not terms:
+            return
         search_fields = criteria.search_fields or self.DEFAULT_SEARCH_FIELDS
-
-        # Parse query into terms
-        terms = self._parse_query(criteria.query)
-
-        for task in tasks:
-            matches: list[SearchMatch] = []
-
+        for result in results:
+            if result.matches:
+                continue
             for field_name in search_fields:
-                field_value = self._get_field_value(task, field_name)
+                field_value = self._get_field_value(result.task, field_name)
                 if field_value:
                     match = self._find_matches(field_name, field_value, terms)
                     if match:
-                        matches.append(match)
-
-            if matches:
-                # Calculate overall score
-                score = self._calculate_score(matches)
-                results.append(
-                    SearchResult(
-                        task=task,
-                        matches=matches,
-                        overall_score=score,
-                        search_type=SearchType.TEXT,
-                    )
-                )
-
-        return results
+                        result.matches.append(match)
 
-    async def _semantic_search(
-        self,
-        tasks: list[Task],
-        criteria: SearchCriteria,
-    ) -> list[SearchResult]:
+    async def _semantic_search(self, criteria: SearchCriteria) -> list[SearchResult]:
         """Perform semantic search using vector embeddings."""
         # Placeholder for semantic search implementation
         # Would use self.vector_search to find similar tasks
         # For now, fall back to text search
-        return await self._text_search(tasks, criteria)
+        return await self._text_search(criteria)
 
-    async def _hybrid_search(
-        self,
-        tasks: list[Task],
-        criteria: SearchCriteria,
-    ) -> list[SearchResult]:
+    async def _hybrid_search(self, criteria: SearchCriteria) -> list[SearchResult]:
         """Perform hybrid search combining text and semantic."""
         # Get results from both methods
-        text_results = await self._text_search(tasks, criteria)
-        semantic_results = await self._semantic_search(tasks, criteria)
+        text_results = await self._text_search(criteria)
+        semantic_results = await self._semantic_search(criteria)
 
         # Merge and re-rank
         merged: dict[str, SearchResult] = {}
@@ -319,9 +427,8 @@ class CrossRepoSearch:
 
     def _parse_query(self, query: str) -> list[str]:
         """Parse query into search terms."""
-        # Simple tokenization - split on whitespace and remove punctuation
-        terms = re.findall(r"\b\w+\b", query.lower())
-        return [t for t in terms if len(t) >= 2]  # Ignore very short terms
+        # Same tokenizer as the index; ignores very short terms
+        return tokenize(query)
 
     def _get_field_value(self, task: Task, field: str) -> str:
         """Get the string value of a task field."""
@@ -413,21 +520,6 @@ class CrossRepoSearch:
 
         return highlighted
 
-    def _calculate_score(self, matches: list[SearchMatch]) -> float:
-        """Calculate overall score from field matches."""
-        if not matches:
-            return 0.0
-
-        weighted_sum = 0.0
-        total_weight = 0.0
-
-        for match in matches:
-            weight = self.FIELD_WEIGHTS.get(match.field, 1.0)
-            weighted_sum += match.score * weight
-            total_weight += weight
-
-        return weighted_sum / total_weight if total_weight > 0 else 0.0
-
     def _apply_filters(
         self,
         results: list[SearchResult],
@@ -464,24 +556,8 @@ class CrossRepoSearch:
         Returns:
             List of suggested completions
         """
-        tasks = await self.task_store.list(TaskListFilter(limit=1000))
-
-        # Collect all words from titles and tags
-        words: set[str] = set()
-        for task in tasks:
-            # Add title words
-            words.update(w.lower() for w in task.title.split() if len(w) >= 3)
-            # Add tags
-            words.update(t.lower() for t in task.tags)
-
-        # Find words that start with partial
-        partial_lower = partial.lower()
-        matches = [w for w in words if w.startswith(partial_lower)]
-
-        # Sort by length (shorter = better suggestion)
-        matches.sort()
-
-        return matches[:limit]
+        index = await self._ensure_index()
+        return index.complete(partial, limit)
 
 
 __all__ = [
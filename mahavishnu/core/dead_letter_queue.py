@@ -9,6 +9,9 @@ Key Features:
 - Configurable retry policies (never, linear, exponential, immediate)
 - Automatic retry with exponential backoff
 - Persistent queue storage (OpenSearch + in-memory fallback)
+- Due-time min-heap scheduler with an id→task index (O(log n) per retry)
+- Bounded concurrent retry workers with per-adapter concurrency limits
+- Batched OpenSearch state updates through the bulk API
 - Circuit breaker integration
 - Observability and metrics
 - Manual reprocessing capabilities
@@ -40,6 +43,8 @@ import contextlib
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 from enum import StrEnum
+import heapq
+import itertools
 import logging
 from typing import TYPE_CHECKING, Any
 
@@ -164,6 +169,10 @@ class FailedTask:
         )
 
 
+DEFAULT_MAX_CONCURRENT_RETRIES = 16
+DEFAULT_ADAPTER_KEY = "default"
+
+
 class DeadLetterQueue:
     """Dead Letter Queue for failed workflow reprocessing.
 
@@ -174,6 +183,16 @@ class DeadLetterQueue:
     - Manual reprocessing and inspection capabilities
     - Full observability and metrics
 
+    Scheduling: tasks live in an id→task index and their due times in a
+    min-heap (lazy deletion via per-task tokens), so a processor cycle
+    costs O(k log n) for k due tasks rather than a scan of the whole
+    queue. Due tasks are dispatched concurrently, bounded by
+    ``max_concurrent_retries`` overall and ``adapter_concurrency`` per
+    adapter (``metadata["adapter"]``). The processor sleeps until the
+    earliest due time (capped at ``check_interval_seconds``) instead of a
+    fixed tick, and a failed retry is never re-attempted within the same
+    processor interval.
+
     Example:
         >>> dlq = DeadLetterQueue(max_size=10000)
         >>>
@@ -204,6 +223,8 @@ class DeadLetterQueue:
         observability_manager: Any = None,
         *,
         fail_on_opensearch_unavailable: bool = False,
+        max_concurrent_retries: int = DEFAULT_MAX_CONCURRENT_RETRIES,
+        adapter_concurrency: dict[str, int] | None = None,
     ):
         """Initialize the Dead Letter Queue.
 
@@ -218,12 +239,33 @@ class DeadLetterQueue:
                 fallback (back-compat). Mirrors the
                 ``dlq.fail_on_opensearch_unavailable`` setting in
                 ``MahavishnuSettings``.
+            max_concurrent_retries: Upper bound on retry callbacks running at
+                once across all adapters.
+            adapter_concurrency: Optional per-adapter limits keyed by
+                ``metadata["adapter"]``. Adapters not listed share the
+                global limit.
         """
         self._max_size = max_size
         self._opensearch: Any = opensearch_client
         self._observability = observability_manager
         self._fail_on_opensearch_unavailable = fail_on_opensearch_unavailable
-        self._queue: list[FailedTask] = []
+        # id → task index (insertion ordered) plus a due-time min-heap of
+        # (due_ts, token, task_id). A heap entry is live only while its
+        # token matches ``_heap_tokens[task_id]``.
+        self._tasks: dict[str, FailedTask] = {}
+        self._due_heap: list[tuple[float, int, str]] = []
+        self._heap_tokens: dict[str, int] = {}
+        self._token_counter = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._max_concurrent_retries = max(1, max_concurrent_retries)
+        self._adapter_concurrency = dict(adapter_concurrency or {})
+        self._retry_slots = asyncio.Semaphore(self._max_concurrent_retries)
+        self._adapter_slots: dict[str, asyncio.Semaphore] = {}
+        # In-flight retries plus outcomes waiting for one bulk write.
+        self._inflight: set[asyncio.Task] = set()
+        self._outcome_updates: list[FailedTask] = []
+        self._outcome_deletes: list[str] = []
+        self._outcome_flush: asyncio.Task | None = None
         self._metrics: DLQMetrics | None = None  # lazy: get_dlq_metrics() on first use
         self._lock = asyncio.Lock()
         self._retry_task: asyncio.Task | None = None
@@ -255,6 +297,70 @@ class DeadLetterQueue:
             self._metrics = get_dlq_metrics()
         return self._metrics
 
+    @property
+    def _queue(self) -> list[FailedTask]:
+        """Snapshot of queued tasks in enqueue order (read-only view)."""
+        return list(self._tasks.values())
+
+    def _schedule(self, failed_task: FailedTask, due: datetime | None) -> None:
+        """(Re)schedule ``failed_task`` at ``due``; ``None`` unschedules it."""
+        if due is None:
+            self._heap_tokens.pop(failed_task.task_id, None)
+            return
+        token = next(self._token_counter)
+        self._heap_tokens[failed_task.task_id] = token
+        heapq.heappush(self._due_heap, (due.timestamp(), token, failed_task.task_id))
+        self._wakeup.set()
+
+    def _unschedule(self, task_id: str) -> None:
+        self._heap_tokens.pop(task_id, None)
+
+    def _remove_task(self, failed_task: FailedTask) -> None:
+        """Drop ``failed_task`` from the index if it is still the live entry."""
+        if self._tasks.get(failed_task.task_id) is failed_task:
+            del self._tasks[failed_task.task_id]
+            self._unschedule(failed_task.task_id)
+
+    def _pop_due_tasks(self, now: datetime) -> list[FailedTask]:
+        """Pop every live heap entry due at ``now`` that is eligible for retry."""
+        now_ts = now.timestamp()
+        due: list[FailedTask] = []
+        while self._due_heap and self._due_heap[0][0] <= now_ts:
+            _, token, task_id = heapq.heappop(self._due_heap)
+            if self._heap_tokens.get(task_id) != token:
+                continue  # stale entry: rescheduled or removed since push
+            del self._heap_tokens[task_id]
+            task = self._tasks.get(task_id)
+            if (
+                task is not None
+                and task.next_retry_at is not None
+                and task.status == DeadLetterStatus.PENDING
+                and task.retry_count < task.max_retries
+            ):
+                due.append(task)
+        return due
+
+    def _seconds_until_next_due(self) -> float | None:
+        """Seconds until the earliest live heap entry, or ``None`` if empty."""
+        while self._due_heap:
+            due_ts, token, task_id = self._due_heap[0]
+            if self._heap_tokens.get(task_id) == token:
+                return max(0.0, due_ts - datetime.now(UTC).timestamp())
+            heapq.heappop(self._due_heap)
+        return None
+
+    def _adapter_key(self, failed_task: FailedTask) -> str:
+        adapter = failed_task.metadata.get("adapter") or failed_task.task.get("adapter")
+        return str(adapter) if adapter else DEFAULT_ADAPTER_KEY
+
+    def _adapter_slot(self, adapter: str) -> asyncio.Semaphore:
+        slot = self._adapter_slots.get(adapter)
+        if slot is None:
+            limit = self._adapter_concurrency.get(adapter, self._max_concurrent_retries)
+            slot = asyncio.Semaphore(max(1, limit))
+            self._adapter_slots[adapter] = slot
+        return slot
+
     def _calculate_next_retry(self, policy: RetryPolicy, retry_count: int) -> datetime | None:
         """Calculate the next retry timestamp based on policy.
 
@@ -323,7 +429,7 @@ class DeadLetterQueue:
         """
         async with self._lock:
             # Check queue size
-            if len(self._queue) >= self._max_size:
+            if len(self._tasks) >= self._max_size:
                 self._logger.error(f"Dead letter queue is full (max_size={self._max_size})")
                 raise ValueError(
                     f"Dead letter queue is full (max_size={self._max_size}). "
@@ -372,15 +478,17 @@ class DeadLetterQueue:
                     raise
                 # If we reach here, the strict persist returned cleanly,
                 # which (given strict=True) means "persisted".
-                self._queue.append(failed_task)
+                self._tasks[task_id] = failed_task
+                self._schedule(failed_task, failed_task.next_retry_at)
                 self._stats["enqueued_total"] += 1
                 if persist_outcome == "persisted":
                     self._get_metrics().record_persisted()
                 # (strict=True can't return the in_memory_* outcomes — it
                 # would have raised ExternalServiceError instead.)
             else:
-                # Legacy silent-fallback path (byte-for-byte unchanged).
-                self._queue.append(failed_task)
+                # Legacy silent-fallback path.
+                self._tasks[task_id] = failed_task
+                self._schedule(failed_task, failed_task.next_retry_at)
                 self._stats["enqueued_total"] += 1
                 persist_outcome = await self._persist_task(failed_task)
                 if persist_outcome == "persisted":
@@ -502,7 +610,7 @@ class DeadLetterQueue:
             self._logger.error(f"Failed to persist task to OpenSearch: {e}")
             return "in_memory_write_failed"
         return "persisted"
-        # In-memory storage is already handled by _queue list
+        # In-memory storage is already handled by the _tasks index
 
     async def _update_task_persistence(self, failed_task: FailedTask) -> None:
         """Update persisted task in OpenSearch.
@@ -520,6 +628,35 @@ class DeadLetterQueue:
             except Exception as e:  # noqa: BLE001 - boundary handler catches all errors to keep calling code alive
                 self._logger.error(f"Failed to update task in OpenSearch: {e}")
 
+    async def _bulk_persist(
+        self,
+        updates: list[FailedTask] | None = None,
+        deletes: list[str] | None = None,
+    ) -> None:
+        """Apply many task updates/deletes to OpenSearch in one bulk request.
+
+        Args:
+            updates: Tasks whose current state should be written
+            deletes: IDs of tasks to remove from the index
+        """
+        if not (self._opensearch and OPENSEARCH_AVAILABLE):
+            return
+        body: list[dict[str, Any]] = []
+        for failed_task in updates or []:
+            body.append({"update": {"_index": "mahavishnu_dlq", "_id": failed_task.task_id}})
+            body.append({"doc": failed_task.to_dict()})
+        for task_id in deletes or []:
+            body.append({"delete": {"_index": "mahavishnu_dlq", "_id": task_id}})
+        if not body:
+            return
+        try:
+            response = await self._opensearch.bulk(body=body)
+        except Exception as e:  # noqa: BLE001 - boundary handler catches all errors to keep calling code alive
+            self._logger.error(f"Failed to bulk update {len(body)} DLQ actions in OpenSearch: {e}")
+            return
+        if isinstance(response, dict) and response.get("errors"):
+            self._logger.error("OpenSearch bulk update reported per-item errors for DLQ tasks")
+
     async def start_retry_processor(
         self,
         callback: Callable[[dict[str, Any], list[str]], Any],
@@ -554,7 +691,7 @@ class DeadLetterQueue:
             while self._is_running:
                 try:
                     await self._process_ready_tasks(callback)
-                    await asyncio.sleep(self._retry_interval_seconds)
+                    await self._wait_for_next_due()
                 except Exception:
                     self._logger.exception("Error in retry processor loop")
                     # Wait before retrying to avoid tight error loop
@@ -563,10 +700,23 @@ class DeadLetterQueue:
         self._retry_task = asyncio.create_task(retry_loop())
         self._logger.info(f"Started DLQ retry processor (check_interval={check_interval_seconds}s)")
 
+    async def _wait_for_next_due(self) -> None:
+        """Sleep until the earliest due task, an enqueue, or the check interval."""
+        self._wakeup.clear()
+        delay = float(self._retry_interval_seconds)
+        until_due = self._seconds_until_next_due()
+        if until_due is not None:
+            delay = min(delay, until_due)
+        if delay <= 0:
+            await asyncio.sleep(0)
+            return
+        with contextlib.suppress(TimeoutError):
+            await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+
     async def stop_retry_processor(self) -> None:
         """Stop the background retry processor.
 
-        Waits for the current retry cycle to complete before stopping.
+        Waits for in-flight retries to complete before stopping.
         """
         if not self._is_running:
             return
@@ -579,122 +729,159 @@ class DeadLetterQueue:
                 await self._retry_task
 
         self._retry_task = None
+        await self.wait_for_retries()
         self._logger.info("Stopped DLQ retry processor")
 
     async def _process_ready_tasks(
         self, callback: Callable[[dict[str, Any], list[str]], Any]
     ) -> None:
-        """Process all tasks ready for retry.
+        """Dispatch all tasks due for retry without waiting for them.
+
+        Due tasks are popped from the heap and marked RETRYING under the
+        lock and their state is written in one bulk request. Each retry
+        then runs as its own task, bounded only by the per-adapter and
+        global slots, so a slow retry never holds back tasks that fall due
+        later. Outcomes finishing together are written back in one bulk
+        request.
 
         Args:
             callback: Function to call for retry attempts
         """
         async with self._lock:
-            now = datetime.now(UTC)
-            tasks_to_retry = [
-                task
-                for task in self._queue
-                if task.next_retry_at
-                and task.next_retry_at <= now
-                and task.status == DeadLetterStatus.PENDING
-                and task.retry_count < task.max_retries
-            ]
-
+            tasks_to_retry = self._pop_due_tasks(datetime.now(UTC))
             if not tasks_to_retry:
                 return
+            for failed_task in tasks_to_retry:
+                failed_task.status = DeadLetterStatus.RETRYING
 
             self._logger.info(f"Processing {len(tasks_to_retry)} tasks ready for retry")
 
-        # Process tasks outside the lock to avoid blocking
-        for failed_task in tasks_to_retry:
-            try:
-                # Update status to retrying
-                failed_task.status = DeadLetterStatus.RETRYING
-                await self._update_task_persistence(failed_task)
+        await self._bulk_persist(updates=tasks_to_retry)
 
-                # Attempt retry
-                await callback(failed_task.task, failed_task.repos)
+        for failed_task in tasks_to_retry:
+            retry = asyncio.create_task(self._retry_and_record(callback, failed_task))
+            self._inflight.add(retry)
+            retry.add_done_callback(self._inflight.discard)
+
+    async def wait_for_retries(self) -> None:
+        """Wait until every dispatched retry has finished and been persisted."""
+        while self._inflight:
+            await asyncio.gather(*self._inflight, return_exceptions=True)
+        if self._outcome_flush is not None:
+            await self._outcome_flush
+
+    async def _retry_and_record(
+        self,
+        callback: Callable[[dict[str, Any], list[str]], Any],
+        failed_task: FailedTask,
+    ) -> None:
+        """Run one retry and queue its outcome for the next bulk write."""
+        if await self._run_retry(callback, failed_task):
+            self._outcome_deletes.append(failed_task.task_id)
+        else:
+            self._outcome_updates.append(failed_task)
+        if self._outcome_flush is None:
+            self._outcome_flush = asyncio.create_task(self._flush_outcomes())
+
+    async def _flush_outcomes(self) -> None:
+        """Write queued retry outcomes, batching those that finish together."""
+        try:
+            while self._outcome_updates or self._outcome_deletes:
+                updates, self._outcome_updates = self._outcome_updates, []
+                deletes, self._outcome_deletes = self._outcome_deletes, []
+                await self._bulk_persist(updates=updates, deletes=deletes)
+        finally:
+            self._outcome_flush = None
+
+    async def _run_retry(
+        self,
+        callback: Callable[[dict[str, Any], list[str]], Any],
+        failed_task: FailedTask,
+    ) -> bool:
+        """Run one retry under the per-adapter and global limits.
 
-                # Success! Remove from queue
-                async with self._lock:
-                    if failed_task in self._queue:
-                        self._queue.remove(failed_task)
+        The adapter slot is taken first, so retries queued behind a
+        throttled adapter do not hold global slots other adapters need.
 
-                failed_task.status = DeadLetterStatus.COMPLETED
-                await self._update_task_persistence(failed_task)
+        Returns:
+            True when the callback succeeded and the task was removed.
+        """
+        try:
+            async with self._adapter_slot(self._adapter_key(failed_task)), self._retry_slots:
+                await callback(failed_task.task, failed_task.repos)
+        except Exception as e:  # noqa: BLE001 - boundary handler catches all errors to keep calling code alive
+            async with self._lock:
+                self._record_retry_failure(failed_task, e)
+            self._stats["retry_failed"] += 1
+            self._logger.warning(
+                f"Retry {failed_task.retry_count} failed for task {failed_task.task_id}: {e}"
+            )
+            return False
 
-                self._stats["retry_success"] += 1
+        # Success! Remove from queue
+        async with self._lock:
+            self._remove_task(failed_task)
+        failed_task.status = DeadLetterStatus.COMPLETED
+        self._stats["retry_success"] += 1
+
+        self._logger.info(f"Successfully retried task {failed_task.task_id}")
+
+        # Record success metrics
+        if self._observability:
+            self._observability.log_info(
+                "Task retry succeeded",
+                attributes={
+                    "task_id": failed_task.task_id,
+                    "retry_count": failed_task.retry_count + 1,
+                    "total_attempts": failed_task.total_attempts + 1,
+                },
+            )
+        return True
 
-                self._logger.info(f"Successfully retried task {failed_task.task_id}")
+    def _record_retry_failure(self, failed_task: FailedTask, error: Exception) -> None:
+        """Update a task after a failed retry; caller holds ``self._lock``."""
+        if self._tasks.get(failed_task.task_id) is not failed_task:
+            return
+        failed_task.retry_count += 1
+        failed_task.total_attempts += 1
+        failed_task.last_error = str(error)
+
+        if failed_task.retry_count >= failed_task.max_retries:
+            failed_task.status = DeadLetterStatus.EXHAUSTED
+            self._unschedule(failed_task.task_id)
+            self._stats["exhausted"] += 1
+
+            self._logger.error(
+                f"Task {failed_task.task_id} exhausted all retries "
+                f"({failed_task.retry_count}/{failed_task.max_retries})"
+            )
 
-                # Record success metrics
-                if self._observability:
-                    self._observability.log_info(
-                        "Task retry succeeded",
-                        attributes={
-                            "task_id": failed_task.task_id,
-                            "retry_count": failed_task.retry_count + 1,
-                            "total_attempts": failed_task.total_attempts + 1,
-                        },
-                    )
+            # Record exhausted metrics
+            if self._observability:
+                self._observability.log_error(
+                    "Task retries exhausted",
+                    attributes={
+                        "task_id": failed_task.task_id,
+                        "retry_count": failed_task.retry_count,
+                        "max_retries": failed_task.max_retries,
+                        "final_error": str(error)[:200],
+                    },
+                )
+            return
 
-                # Remove from OpenSearch
-                await self._remove_from_persistence(failed_task.task_id)
+        failed_task.next_retry_at = self._calculate_next_retry(
+            failed_task.retry_policy, failed_task.retry_count
+        )
+        failed_task.status = DeadLetterStatus.PENDING
+        self._schedule_after_failure(failed_task)
 
-            except Exception as e:  # noqa: BLE001 - boundary handler catches all errors to keep calling code alive
-                # Retry failed again - increment retry count
-                async with self._lock:
-                    if failed_task in self._queue:
-                        index = self._queue.index(failed_task)
-                        new_retry_count = failed_task.retry_count + 1
-                        new_total_attempts = failed_task.total_attempts + 1
-
-                        # Check if retries exhausted
-                        if new_retry_count >= failed_task.max_retries:
-                            # Mark as exhausted
-                            updated_task = failed_task
-                            updated_task.retry_count = new_retry_count
-                            updated_task.total_attempts = new_total_attempts
-                            updated_task.status = DeadLetterStatus.EXHAUSTED
-                            updated_task.last_error = str(e)
-                            self._queue[index] = updated_task
-                            self._stats["exhausted"] += 1
-
-                            self._logger.error(
-                                f"Task {failed_task.task_id} exhausted all retries "
-                                f"({new_retry_count}/{failed_task.max_retries})"
-                            )
-
-                            # Record exhausted metrics
-                            if self._observability:
-                                self._observability.log_error(
-                                    "Task retries exhausted",
-                                    attributes={
-                                        "task_id": failed_task.task_id,
-                                        "retry_count": new_retry_count,
-                                        "max_retries": failed_task.max_retries,
-                                        "final_error": str(e)[:200],
-                                    },
-                                )
-                        else:
-                            # Calculate next retry time
-                            updated_task = failed_task
-                            updated_task.retry_count = new_retry_count
-                            updated_task.total_attempts = new_total_attempts
-                            updated_task.next_retry_at = self._calculate_next_retry(
-                                failed_task.retry_policy, new_retry_count
-                            )
-                            updated_task.last_error = str(e)
-                            updated_task.status = DeadLetterStatus.PENDING
-                            self._queue[index] = updated_task
-
-                        await self._update_task_persistence(updated_task)
-
-                self._stats["retry_failed"] += 1
-
-                self._logger.warning(
-                    f"Retry {failed_task.retry_count + 1} failed for task {failed_task.task_id}: {e}"
-                )
+    def _schedule_after_failure(self, failed_task: FailedTask) -> None:
+        """Reschedule no earlier than the next processor interval."""
+        if failed_task.next_retry_at is None:
+            self._unschedule(failed_task.task_id)
+            return
+        floor = datetime.now(UTC) + timedelta(seconds=self._retry_interval_seconds)
+        self._schedule(failed_task, max(failed_task.next_retry_at, floor))
 
     async def _remove_from_persistence(self, task_id: str) -> None:
         """Remove task from persistent storage.
@@ -725,12 +912,7 @@ class DeadLetterQueue:
             ValueError: If task not found in queue
         """
         async with self._lock:
-            # Find task in queue
-            failed_task = None
-            for task in self._queue:
-                if task.task_id == task_id:
-                    failed_task = task
-                    break
+            failed_task = self._tasks.get(task_id)
 
             if not failed_task:
                 raise ValueError(f"Task {task_id} not found in dead letter queue")
@@ -748,8 +930,7 @@ class DeadLetterQueue:
 
             # Success - remove from queue
             async with self._lock:
-                if failed_task in self._queue:
-                    self._queue.remove(failed_task)
+                self._remove_task(failed_task)
 
             failed_task.status = DeadLetterStatus.COMPLETED
             await self._update_task_persistence(failed_task)
@@ -767,15 +948,13 @@ class DeadLetterQueue:
         except Exception as e:  # noqa: BLE001 - boundary handler catches all errors to keep calling code alive
             # Failed - update error info
             async with self._lock:
-                if failed_task in self._queue:
-                    index = self._queue.index(failed_task)
-                    updated_task = failed_task
-                    updated_task.retry_count += 1
-                    updated_task.total_attempts += 1
-                    updated_task.last_error = str(e)
-                    updated_task.status = DeadLetterStatus.PENDING
-                    self._queue[index] = updated_task
-                    await self._update_task_persistence(updated_task)
+                if self._tasks.get(task_id) is failed_task:
+                    failed_task.retry_count += 1
+                    failed_task.total_attempts += 1
+                    failed_task.last_error = str(e)
+                    failed_task.status = DeadLetterStatus.PENDING
+                    self._schedule_after_failure(failed_task)
+                    await self._update_task_persistence(failed_task)
 
             self._stats["retry_failed"] += 1
 
@@ -796,10 +975,7 @@ class DeadLetterQueue:
             FailedTask object or None if not found
         """
         async with self._lock:
-            for task in self._queue:
-                if task.task_id == task_id:
-                    return task
-            return None
+            return self._tasks.get(task_id)
 
     async def list_tasks(
         self,
@@ -816,7 +992,7 @@ class DeadLetterQueue:
             List of FailedTask objects
         """
         async with self._lock:
-            tasks = self._queue.copy()
+            tasks = list(self._tasks.values())
 
             if status:
                 tasks = [t for t in tasks if t.status == status]
@@ -833,22 +1009,22 @@ class DeadLetterQueue:
             True if task was archived, False if not found
         """
         async with self._lock:
-            for i, task in enumerate(self._queue):
-                if task.task_id == task_id:
-                    # Update status to archived
-                    task.status = DeadLetterStatus.ARCHIVED
-                    self._stats["archived"] += 1
+            task = self._tasks.get(task_id)
+            if task is None:
+                return False
 
-                    # Update persistence
-                    await self._update_task_persistence(task)
+            # Update status to archived
+            task.status = DeadLetterStatus.ARCHIVED
+            self._stats["archived"] += 1
 
-                    # Remove from active queue
-                    self._queue.pop(i)
+            # Update persistence
+            await self._update_task_persistence(task)
 
-                    self._logger.info(f"Archived task {task_id}")
-                    return True
+            # Remove from active queue
+            self._remove_task(task)
 
-            return False
+            self._logger.info(f"Archived task {task_id}")
+            return True
 
     async def get_statistics(self) -> dict[str, Any]:
         """Get queue statistics.
@@ -857,13 +1033,14 @@ class DeadLetterQueue:
             Dictionary with queue metrics
         """
         async with self._lock:
-            pending_count = sum(1 for t in self._queue if t.status == DeadLetterStatus.PENDING)
-            retrying_count = sum(1 for t in self._queue if t.status == DeadLetterStatus.RETRYING)
-            exhausted_count = sum(1 for t in self._queue if t.status == DeadLetterStatus.EXHAUSTED)
+            tasks = list(self._tasks.values())
+            pending_count = sum(1 for t in tasks if t.status == DeadLetterStatus.PENDING)
+            retrying_count = sum(1 for t in tasks if t.status == DeadLetterStatus.RETRYING)
+            exhausted_count = sum(1 for t in tasks if t.status == DeadLetterStatus.EXHAUSTED)
 
             # Calculate error category distribution
             error_categories: dict[str, int] = {}
-            for task in self._queue:
+            for task in tasks:
                 if task.error_category:
                     error_categories[task.error_category] = (
                         error_categories.get(task.error_category, 0) + 1
@@ -871,14 +1048,14 @@ class DeadLetterQueue:
 
             # Calculate retry policy distribution
             retry_policies: dict[str, int] = {}
-            for task in self._queue:
+            for task in tasks:
                 policy = task.retry_policy.value
                 retry_policies[policy] = retry_policies.get(policy, 0) + 1
 
             return {
-                "queue_size": len(self._queue),
+                "queue_size": len(tasks),
                 "max_size": self._max_size,
-                "utilization_percent": round(len(self._queue) / self._max_size * 100, 2),
+                "utilization_percent": round(len(tasks) / self._max_size * 100, 2),
                 "status_breakdown": {
                     "pending": pending_count,
                     "retrying": retrying_count,
@@ -891,6 +1068,8 @@ class DeadLetterQueue:
                 "retry_interval_seconds": self._retry_interval_seconds
                 if self._is_running
                 else None,
+                "scheduled_count": len(self._heap_tokens),
+                "max_concurrent_retries": self._max_concurrent_retries,
             }
 
     async def clear_all(self) -> int:
@@ -902,8 +1081,10 @@ class DeadLetterQueue:
             Number of tasks cleared
         """
         async with self._lock:
-            count = len(self._queue)
-            self._queue.clear()
+            count = len(self._tasks)
+            self._tasks.clear()
+            self._due_heap.clear()
+            self._heap_tokens.clear()
 
             # Clear from OpenSearch if available
             if self._opensearch and OPENSEARCH_AVAILABLE:
@@ -5,6 +5,16 @@ Provides dependency graph data structures and operations including:
 - Cycle detection algorithms
 - Dependency CRUD operations
 - Dependency queries and traversals
+
+Ready/blocked membership and a topological order are maintained
+incrementally, so schedulers polling for ready work get answers without
+rescanning the graph:
+- Each task keeps a count of blocking (PENDING/FAILED) incoming edges;
+  edge and status edits move it between the ready and blocked sets.
+- Tasks carry a topological rank. Adding an edge that already agrees
+  with the ranks costs O(1); otherwise only the tasks ranked between its
+  endpoints are searched for a cycle and re-ranked (Pearce-Kelly).
+- The sorted order is cached and invalidated only by structural edits.
 """
 
 from __future__ import annotations
@@ -14,7 +24,7 @@ from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import StrEnum
 import logging
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from pydantic import BaseModel, Field
 
@@ -68,7 +78,11 @@ class DependencyError(Exception):
 
 @dataclass
 class DependencyEdge:
-    """Represents an edge in the dependency graph."""
+    """Represents an edge in the dependency graph.
+
+    Change ``status`` through :meth:`DependencyGraph.update_edge_status`
+    so the graph's ready/blocked sets stay in sync.
+    """
 
     dependency_id: str  # ID of the task being depended on
     dependent_id: str  # ID of the task that depends
@@ -118,6 +132,10 @@ class Dependency(BaseModel):
 class DependencyGraph:
     """Manages task dependencies as a directed acyclic graph."""
 
+    BLOCKING_STATUSES: ClassVar[frozenset[DependencyStatus]] = frozenset(
+        {DependencyStatus.PENDING, DependencyStatus.FAILED}
+    )
+
     def __init__(self) -> None:
         """Initialize empty dependency graph."""
         # Adjacency lists
@@ -126,6 +144,18 @@ class DependencyGraph:
         self._edges: dict[tuple[str, str], DependencyEdge] = {}
         self._task_metadata: dict[str, dict[str, Any]] = {}
 
+        # Incremental readiness: blocking-edge counts and insertion-ordered sets
+        self._blocking_counts: dict[str, int] = {}
+        self._ready: dict[str, None] = {}
+        self._blocked: dict[str, None] = {}
+
+        # Topological rank per task; None while the graph holds an
+        # unvalidated cycle. _topo_cache is the rank-sorted task list.
+        self._rank: dict[str, int] | None = {}
+        self._first_rank = 0
+        self._next_rank = 0
+        self._topo_cache: list[str] | None = None
+
     def add_task(self, task_id: str, metadata: dict[str, Any] | None = None) -> None:
         """Add a task to the graph.
 
@@ -133,6 +163,7 @@ class DependencyGraph:
             task_id: Unique task identifier
             metadata: Optional task metadata
         """
+        self._track_task(task_id)
         self._task_metadata[task_id] = metadata or {}
 
     def remove_task(self, task_id: str) -> list[str]:
@@ -147,8 +178,8 @@ class DependencyGraph:
         affected = set()
 
         # Remove all edges involving this task
-        dependents = list(self._dependents[task_id])
-        dependencies = list(self._dependencies[task_id])
+        dependents = list(self._dependents.get(task_id, ()))
+        dependencies = list(self._dependencies.get(task_id, ()))
 
         for dep_id in dependents:
             self.remove_dependency(task_id, dep_id)
@@ -161,7 +192,13 @@ class DependencyGraph:
         # Clean up task data
         self._dependents.pop(task_id, None)
         self._dependencies.pop(task_id, None)
-        self._task_metadata.pop(task_id, None)
+        if self._task_metadata.pop(task_id, None) is not None:
+            self._blocking_counts.pop(task_id, None)
+            self._ready.pop(task_id, None)
+            self._blocked.pop(task_id, None)
+            if self._rank is not None:
+                self._rank.pop(task_id, None)
+            self._topo_cache = None
 
         return list(affected)
 
@@ -197,20 +234,32 @@ class DependencyGraph:
                 {"dependency_id": dependency_id, "dependent_id": dependent_id},
             )
 
-        # Add to adjacency lists first for cycle detection
-        self._dependents[dependency_id].add(dependent_id)
-        self._dependencies[dependent_id].add(dependency_id)
-
-        # Validate for cycles
-        if validate and self._would_create_cycle(dependency_id, dependent_id):
-            # Remove the edge we just added
-            self._dependents[dependency_id].discard(dependent_id)
-            self._dependencies[dependent_id].discard(dependency_id)
+        # An edge touching a brand-new task cannot close a cycle (unless it
+        # is a self-loop), so only edges between known tasks are checked.
+        if dependency_id == dependent_id:
+            acyclic = False
+        elif dependency_id in self._task_metadata and dependent_id in self._task_metadata:
+            acyclic = self._rerank_for_edge(dependency_id, dependent_id)
+        else:
+            acyclic = True
 
+        if validate and not acyclic:
             # Find the cycle for error message
             cycle = self._find_cycle_path(dependency_id, dependent_id)
             raise CircularDependencyError(cycle)
 
+        # Ensure both tasks exist in metadata. A new dependency is ranked
+        # before every task and a new dependent after, so ranks stay valid.
+        self._track_task(dependency_id, first=True)
+        self._track_task(dependent_id)
+        if not acyclic:
+            # Unvalidated cycle: no topological order exists until it is removed
+            self._rank = None
+            self._topo_cache = None
+
+        self._dependents[dependency_id].add(dependent_id)
+        self._dependencies[dependent_id].add(dependency_id)
+
         # Create edge
         edge = DependencyEdge(
             dependency_id=dependency_id,
@@ -219,12 +268,8 @@ class DependencyGraph:
             metadata=metadata or {},
         )
         self._edges[edge_key] = edge
-
-        # Ensure both tasks exist in metadata
-        if dependency_id not in self._task_metadata:
-            self._task_metadata[dependency_id] = {}
-        if dependent_id not in self._task_metadata:
-            self._task_metadata[dependent_id] = {}
+        if edge.status in self.BLOCKING_STATUSES:
+            self._adjust_blocking(dependent_id, 1)
 
         logger.debug(
             f"Added dependency: {dependency_id} -> {dependent_id} ({dependency_type.value})"
@@ -243,12 +288,16 @@ class DependencyGraph:
             True if dependency was removed, False if it didn't exist
         """
         edge_key = (dependency_id, dependent_id)
-        if edge_key not in self._edges:
+        edge = self._edges.pop(edge_key, None)
+        if edge is None:
             return False
 
-        del self._edges[edge_key]
         self._dependents[dependency_id].discard(dependent_id)
         self._dependencies[dependent_id].discard(dependency_id)
+        if edge.status in self.BLOCKING_STATUSES:
+            self._adjust_blocking(dependent_id, -1)
+        # Removing an edge keeps any existing rank valid; a graph that was
+        # cyclic gets its ranks rebuilt lazily on the next query.
 
         logger.debug(f"Removed dependency: {dependency_id} -> {dependent_id}")
         return True
@@ -305,7 +354,11 @@ class DependencyGraph:
         """
         edge = self._edges.get((dependency_id, dependent_id))
         if edge:
+            was_blocking = edge.status in self.BLOCKING_STATUSES
             edge.status = status
+            is_blocking = status in self.BLOCKING_STATUSES
+            if was_blocking != is_blocking:
+                self._adjust_blocking(dependent_id, 1 if is_blocking else -1)
             logger.debug(f"Updated edge status: {dependency_id} -> {dependent_id} = {status.value}")
             return True
         return False
@@ -322,11 +375,7 @@ class DependencyGraph:
         Returns:
             True if task has blocking dependencies
         """
-        for dep_id in self._dependencies.get(task_id, set()):
-            edge = self._edges.get((dep_id, task_id))
-            if edge and edge.status in (DependencyStatus.PENDING, DependencyStatus.FAILED):
-                return True
-        return False
+        return task_id in self._blocked
 
     def get_blocking_tasks(self, task_id: str) -> list[str]:
         """Get tasks blocking a given task.
@@ -342,7 +391,7 @@ class DependencyGraph:
         blocking = []
         for dep_id in self._dependencies.get(task_id, set()):
             edge = self._edges.get((dep_id, task_id))
-            if edge and edge.status in (DependencyStatus.PENDING, DependencyStatus.FAILED):
+            if edge and edge.status in self.BLOCKING_STATUSES:
                 blocking.append(dep_id)
         return blocking
 
@@ -352,11 +401,7 @@ class DependencyGraph:
         Returns:
             List of task IDs ready to work on
         """
-        ready = []
-        for task_id in self._task_metadata:
-            if not self.is_blocked(task_id):
-                ready.append(task_id)
-        return ready
+        return list(self._ready)
 
     def get_blocked_tasks(self) -> list[str]:
         """Get all tasks that are blocked.
@@ -364,32 +409,43 @@ class DependencyGraph:
         Returns:
             List of blocked task IDs
         """
-        blocked = []
-        for task_id in self._task_metadata:
-            if self.is_blocked(task_id):
-                blocked.append(task_id)
-        return blocked
+        return list(self._blocked)
+
+    def get_ready_count(self) -> int:
+        """Get number of tasks with no pending dependencies."""
+        return len(self._ready)
+
+    def get_blocked_count(self) -> int:
+        """Get number of blocked tasks."""
+        return len(self._blocked)
 
     def topological_sort(self) -> list[str]:
         """Get tasks in topological order.
 
+        The order is cached and only recomputed after tasks or edges are
+        added or removed; status updates never invalidate it.
+
         Returns:
             List of task IDs in dependency order
 
         Raises:
             CircularDependencyError: If graph has cycles
         """
-        # Check for cycles first
-        cycles = self.detect_cycles()
-        if cycles:
-            raise CircularDependencyError(cycles[0])
-
-        # Kahn's algorithm
-        in_degree: dict[str, int] = defaultdict(int)
+        if self._topo_cache is None:
+            rank = self._ensure_ranks()
+            if rank is None:
+                cycles = self.detect_cycles()
+                raise CircularDependencyError(cycles[0] if cycles else [])
+            self._topo_cache = sorted(rank, key=rank.__getitem__)
+        return list(self._topo_cache)
+
+    def _kahn_order(self) -> list[str]:
+        """Run Kahn's algorithm; the result is short of tasks if cyclic."""
+        in_degree: dict[str, int] = {}
 
         # Initialize in-degrees
         for task_id in self._task_metadata:
-            in_degree[task_id] = len(self._dependencies.get(task_id, set()))
+            in_degree[task_id] = len(self._dependencies.get(task_id, ()))
 
         # Queue of tasks with no dependencies
         queue = deque([task_id for task_id, degree in in_degree.items() if degree == 0])
@@ -400,13 +456,113 @@ class DependencyGraph:
             result.append(task_id)
 
             # Reduce in-degree for dependents
-            for dependent_id in self._dependents.get(task_id, set()):
+            for dependent_id in self._dependents.get(task_id, ()):
                 in_degree[dependent_id] -= 1
                 if in_degree[dependent_id] == 0:
                     queue.append(dependent_id)
 
         return result
 
+    def _ensure_ranks(self) -> dict[str, int] | None:
+        """Return task ranks, rebuilding them if a cycle was recorded.
+
+        Returns:
+            Rank per task, or None if the graph still has a cycle
+        """
+        if self._rank is None:
+            order = self._kahn_order()
+            if len(order) < len(self._task_metadata):
+                return None
+            self._rank = {task_id: index for index, task_id in enumerate(order)}
+            self._first_rank = 0
+            self._next_rank = len(order)
+            self._topo_cache = order
+        return self._rank
+
+    def _rerank_for_edge(self, from_id: str, to_id: str) -> bool:
+        """Keep ranks topological for a new edge ``from_id -> to_id``.
+
+        Only tasks ranked between ``to_id`` and ``from_id`` can lie on a
+        cycle through the new edge, so the search is confined to that
+        window; if no cycle is found, the window's tasks are re-ranked
+        within their existing slots.
+
+        Returns:
+            False if the edge would close a cycle
+        """
+        rank = self._ensure_ranks()
+        if rank is None:
+            # Already cyclic (unvalidated edges): fall back to plain reachability
+            return not self._would_create_cycle(from_id, to_id)
+
+        lower, upper = rank[to_id], rank[from_id]
+        if upper < lower:
+            return True
+
+        # Tasks reachable from to_id that are not ranked after from_id
+        forward: list[str] = []
+        seen = {to_id}
+        stack = [to_id]
+        while stack:
+            current = stack.pop()
+            if current == from_id:
+                return False
+            forward.append(current)
+            for dep_id in self._dependents.get(current, ()):
+                if dep_id not in seen and rank[dep_id] <= upper:
+                    seen.add(dep_id)
+                    stack.append(dep_id)
+
+        # Tasks that reach from_id and are not ranked before to_id
+        backward: list[str] = []
+        seen = {from_id}
+        stack = [from_id]
+        while stack:
+            current = stack.pop()
+            backward.append(current)
+            for dep_id in self._dependencies.get(current, ()):
+                if dep_id not in seen and rank[dep_id] >= lower:
+                    seen.add(dep_id)
+                    stack.append(dep_id)
+
+        moved = sorted(backward, key=rank.__getitem__) + sorted(forward, key=rank.__getitem__)
+        slots = sorted(rank[task_id] for task_id in moved)
+        for task_id, slot in zip(moved, slots, strict=True):
+            rank[task_id] = slot
+        self._topo_cache = None
+        return True
+
+    def _track_task(self, task_id: str, *, first: bool = False) -> None:
+        """Register a new task as ready, ranked after (or before) all others."""
+        if task_id in self._task_metadata:
+            return
+        self._task_metadata[task_id] = {}
+        self._ready[task_id] = None
+        if self._rank is not None:
+            if first:
+                self._first_rank -= 1
+                self._rank[task_id] = self._first_rank
+            else:
+                self._rank[task_id] = self._next_rank
+                self._next_rank += 1
+        self._topo_cache = None
+
+    def _adjust_blocking(self, task_id: str, delta: int) -> None:
+        """Apply a change in blocking edges and move the task between sets."""
+        before = self._blocking_counts.get(task_id, 0)
+        after = before + delta
+        if after > 0:
+            self._blocking_counts[task_id] = after
+        else:
+            self._blocking_counts.pop(task_id, None)
+
+        if before == 0 and after > 0:
+            self._ready.pop(task_id, None)
+            self._blocked[task_id] = None
+        elif before > 0 and after <= 0:
+            self._blocked.pop(task_id, None)
+            self._ready[task_id] = None
+
     def detect_cycles(self) -> list[list[str]]:
         """Detect all cycles in the graph.
 
@@ -447,7 +603,7 @@ class DependencyGraph:
         Returns:
             True if cycles exist
         """
-        return len(self.detect_cycles()) > 0
+        return self._ensure_ranks() is None
 
     def _would_create_cycle(self, from_id: str, to_id: str) -> bool:
         """Check if adding edge would create a cycle.
@@ -621,6 +777,13 @@ class DependencyGraph:
         self._dependencies.clear()
         self._edges.clear()
         self._task_metadata.clear()
+        self._blocking_counts.clear()
+        self._ready.clear()
+        self._blocked.clear()
+        self._rank = {}
+        self._first_rank = 0
+        self._next_rank = 0
+        self._topo_cache = None
 
     def to_dict(self) -> dict[str, Any]:
         """Serialize graph to dictionary."""
@@ -250,9 +250,9 @@ class DependencyManager:
         # Check if dependency is already satisfied
         dep_status = self._task_statuses.get(dependency_id)
         if dep_status == TaskStatus.COMPLETED:
-            edge.status = DependencyStatus.SATISFIED
+            self._graph.update_edge_status(dependency_id, dependent_id, DependencyStatus.SATISFIED)
         elif dep_status == TaskStatus.FAILED:
-            edge.status = DependencyStatus.FAILED
+            self._graph.update_edge_status(dependency_id, dependent_id, DependencyStatus.FAILED)
 
         # Emit event
         self._emitter.emit(
@@ -461,7 +461,7 @@ class DependencyManager:
             edge = self._graph.get_edge(task_id, dep_id)
             if edge and edge.status == DependencyStatus.PENDING:
                 # Mark edge as satisfied
-                edge.status = DependencyStatus.SATISFIED
+                self._graph.update_edge_status(task_id, dep_id, DependencyStatus.SATISFIED)
 
                 # Emit event
                 self._emitter.emit(
@@ -495,7 +495,7 @@ class DependencyManager:
             edge = self._graph.get_edge(task_id, dep_id)
             if edge:
                 # Mark edge as failed
-                edge.status = DependencyStatus.FAILED
+                self._graph.update_edge_status(task_id, dep_id, DependencyStatus.FAILED)
 
                 # Emit event
                 self._emitter.emit(
@@ -526,7 +526,7 @@ class DependencyManager:
             edge = self._graph.get_edge(task_id, dep_id)
             if edge:
                 # Mark edge as cancelled
-                edge.status = DependencyStatus.CANCELLED
+                self._graph.update_edge_status(task_id, dep_id, DependencyStatus.CANCELLED)
 
                 # Check if dependent is now unblocked
                 # (cancelled dependencies don't block)
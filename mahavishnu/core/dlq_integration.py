@@ -317,6 +317,7 @@ class DLQIntegration:
                 task=task,
                 repos=repos or [],
                 error=e,
+                metadata={"adapter": adapter_name},
             )
 
             if failed_task:
@@ -382,7 +383,7 @@ async def create_dlq_integration(app) -> DLQIntegration:
     """
     # Create DLQ if it doesn't exist
     if not hasattr(app, "dlq") or app.dlq is None:
-        from .dead_letter_queue import DeadLetterQueue
+        from .dead_letter_queue import DEFAULT_MAX_CONCURRENT_RETRIES, DeadLetterQueue
 
         # ``app.config`` is MahavishnuSettings; ``dlq`` is a DLQConfig (see
         # mahavishnu/core/config.py:DLQConfig). Mirrors the
@@ -392,6 +393,10 @@ async def create_dlq_integration(app) -> DLQIntegration:
         app.dlq = DeadLetterQueue(
             max_size=app.config.dlq.max_size,
             fail_on_opensearch_unavailable=app.config.dlq.fail_on_opensearch_unavailable,
+            max_concurrent_retries=getattr(
+                app.config.dlq, "max_concurrent_retries", DEFAULT_MAX_CONCURRENT_RETRIES
+            ),
+            adapter_concurrency=getattr(app.config.dlq, "adapter_concurrency", None),
             opensearch_client=app.opensearch_integration.client
             if app.opensearch_integration
             else None,
@@ -539,7 +539,7 @@ class EcosystemStatusService:
         Checks each configured service URL via HTTP GET with timeout.
         Falls back to UNKNOWN for unreachable services.
         """
-        import httpx
+        from mahavishnu.core.http_clients import get_http_client
 
         services: dict[str, ServiceStatus] = {}
         for name, cfg in self._service_configs.items():
@@ -553,16 +553,17 @@ class EcosystemStatusService:
                 continue
             try:
                 timeout_s = cfg.get("timeout_s", 3)
-                async with httpx.AsyncClient(timeout=timeout_s) as client:
-                    resp = await client.get(f"{url.rstrip('/')}/health")
-                    body = resp.json()
-                    raw_status = body.get("status", "unknown")
-                    services[name] = ServiceStatus(
-                        status=normalize_status(raw_status),
-                        last_check=datetime.now(UTC),
-                        required=required,
-                        latency_ms=body.get("latency_ms"),
-                    )
+                # Service names double as registry keys (session_buddy, akosha, ...)
+                client = get_http_client(name)
+                resp = await client.get(f"{url.rstrip('/')}/health", timeout=timeout_s)
+                body = resp.json()
+                raw_status = body.get("status", "unknown")
+                services[name] = ServiceStatus(
+                    status=normalize_status(raw_status),
+                    last_check=datetime.now(UTC),
+                    required=required,
+                    latency_ms=body.get("latency_ms"),
+                )
             except Exception:  # noqa: BLE001 - boundary handler catches all errors to keep calling code alive
                 services[name] = ServiceStatus(
                     status=CanonicalStatus.UNKNOWN,
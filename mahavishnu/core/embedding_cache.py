@@ -5,6 +5,8 @@ Provides efficient caching for embedding vectors:
 - L2: Redis cache for distributed sharing (~1ms latency)
 - Automatic cache key hashing for security
 - Prometheus metrics for monitoring
+- Batch path: one L1 pass, one MGET, one compute call, one pipelined write
+- Compact float32 binary encoding for L2 values
 
 Architecture:
     ┌─────────────────────────────────────────────────────────┐
@@ -37,14 +39,16 @@ Usage:
 
 from __future__ import annotations
 
+from array import array
 import asyncio
-from collections.abc import Callable, Coroutine
+from collections.abc import Awaitable, Callable, Coroutine
 from dataclasses import dataclass
 from enum import Enum
 import hashlib
 import json
 import logging
 import random
+import sys
 import time
 from typing import Any
 
@@ -55,6 +59,33 @@ logger = logging.getLogger(__name__)
 # Type alias for compute function
 ComputeFn = Callable[[], Coroutine[Any, Any, list[list[float]]]]
 
+# L2 values are a 4-byte header followed by little-endian float32s, about
+# 4 bytes per dimension instead of roughly 20 for a JSON list of floats.
+_VECTOR_MAGIC = b"EV\x01f"
+
+
+def _encode_vector(embedding: list[float]) -> bytes:
+    """Encode an embedding as a compact float32 L2 value."""
+    packed = array("f", embedding)
+    if sys.byteorder == "big":
+        packed.byteswap()
+    return _VECTOR_MAGIC + packed.tobytes()
+
+
+def _decode_vector(raw: bytes | str) -> list[float]:
+    """Decode an L2 value written by ``_encode_vector``.
+
+    JSON lists written by earlier releases are still accepted so existing
+    Redis entries stay readable until their TTL expires.
+    """
+    if isinstance(raw, bytes) and raw.startswith(_VECTOR_MAGIC):
+        packed = array("f")
+        packed.frombytes(raw[len(_VECTOR_MAGIC) :])
+        if sys.byteorder == "big":
+            packed.byteswap()
+        return packed.tolist()
+    return json.loads(raw)  # type: ignore[no-any-return]
+
 
 class CircuitState(Enum):
     """Circuit breaker states for Redis."""
@@ -161,6 +192,57 @@ class Singleflight:
         finally:
             del self._in_flight[key]
 
+    async def do_batch(
+        self,
+        keys: list[str],
+        fn: Callable[[list[str]], Awaitable[dict[str, Any]]],
+    ) -> dict[str, Any]:
+        """Coalesce a batch of keys with computations already in flight.
+
+        Keys another caller is computing (via :meth:`do` or another batch)
+        are awaited; the rest are claimed and handed to ``fn`` in a single
+        call, which returns a mapping of key to value.
+
+        Args:
+            keys: Distinct cache keys being requested
+            fn: Async function computing values for the claimed keys
+
+        Returns:
+            Mapping of every requested key to its value (``None`` when
+            ``fn`` did not return one)
+        """
+        waiting = {key: self._in_flight[key] for key in keys if key in self._in_flight}
+        loop = asyncio.get_running_loop()
+        claimed: dict[str, asyncio.Future] = {}
+        for key in keys:
+            if key not in waiting:
+                claimed[key] = loop.create_future()
+                self._in_flight[key] = claimed[key]
+
+        results: dict[str, Any] = {}
+        if claimed:
+            try:
+                computed = await fn(list(claimed))
+            except Exception as e:
+                for future in claimed.values():
+                    future.set_exception(e)
+                    future.exception()  # waiters re-raise; avoid "never retrieved" noise
+                raise
+            except BaseException:
+                for future in claimed.values():
+                    future.cancel()
+                raise
+            finally:
+                for key in claimed:
+                    del self._in_flight[key]
+            for key, future in claimed.items():
+                future.set_result(computed.get(key))
+                results[key] = computed.get(key)
+
+        for key, future in waiting.items():
+            results[key] = await future
+        return results
+
 
 @dataclass
 class EmbeddingCacheConfig:
@@ -213,6 +295,13 @@ class EmbeddingCacheMetrics:
         l2_misses: L2 cache misses
         computes: Number of embeddings computed
         total_latency_ms: Total latency in milliseconds
+        batch_requests: Calls to ``get_batch_or_compute``
+        batch_items: Distinct texts looked up by batch calls
+        batch_l1_hits: Batch items served from L1
+        batch_l2_lookups: Batch items looked up in L2 (L1 misses)
+        batch_l2_hits: Batch items served from L2
+        batch_coalesced: Batch items served by another in-flight computation
+        batch_computed: Batch items computed by this caller
     """
 
     l1_hits: int = 0
@@ -221,6 +310,13 @@ class EmbeddingCacheMetrics:
     l2_misses: int = 0
     computes: int = 0
     total_latency_ms: float = 0.0
+    batch_requests: int = 0
+    batch_items: int = 0
+    batch_l1_hits: int = 0
+    batch_l2_lookups: int = 0
+    batch_l2_hits: int = 0
+    batch_coalesced: int = 0
+    batch_computed: int = 0
 
     def record_l1_hit(self) -> None:
         """Record an L1 cache hit."""
@@ -247,6 +343,33 @@ class EmbeddingCacheMetrics:
         self.computes += 1
         self.total_latency_ms += latency_ms
 
+    def record_batch(
+        self,
+        items: int,
+        l1_hits: int,
+        l2_lookups: int,
+        l2_hits: int,
+        coalesced: int,
+        computed: int,
+    ) -> None:
+        """Record the per-tier outcome of one batch lookup.
+
+        Args:
+            items: Distinct texts in the batch
+            l1_hits: Items served from L1
+            l2_lookups: Items looked up in L2
+            l2_hits: Items served from L2
+            coalesced: Items served by another caller's computation
+            computed: Items computed by this call
+        """
+        self.batch_requests += 1
+        self.batch_items += items
+        self.batch_l1_hits += l1_hits
+        self.batch_l2_lookups += l2_lookups
+        self.batch_l2_hits += l2_hits
+        self.batch_coalesced += coalesced
+        self.batch_computed += computed
+
     @property
     def l1_hit_rate(self) -> float:
         """Calculate L1 cache hit rate."""
@@ -266,6 +389,16 @@ class EmbeddingCacheMetrics:
         total_requests = self.l1_hits + self.l1_misses
         return total_hits / total_requests if total_requests > 0 else 0.0
 
+    @property
+    def batch_l1_hit_rate(self) -> float:
+        """Fraction of batch items served from L1."""
+        return self.batch_l1_hits / self.batch_items if self.batch_items > 0 else 0.0
+
+    @property
+    def batch_l2_hit_rate(self) -> float:
+        """Fraction of batch L2 lookups served from L2."""
+        return self.batch_l2_hits / self.batch_l2_lookups if self.batch_l2_lookups > 0 else 0.0
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
         return {
@@ -280,6 +413,12 @@ class EmbeddingCacheMetrics:
             "avg_compute_latency_ms": (
                 self.total_latency_ms / self.computes if self.computes > 0 else 0
             ),
+            "batch_requests": self.batch_requests,
+            "batch_items": self.batch_items,
+            "batch_l1_hit_rate": f"{self.batch_l1_hit_rate:.2%}",
+            "batch_l2_hit_rate": f"{self.batch_l2_hit_rate:.2%}",
+            "batch_coalesced": self.batch_coalesced,
+            "batch_computed": self.batch_computed,
         }
 
 
@@ -372,7 +511,7 @@ class EmbeddingCache:
 
             self._l2_client = aioredis.from_url(
                 self._config.l2_redis_url,
-                decode_responses=True,
+                decode_responses=False,  # values are binary float32 vectors
                 ssl_cert_reqs="required" if self._config.l2_tls_verify else "none",
             )
             # Test connection
@@ -413,7 +552,7 @@ class EmbeddingCache:
                 try:
                     cached = await client.get(self._make_l2_key(key))
                     if cached is not None:
-                        embedding = json.loads(cached)
+                        embedding = _decode_vector(cached)
                         # Populate L1 cache
                         self._l1.set(key, embedding)
                         self._metrics.record_l2_hit()
@@ -453,7 +592,7 @@ class EmbeddingCache:
                     ttl = self._config.get_ttl_with_jitter()
                     await client.set(
                         self._make_l2_key(key),
-                        json.dumps(embedding),
+                        _encode_vector(embedding),
                         ex=ttl,
                     )
                     self._circuit_breaker.record_success()
@@ -518,10 +657,13 @@ class EmbeddingCache:
     ) -> list[list[float]]:
         """Get batch of embeddings from cache or compute missing ones.
 
-        Efficiently handles batch requests by:
-        1. Checking cache for each text
-        2. Computing only missing embeddings
-        3. Caching new results
+        Round trips are per batch, not per text:
+        1. One pass over L1 for all texts
+        2. One MGET for every L1 miss
+        3. Singleflight per key, so texts already being computed by a
+           concurrent call are awaited rather than recomputed
+        4. One ``compute_fn`` call for the remaining texts
+        5. One pipelined SET (with TTL jitter) to write them back to L2
 
         Args:
             texts: List of texts to embed
@@ -530,37 +672,123 @@ class EmbeddingCache:
         Returns:
             List of embedding vectors
         """
-        results: list[list[float]] = []
-        uncached_indices: list[int] = []
-        uncached_texts: list[str] = []
-
-        # Check cache for each text
-        for i, text in enumerate(texts):
-            cached = await self.get(text)
+        keys = [self._hash_text(text) for text in texts]
+        text_by_key = dict(zip(keys, texts, strict=True))
+        found: dict[str, list[float]] = {}
+
+        # 1. L1, one pass
+        l1_misses: list[str] = []
+        for key in text_by_key:
+            cached = self._l1.get(key)
             if cached is not None:
-                results.append(cached)
+                self._metrics.record_l1_hit()
+                found[key] = cached
             else:
-                results.append([])  # Placeholder
-                uncached_indices.append(i)
-                uncached_texts.append(text)
-
-        # Compute missing embeddings
-        if uncached_texts:
-            start_time = time.perf_counter()
-            computed = await compute_fn(uncached_texts)
-            latency_ms = (time.perf_counter() - start_time) * 1000
-
-            # Fill in results and cache
-            for idx, text, embedding in zip(
-                uncached_indices, uncached_texts, computed, strict=False
-            ):
-                results[idx] = embedding
-                await self.set(text, embedding)
+                self._metrics.record_l1_miss()
+                l1_misses.append(key)
+        l1_hits = len(found)
+
+        # 2. L2, one MGET
+        l2_hits = 0
+        if l1_misses:
+            l2_found = await self._l2_get_many(l1_misses)
+            l2_hits = len(l2_found)
+            for key, embedding in l2_found.items():
+                self._l1.set(key, embedding)
+            found.update(l2_found)
+
+        # 3-5. Coalesce, compute once, write back once
+        missing = [key for key in l1_misses if key not in found]
+        computed_count = 0
+        if missing:
+
+            async def _compute_batch(claimed: list[str]) -> dict[str, list[float]]:
+                nonlocal computed_count
+                start_time = time.perf_counter()
+                computed = await compute_fn([text_by_key[key] for key in claimed])
+                latency_ms = (time.perf_counter() - start_time) * 1000
+                values = dict(zip(claimed, computed, strict=False))
+                for key, embedding in values.items():
+                    self._l1.set(key, embedding)
+                await self._l2_set_many(values)
+                self._metrics.record_compute(latency_ms)
+                computed_count = len(claimed)
+                return values
 
-            # Record metrics
-            self._metrics.record_compute(latency_ms)
+            if self._singleflight is not None:
+                resolved = await self._singleflight.do_batch(missing, _compute_batch)
+            else:
+                resolved = await _compute_batch(missing)
+            found.update({key: value for key, value in resolved.items() if value is not None})
+
+        self._metrics.record_batch(
+            items=len(text_by_key),
+            l1_hits=l1_hits,
+            l2_lookups=len(l1_misses) if self._config.l2_enabled else 0,
+            l2_hits=l2_hits,
+            coalesced=len(missing) - computed_count,
+            computed=computed_count,
+        )
+        return [found.get(key, []) for key in keys]
 
-        return results
+    async def _l2_get_many(self, keys: list[str]) -> dict[str, list[float]]:
+        """Fetch ``keys`` from L2 with a single MGET.
+
+        Returns:
+            Mapping of the keys that were found to their embeddings
+        """
+        if not self._config.l2_enabled or not self._circuit_breaker.can_execute():
+            return {}
+        client = await self._get_l2_client()
+        if client is None:
+            return {}
+
+        found: dict[str, list[float]] = {}
+        try:
+            values = await client.mget([self._make_l2_key(key) for key in keys])
+            self._circuit_breaker.record_success()
+        except Exception as e:  # noqa: BLE001 - boundary handler catches all errors to keep calling code alive
+            logger.debug(f"L2 cache mget failed: {e}")
+            self._circuit_breaker.record_failure()
+            values = [None] * len(keys)
+
+        for key, raw in zip(keys, values, strict=False):
+            if raw is None:
+                self._metrics.record_l2_miss()
+                continue
+            try:
+                found[key] = _decode_vector(raw)
+                self._metrics.record_l2_hit()
+            except ValueError:
+                self._metrics.record_l2_miss()
+        return found
+
+    async def _l2_set_many(self, embeddings: dict[str, list[float]]) -> None:
+        """Write ``embeddings`` to L2 in one pipelined round trip.
+
+        Each key gets its own jittered TTL (MSET cannot carry expiries).
+        """
+        if not embeddings or not self._config.l2_enabled:
+            return
+        if not self._circuit_breaker.can_execute():
+            return
+        client = await self._get_l2_client()
+        if client is None:
+            return
+
+        try:
+            pipe = client.pipeline(transaction=False)
+            for key, embedding in embeddings.items():
+                pipe.set(
+                    self._make_l2_key(key),
+                    _encode_vector(embedding),
+                    ex=self._config.get_ttl_with_jitter(),
+                )
+            await pipe.execute()
+            self._circuit_breaker.record_success()
+        except Exception as e:  # noqa: BLE001 - boundary handler catches all errors to keep calling code alive
+            logger.debug(f"L2 cache pipelined set failed: {e}")
+            self._circuit_breaker.record_failure()
 
     def get_stats(self) -> dict[str, Any]:
         """Get cache statistics.
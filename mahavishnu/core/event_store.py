@@ -6,6 +6,13 @@ Implements event sourcing for:
 - Temporal queries (what was the state at time T?)
 - Event-based integrations
 
+Replay folds events in (occurred_at, id) order. To keep long-lived tasks
+cheap to replay, the store writes a ``TaskSnapshot`` (the serialized
+``TaskState`` plus the last event it covers) whenever a replay folds
+``snapshot_every`` settled events past the newest snapshot, or on demand
+via ``snapshot_task``. Replay then loads that snapshot and only the tail
+events. Only the newest ``keep_snapshots`` snapshots per task are kept.
+
 Usage:
     from mahavishnu.core.event_store import EventStore, TaskEvent
 
@@ -24,12 +31,16 @@ Usage:
 
     # Replay events to reconstruct state
     state = await store.replay_task_state("task-123")
+
+    # Snapshot now instead of waiting for snapshot_every events
+    await store.snapshot_task("task-123")
 """
 
 from __future__ import annotations
 
+import bisect
 from dataclasses import dataclass, field
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from enum import StrEnum
 import json
 import logging
@@ -39,12 +50,22 @@ import uuid
 from mahavishnu.core.errors import DatabaseError
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator
+    from collections.abc import AsyncIterator, Callable
 
     from mahavishnu.core.database import Database
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on events folded by one replay (on top of any snapshot)
+REPLAY_EVENT_LIMIT = 10000
+# Replays write a snapshot once this many settled events follow the newest one
+DEFAULT_SNAPSHOT_EVERY = 100
+# Snapshots kept per task by compaction; older ones serve as_of replays
+DEFAULT_KEEP_SNAPSHOTS = 3
+# Automatic snapshots only cover events at least this old, so an event
+# appended late with a slightly earlier timestamp still lands in the tail
+SNAPSHOT_SETTLE = timedelta(seconds=30)
+
 
 class TaskEventType(StrEnum):
     """Types of task events."""
@@ -287,6 +308,30 @@ class TaskState:
             "version": self.version,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> TaskState:
+        """Create from a :meth:`to_dict` payload."""
+
+        def _parse(value: str | None) -> datetime | None:
+            return datetime.fromisoformat(value) if value else None
+
+        return cls(
+            task_id=data["task_id"],
+            title=data.get("title", ""),
+            description=data.get("description"),
+            repository=data.get("repository", ""),
+            status=data.get("status", "pending"),
+            priority=data.get("priority", "medium"),
+            assignee=data.get("assignee"),
+            tags=list(data.get("tags", [])),
+            metadata=dict(data.get("metadata", {})),
+            created_at=_parse(data.get("created_at")),
+            updated_at=_parse(data.get("updated_at")),
+            completed_at=_parse(data.get("completed_at")),
+            is_deleted=data.get("is_deleted", False),
+            version=data.get("version", 0),
+        )
+
 
 # Dispatch table mapping TaskEventType → TaskState handler method.
 # Defined at module level so apply_event stays a thin dispatcher and
@@ -307,13 +352,45 @@ _TASK_EVENT_HANDLERS: dict[TaskEventType, Any] = {
 }
 
 
+@dataclass
+class TaskSnapshot:
+    """Task state after folding every event up to and including one event.
+
+    ``(last_occurred_at, last_event_id)`` is that event's position in
+    replay order; replay resumes with the events after it.
+    """
+
+    state: TaskState
+    last_event_id: str
+    last_occurred_at: datetime
+
+    @property
+    def task_id(self) -> str:
+        return self.state.task_id
+
+    @property
+    def version(self) -> int:
+        """Number of events folded into the snapshot."""
+        return self.state.version
+
+    @classmethod
+    def from_row(cls, row: Any) -> TaskSnapshot:
+        """Create from a ``task_state_snapshots`` row."""
+        state = row["state"] if isinstance(row["state"], dict) else json.loads(row["state"])
+        return cls(
+            state=TaskState.from_dict(state),
+            last_event_id=str(row["last_event_id"]),
+            last_occurred_at=row["last_occurred_at"],
+        )
+
+
 class EventStore:
     """Event store for task events.
 
     Provides:
     - Event persistence
     - Event retrieval by task
-    - Event replay for state reconstruction
+    - Event replay for state reconstruction, resumed from snapshots
     - Temporal queries
 
     Example:
@@ -334,13 +411,50 @@ class EventStore:
         state = await store.replay_task_state("task-123", as_of=some_datetime)
     """
 
-    def __init__(self, db: Database):
+    def __init__(
+        self,
+        db: Database,
+        snapshot_every: int | None = DEFAULT_SNAPSHOT_EVERY,
+        keep_snapshots: int = DEFAULT_KEEP_SNAPSHOTS,
+    ):
         """Initialize event store.
 
         Args:
             db: Database connection
+            snapshot_every: Write a snapshot when a replay folds at least this
+                many settled events past the newest snapshot (None or 0
+                disables automatic snapshots; ``snapshot_task`` still works)
+            keep_snapshots: Newest snapshots kept per task by compaction
         """
+        if keep_snapshots < 1:
+            raise ValueError("keep_snapshots must be at least 1")
+
         self.db = db
+        self.snapshot_every = snapshot_every
+        self.keep_snapshots = keep_snapshots
+        self._listeners: list[Callable[[TaskEvent], None]] = []
+
+    def subscribe(self, listener: Callable[[TaskEvent], None]) -> None:
+        """Register a callback invoked with every successfully appended event.
+
+        Listeners run synchronously after the insert and must be cheap
+        (e.g. in-memory index maintenance). Exceptions are logged, never
+        propagated to the appender.
+        """
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def unsubscribe(self, listener: Callable[[TaskEvent], None]) -> None:
+        """Remove a callback registered with :meth:`subscribe`."""
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def _notify(self, event: TaskEvent) -> None:
+        for listener in list(self._listeners):
+            try:
+                listener(event)
+            except Exception as e:  # noqa: BLE001 - listener faults must not fail the append
+                logger.warning(f"Event listener failed for {event.event_type.value}: {e}")
 
     async def append(
         self,
@@ -396,7 +510,6 @@ class EventStore:
             )
 
             logger.debug(f"Appended event {event.event_type.value} for task {task_id} by {actor}")
-            return event
 
         except Exception as e:
             logger.error(f"Failed to append event: {e}")
@@ -405,6 +518,9 @@ class EventStore:
                 details={"task_id": task_id, "event_type": event_type.value},
             ) from e
 
+        self._notify(event)
+        return event
+
     async def get_task_events(
         self,
         task_id: str,
@@ -448,7 +564,7 @@ class EventStore:
             query += f" AND event_type IN ({placeholders})"
             params.extend(et.value for et in event_types)
 
-        query += " ORDER BY occurred_at ASC LIMIT $"
+        query += " ORDER BY occurred_at ASC, id ASC LIMIT $"
         param_count += 1
         query += str(param_count)
         params.append(limit)
@@ -463,6 +579,12 @@ class EventStore:
     ) -> TaskState | None:
         """Reconstruct task state from events.
 
+        Starts from the newest snapshot at or before ``as_of`` and folds only
+        the events after it, falling back to a full replay when snapshots
+        cannot be read. A current-state replay that folds ``snapshot_every``
+        or more settled events (older than ``SNAPSHOT_SETTLE``) snapshots
+        the state after the last of them.
+
         Args:
             task_id: Task identifier
             as_of: Reconstruct state as of this time (None = current)
@@ -470,20 +592,254 @@ class EventStore:
         Returns:
             Reconstructed task state, or None if no events found
         """
-        events = await self.get_task_events(
-            task_id=task_id,
-            until=as_of,
-            limit=10000,
+        settled_before = None
+        if as_of is None and self.snapshot_every:
+            settled_before = datetime.now(UTC) - SNAPSHOT_SETTLE
+
+        state, _, checkpoint = await self._replay(task_id, as_of, settled_before)
+
+        if checkpoint is not None:
+            try:
+                await self._save_snapshot(checkpoint)
+            except DatabaseError as e:
+                logger.warning(f"Failed to snapshot task {task_id}: {e}")
+
+        return state
+
+    async def _replay(
+        self,
+        task_id: str,
+        as_of: datetime | None,
+        settled_before: datetime | None = None,
+    ) -> tuple[TaskState | None, list[TaskEvent], TaskSnapshot | None]:
+        """Fold the tail events onto the newest usable snapshot.
+
+        Args:
+            task_id: Task identifier
+            as_of: Ignore snapshots and events after this time
+            settled_before: If set, also capture a snapshot after the last
+                tail event older than this, provided at least
+                ``snapshot_every`` tail events precede it
+
+        Returns:
+            The state (None if the task has no snapshot and no events), the
+            tail events folded into it, and the captured snapshot if any
+        """
+        snapshot: TaskSnapshot | None = None
+        try:
+            snapshot = await self.get_latest_snapshot(task_id, as_of=as_of)
+        except DatabaseError as e:
+            logger.warning(f"Snapshot lookup failed for task {task_id}, replaying all events: {e}")
+
+        tail = await self._get_replay_events(task_id, snapshot, as_of)
+        if snapshot is None and not tail:
+            return None, tail, None
+
+        # Number of leading tail events to capture a snapshot after (0 = none)
+        settled = 0
+        if settled_before is not None:
+            settled = bisect.bisect_left([e.occurred_at for e in tail], settled_before)
+            if settled < (self.snapshot_every or 0):
+                settled = 0
+
+        state = snapshot.state if snapshot else TaskState(task_id=task_id)
+        checkpoint = None
+        for folded, event in enumerate(tail, 1):
+            state.apply_event(event)
+            if folded == settled:
+                checkpoint = TaskSnapshot(
+                    state=TaskState.from_dict(state.to_dict()),
+                    last_event_id=event.id,
+                    last_occurred_at=event.occurred_at,
+                )
+
+        return state, tail, checkpoint
+
+    async def _get_replay_events(
+        self,
+        task_id: str,
+        snapshot: TaskSnapshot | None,
+        until: datetime | None,
+    ) -> list[TaskEvent]:
+        """Events after ``snapshot`` (all if None) in replay order."""
+        query = """
+            SELECT * FROM task_events
+            WHERE task_id = $1
+        """
+        params: list[Any] = [task_id]
+
+        if snapshot is not None:
+            query += " AND (occurred_at, id) > ($2::timestamptz, $3::uuid)"
+            params.extend([snapshot.last_occurred_at, snapshot.last_event_id])
+
+        if until:
+            params.append(until)
+            query += f" AND occurred_at <= ${len(params)}"
+
+        params.append(REPLAY_EVENT_LIMIT)
+        query += f" ORDER BY occurred_at ASC, id ASC LIMIT ${len(params)}"
+
+        rows = await self.db.fetch(query, *params)
+        return [TaskEvent.from_row(row) for row in rows]
+
+    async def get_latest_snapshot(
+        self,
+        task_id: str,
+        as_of: datetime | None = None,
+    ) -> TaskSnapshot | None:
+        """Get the newest snapshot of a task.
+
+        Args:
+            task_id: Task identifier
+            as_of: Only snapshots whose last event occurred at or before this time
+
+        Returns:
+            Snapshot if one exists, None otherwise
+
+        Raises:
+            DatabaseError: If snapshots cannot be read
+        """
+        query = """
+            SELECT * FROM task_state_snapshots
+            WHERE task_id = $1
+        """
+        params: list[Any] = [task_id]
+        if as_of:
+            query += " AND last_occurred_at <= $2"
+            params.append(as_of)
+        query += " ORDER BY version DESC LIMIT 1"
+
+        try:
+            row = await self.db.fetchrow(query, *params)
+        except Exception as e:
+            raise DatabaseError(
+                f"Failed to read task snapshot: {e}",
+                details={"task_id": task_id},
+            ) from e
+
+        return TaskSnapshot.from_row(row) if row else None
+
+    async def save_snapshot(self, state: TaskState, last_event: TaskEvent) -> TaskSnapshot:
+        """Persist ``state`` as the snapshot through ``last_event``, then compact.
+
+        Args:
+            state: State after folding every event up to ``last_event``
+            last_event: Last event folded into ``state``
+
+        Returns:
+            The stored snapshot
+
+        Raises:
+            DatabaseError: If the snapshot cannot be written
+        """
+        snapshot = TaskSnapshot(
+            state=TaskState.from_dict(state.to_dict()),
+            last_event_id=last_event.id,
+            last_occurred_at=last_event.occurred_at,
         )
+        await self._save_snapshot(snapshot)
+        return snapshot
+
+    async def _save_snapshot(self, snapshot: TaskSnapshot) -> None:
+        try:
+            # Concurrent replays of the same task write identical snapshots.
+            await self.db.execute(
+                """
+                INSERT INTO task_state_snapshots
+                    (task_id, version, last_event_id, last_occurred_at, state)
+                VALUES
+                    ($1, $2, $3, $4, $5)
+                ON CONFLICT (task_id, version) DO NOTHING
+                """,
+                snapshot.task_id,
+                snapshot.version,
+                snapshot.last_event_id,
+                snapshot.last_occurred_at,
+                json.dumps(snapshot.state.to_dict()),
+            )
+        except Exception as e:
+            logger.error(f"Failed to save snapshot: {e}")
+            raise DatabaseError(
+                f"Failed to save snapshot: {e}",
+                details={"task_id": snapshot.task_id, "version": snapshot.version},
+            ) from e
+
+        logger.debug(f"Saved snapshot v{snapshot.version} for task {snapshot.task_id}")
+        await self.compact_snapshots(snapshot.task_id)
+
+    async def snapshot_task(self, task_id: str) -> TaskSnapshot | None:
+        """Snapshot a task's settled state now, regardless of ``snapshot_every``.
+
+        Like automatic snapshots, this only covers events older than
+        ``SNAPSHOT_SETTLE``: newer ones stay in the replay tail, so an event
+        appended late with a slightly earlier timestamp is not hidden behind
+        the snapshot.
+
+        Args:
+            task_id: Task identifier
 
-        if not events:
+        Returns:
+            The new snapshot, the existing one if no settled events followed
+            it, or None if the task has no settled events
+
+        Raises:
+            DatabaseError: If the snapshot cannot be written
+        """
+        settled_before = datetime.now(UTC) - SNAPSHOT_SETTLE
+        state, tail, _ = await self._replay(task_id, as_of=settled_before)
+        if state is None:
             return None
+        if not tail:
+            return await self.get_latest_snapshot(task_id)
+        return await self.save_snapshot(state, tail[-1])
 
-        state = TaskState(task_id=task_id)
-        for event in events:
-            state.apply_event(event)
+    async def compact_snapshots(
+        self,
+        task_id: str | None = None,
+        keep: int | None = None,
+    ) -> int:
+        """Delete all but the newest snapshots of each task.
 
-        return state
+        Args:
+            task_id: Only compact this task (None = every task)
+            keep: Snapshots kept per task (defaults to ``keep_snapshots``)
+
+        Returns:
+            Number of snapshots deleted
+
+        Raises:
+            DatabaseError: If snapshots cannot be deleted
+        """
+        keep = self.keep_snapshots if keep is None else max(keep, 1)
+        scope = "WHERE task_id = $2" if task_id else ""
+        params: list[Any] = [keep, task_id] if task_id else [keep]
+
+        try:
+            result = await self.db.execute(
+                f"""
+                DELETE FROM task_state_snapshots s
+                USING (
+                    SELECT task_id, version,
+                           row_number() OVER (PARTITION BY task_id ORDER BY version DESC) AS rank
+                    FROM task_state_snapshots
+                    {scope}
+                ) ranked
+                WHERE s.task_id = ranked.task_id
+                  AND s.version = ranked.version
+                  AND ranked.rank > $1
+                """,
+                *params,
+            )
+        except Exception as e:
+            raise DatabaseError(
+                f"Failed to compact snapshots: {e}",
+                details={"task_id": task_id, "keep": keep},
+            ) from e
+
+        deleted = int(result.split()[-1]) if isinstance(result, str) and result else 0
+        if deleted:
+            logger.debug(f"Compacted {deleted} task snapshots")
+        return deleted
 
     async def get_events_by_correlation(
         self,
@@ -570,6 +926,48 @@ class EventStore:
 
         return [TaskEvent.from_row(row) for row in rows]
 
+    async def get_events_after(
+        self,
+        occurred_at: datetime,
+        event_id: str | None = None,
+        limit: int = 1000,
+    ) -> list[TaskEvent]:
+        """Get events of every task after a position in replay order.
+
+        Args:
+            occurred_at: Timestamp of the position
+            event_id: Event id of the position; None includes every event
+                that occurred at or after ``occurred_at``
+            limit: Maximum number of events to return
+
+        Returns:
+            Events ordered by (occurred_at, id)
+        """
+        if event_id is None:
+            rows = await self.db.fetch(
+                """
+                SELECT * FROM task_events
+                WHERE occurred_at >= $1
+                ORDER BY occurred_at ASC, id ASC
+                LIMIT $2
+                """,
+                occurred_at,
+                limit,
+            )
+        else:
+            rows = await self.db.fetch(
+                """
+                SELECT * FROM task_events
+                WHERE (occurred_at, id) > ($1::timestamptz, $2::uuid)
+                ORDER BY occurred_at ASC, id ASC
+                LIMIT $3
+                """,
+                occurred_at,
+                event_id,
+                limit,
+            )
+        return [TaskEvent.from_row(row) for row in rows]
+
     async def iter_all_events(
         self,
         since: datetime | None = None,
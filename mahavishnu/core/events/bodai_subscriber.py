@@ -3,8 +3,12 @@
 This module is the Mahavishnu-side consumer for the unified Bodai activity
 event stream. It consumes ``oneiric.runtime.events.EventEnvelope`` objects
 from Oneiric EventBridge (Redis Streams transport) and persists them to a
-local queue file at ``~/.mahavishnu/bodai-event-queue.json`` (atomic write,
-cap at 100 entries, oldest dropped first).
+segmented JSON-lines spool next to the configured queue path
+(``~/.mahavishnu/bodai-event-queue.spool/``; O(1) appends, capped at 100
+entries by dropping whole segments, oldest first). See
+:mod:`mahavishnu.core.events.spool` for the on-disk format and the reader
+cursor used by the PostToolUse hook. A legacy single-file JSON queue left
+by an older subscriber is imported into the spool on first append.
 
 Phase 5's ``.claude/hooks/mahavishnu-activity-stream.py`` is the
 WebSocket-based transition state (Mahavishnu-only). This module is the
@@ -40,6 +44,7 @@ import logging
 import os
 from pathlib import Path
 import socket
+import threading
 from typing import TYPE_CHECKING, Any
 
 from mahavishnu.core.errors import EventEnvelopeConversionError
@@ -54,6 +59,7 @@ from mahavishnu.core.events.observability import (
     record_legacy_decoded,
     record_wire_decode_failed,
 )
+from mahavishnu.core.events.spool import EventSpool, read_spool, spool_dir_for
 
 if TYPE_CHECKING:
     from collections.abc import Awaitable, Callable
@@ -71,6 +77,10 @@ SOURCE_UNKNOWN = "unknown"
 
 _logger = logging.getLogger(__name__)
 
+# One open spool per queue path so appends never rescan the directory.
+_spools: dict[Path, EventSpool] = {}
+_spools_lock = threading.Lock()
+
 
 def _accept_legacy_wire() -> bool:
     """Return True when the legacy Pydantic wire format should be accepted.
@@ -114,7 +124,7 @@ def _default_consumer_name() -> str:
 
 
 def _read_queue(path: Path) -> list[dict[str, Any]]:
-    """Read the queue file atomically. Returns ``[]`` if the file is missing or unreadable."""
+    """Read a legacy JSON-array queue file. Returns ``[]`` if missing or unreadable."""
     if not path.exists():
         return []
     try:
@@ -127,21 +137,42 @@ def _read_queue(path: Path) -> list[dict[str, Any]]:
     return data
 
 
-def _write_queue_atomic(path: Path, envelopes: list[dict[str, Any]]) -> None:
-    """Write the queue file atomically via tmp + rename. Mirrors Phase 5 hook pattern."""
-    path.parent.mkdir(parents=True, exist_ok=True)
-    tmp = path.with_suffix(path.suffix + ".tmp")
-    try:
-        with tmp.open("w", encoding="utf-8") as fh:
-            json.dump(envelopes, fh)
-            fh.flush()
-            os.fsync(fh.fileno())
-        os.replace(tmp, path)
-    except OSError:
-        try:
-            tmp.unlink()
-        except OSError:
-            pass
+def _open_spool(path: Path, queue_cap: int) -> EventSpool:
+    """Return the process-wide spool for ``path``, importing any legacy queue file."""
+    with _spools_lock:
+        spool = _spools.get(path)
+        if spool is None:
+            spool = EventSpool(spool_dir_for(path), cap=queue_cap)
+            legacy = _read_queue(path)
+            for envelope in legacy:
+                if isinstance(envelope, dict):
+                    spool.append(envelope)
+            if path.exists():
+                try:
+                    path.unlink()
+                except OSError:
+                    _logger.warning("bodai.subscriber: could not remove legacy queue %s", path)
+            _spools[path] = spool
+        elif spool.cap != max(1, queue_cap):
+            spool.cap = max(1, queue_cap)
+        return spool
+
+
+def _flush_spool(path: Path) -> None:
+    """Fsync the open spool for ``path`` (no-op when none is open)."""
+    with _spools_lock:
+        spool = _spools.get(path)
+    if spool is not None:
+        spool.flush()
+
+
+def close_spools() -> None:
+    """Fsync and close every open spool (subscriber shutdown / tests)."""
+    with _spools_lock:
+        spools = list(_spools.values())
+        _spools.clear()
+    for spool in spools:
+        spool.close()
 
 
 def append_to_queue(
@@ -150,17 +181,24 @@ def append_to_queue(
     queue_path: Path | None = None,
     queue_cap: int = DEFAULT_QUEUE_CAP,
 ) -> None:
-    """Append an envelope dict to the queue file, dropping oldest entries past the cap.
+    """Append an envelope dict to the spool, dropping whole oldest segments past the cap.
 
-    Atomic write: the queue file is rewritten via tmp + rename so concurrent
-    readers (e.g., the Phase 6 PostToolUse hook) never observe a partial file.
+    O(1) per event: one line is appended to the active segment; fsyncs are
+    batched. Readers tail the spool with
+    :func:`mahavishnu.core.events.spool.read_spool` and never observe a
+    partial line.
     """
     path = _resolve_queue_path(queue_path)
-    envelopes = _read_queue(path)
-    envelopes.append(envelope_dict)
-    if len(envelopes) > queue_cap:
-        envelopes = envelopes[-queue_cap:]
-    _write_queue_atomic(path, envelopes)
+    _open_spool(path, queue_cap).append(envelope_dict)
+
+
+def read_queue(queue_path: Path | str | None = None) -> list[dict[str, Any]]:
+    """Return every retained envelope, oldest first (spool plus any legacy file)."""
+    path = _resolve_queue_path(queue_path)
+    with _spools_lock:
+        spool = _spools.get(path)
+    result = spool.read() if spool is not None else read_spool(spool_dir_for(path))
+    return _read_queue(path) + result.envelopes
 
 
 def format_bodai_summary(envelope: EventEnvelope) -> str:
@@ -574,20 +612,22 @@ async def _close_redis_client(client: Any) -> None:
 
 
 async def _process_stream_entry(
-    client: Any,
     entry: object,
     *,
     callback: Callable[[Any], Awaitable[None]],
     queue_path: Path,
     queue_cap: int,
     per_event_timeout_seconds: float,
-    stream_name: str,
-    consumer_group: str,
-) -> None:
-    """Decode → invoke → append → ack a single Redis-stream entry."""
+) -> str | None:
+    """Decode → invoke → append a single Redis-stream entry.
+
+    Returns:
+        The message id to acknowledge once the batch is durable, or
+        ``None`` when the message must stay pending for redelivery.
+    """
     normalized = _normalize_stream_entry(entry)
     if normalized is None:
-        return
+        return None
     message_id, payload = normalized
 
     try:
@@ -599,7 +639,7 @@ async def _process_stream_entry(
             exc_info=True,
             extra={"message_id": message_id},
         )
-        return
+        return None
 
     callback_ran = await _invoke_callback(
         callback,
@@ -612,7 +652,7 @@ async def _process_stream_entry(
             per_event_timeout_seconds,
             message_id,
         )
-        return
+        return None
 
     try:
         await _append_envelope_to_queue(
@@ -625,13 +665,7 @@ async def _process_stream_entry(
             "bodai.subscriber: failed to append envelope to queue path=%s",
             queue_path,
         )
-
-    await _acknowledge_message(
-        client,
-        stream_name=stream_name,
-        consumer_group=consumer_group,
-        message_id=message_id,
-    )
+    return message_id
 
 
 # ---------------------------------------------------------------------------
@@ -650,21 +684,46 @@ async def _process_response(
     stream_name: str,
     consumer_group: str,
 ) -> None:
-    """Decode → invoke → append → ack each entry returned by ``xreadgroup``."""
+    """Decode → invoke → append each entry returned by ``xreadgroup``, fsync, then ack.
+
+    Acknowledgements wait for one spool fsync per batch, so an acked
+    envelope is never lost to a crash. If the fsync fails, the batch stays
+    pending and Redis redelivers it.
+    """
+    to_ack: list[str] = []
     for _stream_key, entries in response:
         if not isinstance(entries, list):
             continue
         for entry in entries:
-            await _process_stream_entry(
-                client,
+            message_id = await _process_stream_entry(
                 entry,
                 callback=callback,
                 queue_path=queue_path,
                 queue_cap=queue_cap,
                 per_event_timeout_seconds=per_event_timeout_seconds,
-                stream_name=stream_name,
-                consumer_group=consumer_group,
             )
+            if message_id is not None:
+                to_ack.append(message_id)
+    if not to_ack:
+        return
+
+    try:
+        await asyncio.to_thread(_flush_spool, queue_path)
+    except OSError:
+        _logger.exception(
+            "bodai.subscriber: spool fsync failed; leaving %d messages unacked path=%s",
+            len(to_ack),
+            queue_path,
+        )
+        return
+
+    for message_id in to_ack:
+        await _acknowledge_message(
+            client,
+            stream_name=stream_name,
+            consumer_group=consumer_group,
+            message_id=message_id,
+        )
 
 
 async def _run_subscription_loop(
@@ -760,8 +819,9 @@ async def subscribe_to_bodai_events(
     The transport is Redis Streams via ``redis.asyncio.client.Redis`` using a
     consumer group. Each message is decoded as an ``EventEnvelope``, the
     caller-supplied ``callback`` is invoked, and the envelope dict is
-    appended to the local queue file via :func:`append_to_queue`. Messages
-    are acknowledged (XACK) after the callback completes successfully.
+    appended to the local spool via :func:`append_to_queue`. Messages
+    are acknowledged (XACK) after the callback completes and the batch's
+    spool appends have been fsynced. Open spools are closed on exit.
 
     Args:
         callback: Async function invoked for each decoded envelope.
@@ -769,10 +829,12 @@ async def subscribe_to_bodai_events(
         consumer_group: Name of the Redis Streams consumer group to join.
         consumer_name: Name for this consumer within the group. Defaults to
             ``socket.gethostname()``.
-        queue_path: Local queue-file path. Defaults to
+        queue_path: Local queue path; the spool directory lives beside it
+            (``<stem>.spool``). Defaults to
             ``~/.mahavishnu/bodai-event-queue.json``. Override via the
             ``MAHAVISHNU_BODAI_QUEUE_PATH`` env var when omitted.
-        queue_cap: Maximum number of envelopes retained in the queue file.
+        queue_cap: Envelopes retained in the spool. Eviction drops whole
+            segments, so up to ``queue_cap // 4 - 1`` extra may be kept.
         per_event_timeout_seconds: Per-callback timeout. The callback is
             awaited with this ceiling; a timeout is logged and the message
             is not acked (so another consumer can retry).
@@ -811,6 +873,7 @@ async def subscribe_to_bodai_events(
         )
     finally:
         await _close_redis_client(client)
+        await asyncio.to_thread(close_spools)
 
 
 __all__ = [
@@ -818,6 +881,8 @@ __all__ = [
     "DEFAULT_QUEUE_CAP",
     "STREAM_NAME",
     "append_to_queue",
+    "close_spools",
     "format_bodai_summary",
+    "read_queue",
     "subscribe_to_bodai_events",
 ]
@@ -6,8 +6,9 @@ Wraps existing ``broadcast_workflow_started`` / ``broadcast_workflow_completed``
 Mahavishnu event publisher (an
 :class:`OneiricEventPublisherProtocol` implementation).
 
-The result: events appear in the unified Bodai queue
-(``~/.mahavishnu/bodai-event-queue.json``) for consumption by ``/bodai-status``
+The result: events appear in the unified Bodai spool (the segmented
+JSON-lines directory ``~/.mahavishnu/bodai-event-queue.spool/``, see
+:mod:`mahavishnu.core.events.spool`) for consumption by ``/bodai-status``
 and the PostToolUse hook, in addition to the existing WebSocket broadcasts
 (which are kept for non-Claude consumers).
 
@@ -0,0 +1,336 @@
+"""Segmented JSON-lines spool for locally persisted Bodai envelopes.
+
+Replaces the single JSON array queue file that was read, appended to and
+fully rewritten (and fsynced) for every event. The spool is a directory
+of numbered segment files, one JSON object per line:
+
+  <queue>.spool/
+    000000000001.jsonl
+    000000000002.jsonl
+    ...
+
+Properties:
+
+- **O(1) appends.** The writer keeps the active segment open in append
+  mode; an event costs one ``write`` of its own line. Nothing already in
+  the spool is re-read or re-written.
+- **Cap by whole segments.** When the retained count exceeds ``cap``,
+  the oldest segment files are unlinked while doing so still leaves at
+  least ``cap`` envelopes. The spool therefore holds between ``cap`` and
+  ``cap + segment_records - 1`` envelopes once full.
+- **Batched fsync.** Lines are flushed to the OS on every append (safe
+  against a process crash) and fsynced once per ``fsync_every`` appends
+  or ``fsync_interval_seconds``, whichever comes first. When appends stop
+  inside an interval, a timer thread fsyncs the remainder once the
+  interval has passed, so an idle spool is never left unsynced. Callers
+  that must not acknowledge upstream before durability call ``flush()``.
+- **Reader cursor.** :func:`read_spool` is stateless and takes a
+  :class:`SpoolCursor` ``(segment, offset)``; it returns only envelopes
+  written after the cursor plus the advanced cursor, so a tailing reader
+  (the PostToolUse hook) never re-parses old envelopes. A partially
+  written trailing line is left for the next read.
+- **Torn-line repair.** A final line torn by a crashed writer is closed
+  with a newline before the next append, so readers skip it as one
+  corrupt line instead of merging it with the next envelope.
+
+Single writer per directory (the subscriber process); any number of
+readers.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import json
+import logging
+import os
+import threading
+import time
+from typing import IO, TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+_logger = logging.getLogger(__name__)
+
+SEGMENT_SUFFIX = ".jsonl"
+DEFAULT_FSYNC_EVERY = 32
+DEFAULT_FSYNC_INTERVAL_SECONDS = 1.0
+
+
+def spool_dir_for(queue_path: Path) -> Path:
+    """Return the spool directory that backs ``queue_path``.
+
+    ``~/.mahavishnu/bodai-event-queue.json`` → ``~/.mahavishnu/bodai-event-queue.spool``
+    """
+    return queue_path.with_name(queue_path.stem + ".spool")
+
+
+def _segment_name(segment_id: int) -> str:
+    return f"{segment_id:012d}{SEGMENT_SUFFIX}"
+
+
+def _list_segments(directory: Path) -> list[int]:
+    """Return the sorted ids of segment files present in ``directory``."""
+    if not directory.is_dir():
+        return []
+    ids: list[int] = []
+    for entry in directory.iterdir():
+        if entry.suffix != SEGMENT_SUFFIX:
+            continue
+        try:
+            ids.append(int(entry.stem))
+        except ValueError:
+            continue
+    ids.sort()
+    return ids
+
+
+def _count_lines(path: Path) -> int:
+    try:
+        with path.open("rb") as fh:
+            return sum(1 for line in fh if line.endswith(b"\n"))
+    except OSError:
+        return 0
+
+
+def _ends_with_newline(path: Path) -> bool:
+    """Whether ``path`` is empty or its last byte terminates a line."""
+    try:
+        with path.open("rb") as fh:
+            if fh.seek(0, os.SEEK_END) == 0:
+                return True
+            fh.seek(-1, os.SEEK_END)
+            return fh.read(1) == b"\n"
+    except OSError:
+        return True
+
+
+@dataclass(frozen=True, slots=True)
+class SpoolCursor:
+    """Position in a spool: the next unread byte of ``segment``."""
+
+    segment: int = 0
+    offset: int = 0
+
+    def to_dict(self) -> dict[str, int]:
+        return {"segment": self.segment, "offset": self.offset}
+
+    @classmethod
+    def from_dict(cls, data: Any) -> SpoolCursor:
+        if not isinstance(data, dict):
+            return cls()
+        try:
+            return cls(segment=int(data.get("segment", 0)), offset=int(data.get("offset", 0)))
+        except (TypeError, ValueError):
+            return cls()
+
+
+@dataclass(frozen=True, slots=True)
+class SpoolRead:
+    """Result of :func:`read_spool`."""
+
+    envelopes: list[dict[str, Any]]
+    cursor: SpoolCursor
+    dropped: bool = False
+    """``True`` when the cursor pointed at a segment that was already evicted."""
+
+
+def _parse_lines(raw: bytes, envelopes: list[dict[str, Any]], limit: int | None) -> int:
+    """Parse complete lines from ``raw`` into ``envelopes``; return bytes consumed."""
+    consumed = 0
+    while True:
+        if limit is not None and len(envelopes) >= limit:
+            break
+        newline = raw.find(b"\n", consumed)
+        if newline < 0:
+            break  # partial trailing line: leave for the next read
+        line = raw[consumed:newline]
+        consumed = newline + 1
+        if not line.strip():
+            continue
+        try:
+            item = json.loads(line)
+        except ValueError:
+            _logger.warning("bodai.spool: skipping corrupt spool line")
+            continue
+        if isinstance(item, dict):
+            envelopes.append(item)
+    return consumed
+
+
+def read_spool(
+    directory: Path,
+    cursor: SpoolCursor | None = None,
+    *,
+    limit: int | None = None,
+) -> SpoolRead:
+    """Return envelopes written after ``cursor`` (all of them when ``None``).
+
+    Only segments at or after ``cursor.segment`` are opened, and the
+    cursor's segment is read from ``cursor.offset`` onward.
+    """
+    segments = _list_segments(directory)
+    start = cursor or SpoolCursor()
+    if not segments:
+        return SpoolRead(envelopes=[], cursor=start)
+
+    dropped = cursor is not None and cursor.segment != 0 and cursor.segment < segments[0]
+    envelopes: list[dict[str, Any]] = []
+    position = start
+    for segment_id in segments:
+        if segment_id < start.segment:
+            continue
+        offset = start.offset if segment_id == start.segment else 0
+        try:
+            with (directory / _segment_name(segment_id)).open("rb") as fh:
+                fh.seek(offset)
+                raw = fh.read()
+        except FileNotFoundError:
+            # Evicted between listing and opening; keep going.
+            dropped = True
+            continue
+        consumed = _parse_lines(raw, envelopes, limit)
+        position = SpoolCursor(segment=segment_id, offset=offset + consumed)
+        if limit is not None and len(envelopes) >= limit:
+            break
+    return SpoolRead(envelopes=envelopes, cursor=position, dropped=dropped)
+
+
+class EventSpool:
+    """Append-side handle on a segmented spool directory.
+
+    Thread-safe: the subscriber appends from ``asyncio.to_thread`` workers.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        *,
+        cap: int,
+        segment_records: int | None = None,
+        fsync_every: int = DEFAULT_FSYNC_EVERY,
+        fsync_interval_seconds: float = DEFAULT_FSYNC_INTERVAL_SECONDS,
+    ) -> None:
+        self.directory = directory
+        self.cap = max(1, cap)
+        self.segment_records = max(1, segment_records or self.cap // 4 or 1)
+        self._fsync_every = max(1, fsync_every)
+        self._fsync_interval = max(0.0, fsync_interval_seconds)
+        self._lock = threading.Lock()
+        self._handle: IO[bytes] | None = None
+        self._pending_fsync = 0
+        self._last_fsync = time.monotonic()
+        self._fsync_timer: threading.Timer | None = None
+
+        # One directory scan at open; every later append is O(1).
+        self._segments: list[list[int]] = [
+            [segment_id, _count_lines(directory / _segment_name(segment_id))]
+            for segment_id in _list_segments(directory)
+        ]
+        self._total = sum(count for _, count in self._segments)
+
+    def __len__(self) -> int:
+        return self._total
+
+    @property
+    def segment_count(self) -> int:
+        return len(self._segments)
+
+    def append(self, envelope: dict[str, Any]) -> None:
+        """Append one envelope; evict whole segments beyond the cap."""
+        line = json.dumps(envelope, separators=(",", ":"), default=str).encode("utf-8") + b"\n"
+        with self._lock:
+            handle = self._active_handle()
+            handle.write(line)
+            handle.flush()
+            self._segments[-1][1] += 1
+            self._total += 1
+            self._pending_fsync += 1
+            elapsed = time.monotonic() - self._last_fsync
+            if self._pending_fsync >= self._fsync_every or elapsed >= self._fsync_interval:
+                self._fsync()
+            else:
+                self._schedule_fsync(self._fsync_interval - elapsed)
+            self._enforce_cap()
+
+    def _schedule_fsync(self, delay: float) -> None:
+        """Fsync after ``delay`` unless an append or flush gets there first."""
+        if self._fsync_timer is not None:
+            return
+        self._fsync_timer = threading.Timer(delay, self._deferred_fsync)
+        self._fsync_timer.daemon = True
+        self._fsync_timer.start()
+
+    def _deferred_fsync(self) -> None:
+        with self._lock:
+            try:
+                self._fsync()
+            except OSError:
+                _logger.warning("bodai.spool: deferred fsync of %s failed", self.directory)
+
+    def _active_handle(self) -> IO[bytes]:
+        if self._segments and self._segments[-1][1] >= self.segment_records:
+            self._roll()
+        if not self._segments:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._segments.append([1, 0])
+        if self._handle is None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            path = self.directory / _segment_name(self._segments[-1][0])
+            self._handle = path.open("ab")
+            if not _ends_with_newline(path):
+                self._handle.write(b"\n")
+        return self._handle
+
+    def _roll(self) -> None:
+        """Seal the active segment and start the next one."""
+        self._fsync()
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+        self._segments.append([self._segments[-1][0] + 1, 0])
+
+    def _enforce_cap(self) -> None:
+        while len(self._segments) > 1 and self._total - self._segments[0][1] >= self.cap:
+            segment_id, count = self._segments.pop(0)
+            try:
+                (self.directory / _segment_name(segment_id)).unlink()
+            except FileNotFoundError:
+                pass
+            self._total -= count
+
+    def _fsync(self) -> None:
+        if self._fsync_timer is not None:
+            self._fsync_timer.cancel()
+            self._fsync_timer = None
+        if self._handle is not None and self._pending_fsync:
+            os.fsync(self._handle.fileno())
+        self._pending_fsync = 0
+        self._last_fsync = time.monotonic()
+
+    def read(self, cursor: SpoolCursor | None = None, *, limit: int | None = None) -> SpoolRead:
+        with self._lock:
+            if self._handle is not None:
+                self._handle.flush()
+        return read_spool(self.directory, cursor, limit=limit)
+
+    def flush(self) -> None:
+        """Force any batched writes to stable storage."""
+        with self._lock:
+            self._fsync()
+
+    def close(self) -> None:
+        with self._lock:
+            self._fsync()
+            if self._handle is not None:
+                self._handle.close()
+                self._handle = None
+
+
+__all__ = [
+    "EventSpool",
+    "SpoolCursor",
+    "SpoolRead",
+    "read_spool",
+    "spool_dir_for",
+]
@@ -14,6 +14,7 @@ from uuid import uuid4
 
 import httpx
 
+from mahavishnu.core.http_clients import SESSION_BUDDY, get_http_client
 from mahavishnu.core.skill_governance import LearningEvidence
 
 logger = logging.getLogger(__name__)
@@ -34,22 +35,22 @@ class _SessionBuddyEvidenceSource:
         self._timeout = store_timeout
 
     async def get_recent_outcomes(self, limit: int) -> list[dict[str, Any]]:
-        async with httpx.AsyncClient(timeout=self._timeout) as client:
-            resp = await client.post(
-                f"{self._url}/tools/call",
-                json={
-                    "jsonrpc": "2.0",
-                    "id": str(uuid4()),
-                    "method": "tools/call",
-                    "params": {
-                        "name": "search_conversations",
-                        "arguments": {"query": "outcome", "limit": limit},
-                    },
+        resp = await get_http_client(SESSION_BUDDY).post(
+            f"{self._url}/tools/call",
+            json={
+                "jsonrpc": "2.0",
+                "id": str(uuid4()),
+                "method": "tools/call",
+                "params": {
+                    "name": "search_conversations",
+                    "arguments": {"query": "outcome", "limit": limit},
                 },
-            )
-            resp.raise_for_status()
-            result = resp.json().get("result", {})
-            return result.get("conversations", []) if isinstance(result, dict) else []
+            },
+            timeout=self._timeout,
+        )
+        resp.raise_for_status()
+        result = resp.json().get("result", {})
+        return result.get("conversations", []) if isinstance(result, dict) else []
 
 
 class EvidenceCollector:
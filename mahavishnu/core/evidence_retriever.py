@@ -6,9 +6,9 @@ import logging
 from typing import Protocol, runtime_checkable
 from uuid import uuid4
 
-import httpx
 from pydantic import BaseModel, Field
 
+from mahavishnu.core.http_clients import AKOSHA, SESSION_BUDDY, get_http_client
 from mahavishnu.core.skill_governance import LearningEvidence
 
 logger = logging.getLogger(__name__)
@@ -120,90 +120,84 @@ class EvidenceRetriever:
         )
 
     async def _search_akosha(self, query: str, limit: int) -> list[RetrievedEvidence]:
-        async with httpx.AsyncClient(timeout=self._timeout) as client:
-            resp = await client.post(
-                f"{self._akosha_url}/tools/call",
+        resp = await get_http_client(AKOSHA).post(
+            f"{self._akosha_url}/tools/call",
+            json={
+                "jsonrpc": "2.0",
+                "id": str(uuid4()),
+                "method": "tools/call",
+                "params": {
+                    "name": "search_all_systems",
+                    "arguments": {"query": query, "limit": limit},
+                },
+            },
+            timeout=self._timeout,
+        )
+        if resp.status_code != 200:
+            logger.warning("akosha_search_http_error: status=%s", resp.status_code)
+            return []
+
+        data = resp.json()
+        items = data.get("result", {}).get("results", [])
+        if not items:
+            items = data.get("result", {}).get("content", [])
+        if isinstance(items, dict):
+            items = items.get("items", [])
+
+        results: list[RetrievedEvidence] = []
+        for item in items:
+            if isinstance(item, dict):
+                results.append(
+                    RetrievedEvidence(
+                        evidence_id=item.get("id", item.get("evidence_id", f"re_{uuid4().hex}")),
+                        similarity=float(item.get("score", item.get("similarity", 0.0))),
+                        goal=item.get("text", item.get("goal", "")),
+                        outcome=item.get("outcome", item.get("metadata", {}).get("outcome", "")),
+                        observations=item.get(
+                            "observations", item.get("metadata", {}).get("observations", [])
+                        ),
+                        source="akosha",
+                    )
+                )
+        return results
+
+    async def _search_session_buddy(self, query: str, limit: int) -> list[RetrievedEvidence]:
+        try:
+            resp = await get_http_client(SESSION_BUDDY).post(
+                f"{self._session_buddy_url}/tools/call",
                 json={
                     "jsonrpc": "2.0",
                     "id": str(uuid4()),
                     "method": "tools/call",
                     "params": {
-                        "name": "search_all_systems",
+                        "name": "search_conversations",
                         "arguments": {"query": query, "limit": limit},
                     },
                 },
+                timeout=self._timeout,
             )
             if resp.status_code != 200:
-                logger.warning("akosha_search_http_error: status=%s", resp.status_code)
+                logger.warning("session_buddy_search_http_error: status=%s", resp.status_code)
                 return []
 
             data = resp.json()
-            items = data.get("result", {}).get("results", [])
-            if not items:
-                items = data.get("result", {}).get("content", [])
-            if isinstance(items, dict):
-                items = items.get("items", [])
-
+            items = data.get("result", {}).get("conversations", [])
             results: list[RetrievedEvidence] = []
             for item in items:
-                if isinstance(item, dict):
-                    results.append(
-                        RetrievedEvidence(
-                            evidence_id=item.get(
-                                "id", item.get("evidence_id", f"re_{uuid4().hex}")
-                            ),
-                            similarity=float(item.get("score", item.get("similarity", 0.0))),
-                            goal=item.get("text", item.get("goal", "")),
-                            outcome=item.get(
-                                "outcome", item.get("metadata", {}).get("outcome", "")
-                            ),
-                            observations=item.get(
-                                "observations", item.get("metadata", {}).get("observations", [])
-                            ),
-                            source="akosha",
-                        )
+                meta = item.get("metadata", {})
+                if meta.get("artifact_type") != "learning_evidence":
+                    continue
+                results.append(
+                    RetrievedEvidence(
+                        evidence_id=item.get("id", item.get("evidence_id", f"re_{uuid4().hex}")),
+                        similarity=float(item.get("score", 0.5)),
+                        goal=item.get("summary", item.get("goal", "")),
+                        outcome=meta.get("outcome", ""),
+                        observations=meta.get("observations", []),
+                        source="session_buddy",
                     )
-            return results
-
-    async def _search_session_buddy(self, query: str, limit: int) -> list[RetrievedEvidence]:
-        try:
-            async with httpx.AsyncClient(timeout=self._timeout) as client:
-                resp = await client.post(
-                    f"{self._session_buddy_url}/tools/call",
-                    json={
-                        "jsonrpc": "2.0",
-                        "id": str(uuid4()),
-                        "method": "tools/call",
-                        "params": {
-                            "name": "search_conversations",
-                            "arguments": {"query": query, "limit": limit},
-                        },
-                    },
                 )
-                if resp.status_code != 200:
-                    logger.warning("session_buddy_search_http_error: status=%s", resp.status_code)
-                    return []
-
-                data = resp.json()
-                items = data.get("result", {}).get("conversations", [])
-                results: list[RetrievedEvidence] = []
-                for item in items:
-                    meta = item.get("metadata", {})
-                    if meta.get("artifact_type") != "learning_evidence":
-                        continue
-                    results.append(
-                        RetrievedEvidence(
-                            evidence_id=item.get(
-                                "id", item.get("evidence_id", f"re_{uuid4().hex}")
-                            ),
-                            similarity=float(item.get("score", 0.5)),
-                            goal=item.get("summary", item.get("goal", "")),
-                            outcome=meta.get("outcome", ""),
-                            observations=meta.get("observations", []),
-                            source="session_buddy",
-                        )
-                    )
-                return results
+            return results
         except Exception:
             logger.warning("session_buddy_search_failed: returning empty", exc_info=True)
             return []
@@ -8,6 +8,7 @@ from uuid import uuid4
 import httpx
 from pydantic import BaseModel, Field
 
+from mahavishnu.core.http_clients import SESSION_BUDDY, get_http_client
 from mahavishnu.core.skill_governance import LearningEvidence
 
 logger = logging.getLogger(__name__)
@@ -39,31 +40,32 @@ class EvidenceStore:
 
     async def store(self, evidence: LearningEvidence) -> bool:
         try:
-            async with httpx.AsyncClient(timeout=self._timeout) as client:
-                resp = await client.post(
-                    f"{self._url}/tools/call",
-                    json={
-                        "jsonrpc": "2.0",
-                        "id": str(uuid4()),
-                        "method": "tools/call",
-                        "params": {
-                            "name": "store_memory",
-                            "arguments": {
-                                "memory_id": evidence.evidence_id,
-                                "text": evidence.goal,
-                                "metadata": {
-                                    "artifact_type": "learning_evidence",
-                                    "evidence_id": evidence.evidence_id,
-                                    "session_id": evidence.session_id,
-                                    "outcome": evidence.outcome,
-                                    "repo_paths": evidence.repo_paths,
-                                    "tool_calls": evidence.tool_calls,
-                                    "collected_at": evidence.collected_at.isoformat(),
-                                },
+            client = get_http_client(SESSION_BUDDY)
+            resp = await client.post(
+                f"{self._url}/tools/call",
+                json={
+                    "jsonrpc": "2.0",
+                    "id": str(uuid4()),
+                    "method": "tools/call",
+                    "params": {
+                        "name": "store_memory",
+                        "arguments": {
+                            "memory_id": evidence.evidence_id,
+                            "text": evidence.goal,
+                            "metadata": {
+                                "artifact_type": "learning_evidence",
+                                "evidence_id": evidence.evidence_id,
+                                "session_id": evidence.session_id,
+                                "outcome": evidence.outcome,
+                                "repo_paths": evidence.repo_paths,
+                                "tool_calls": evidence.tool_calls,
+                                "collected_at": evidence.collected_at.isoformat(),
                             },
                         },
                     },
-                )
+                },
+                timeout=self._timeout,
+            )
             if resp.status_code == 200:
                 logger.debug("evidence_stored: id=%s", evidence.evidence_id)
                 return True
@@ -97,19 +99,20 @@ class EvidenceStore:
 
     async def query_evidence(self, query: str, limit: int = 20) -> list[LearningEvidence]:
         try:
-            async with httpx.AsyncClient(timeout=self._timeout) as client:
-                resp = await client.post(
-                    f"{self._url}/tools/call",
-                    json={
-                        "jsonrpc": "2.0",
-                        "id": str(uuid4()),
-                        "method": "tools/call",
-                        "params": {
-                            "name": "search_conversations",
-                            "arguments": {"query": query, "limit": limit},
-                        },
+            client = get_http_client(SESSION_BUDDY)
+            resp = await client.post(
+                f"{self._url}/tools/call",
+                json={
+                    "jsonrpc": "2.0",
+                    "id": str(uuid4()),
+                    "method": "tools/call",
+                    "params": {
+                        "name": "search_conversations",
+                        "arguments": {"query": query, "limit": limit},
                     },
-                )
+                },
+                timeout=self._timeout,
+            )
             if resp.status_code != 200:
                 logger.warning("evidence_query_failed: status=%s", resp.status_code)
                 return []
@@ -0,0 +1,338 @@
+"""Process-wide keep-alive HTTP clients for sibling ecosystem services.
+
+Call sites used to open a fresh ``httpx.AsyncClient`` per request, paying
+TCP setup (and TLS for external endpoints) on every call. This module keeps
+one pooled client per service instead:
+
+- Clients are keyed by service name (Session-Buddy, Akosha, Crackerjack,
+  Dhara, Ollama, plus ``external`` for third-party APIs) and carry that
+  service's connection limits, keep-alive expiry and default timeout.
+- Async clients are bound to the event loop that created them; a later
+  ``asyncio.run()`` (CLI commands, capability probes) transparently gets a
+  fresh client instead of one whose connections belong to a dead loop.
+- HTTP/2 is enabled per service when the ``h2`` package is installed.
+- ``MahavishnuApp.start_http_clients()`` / ``close_http_clients()`` warm and
+  release the pools; :func:`http_client_stats` and
+  :func:`export_http_pool_metrics` report pool utilization, and the health
+  app's ``/metrics`` endpoint exports it on every scrape.
+
+Callers keep their own per-request timeouts by passing ``timeout=`` to the
+request method; the registry owns the client, so callers must not close it.
+
+Usage:
+    from mahavishnu.core.http_clients import SESSION_BUDDY, get_http_client
+
+    client = get_http_client(SESSION_BUDDY)
+    resp = await client.post(f"{url}/tools/call", json=payload, timeout=10)
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from dataclasses import dataclass
+import importlib.util
+import logging
+import threading
+from typing import Any
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+SESSION_BUDDY = "session_buddy"
+AKOSHA = "akosha"
+CRACKERJACK = "crackerjack"
+DHARA = "dhara"
+OLLAMA = "ollama"
+EXTERNAL = "external"
+
+
+@dataclass(frozen=True)
+class ServiceClientConfig:
+    """Connection pool settings for one service.
+
+    Attributes:
+        max_connections: Upper bound on open connections to the service
+        max_keepalive_connections: Idle connections kept for reuse
+        keepalive_expiry: Seconds an idle connection is kept open
+        timeout: Default request timeout in seconds
+        connect_timeout: Connection establishment timeout in seconds
+        http2: Negotiate HTTP/2 when the ``h2`` package is available
+    """
+
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry: float = 30.0
+    timeout: float = 10.0
+    connect_timeout: float = 5.0
+    http2: bool = False
+
+
+DEFAULT_SERVICE_CONFIGS: dict[str, ServiceClientConfig] = {
+    SESSION_BUDDY: ServiceClientConfig(max_connections=20, timeout=10.0),
+    AKOSHA: ServiceClientConfig(max_connections=20, timeout=30.0),
+    CRACKERJACK: ServiceClientConfig(max_connections=10, timeout=30.0),
+    DHARA: ServiceClientConfig(max_connections=10, timeout=10.0),
+    OLLAMA: ServiceClientConfig(max_connections=8, max_keepalive_connections=4, timeout=120.0),
+    EXTERNAL: ServiceClientConfig(max_connections=20, timeout=10.0, http2=True),
+}
+
+
+def _h2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+def _pool_connections(client: Any) -> list[Any]:
+    """Return the httpcore connections behind ``client`` (empty if unknown)."""
+    pool = getattr(getattr(client, "_transport", None), "_pool", None)
+    connections = getattr(pool, "connections", None)
+    return list(connections) if isinstance(connections, list) else []
+
+
+class HttpClientRegistry:
+    """Lazily created, pooled HTTP clients keyed by service name.
+
+    Example:
+        registry = HttpClientRegistry()
+        client = registry.get("akosha")
+        await registry.aclose()
+    """
+
+    def __init__(self, configs: dict[str, ServiceClientConfig] | None = None) -> None:
+        """Initialize the registry.
+
+        Args:
+            configs: Per-service overrides merged over DEFAULT_SERVICE_CONFIGS
+        """
+        self._configs = {**DEFAULT_SERVICE_CONFIGS, **(configs or {})}
+        self._clients: dict[tuple[str, asyncio.AbstractEventLoop], httpx.AsyncClient] = {}
+        self._sync_clients: dict[str, httpx.Client] = {}
+        self._requests: Counter[str] = Counter()
+        self._dropped: Counter[str] = Counter()
+        self._lock = threading.Lock()
+
+    def configure(self, service: str, config: ServiceClientConfig) -> None:
+        """Set pool settings for ``service``.
+
+        Applies to clients created afterwards; call :meth:`aclose` first to
+        rebuild live clients with the new settings.
+        """
+        self._configs[service] = config
+
+    def config_for(self, service: str) -> ServiceClientConfig:
+        """Return the settings for ``service`` (unknown services use ``external``)."""
+        return self._configs.get(service) or self._configs[EXTERNAL]
+
+    def _client_kwargs(self, service: str) -> dict[str, Any]:
+        config = self.config_for(service)
+        return {
+            "limits": httpx.Limits(
+                max_connections=config.max_connections,
+                max_keepalive_connections=config.max_keepalive_connections,
+                keepalive_expiry=config.keepalive_expiry,
+            ),
+            "timeout": httpx.Timeout(config.timeout, connect=config.connect_timeout),
+            "http2": config.http2 and _h2_available(),
+        }
+
+    def get(self, service: str) -> httpx.AsyncClient:
+        """Return the pooled async client for ``service`` on the running loop.
+
+        Raises:
+            RuntimeError: If called outside a running event loop
+        """
+        loop = asyncio.get_running_loop()
+        key = (service, loop)
+        client = self._clients.get(key)
+        if client is not None and getattr(client, "is_closed", False) is not True:
+            return client
+
+        with self._lock:
+            # Clients whose loop has finished cannot be awaited for close;
+            # their sockets are already gone, so just drop the references.
+            for stale in [k for k in self._clients if k[1].is_closed()]:
+                del self._clients[stale]
+                self._dropped[stale[0]] += 1
+
+            async def count_request(request: httpx.Request) -> None:
+                self._requests[service] += 1
+
+            client = httpx.AsyncClient(
+                **self._client_kwargs(service),
+                event_hooks={"request": [count_request]},
+            )
+            self._clients[key] = client
+        logger.debug(f"Created pooled HTTP client for {service}")
+        return client
+
+    def get_sync(self, service: str) -> httpx.Client:
+        """Return the pooled blocking client for ``service`` (thread-safe)."""
+        with self._lock:
+            client = self._sync_clients.get(service)
+            if client is None or client.is_closed:
+
+                def count_request(request: httpx.Request) -> None:
+                    self._requests[service] += 1
+
+                client = httpx.Client(
+                    **self._client_kwargs(service),
+                    event_hooks={"request": [count_request]},
+                )
+                self._sync_clients[service] = client
+            return client
+
+    async def start(self, services: list[str] | None = None) -> None:
+        """Create clients for ``services`` (default: all configured) on this loop."""
+        for service in services or list(self._configs):
+            self.get(service)
+
+    async def aclose(self) -> None:
+        """Close every client this process can still close. Idempotent.
+
+        Clients bound to another event loop are closed on that loop when it
+        is still running (e.g. a loop in a worker thread). Clients whose
+        loop is closed or stopped cannot be closed from here; they are
+        logged and counted in ``stats()`` as ``dropped``.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            clients, self._clients = self._clients, {}
+            sync_clients, self._sync_clients = self._sync_clients, {}
+
+        for (service, owner), client in clients.items():
+            try:
+                if owner is loop:
+                    await client.aclose()
+                elif owner.is_running():
+                    future = asyncio.run_coroutine_threadsafe(client.aclose(), owner)
+                    await asyncio.wrap_future(future)
+                else:
+                    self._dropped[service] += 1
+                    logger.warning(
+                        f"Dropped HTTP client for {service}: its event loop is no longer running"
+                    )
+            except Exception as e:  # noqa: BLE001 - shutdown must close the remaining clients
+                logger.warning(f"Failed to close HTTP client for {service}: {e}")
+        for client in sync_clients.values():
+            client.close()
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """Return pool utilization per service.
+
+        Returns:
+            Mapping of service to ``connections``, ``in_use``, ``idle``,
+            ``max_connections``, cumulative ``requests`` and ``dropped``
+            (clients released without close because their loop had ended)
+        """
+        with self._lock:
+            clients = [(service, client) for (service, _), client in self._clients.items()]
+            clients += list(self._sync_clients.items())
+            requests = dict(self._requests)
+            dropped = dict(self._dropped)
+
+        stats: dict[str, dict[str, int]] = {}
+        services = {service for service, _ in clients} | set(requests) | set(dropped)
+        for service in sorted(services):
+            stats[service] = {
+                "connections": 0,
+                "in_use": 0,
+                "idle": 0,
+                "max_connections": self.config_for(service).max_connections,
+                "requests": requests.get(service, 0),
+                "dropped": dropped.get(service, 0),
+            }
+        for service, client in clients:
+            for connection in _pool_connections(client):
+                idle = bool(connection.is_idle())
+                entry = stats[service]
+                entry["connections"] += 1
+                entry["idle" if idle else "in_use"] += 1
+        return stats
+
+
+_registry = HttpClientRegistry()
+_pool_gauges: dict[str, Any] = {}
+
+
+def get_http_client_registry() -> HttpClientRegistry:
+    """Return the process-wide registry."""
+    return _registry
+
+
+def get_http_client(service: str) -> httpx.AsyncClient:
+    """Return the process-wide pooled async client for ``service``."""
+    return _registry.get(service)
+
+
+def get_sync_http_client(service: str) -> httpx.Client:
+    """Return the process-wide pooled blocking client for ``service``."""
+    return _registry.get_sync(service)
+
+
+async def close_http_clients() -> None:
+    """Close the process-wide clients. Idempotent."""
+    await _registry.aclose()
+
+
+def http_client_stats() -> dict[str, dict[str, int]]:
+    """Return pool utilization for the process-wide clients."""
+    return _registry.stats()
+
+
+def export_http_pool_metrics() -> dict[str, dict[str, int]]:
+    """Publish pool utilization as Prometheus gauges and return it.
+
+    Gauges are ``mahavishnu_http_pool_connections{service,state}``,
+    ``mahavishnu_http_pool_max_connections{service}`` and
+    ``mahavishnu_http_pool_dropped_clients{service}``. Called by the
+    ``/metrics`` endpoint of :mod:`mahavishnu.health` on every scrape.
+    Without ``prometheus_client`` installed only the stats dict is returned.
+    """
+    stats = http_client_stats()
+    try:
+        from prometheus_client import Gauge
+    except ImportError:
+        return stats
+
+    if not _pool_gauges:
+        _pool_gauges["connections"] = Gauge(
+            "mahavishnu_http_pool_connections",
+            "Pooled HTTP connections to ecosystem services",
+            ["service", "state"],
+        )
+        _pool_gauges["max_connections"] = Gauge(
+            "mahavishnu_http_pool_max_connections",
+            "Configured HTTP connection limit per ecosystem service",
+            ["service"],
+        )
+        _pool_gauges["dropped"] = Gauge(
+            "mahavishnu_http_pool_dropped_clients",
+            "HTTP clients released without close because their event loop had ended",
+            ["service"],
+        )
+    for service, entry in stats.items():
+        for state in ("in_use", "idle"):
+            _pool_gauges["connections"].labels(service=service, state=state).set(entry[state])
+        _pool_gauges["max_connections"].labels(service=service).set(entry["max_connections"])
+        _pool_gauges["dropped"].labels(service=service).set(entry["dropped"])
+    return stats
+
+
+__all__ = [
+    "AKOSHA",
+    "CRACKERJACK",
+    "DEFAULT_SERVICE_CONFIGS",
+    "DHARA",
+    "EXTERNAL",
+    "OLLAMA",
+    "SESSION_BUDDY",
+    "HttpClientRegistry",
+    "ServiceClientConfig",
+    "close_http_clients",
+    "export_http_pool_metrics",
+    "get_http_client",
+    "get_http_client_registry",
+    "get_sync_http_client",
+    "http_client_stats",
+]
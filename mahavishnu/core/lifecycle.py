@@ -40,6 +40,22 @@ async def stop_learning_pipeline(app: Any) -> None:
         logger.info("Learning pipeline stopped")
 
 
+async def start_http_clients(app: Any) -> None:
+    """Warm the shared keep-alive HTTP clients on the running event loop."""
+    from .http_clients import get_http_client_registry
+
+    await get_http_client_registry().start()
+    logger.info("Shared HTTP clients started")
+
+
+async def close_http_clients(app: Any) -> None:
+    """Close the shared keep-alive HTTP clients."""
+    from .http_clients import close_http_clients as _close_http_clients
+
+    await _close_http_clients()
+    logger.info("Shared HTTP clients closed")
+
+
 async def initialize_worktree_coordinator(app: Any) -> None:
     """Initialize WorktreeCoordinator after the event loop is running."""
     if app.worktree_coordinator is None and hasattr(app, "repository_manager"):
@@ -15,8 +15,7 @@ import smtplib
 import time
 from typing import TYPE_CHECKING, Any, cast
 
-import httpx
-
+from ..core.http_clients import EXTERNAL, get_http_client
 from ..core.status import HealthStatus as ComponentHealthStatus
 from ..core.workflow_state import WorkflowStatus
 
@@ -702,8 +701,8 @@ class SlackNotificationChannel(NotificationChannel):
                 ],
             }
 
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.post(self.webhook_url, json=message)
+            client = get_http_client(EXTERNAL)
+            response = await client.post(self.webhook_url, json=message, timeout=10.0)
             if response.status_code != 200:
                 self.logger.warning(f"Failed to send Slack notification: {response.text}")
             else:
@@ -750,12 +749,13 @@ class PagerDutyNotificationChannel(NotificationChannel):
 
             headers = {"Content-Type": "application/json"}
 
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.post(
-                    "https://events.pagerduty.com/v2/enqueue",
-                    json=payload,
-                    headers=headers,
-                )
+            client = get_http_client(EXTERNAL)
+            response = await client.post(
+                "https://events.pagerduty.com/v2/enqueue",
+                json=payload,
+                headers=headers,
+                timeout=10.0,
+            )
 
             if response.status_code != 202:
                 self.logger.warning(f"Failed to send PagerDuty notification: {response.text}")
@@ -6,7 +6,7 @@ and estimate task durations using statistical analysis and similarity search.
 
 from __future__ import annotations
 
-from collections import Counter, defaultdict
+from collections import defaultdict
 from datetime import datetime
 import logging
 import math
@@ -14,6 +14,7 @@ from typing import Any, cast
 
 from pydantic import BaseModel, Field
 
+from mahavishnu.core.task_history import TaskHistoryIndex
 from mahavishnu.models.pattern import (
     BlockerPattern,
     CompletionSequencePattern,
@@ -122,8 +123,15 @@ class PatternDetector:
         by_repo: dict[str, list[float]] = defaultdict(list)
         by_type: dict[str, list[float]] = defaultdict(list)
         by_priority: dict[str, list[float]] = defaultdict(list)
+        repo_task_ids: dict[str, list[str]] = defaultdict(list)
+        type_task_ids: dict[str, list[str]] = defaultdict(list)
 
         for task in tasks:
+            if (task_id := task.get("id")) is not None:
+                if repo := task.get("repository"):
+                    repo_task_ids[repo].append(task_id)
+                for tag in dict.fromkeys(task.get("tags") or []):
+                    type_task_ids[tag].append(task_id)
             if duration := self._get_task_duration_hours(task):
                 if repo := task.get("repository"):
                     by_repo[repo].append(duration)
@@ -139,7 +147,7 @@ class PatternDetector:
                 pattern = self._create_duration_pattern(
                     durations=durations,
                     repository=repo,
-                    sample_task_ids=[t["id"] for t in tasks if t.get("repository") == repo][:10],
+                    sample_task_ids=repo_task_ids[repo][:10],
                 )
                 patterns.append(pattern)
 
@@ -149,7 +157,7 @@ class PatternDetector:
                 pattern = self._create_duration_pattern(
                     durations=durations,
                     task_type=task_type,
-                    sample_task_ids=[t["id"] for t in tasks if task_type in t.get("tags", [])][:10],
+                    sample_task_ids=type_task_ids[task_type][:10],
                 )
                 patterns.append(pattern)
 
@@ -214,35 +222,27 @@ class PatternDetector:
         return patterns
 
     def _detect_sequence_patterns(
-        self, tasks: list[dict[str, Any]]
+        self, tasks: list[dict[str, Any]], history: TaskHistoryIndex | None = None
     ) -> list[CompletionSequencePattern]:
         """Detect task completion sequence patterns.
 
         Args:
             tasks: List of tasks with status history
+            history: Index already built over ``tasks``; built here if omitted
 
         Returns:
             List of detected sequence patterns
         """
         patterns: list[CompletionSequencePattern] = []
 
-        # Track status transitions
-        transitions: dict[tuple[str, ...], int] = Counter()
-        by_repo: dict[str, list[tuple[str, ...]]] = defaultdict(list)
-
-        for task in tasks:
-            if history := task.get("status_history"):
-                sequence = tuple(h.get("status") for h in history if h.get("status"))
-                if len(sequence) >= 2:
-                    transitions[sequence] += 1
-                    if repo := task.get("repository"):
-                        by_repo[repo].append(sequence)
+        # Status sequences and prefix completion counts, tallied once
+        history = history or TaskHistoryIndex.from_tasks(tasks)
 
         # Create patterns for common sequences
         total_tasks = len(tasks)
-        for sequence, count in transitions.most_common(10):
+        for sequence, count in history.sequence_counts.most_common(10):
             if count >= self.config.min_samples:
-                completion_prob = self._calculate_sequence_completion_prob(sequence, tasks)
+                completion_prob = self._calculate_sequence_completion_prob(sequence, history)
 
                 pattern = CompletionSequencePattern(
                     sequence=list(sequence),
@@ -256,11 +256,11 @@ class PatternDetector:
                 patterns.append(pattern)
 
         # Create repository-specific patterns
-        for repo, repo_sequences in by_repo.items():
-            repo_transitions = Counter(repo_sequences)
+        for repo, repo_transitions in history.repo_sequence_counts.items():
+            repo_total = repo_transitions.total()
             for sequence, count in repo_transitions.most_common(5):
                 if count >= self.config.min_samples:
-                    completion_prob = self._calculate_sequence_completion_prob(sequence, tasks)
+                    completion_prob = self._calculate_sequence_completion_prob(sequence, history)
 
                     pattern = CompletionSequencePattern(
                         sequence=list(sequence),
@@ -269,7 +269,7 @@ class PatternDetector:
                         leads_to_completion=sequence[-1] == "completed",
                         completion_probability=completion_prob,
                         confidence=min(1.0, count / 8),
-                        frequency=self._calculate_frequency(count, len(repo_sequences)),
+                        frequency=self._calculate_frequency(count, repo_total),
                     )
                     patterns.append(pattern)
 
@@ -515,25 +515,14 @@ class PatternDetector:
         return completed / len(tasks)
 
     def _calculate_sequence_completion_prob(
-        self, sequence: tuple[str, ...], tasks: list[dict[str, Any]]
+        self, sequence: tuple[str, ...], history: TaskHistoryIndex
     ) -> float:
-        """Calculate probability that a sequence leads to completion."""
-        if not sequence or sequence[-1] == "completed":
-            return 1.0
+        """Calculate probability that a sequence leads to completion.
 
-        # Count tasks with this sequence that eventually completed
-        matching = 0
-        completed = 0
-
-        for task in tasks:
-            if history := task.get("status_history"):
-                task_sequence = tuple(h.get("status") for h in history)
-                if task_sequence[: len(sequence)] == sequence:
-                    matching += 1
-                    if task.get("status") == "completed":
-                        completed += 1
-
-        return completed / matching if matching > 0 else 0.0
+        Share of tasks whose status history starts with ``sequence`` that
+        completed, read from the index's prefix tables.
+        """
+        return history.completion_probability(sequence)
 
 
 def detect_patterns(tasks: list[dict[str, Any]]) -> PatternAnalysisResult:
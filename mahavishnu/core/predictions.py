@@ -4,6 +4,10 @@ Provides predictive insights including:
 - Blocker prediction based on historical patterns
 - Task duration estimation
 - Confidence intervals for predictions
+
+Historical durations come from a ``TaskHistoryIndex`` (see
+``core/task_history.py``), so an estimate is a group lookup plus NumPy
+statistics rather than a scan of every historical task.
 """
 
 from __future__ import annotations
@@ -13,8 +17,15 @@ import logging
 import math
 from typing import TYPE_CHECKING, Any, ClassVar
 
+import numpy as np
 from pydantic import BaseModel, Field
 
+from mahavishnu.core.task_history import (
+    TaskHistoryIndex,
+    duration_percentiles,
+    task_duration_hours,
+)
+
 if TYPE_CHECKING:
     from mahavishnu.models.pattern import (
         BlockerPattern,
@@ -316,26 +327,34 @@ class BlockerPredictor:
 class DurationEstimator:
     """Estimates task duration based on historical data."""
 
-    def __init__(self, config: PredictionConfig | None = None) -> None:
+    def __init__(
+        self,
+        config: PredictionConfig | None = None,
+        history: TaskHistoryIndex | None = None,
+    ) -> None:
         """Initialize duration estimator.
 
         Args:
             config: Optional prediction configuration
+            history: Index of finished tasks used when an estimate is not
+                given ``historical_tasks`` explicitly
         """
         self.config = config or PredictionConfig()
+        self.history = history or TaskHistoryIndex()
 
     def estimate_duration(
         self,
         task: dict[str, Any],
         duration_patterns: list[TaskDurationPattern],
-        historical_tasks: list[dict[str, Any]],
+        historical_tasks: list[dict[str, Any]] | None = None,
     ) -> DurationPrediction:
         """Estimate task duration.
 
         Args:
             task: Task to estimate
             duration_patterns: Known duration patterns
-            historical_tasks: Historical task data
+            historical_tasks: Historical task data; indexed once for this
+                call. Defaults to the estimator's history index.
 
         Returns:
             DurationPrediction with estimate and confidence
@@ -349,10 +368,10 @@ class DurationEstimator:
                 matching_durations.append((pattern.avg_duration, weight))
 
         # Also check direct historical matches
-        historical_durations = self._get_historical_durations(task, historical_tasks)
+        historical_durations = self._similar_durations(task, historical_tasks)
 
         # Combine estimates
-        if matching_durations or historical_durations:
+        if matching_durations or historical_durations.size:
             estimated_hours, confidence = self._combine_estimates(
                 matching_durations, historical_durations
             )
@@ -362,11 +381,14 @@ class DurationEstimator:
             confidence = 0.3
 
         # Calculate confidence interval
-        all_durations = [d for d, _ in matching_durations] + historical_durations
+        pattern_durations = np.fromiter((d for d, _ in matching_durations), dtype=np.float64)
+        all_durations = np.concatenate([pattern_durations, historical_durations])
         confidence_interval = self._calculate_duration_interval(estimated_hours, all_durations)
 
         # Identify factors affecting estimate
         factors = self._identify_factors(task, duration_patterns)
+        if historical_durations.size:
+            factors["historical_percentiles"] = duration_percentiles(historical_durations)
 
         return DurationPrediction(
             task_id=task.get("id", "unknown"),
@@ -399,87 +421,58 @@ class DurationEstimator:
 
         return weight
 
+    def _similar_durations(
+        self, task: dict[str, Any], historical_tasks: list[dict[str, Any]] | None
+    ) -> np.ndarray:
+        """Durations of completed historical tasks similar to ``task``.
+
+        Similarity scores repository 0.4, shared tag 0.3 and priority 0.2;
+        tasks scoring >= 0.5 count, which the index answers from its groups.
+        """
+        if historical_tasks is None:
+            return self.history.similar_durations(task)
+        return TaskHistoryIndex.from_tasks(historical_tasks).similar_durations(task)
+
     def _get_historical_durations(
-        self, task: dict[str, Any], historical_tasks: list[dict[str, Any]]
+        self, task: dict[str, Any], historical_tasks: list[dict[str, Any]] | None = None
     ) -> list[float]:
         """Get durations from similar historical tasks."""
-        durations: list[float] = []
-
-        for hist_task in historical_tasks:
-            # Check similarity
-            similarity = 0.0
-
-            if hist_task.get("repository") == task.get("repository"):
-                similarity += 0.4
-
-            task_tags = set(task.get("tags", []))
-            hist_tags = set(hist_task.get("tags", []))
-            if task_tags & hist_tags:
-                similarity += 0.3
-
-            if hist_task.get("priority") == task.get("priority"):
-                similarity += 0.2
-
-            # Get duration if similar and completed
-            if similarity >= 0.5 and hist_task.get("status") == "completed":
-                duration = self._calculate_task_duration(hist_task)
-                if duration:
-                    durations.append(duration)
-
-        return durations
+        return self._similar_durations(task, historical_tasks).tolist()
 
     def _calculate_task_duration(self, task: dict[str, Any]) -> float | None:
         """Calculate duration of a completed task in hours."""
-        created = task.get("created_at")
-        completed = task.get("completed_at")
-
-        if created and completed:
-            try:
-                created_dt = (
-                    datetime.fromisoformat(created) if isinstance(created, str) else created
-                )
-                completed_dt = (
-                    datetime.fromisoformat(completed) if isinstance(completed, str) else completed
-                )
-                return (completed_dt - created_dt).total_seconds() / 3600
-            except (ValueError, TypeError):
-                pass
-        return None
+        return task_duration_hours(task)
 
     def _combine_estimates(
         self,
         weighted_durations: list[tuple[float, float]],
-        historical_durations: list[float],
+        historical_durations: list[float] | np.ndarray,
     ) -> tuple[float, float]:
         """Combine estimates from patterns and history.
 
         Returns:
             Tuple of (estimated_hours, confidence)
         """
-        all_estimates: list[tuple[float, float]] = []
+        history = np.asarray(historical_durations, dtype=np.float64)
+        pattern = np.asarray(weighted_durations, dtype=np.float64).reshape(-1, 2)
 
-        # Add weighted pattern estimates
-        for duration, weight in weighted_durations:
-            all_estimates.append((duration, weight))
+        # Pattern estimates keep their match weight; history counts 0.5 each
+        durations = np.concatenate([pattern[:, 0], history])
+        weights = np.concatenate([pattern[:, 1], np.full(history.size, 0.5)])
 
-        # Add historical estimates with equal weight
-        for duration in historical_durations:
-            all_estimates.append((duration, 0.5))
-
-        if not all_estimates:
+        if not durations.size:
             return (8.0, 0.3)
 
         # Weighted average
-        total_weight = sum(w for _, w in all_estimates)
-        weighted_sum = sum(d * w for d, w in all_estimates)
+        total_weight = float(weights.sum())
+        weighted_sum = float(durations @ weights)
         estimated_hours = weighted_sum / total_weight if total_weight > 0 else 8.0
 
         # Confidence based on sample size and consistency
-        sample_size = len(all_estimates)
-        durations = [d for d, _ in all_estimates]
+        sample_size = int(durations.size)
 
-        if len(durations) > 1:
-            variance = sum((d - estimated_hours) ** 2 for d in durations) / len(durations)
+        if sample_size > 1:
+            variance = float(np.mean((durations - estimated_hours) ** 2))
             std_dev = math.sqrt(variance)
             coefficient_of_variation = std_dev / estimated_hours if estimated_hours > 0 else 1.0
 
@@ -494,17 +487,15 @@ class DurationEstimator:
         return (estimated_hours, confidence)
 
     def _calculate_duration_interval(
-        self, estimate: float, durations: list[float]
+        self, estimate: float, durations: list[float] | np.ndarray
     ) -> tuple[float, float]:
         """Calculate confidence interval for duration estimate."""
         if len(durations) < self.config.min_samples:
             # Wide interval for small samples
             return (max(0.0, estimate * 0.5), estimate * 2.0)
 
-        # Calculate standard deviation
-        avg = sum(durations) / len(durations)
-        variance = sum((d - avg) ** 2 for d in durations) / len(durations)
-        std_dev = math.sqrt(variance)
+        # Calculate (population) standard deviation
+        std_dev = float(np.std(np.asarray(durations, dtype=np.float64)))
 
         # 95% confidence interval
         margin = 1.96 * std_dev
@@ -561,7 +552,8 @@ def predict_blockers(
 def estimate_duration(
     task: dict[str, Any],
     duration_patterns: list[TaskDurationPattern],
-    historical_tasks: list[dict[str, Any]],
+    historical_tasks: list[dict[str, Any]] | None = None,
+    history: TaskHistoryIndex | None = None,
 ) -> DurationPrediction:
     """Convenience function to estimate duration.
 
@@ -569,9 +561,10 @@ def estimate_duration(
         task: Task to estimate
         duration_patterns: Known duration patterns
         historical_tasks: Historical task data
+        history: Prebuilt history index, used when ``historical_tasks`` is None
 
     Returns:
         DurationPrediction
     """
-    estimator = DurationEstimator()
+    estimator = DurationEstimator(history=history)
     return estimator.estimate_duration(task, duration_patterns, historical_tasks)
@@ -2,12 +2,22 @@
 
 Implements in-memory rate limiting with configurable limits and strategies.
 Supports IP-based, user-based, and token-based rate limiting.
+
+Per-client state is constant-size and constant-time to update, so checking
+a request costs the same with ten tracked clients or a hundred thousand:
+
+- **Sliding-window counters.** Each minute/hour/day window is split into
+  ``WINDOW_BUCKETS`` fixed-width buckets with a running total; expiring a
+  bucket subtracts its count instead of rescanning request timestamps.
+- **Idle-client expiry.** Clients sit in a min-heap keyed by the time they
+  fall idle. Each check pops only the clients that are due, so stale state
+  is dropped without a sweep over every key.
 """
 
-from collections import defaultdict
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from functools import wraps
+import heapq
 from logging import getLogger
 import time
 from typing import TYPE_CHECKING, Any, cast
@@ -21,6 +31,20 @@ if TYPE_CHECKING:
 
 logger = getLogger(__name__)
 
+# Buckets per sliding window; a window's count has one bucket of resolution.
+WINDOW_BUCKETS = 60
+
+MINUTE = 60
+HOUR = 3600
+DAY = 86400
+
+# Seconds a client stays blocked after too many recent violations.
+VIOLATION_COOLDOWN = 300
+VIOLATIONS_BEFORE_COOLDOWN = 5
+
+# Window for "active_clients" in global stats.
+ACTIVE_CLIENT_WINDOW = 300
+
 
 @dataclass
 class RateLimitConfig:
@@ -64,6 +88,71 @@ class RateLimitInfo:
     retry_after: int | None = None
 
 
+class SlidingWindowCounter:
+    """Event count over the last ``window`` seconds, kept in fixed-width buckets.
+
+    Only non-empty buckets are stored, as ``[index, count, first_timestamp]``
+    with ``index = int(timestamp // width)``; at most ``buckets`` of them are
+    live at once. A bucket expires as a whole once it falls out of the
+    window, so counts have one bucket-width of resolution. Timestamps are
+    expected to be non-decreasing; an earlier one is counted in the newest
+    bucket.
+
+    Args:
+        window: Window length in seconds
+        buckets: Number of buckets the window is divided into
+    """
+
+    __slots__ = ("_buckets", "_size", "_width", "total")
+
+    def __init__(self, window: float, buckets: int = WINDOW_BUCKETS):
+        self._width = window / buckets
+        self._size = buckets
+        self._buckets: list[list[Any]] = []
+        self.total = 0
+
+    def _expire(self, now: float) -> None:
+        horizon = int(now // self._width) - self._size
+        buckets = self._buckets
+        while buckets and buckets[0][0] <= horizon:
+            self.total -= buckets.pop(0)[1]
+
+    def add(self, now: float, count: int = 1) -> None:
+        """Record ``count`` events at ``now``."""
+        self._expire(now)
+        index = int(now // self._width)
+        if self._buckets and self._buckets[-1][0] >= index:
+            self._buckets[-1][1] += count
+        else:
+            self._buckets.append([index, count, now])
+        self.total += count
+
+    def count(self, now: float) -> int:
+        """Events recorded within the window ending at ``now``."""
+        self._expire(now)
+        return self.total
+
+    def oldest(self, now: float) -> float | None:
+        """Timestamp of the first event still in the window, if any."""
+        self._expire(now)
+        return self._buckets[0][2] if self._buckets else None
+
+
+@dataclass(slots=True)
+class _ClientState:
+    """Token bucket, request windows and violations for one client key."""
+
+    tokens: float
+    last_update: float
+    minute: SlidingWindowCounter = field(default_factory=lambda: SlidingWindowCounter(MINUTE))
+    hour: SlidingWindowCounter = field(default_factory=lambda: SlidingWindowCounter(HOUR))
+    day: SlidingWindowCounter = field(default_factory=lambda: SlidingWindowCounter(DAY))
+    last_request: float | None = None
+    # Created on the first violation; most clients never have one.
+    recent_violations: SlidingWindowCounter | None = None
+    violations: SlidingWindowCounter | None = None
+
+
 class RateLimiter:
     """In-memory rate limiter using sliding window and token bucket algorithms.
 
@@ -105,7 +194,7 @@ class RateLimiter:
             per_hour: Maximum requests per hour per client
             per_day: Maximum requests per day per client
             burst_size: Maximum burst size (token bucket)
-            cleanup_interval: Seconds between cleanup of old entries
+            cleanup_interval: Seconds violations are kept for stats
         """
         self.per_minute = per_minute
         self.per_hour = per_hour
@@ -113,39 +202,43 @@ class RateLimiter:
         self.burst_size = burst_size
         self.cleanup_interval = cleanup_interval
 
-        # Sliding window tracking: {key: [(timestamp, count), ...]}
-        self._requests: dict[str, list[tuple[float, int]]] = defaultdict(list)
+        # Per-client state: {key: _ClientState}
+        self._clients: dict[str, _ClientState] = {}
 
-        # Token bucket tracking: {key: tokens}
-        self._tokens: dict[str, float] = defaultdict(lambda: burst_size)
+        # Min-heap of (idle_deadline, key), one entry per tracked client.
+        # Deadlines are refreshed lazily when an entry reaches the top.
+        self._expiry: list[tuple[float, str]] = []
 
-        # Last update time for token buckets
-        self._last_update: dict[str, float] = defaultdict(time.time)
-
-        # Rate limit violations tracking
-        self._violations: dict[str, list[float]] = defaultdict(list)
+        # A client is dropped once idle for the longest window it counts.
+        self._idle_ttl = max(DAY, cleanup_interval)
 
         # Start cleanup task
         self._cleanup_task: asyncio.Task | None = None
 
+    def _client(self, key: str, now: float) -> _ClientState:
+        state = self._clients.get(key)
+        if state is None:
+            state = self._clients[key] = _ClientState(tokens=self.burst_size, last_update=now)
+            heapq.heappush(self._expiry, (now + self._idle_ttl, key))
+        return state
+
+    def _expire_idle(self, now: float) -> None:
+        """Drop clients idle past ``_idle_ttl``; amortized O(log n) per client."""
+        expiry = self._expiry
+        while expiry and expiry[0][0] <= now:
+            _, key = heapq.heappop(expiry)
+            state = self._clients.get(key)
+            if state is None:
+                continue
+            deadline = state.last_update + self._idle_ttl
+            if deadline <= now:
+                del self._clients[key]
+            else:
+                heapq.heappush(expiry, (deadline, key))
+
     def _cleanup_old_entries(self):
-        """Remove old entries from tracking dictionaries."""
-        now = time.time()
-        cutoff_time = now - self.cleanup_interval
-
-        # Clean up request history
-        for key in list(self._requests.keys()):
-            self._requests[key] = [
-                (ts, count) for ts, count in self._requests[key] if ts > cutoff_time
-            ]
-            if not self._requests[key]:
-                del self._requests[key]
-
-        # Clean up violations
-        for key in list(self._violations.keys()):
-            self._violations[key] = [ts for ts in self._violations[key] if ts > cutoff_time]
-            if not self._violations[key]:
-                del self._violations[key]
+        """Remove clients that have been idle past the retention window."""
+        self._expire_idle(time.time())
 
     async def is_allowed(
         self,
@@ -168,34 +261,28 @@ class RateLimiter:
             return True, RateLimitInfo(limited=False)
 
         now = time.time()
+        self._expire_idle(now)
+        state = self._client(key, now)
 
         # Check if key is currently in violation cooldown
-        if self._violations.get(key):
-            # Check if there was a recent violation (within last minute)
-            recent_violations = [v for v in self._violations[key] if now - v < 60]
-            if len(recent_violations) >= 5:
-                # Too many recent violations, extend rate limit
-                retry_after = 300  # 5 minutes
-                return False, RateLimitInfo(
-                    limited=True,
-                    retry_after=retry_after,
-                    reset_time=now + retry_after,
-                )
-
-        # Check per-minute limit
-        minute_ago = now - 60
-        recent_requests = [(ts, count) for ts, count in self._requests[key] if ts > minute_ago]
+        recent_violations = state.recent_violations
+        if recent_violations and recent_violations.count(now) >= VIOLATIONS_BEFORE_COOLDOWN:
+            # Too many recent violations, extend rate limit
+            retry_after = VIOLATION_COOLDOWN
+            return False, RateLimitInfo(
+                limited=True,
+                retry_after=retry_after,
+                reset_time=now + retry_after,
+            )
 
         # Check token bucket for burst control
-        tokens = self._tokens[key]
-        last_update = self._last_update[key]
-        time_passed = now - last_update
+        time_passed = now - state.last_update
 
         # Refill tokens based on time passed (1 token per second)
         refill_rate = 1.0
-        tokens = min(self.burst_size, tokens + time_passed * refill_rate)
-        self._tokens[key] = tokens
-        self._last_update[key] = now
+        tokens = min(self.burst_size, state.tokens + time_passed * refill_rate)
+        state.tokens = tokens
+        state.last_update = now
 
         # Check if we have tokens for this request
         if tokens < 1:
@@ -208,14 +295,15 @@ class RateLimiter:
             )
 
         # Consume a token
-        self._tokens[key] = tokens - 1
+        state.tokens = tokens - 1
 
-        # Check per-minute limit (sum of recent request counts)
-        total_requests = sum(count for _, count in recent_requests)
+        # Check per-minute limit
+        total_requests = state.minute.count(now)
+        window_start = state.minute.oldest(now)
 
         if total_requests >= self.per_minute:
             # Rate limited
-            retry_after = 60 - int(now - recent_requests[0][0]) if recent_requests else 60
+            retry_after = MINUTE - int(now - window_start) if window_start else MINUTE
             return False, RateLimitInfo(
                 limited=True,
                 retry_after=retry_after,
@@ -223,11 +311,9 @@ class RateLimiter:
             )
 
         # Check per-hour limit
-        hour_ago = now - 3600
-        hour_requests = sum(count for ts, count in self._requests[key] if ts > hour_ago)
-
-        if hour_requests >= self.per_hour:
-            retry_after = 3600 - int(now - hour_ago) + 1
+        if state.hour.count(now) >= self.per_hour:
+            hour_start = state.hour.oldest(now)
+            retry_after = HOUR - int(now - hour_start) if hour_start else HOUR
             return False, RateLimitInfo(
                 limited=True,
                 retry_after=retry_after,
@@ -235,11 +321,9 @@ class RateLimiter:
             )
 
         # Check per-day limit
-        day_ago = now - 86400
-        day_requests = sum(count for ts, count in self._requests[key] if ts > day_ago)
-
-        if day_requests >= self.per_day:
-            retry_after = 86400 - int(now - day_ago) + 1
+        if state.day.count(now) >= self.per_day:
+            day_start = state.day.oldest(now)
+            retry_after = DAY - int(now - day_start) if day_start else DAY
             return False, RateLimitInfo(
                 limited=True,
                 retry_after=retry_after,
@@ -247,12 +331,15 @@ class RateLimiter:
             )
 
         # Request is allowed, record it
-        self._requests[key].append((now, 1))
+        state.minute.add(now)
+        state.hour.add(now)
+        state.day.add(now)
+        state.last_request = now
 
         return True, RateLimitInfo(
             request_count=total_requests + 1,
-            window_start=recent_requests[0][0] if recent_requests else now,
-            reset_time=now + 60 - (now - recent_requests[0][0]) if recent_requests else now + 60,
+            window_start=window_start if window_start else now,
+            reset_time=window_start + MINUTE if window_start else now + MINUTE,
             limited=False,
         )
 
@@ -262,7 +349,13 @@ class RateLimiter:
         Args:
             key: Unique identifier for the client
         """
-        self._violations[key].append(time.time())
+        now = time.time()
+        state = self._client(key, now)
+        if state.violations is None or state.recent_violations is None:
+            state.recent_violations = SlidingWindowCounter(MINUTE)
+            state.violations = SlidingWindowCounter(self.cleanup_interval)
+        state.recent_violations.add(now)
+        state.violations.add(now)
 
     def get_stats(self, key: str | None = None) -> dict[str, Any]:
         """Get rate limiting statistics.
@@ -277,44 +370,38 @@ class RateLimiter:
 
         if key:
             # Get stats for specific key
-            minute_ago = now - 60
-            hour_ago = now - 3600
-            day_ago = now - 86400
-
-            requests = self._requests.get(key, [])
-            minute_requests = sum(count for ts, count in requests if ts > minute_ago)
-            hour_requests = sum(count for ts, count in requests if ts > hour_ago)
-            day_requests = sum(count for ts, count in requests if ts > day_ago)
-            violations = len(self._violations.get(key, []))
+            state = self._clients.get(key)
+            if state is None:
+                return {
+                    "key": key,
+                    "requests_per_minute": 0,
+                    "requests_per_hour": 0,
+                    "requests_per_day": 0,
+                    "violations": 0,
+                    "current_tokens": self.burst_size,
+                }
 
             return {
                 "key": key,
-                "requests_per_minute": minute_requests,
-                "requests_per_hour": hour_requests,
-                "requests_per_day": day_requests,
-                "violations": violations,
-                "current_tokens": self._tokens.get(key, self.burst_size),
+                "requests_per_minute": state.minute.count(now),
+                "requests_per_hour": state.hour.count(now),
+                "requests_per_day": state.day.count(now),
+                "violations": state.violations.count(now) if state.violations else 0,
+                "current_tokens": state.tokens,
             }
 
         # Get global stats
-        total_clients = len(self._requests)
-        total_violations = sum(len(v) for v in self._violations.values())
-
-        # Calculate total requests across all clients
-        total_requests = sum(
-            sum(count for _, count in requests) for requests in self._requests.values()
-        )
+        self._expire_idle(now)
+        states = self._clients.values()
 
         return {
-            "total_clients": total_clients,
-            "total_requests": total_requests,
-            "total_violations": total_violations,
-            "active_clients": len(
-                [
-                    k
-                    for k, v in self._requests.items()
-                    if any(ts > now - 300 for ts, _ in v)  # Active in last 5 minutes
-                ]
+            "total_clients": len(self._clients),
+            "total_requests": sum(s.day.count(now) for s in states),
+            "total_violations": sum(s.violations.count(now) for s in states if s.violations),
+            "active_clients": sum(
+                1
+                for s in states
+                if s.last_request is not None and s.last_request > now - ACTIVE_CLIENT_WINDOW
             ),
         }
 
@@ -10,6 +10,18 @@ Key Features:
 - Graceful fallback to lexical-only when embeddings are missing
 - Repository filtering support
 - Observability through structured logging
+- Two-stage retrieval that stays on the HNSW and GIN indexes
+
+Retrieval Modes:
+- ``two_stage`` (default): pull the top ``vector_candidates`` documents with a
+  plain ``ORDER BY embedding <=> $1 LIMIT k`` (served by the HNSW index) and
+  the top ``lexical_candidates`` with a ``content_tsv @@ tsquery`` match
+  (served by the GIN index), concurrently on two pool connections, then fuse
+  the candidates in Python. ``fusion="weighted"`` reproduces the single-query
+  combined score for every candidate; ``fusion="rrf"`` uses reciprocal-rank
+  fusion, scaled so a document ranked first by both stages scores 1.0.
+- ``single_query``: the original plan query below. Its ORDER BY expression
+  mixes both scores, so Postgres has to rank every joined row.
 
 Architecture:
 - Uses asyncpg connection pool for database operations
@@ -36,6 +48,7 @@ SQL Query Pattern (from plan):
 
 from __future__ import annotations
 
+import asyncio
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from datetime import UTC, datetime
@@ -56,6 +69,49 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+RETRIEVAL_MODES = ("two_stage", "single_query")
+FUSION_METHODS = ("weighted", "rrf")
+
+_RESULT_COLUMNS = """
+                d.id,
+                d.source_type,
+                d.title,
+                d.content,
+                d.repository,
+                d.metadata,
+                d.created_at,
+                d.updated_at,
+                1 - (e.embedding <=> $1::vector) AS semantic_score,
+                ts_rank(d.content_tsv, plainto_tsquery('english', $2)) AS lexical_score"""
+
+# pgvector's default hnsw.ef_search. An HNSW scan returns at most ef_search
+# rows, so the vector stage raises it to the candidate count per query.
+HNSW_DEFAULT_EF_SEARCH = 40
+
+# Transaction-local ``SET LOCAL hnsw.ef_search``; set_config takes a bind value.
+_SET_EF_SEARCH_SQL = "SELECT set_config('hnsw.ef_search', $1, true);"
+
+# Stage 1: nearest neighbours straight off the HNSW index.
+_VECTOR_STAGE_SQL = f"""
+            SELECT{_RESULT_COLUMNS}
+            FROM search.document_embeddings e
+            JOIN search.documents d ON d.id = e.document_id
+            WHERE d.repository = COALESCE($3, d.repository)
+            ORDER BY e.embedding <=> $1::vector
+            LIMIT $4;
+        """
+
+# Stage 2: full-text matches through the GIN index on content_tsv.
+_LEXICAL_STAGE_SQL = f"""
+            SELECT{_RESULT_COLUMNS}
+            FROM search.documents d
+            JOIN search.document_embeddings e ON e.document_id = d.id
+            WHERE d.content_tsv @@ plainto_tsquery('english', $2)
+              AND d.repository = COALESCE($3, d.repository)
+            ORDER BY lexical_score DESC
+            LIMIT $4;
+        """
+
 
 # =============================================================================
 # Configuration Models
@@ -74,6 +130,13 @@ class HybridSearchConfig:
         embedding_provider: Embedding provider to use for query embedding
         embedding_model: Specific embedding model name
         enable_lexical_fallback: Fall back to lexical-only if embedding fails
+        retrieval_mode: "two_stage" (index-backed candidates fused in Python)
+            or "single_query" (one weighted ORDER BY over the whole join)
+        fusion: How two-stage candidates are ranked: "weighted" (same
+            combined score as single_query) or "rrf" (reciprocal-rank fusion)
+        vector_candidates: Candidates pulled from the vector index per query
+        lexical_candidates: Candidates pulled from the full-text index per query
+        rrf_k: Rank offset for reciprocal-rank fusion
     """
 
     semantic_weight: float = 0.7
@@ -83,9 +146,24 @@ class HybridSearchConfig:
     embedding_provider: EmbeddingProvider = EmbeddingProvider.FASTEMBED
     embedding_model: str = "BAAI/bge-small-en-v1.5"
     enable_lexical_fallback: bool = True
+    retrieval_mode: str = "two_stage"
+    fusion: str = "weighted"
+    vector_candidates: int = 100
+    lexical_candidates: int = 100
+    rrf_k: int = 60
 
     def __post_init__(self) -> None:
         """Validate configuration after initialization."""
+        if self.retrieval_mode not in RETRIEVAL_MODES:
+            raise ValueError(
+                f"retrieval_mode must be one of {RETRIEVAL_MODES}, got {self.retrieval_mode!r}"
+            )
+        if self.fusion not in FUSION_METHODS:
+            raise ValueError(f"fusion must be one of {FUSION_METHODS}, got {self.fusion!r}")
+        if self.vector_candidates < 1 or self.lexical_candidates < 1:
+            raise ValueError("vector_candidates and lexical_candidates must be at least 1")
+        if self.rrf_k < 0:
+            raise ValueError(f"rrf_k must be non-negative, got {self.rrf_k}")
         if not 0.0 <= self.semantic_weight <= 1.0:
             raise ValueError(
                 f"semantic_weight must be between 0.0 and 1.0, got {self.semantic_weight}"
@@ -210,6 +288,7 @@ class HybridSearchEngine:
                 "lexical_weight": self.config.lexical_weight,
                 "min_score": self.config.min_score,
                 "embedding_provider": self.config.embedding_provider.value,
+                "retrieval_mode": self.config.retrieval_mode,
             },
         )
 
@@ -390,6 +469,30 @@ class HybridSearchEngine:
     ) -> list[HybridSearchResult]:
         """Execute full hybrid search with semantic + lexical.
 
+        Dispatches on ``config.retrieval_mode``.
+
+        Args:
+            query: Search query string
+            query_embedding: Query embedding vector
+            repository: Optional repository filter
+            limit: Maximum results
+
+        Returns:
+            List of HybridSearchResult
+        """
+        if self.config.retrieval_mode == "single_query":
+            return await self._single_query_search(query, query_embedding, repository, limit)
+        return await self._two_stage_search(query, query_embedding, repository, limit)
+
+    async def _single_query_search(
+        self,
+        query: str,
+        query_embedding: list[float],
+        repository: str | None,
+        limit: int,
+    ) -> list[HybridSearchResult]:
+        """Rank the whole document/embedding join with one weighted ORDER BY.
+
         Args:
             query: Search query string
             query_embedding: Query embedding vector
@@ -445,24 +548,149 @@ class HybridSearchEngine:
                 self.config.semantic_weight * semantic_score
                 + self.config.lexical_weight * lexical_score
             )
-
-            result = HybridSearchResult(
-                id=row["id"],
-                source_type=row["source_type"],
-                title=row["title"],
-                content=row["content"],
-                repository=row["repository"],
-                metadata=row["metadata"] or {},
-                created_at=row["created_at"],
-                updated_at=row["updated_at"],
-                semantic_score=semantic_score,
-                lexical_score=lexical_score,
-                combined_score=combined_score,
-            )
-            results.append(result)
+            results.append(self._row_to_result(row, semantic_score, lexical_score, combined_score))
 
         return results
 
+    async def _two_stage_search(
+        self,
+        query: str,
+        query_embedding: list[float],
+        repository: str | None,
+        limit: int,
+    ) -> list[HybridSearchResult]:
+        """Fetch index-backed candidates from both stages and fuse them.
+
+        The vector and full-text stages run concurrently on separate pool
+        connections. Each stage returns both scores for its own candidates,
+        so weighted fusion needs no follow-up query. The vector stage raises
+        ``hnsw.ef_search`` to its candidate count for its own transaction, as
+        the index scan otherwise stops at the server default of 40 rows.
+
+        Args:
+            query: Search query string
+            query_embedding: Query embedding vector
+            repository: Optional repository filter
+            limit: Maximum results
+
+        Returns:
+            List of HybridSearchResult sorted by combined_score descending
+        """
+        pool = await self._get_pool()
+        vector_k = max(self.config.vector_candidates, limit)
+        lexical_k = max(self.config.lexical_candidates, limit)
+
+        vector_rows, lexical_rows = await asyncio.gather(
+            self._fetch_stage(
+                pool,
+                _VECTOR_STAGE_SQL,
+                query_embedding,
+                query,
+                repository,
+                vector_k,
+                ef_search=max(vector_k, HNSW_DEFAULT_EF_SEARCH),
+            ),
+            self._fetch_stage(
+                pool, _LEXICAL_STAGE_SQL, query_embedding, query, repository, lexical_k
+            ),
+        )
+
+        logger.debug(
+            "Two-stage candidates fetched",
+            extra={"vector_candidates": len(vector_rows), "lexical_candidates": len(lexical_rows)},
+        )
+        return self._fuse(vector_rows, lexical_rows, limit)
+
+    async def _fetch_stage(
+        self,
+        pool: Pool,
+        sql: str,
+        query_embedding: list[float],
+        query: str,
+        repository: str | None,
+        k: int,
+        ef_search: int | None = None,
+    ) -> list[Any]:
+        """Run one candidate stage on its own pool connection.
+
+        When ``ef_search`` is given, the stage runs in a transaction that sets
+        ``hnsw.ef_search`` locally, so the pooled connection is left unchanged.
+        """
+        async with self._acquire_connection(pool) as conn:
+            if ef_search is None:
+                return list(await conn.fetch(sql, query_embedding, query, repository, k))
+            async with self._enter_async_context(conn.transaction()):
+                await conn.execute(_SET_EF_SEARCH_SQL, str(ef_search))
+                return list(await conn.fetch(sql, query_embedding, query, repository, k))
+
+    def _fuse(
+        self,
+        vector_rows: list[Any],
+        lexical_rows: list[Any],
+        limit: int,
+    ) -> list[HybridSearchResult]:
+        """Merge the two candidate lists into the final ranking.
+
+        Args:
+            vector_rows: Stage 1 rows, nearest first
+            lexical_rows: Stage 2 rows, best ts_rank first
+            limit: Maximum results
+
+        Returns:
+            Up to ``limit`` results sorted by combined_score descending
+        """
+        semantic_weight = self.config.semantic_weight
+        lexical_weight = self.config.lexical_weight
+
+        rows: dict[Any, Any] = {}
+        rrf_scores: dict[Any, float] = {}
+        for weight, stage_rows in ((semantic_weight, vector_rows), (lexical_weight, lexical_rows)):
+            for rank, row in enumerate(stage_rows, start=1):
+                doc_id = row["id"]
+                rows.setdefault(doc_id, row)
+                rrf_scores[doc_id] = rrf_scores.get(doc_id, 0.0) + weight / (
+                    self.config.rrf_k + rank
+                )
+
+        # Weights sum to 1.0, so a document ranked first by both stages
+        # reaches 1 / (rrf_k + 1); scale that to a combined_score of 1.0.
+        rrf_scale = float(self.config.rrf_k + 1)
+
+        results = []
+        for doc_id, row in rows.items():
+            semantic_score = min(max(float(row["semantic_score"]), 0.0), 1.0)
+            lexical_score = min(float(row["lexical_score"]), 1.0)
+            if self.config.fusion == "rrf":
+                combined_score = min(rrf_scores[doc_id] * rrf_scale, 1.0)
+            else:
+                combined_score = semantic_weight * semantic_score + lexical_weight * lexical_score
+            results.append(self._row_to_result(row, semantic_score, lexical_score, combined_score))
+
+        results.sort(key=lambda result: result.combined_score, reverse=True)
+        return results[:limit]
+
+    @staticmethod
+    def _row_to_result(
+        row: Any,
+        semantic_score: float,
+        lexical_score: float,
+        combined_score: float,
+    ) -> HybridSearchResult:
+        """Build a HybridSearchResult from a document row and its scores."""
+        return HybridSearchResult(
+            id=row["id"],
+            source_type=row["source_type"],
+            title=row["title"],
+            content=row["content"],
+            repository=row["repository"],
+            metadata=row["metadata"] or {},
+            created_at=row["created_at"],
+            updated_at=row["updated_at"],
+            semantic_score=semantic_score,
+            lexical_score=lexical_score,
+            combined_score=combined_score,
+        )
+
     async def _lexical_only_search(
         self,
         query: str,
@@ -504,21 +732,14 @@ class HybridSearchEngine:
         results = []
         for row in rows:
             lexical_score = min(float(row["lexical_score"]), 1.0)
-
-            result = HybridSearchResult(
-                id=row["id"],
-                source_type=row["source_type"],
-                title=row["title"],
-                content=row["content"],
-                repository=row["repository"],
-                metadata=row["metadata"] or {},
-                created_at=row["created_at"],
-                updated_at=row["updated_at"],
-                semantic_score=0.0,  # No semantic search
-                lexical_score=lexical_score,
-                combined_score=self.config.lexical_weight * lexical_score,
+            results.append(
+                self._row_to_result(
+                    row,
+                    0.0,  # No semantic search
+                    lexical_score,
+                    self.config.lexical_weight * lexical_score,
+                )
             )
-            results.append(result)
 
         return results
 
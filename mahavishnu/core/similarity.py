@@ -0,0 +1,181 @@
+"""Vectorized cosine similarity over embedding matrices.
+
+Replaces pairwise Python loops over ``embeddings.cosine_similarity`` with
+NumPy matrix products:
+
+- Vectors are L2-normalized once into a contiguous float32 matrix, so
+  cosine similarity reduces to a dot product.
+- Similarities are computed one row block at a time (``block_size`` rows
+  against the whole matrix), bounding peak memory to
+  ``block_size * N * 4`` bytes instead of ``N * N``.
+- Callers get top-k neighbours or thresholded pairs directly; nothing
+  materializes an N² dict.
+
+Usage:
+    index = SimilarityIndex.from_vectors(task_ids, embeddings)
+    neighbours = index.top_k(5)
+    duplicates = index.pairs_above(0.95)
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+
+DEFAULT_BLOCK_SIZE = 1024
+
+
+def normalize_rows(vectors: Any) -> np.ndarray:
+    """Return ``vectors`` as a C-contiguous float32 matrix of unit rows.
+
+    Zero vectors stay zero, so their similarity with everything is 0.0
+    (matching ``embeddings.cosine_similarity``).
+
+    Raises:
+        ValueError: If the vectors do not form a 2-D matrix
+    """
+    matrix = np.array(vectors, dtype=np.float32, order="C", copy=True)
+    if matrix.ndim != 2:
+        raise ValueError("Vectors must all have the same length")
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    np.divide(matrix, norms, out=matrix, where=norms > 0)
+    return matrix
+
+
+class SimilarityIndex:
+    """Normalized embedding matrix with blocked similarity queries.
+
+    Example:
+        index = SimilarityIndex.from_vectors(["a", "b"], [[1, 0], [0.9, 0.1]])
+        index.pairs_above(0.9)  # [("a", "b", 0.99...)]
+    """
+
+    def __init__(self, ids: Sequence[str], matrix: np.ndarray) -> None:
+        """Wrap an already-normalized matrix.
+
+        Args:
+            ids: Identifier for each row
+            matrix: Unit-row float32 matrix (see :func:`normalize_rows`)
+        """
+        if len(ids) != matrix.shape[0]:
+            raise ValueError("ids and matrix rows must have the same length")
+        self.ids = list(ids)
+        self.matrix = matrix
+
+    @classmethod
+    def from_vectors(cls, ids: Sequence[str], vectors: Sequence[Any]) -> SimilarityIndex:
+        """Build an index from raw (unnormalized) vectors."""
+        if not ids:
+            return cls([], np.zeros((0, 0), dtype=np.float32))
+        return cls(ids, normalize_rows(vectors))
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def _blocks(self, block_size: int) -> Iterator[tuple[int, np.ndarray]]:
+        """Yield ``(row_offset, similarities)`` for each block of rows."""
+        block_size = max(1, block_size)
+        for start in range(0, len(self.ids), block_size):
+            yield start, self.matrix[start : start + block_size] @ self.matrix.T
+
+    def pairs_above(
+        self,
+        threshold: float,
+        *,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+    ) -> list[tuple[str, str, float]]:
+        """Return each unordered pair with similarity >= ``threshold``.
+
+        Pairs are ``(id_i, id_j, similarity)`` with ``i < j`` in index
+        order, sorted by descending similarity.
+        """
+        found_i: list[np.ndarray] = []
+        found_j: list[np.ndarray] = []
+        found_s: list[np.ndarray] = []
+        for start, sims in self._blocks(block_size):
+            rows, cols = np.nonzero(sims >= threshold)
+            rows += start
+            upper = cols > rows
+            rows, cols = rows[upper], cols[upper]
+            found_i.append(rows)
+            found_j.append(cols)
+            found_s.append(sims[rows - start, cols])
+
+        if not found_s:
+            return []
+        rows = np.concatenate(found_i)
+        cols = np.concatenate(found_j)
+        scores = np.concatenate(found_s)
+        order = np.argsort(-scores, kind="stable")
+        return [(self.ids[rows[n]], self.ids[cols[n]], float(scores[n])) for n in order]
+
+    def top_k(
+        self,
+        k: int,
+        *,
+        threshold: float | None = None,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+    ) -> dict[str, list[tuple[str, float]]]:
+        """Return the ``k`` most similar other rows for every row.
+
+        Args:
+            k: Neighbours per row
+            threshold: Optional minimum similarity
+            block_size: Rows per matrix-product block
+
+        Returns:
+            Mapping of id to ``[(neighbour_id, similarity), ...]``, most
+            similar first
+        """
+        n = len(self.ids)
+        k = min(k, n - 1)
+        if k <= 0:
+            return {id_: [] for id_ in self.ids}
+
+        neighbours: dict[str, list[tuple[str, float]]] = {}
+        for start, sims in self._blocks(block_size):
+            rows = np.arange(sims.shape[0])
+            sims[rows, rows + start] = -np.inf  # exclude self
+            candidates = np.argpartition(-sims, k - 1, axis=1)[:, :k]
+            scores = np.take_along_axis(sims, candidates, axis=1)
+            order = np.argsort(-scores, axis=1, kind="stable")
+            candidates = np.take_along_axis(candidates, order, axis=1)
+            scores = np.take_along_axis(scores, order, axis=1)
+            for offset in range(sims.shape[0]):
+                neighbours[self.ids[start + offset]] = [
+                    (self.ids[col], float(score))
+                    for col, score in zip(candidates[offset], scores[offset], strict=True)
+                    if threshold is None or score >= threshold
+                ]
+        return neighbours
+
+    def query(
+        self,
+        vector: Sequence[float],
+        k: int = 10,
+        *,
+        threshold: float | None = None,
+    ) -> list[tuple[str, float]]:
+        """Return the ``k`` rows most similar to ``vector``."""
+        if not self.ids or k <= 0:
+            return []
+        sims = self.matrix @ normalize_rows([vector])[0]
+        k = min(k, len(self.ids))
+        candidates = np.argpartition(-sims, k - 1)[:k]
+        candidates = candidates[np.argsort(-sims[candidates], kind="stable")]
+        return [
+            (self.ids[i], float(sims[i]))
+            for i in candidates
+            if threshold is None or sims[i] >= threshold
+        ]
+
+
+__all__ = [
+    "DEFAULT_BLOCK_SIZE",
+    "SimilarityIndex",
+    "normalize_rows",
+]
@@ -1,5 +1,6 @@
 """State backend abstractions for Mahavishnu durable persistence."""
 
 from .dhara import DharaStateBackend, DharaStateConfig
+from .journal import StateJournal
 
-__all__ = ["DharaStateBackend", "DharaStateConfig"]
+__all__ = ["DharaStateBackend", "DharaStateConfig", "StateJournal"]
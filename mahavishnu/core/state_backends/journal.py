@@ -0,0 +1,328 @@
+"""Append-only journal with periodic snapshot compaction.
+
+Backs ``StateManager`` in ``mahavishnu.core.task_router``. Every mutation
+is appended to ``<name>.journal`` as a single JSON line describing *what
+changed* (not the whole state), so per-repo progress updates cost O(1)
+bytes on disk instead of re-serializing every workflow record.
+
+On-disk layout (inside ``directory``):
+
+  <name>.json      snapshot: ``{"version": 2, "seq": N, "records": {...}}``
+  <name>.journal   JSON lines: ``{"seq": N, "op": ..., "id": ..., ...}``
+
+Crash safety:
+  - Snapshots are written to a temp file, fsynced and ``os.replace``d.
+  - Each journal line carries a monotonically increasing ``seq``. Replay
+    skips lines whose ``seq`` is already covered by the snapshot, so a
+    crash between "snapshot replaced" and "journal truncated" never
+    double-applies non-idempotent ops such as ``append``.
+  - A torn trailing line (crash mid-write) ends replay and is truncated
+    away before new lines are appended.
+
+Durability: lines are flushed to the OS on every append (survives a
+process crash); ``fsync`` is coalesced to at most once per
+``fsync_interval_seconds``. When appends stop inside an interval, a
+deferred fsync is scheduled on the running event loop, so the loss
+window on power failure stays bounded by the interval. ``flush()`` /
+``close()`` force an fsync; owners should ``close()`` on shutdown.
+
+Legacy snapshots (a bare ``{workflow_id: record}`` mapping written by the
+pre-journal ``StateManager``) are read transparently and rewritten in the
+versioned format on the first compaction.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+from pathlib import Path
+import tempfile
+import time
+from typing import IO, TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_VERSION = 2
+
+_DEFAULT_COMPACT_AFTER_RECORDS = 1000
+_DEFAULT_COMPACT_AFTER_BYTES = 4 * 1024 * 1024
+_DEFAULT_FSYNC_INTERVAL_SECONDS = 1.0
+
+
+def apply_op(records: dict[str, dict[str, Any]], entry: Mapping[str, Any]) -> None:
+    """Apply one journal entry to ``records`` in place.
+
+    Supported ops:
+      ``put``      replace the whole record
+      ``merge``    shallow-merge ``fields`` into the record
+      ``append``   append ``value`` to the list at ``field``
+      ``set_key``  set ``record[field][key] = value``
+      ``delete``   drop the record
+
+    ``append`` and ``set_key`` may also carry ``fields`` (e.g. a fresh
+    ``updated_at``), merged before the op so one line covers one mutation.
+    """
+    op = entry.get("op")
+    record_id = str(entry.get("id"))
+    if op == "put":
+        records[record_id] = dict(entry.get("record") or {})
+        return
+    if op == "delete":
+        records.pop(record_id, None)
+        return
+
+    record = records.get(record_id)
+    if record is None:
+        # Ops against unknown records are dropped, mirroring the in-memory
+        # semantics of ``StateManager.update`` on a missing workflow.
+        return
+    record.update(entry.get("fields") or {})
+    if op == "merge":
+        return
+    if op == "append":
+        field_name = str(entry.get("field"))
+        current = record.get(field_name)
+        if not isinstance(current, list):
+            current = []
+            record[field_name] = current
+        current.append(entry.get("value"))
+    elif op == "set_key":
+        field_name = str(entry.get("field"))
+        current = record.get(field_name)
+        if not isinstance(current, dict):
+            current = {}
+            record[field_name] = current
+        current[str(entry.get("key"))] = entry.get("value")
+    else:
+        logger.warning("Ignoring unknown journal op %r for %s", op, record_id)
+
+
+class StateJournal:
+    """Append-only record log compacted into a periodic snapshot.
+
+    Not thread-safe; callers (the asyncio-driven ``StateManager``) are
+    expected to serialize access.
+    """
+
+    def __init__(
+        self,
+        directory: Path | str,
+        name: str = "workflows",
+        *,
+        compact_after_records: int = _DEFAULT_COMPACT_AFTER_RECORDS,
+        compact_after_bytes: int = _DEFAULT_COMPACT_AFTER_BYTES,
+        fsync_interval_seconds: float = _DEFAULT_FSYNC_INTERVAL_SECONDS,
+    ) -> None:
+        self._dir = Path(directory)
+        self._name = name
+        self._compact_after_records = max(1, compact_after_records)
+        self._compact_after_bytes = max(1, compact_after_bytes)
+        self._fsync_interval = max(0.0, fsync_interval_seconds)
+
+        self._seq = 0
+        self._journal_records = 0
+        self._journal_bytes = 0
+        self._handle: IO[bytes] | None = None
+        self._dirty_since_fsync = False
+        self._last_fsync = time.monotonic()
+        self._fsync_timer: asyncio.TimerHandle | None = None
+
+    @property
+    def snapshot_path(self) -> Path:
+        return self._dir / f"{self._name}.json"
+
+    @property
+    def journal_path(self) -> Path:
+        return self._dir / f"{self._name}.journal"
+
+    @property
+    def seq(self) -> int:
+        return self._seq
+
+    @property
+    def needs_compaction(self) -> bool:
+        return (
+            self._journal_records >= self._compact_after_records
+            or self._journal_bytes >= self._compact_after_bytes
+        )
+
+    # ── Load / replay ─────────────────────────────────────────────────
+
+    def load(self) -> dict[str, dict[str, Any]]:
+        """Return the state rebuilt from the snapshot plus journal tail."""
+        records, snapshot_seq = self._read_snapshot()
+        self._seq = snapshot_seq
+
+        path = self.journal_path
+        if not path.is_file():
+            return records
+
+        good_offset = 0
+        replayed = 0
+        with path.open("rb") as fh:
+            for raw in fh:
+                if not raw.endswith(b"\n"):
+                    break  # torn trailing write
+                try:
+                    entry = json.loads(raw)
+                except ValueError:
+                    break
+                if not isinstance(entry, dict):
+                    break
+                good_offset += len(raw)
+                seq = int(entry.get("seq", 0))
+                self._journal_records += 1
+                if seq <= snapshot_seq:
+                    continue
+                apply_op(records, entry)
+                self._seq = max(self._seq, seq)
+                replayed += 1
+
+        size = path.stat().st_size
+        if good_offset < size:
+            logger.warning(
+                "Truncating %d corrupt trailing bytes from %s",
+                size - good_offset,
+                path,
+            )
+            with path.open("r+b") as fh:
+                fh.truncate(good_offset)
+                os.fsync(fh.fileno())
+        self._journal_bytes = good_offset
+        logger.debug("Replayed %d journal entries from %s", replayed, path)
+        return records
+
+    def _read_snapshot(self) -> tuple[dict[str, dict[str, Any]], int]:
+        path = self.snapshot_path
+        if not path.is_file():
+            return {}, 0
+        data = json.loads(path.read_text())
+        if not isinstance(data, dict):
+            return {}, 0
+        if data.get("version") == SNAPSHOT_VERSION and isinstance(data.get("records"), dict):
+            return dict(data["records"]), int(data.get("seq", 0))
+        # Legacy bare mapping from the pre-journal StateManager.
+        return dict(data), 0
+
+    # ── Append ────────────────────────────────────────────────────────
+
+    def append(self, op: str, record_id: str, **payload: Any) -> int:
+        """Append one op to the journal and return its sequence number."""
+        self._seq += 1
+        entry = {"seq": self._seq, "op": op, "id": record_id, **payload}
+        line = json.dumps(entry, separators=(",", ":"), default=str).encode("utf-8") + b"\n"
+
+        handle = self._open()
+        handle.write(line)
+        handle.flush()
+        self._journal_records += 1
+        self._journal_bytes += len(line)
+        self._dirty_since_fsync = True
+        elapsed = time.monotonic() - self._last_fsync
+        if elapsed >= self._fsync_interval:
+            self._fsync()
+        else:
+            self._schedule_fsync(self._fsync_interval - elapsed)
+        return self._seq
+
+    def _open(self) -> IO[bytes]:
+        if self._handle is None:
+            self._dir.mkdir(parents=True, exist_ok=True)
+            self._handle = self.journal_path.open("ab")
+        return self._handle
+
+    def _fsync(self) -> None:
+        self._cancel_fsync_timer()
+        if self._handle is not None and self._dirty_since_fsync:
+            self._handle.flush()
+            os.fsync(self._handle.fileno())
+        self._dirty_since_fsync = False
+        self._last_fsync = time.monotonic()
+
+    def _schedule_fsync(self, delay: float) -> None:
+        """Fsync after ``delay`` unless an append or flush gets there first.
+
+        Needs a running event loop; synchronous callers rely on the next
+        append or ``close()``.
+        """
+        if self._fsync_timer is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._fsync_timer = loop.call_later(delay, self._deferred_fsync)
+
+    def _deferred_fsync(self) -> None:
+        self._fsync_timer = None
+        try:
+            self._fsync()
+        except OSError:
+            logger.warning("Deferred fsync of %s failed", self.journal_path, exc_info=True)
+
+    def _cancel_fsync_timer(self) -> None:
+        if self._fsync_timer is not None:
+            self._fsync_timer.cancel()
+            self._fsync_timer = None
+
+    # ── Compaction / lifecycle ────────────────────────────────────────
+
+    def compact(self, records: Mapping[str, Any]) -> None:
+        """Write ``records`` as the new snapshot and truncate the journal.
+
+        ``records`` must reflect every op appended so far.
+        """
+        self._dir.mkdir(parents=True, exist_ok=True)
+        payload = {"version": SNAPSHOT_VERSION, "seq": self._seq, "records": dict(records)}
+        encoded = json.dumps(payload, separators=(",", ":"), default=str).encode("utf-8")
+
+        fd, tmp_path = tempfile.mkstemp(
+            prefix=self.snapshot_path.name + ".", suffix=".tmp", dir=str(self._dir)
+        )
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(encoded)
+                fh.flush()
+                os.fsync(fh.fileno())
+            os.replace(tmp_path, self.snapshot_path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+        # The snapshot now covers every seq; a crash before this truncate
+        # is harmless because replay skips seq <= snapshot seq.
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+        with self.journal_path.open("wb") as fh:
+            os.fsync(fh.fileno())
+        self._cancel_fsync_timer()
+        self._journal_records = 0
+        self._journal_bytes = 0
+        self._dirty_since_fsync = False
+        self._last_fsync = time.monotonic()
+
+    def flush(self) -> None:
+        """Force pending journal writes to stable storage."""
+        self._fsync()
+
+    def close(self) -> None:
+        self._fsync()
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "seq": self._seq,
+            "journal_records": self._journal_records,
+            "journal_bytes": self._journal_bytes,
+            "compact_after_records": self._compact_after_records,
+            "compact_after_bytes": self._compact_after_bytes,
+            "fsync_interval_seconds": self._fsync_interval,
+        }
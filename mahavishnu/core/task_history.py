@@ -0,0 +1,196 @@
+"""Precomputed task history for duration estimates and sequence patterns.
+
+``DurationEstimator`` used to score every historical task for every
+estimate, and ``PatternDetector`` rescanned the whole task list for each
+candidate sequence. ``TaskHistoryIndex`` folds each task in once instead:
+
+- **Duration groups.** Completed-task durations live in one NumPy array;
+  repository, tag and priority map to the (ascending) row numbers of their
+  tasks, so "similar tasks" is a few set operations on small row arrays
+  followed by a fancy-indexed gather.
+- **Sequence tables.** Status histories are counted as full sequences
+  (globally and per repository) and as prefixes with their completion
+  counts, so a sequence's completion probability is two dict lookups.
+- **Incremental updates.** ``add()`` folds one finished task into every
+  table; call it as tasks complete rather than rebuilding.
+
+Usage:
+    history = TaskHistoryIndex.from_tasks(completed_tasks)
+    estimator = DurationEstimator(history=history)
+
+    prediction = estimator.estimate_duration(task, duration_patterns)
+    history.add(finished_task)  # keeps the index current
+"""
+
+from __future__ import annotations
+
+from collections import Counter, defaultdict
+from collections.abc import Hashable, Iterable, Sequence
+from datetime import datetime
+import logging
+from typing import Any
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+_EMPTY_ROWS = np.empty(0, dtype=np.int64)
+
+
+def task_duration_hours(task: dict[str, Any]) -> float | None:
+    """Hours between ``created_at`` and ``completed_at``, or None if unknown."""
+    created = task.get("created_at")
+    completed = task.get("completed_at")
+    if not (created and completed):
+        return None
+    try:
+        created_dt = datetime.fromisoformat(created) if isinstance(created, str) else created
+        completed_dt = (
+            datetime.fromisoformat(completed) if isinstance(completed, str) else completed
+        )
+        return float((completed_dt - created_dt).total_seconds() / 3600)
+    except (ValueError, TypeError):
+        return None
+
+
+def duration_percentiles(
+    durations: Sequence[float] | np.ndarray, percentiles: Sequence[float] = (50, 90)
+) -> dict[str, float]:
+    """Return ``{"p50": ..., "p90": ...}`` for ``durations`` (empty if none)."""
+    values = np.asarray(durations, dtype=np.float64)
+    if values.size == 0:
+        return {}
+    points = np.percentile(values, percentiles)
+    return {f"p{q:g}": float(value) for q, value in zip(percentiles, points, strict=True)}
+
+
+class TaskHistoryIndex:
+    """Incrementally maintained duration groups and status-sequence counts.
+
+    Each task should be added once, when it reaches a final state;
+    re-adding a task counts it twice.
+    """
+
+    def __init__(self) -> None:
+        self._durations = np.empty(64, dtype=np.float64)
+        self._size = 0
+        self._rows: dict[tuple[str, Hashable], list[int]] = defaultdict(list)
+        self._row_arrays: dict[tuple[str, Hashable], np.ndarray] = {}
+
+        self.task_count = 0
+        self.sequence_counts: Counter[tuple[str, ...]] = Counter()
+        self.repo_sequence_counts: dict[str, Counter[tuple[str, ...]]] = defaultdict(Counter)
+        self._prefix_counts: Counter[tuple[Any, ...]] = Counter()
+        self._prefix_completed: Counter[tuple[Any, ...]] = Counter()
+
+    @classmethod
+    def from_tasks(cls, tasks: Iterable[dict[str, Any]]) -> TaskHistoryIndex:
+        """Build an index over ``tasks`` in one pass."""
+        index = cls()
+        for task in tasks:
+            index.add(task)
+        return index
+
+    def __len__(self) -> int:
+        return self.task_count
+
+    @property
+    def duration_count(self) -> int:
+        """Number of completed tasks with a known, non-zero duration."""
+        return self._size
+
+    def add(self, task: dict[str, Any]) -> None:
+        """Fold one task into the duration groups and sequence tables."""
+        self.task_count += 1
+        completed = task.get("status") == "completed"
+
+        if history := task.get("status_history"):
+            statuses = tuple(h.get("status") for h in history)
+            for end in range(1, len(statuses) + 1):
+                self._prefix_counts[statuses[:end]] += 1
+                if completed:
+                    self._prefix_completed[statuses[:end]] += 1
+
+            sequence = tuple(status for status in statuses if status)
+            if len(sequence) >= 2:
+                self.sequence_counts[sequence] += 1
+                if repo := task.get("repository"):
+                    self.repo_sequence_counts[repo][sequence] += 1
+
+        if completed and (duration := task_duration_hours(task)):
+            self._append_duration(task, duration)
+
+    def _append_duration(self, task: dict[str, Any], duration: float) -> None:
+        if self._size == len(self._durations):
+            self._durations = np.resize(self._durations, self._size * 2)
+        row = self._size
+        self._durations[row] = duration
+        self._size += 1
+
+        keys = [("repository", task.get("repository")), ("priority", task.get("priority"))]
+        keys += [("tag", tag) for tag in set(task.get("tags") or [])]
+        for key in keys:
+            if isinstance(key[1], Hashable):
+                self._rows[key].append(row)
+                self._row_arrays.pop(key, None)
+
+    def _group(self, kind: str, value: Any) -> np.ndarray:
+        key = (kind, value)
+        if not isinstance(value, Hashable) or key not in self._rows:
+            return _EMPTY_ROWS
+        rows = self._row_arrays.get(key)
+        if rows is None:
+            rows = self._row_arrays[key] = np.asarray(self._rows[key], dtype=np.int64)
+        return rows
+
+    def durations(
+        self,
+        repository: Any = None,
+        tag: str | None = None,
+        priority: Any = None,
+    ) -> np.ndarray:
+        """Durations of completed tasks matching every given filter."""
+        rows: np.ndarray | None = None
+        for kind, value in (("repository", repository), ("tag", tag), ("priority", priority)):
+            if value is None:
+                continue
+            group = self._group(kind, value)
+            rows = group if rows is None else np.intersect1d(rows, group, assume_unique=True)
+        if rows is None:
+            return self._durations[: self._size].copy()
+        return self._durations[rows]
+
+    def similar_durations(self, task: dict[str, Any]) -> np.ndarray:
+        """Durations of completed tasks similar to ``task``, oldest first.
+
+        Similar means at least two of: same repository, a shared tag, same
+        priority (the similarity >= 0.5 rule ``DurationEstimator`` applies).
+        """
+        repo = self._group("repository", task.get("repository"))
+        priority = self._group("priority", task.get("priority"))
+        tag_groups = [self._group("tag", tag) for tag in set(task.get("tags") or [])]
+        tags = np.unique(np.concatenate(tag_groups)) if tag_groups else _EMPTY_ROWS
+
+        rows = np.union1d(
+            np.union1d(
+                np.intersect1d(repo, tags, assume_unique=True),
+                np.intersect1d(repo, priority, assume_unique=True),
+            ),
+            np.intersect1d(tags, priority, assume_unique=True),
+        )
+        return self._durations[rows]
+
+    def completion_probability(self, sequence: Sequence[Any]) -> float:
+        """Share of tasks whose status history starts with ``sequence`` that completed."""
+        sequence = tuple(sequence)
+        if not sequence or sequence[-1] == "completed":
+            return 1.0
+        matching = self._prefix_counts.get(sequence, 0)
+        return self._prefix_completed.get(sequence, 0) / matching if matching else 0.0
+
+
+__all__ = [
+    "TaskHistoryIndex",
+    "duration_percentiles",
+    "task_duration_hours",
+]
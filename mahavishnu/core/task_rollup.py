@@ -0,0 +1,191 @@
+"""Event-maintained per-repository task rollup for CrossRepoAggregator.
+
+``TaskStore.count_by_repository`` answers dashboard summaries with one
+grouped query. ``TaskRollup`` goes one step further for hot dashboards: it
+keeps the same per-repository counts in memory and folds ``EventStore``
+task events into them, so ``get_summary`` and friends run without touching
+the database at all.
+
+- **Rollup cells.** Each repository keeps counts per (status, priority),
+  tag totals, and ordered id sets per status (for blocked ids and the
+  oldest pending task). A status change moves one task between cells.
+- **Incremental updates.** ``apply_event`` mirrors the field changes
+  ``TaskSearchIndex`` derives from events, so
+  ``EventStore.subscribe(rollup.apply_event)`` keeps it current.
+- **Same shape as SQL.** ``repository_counts()`` returns the
+  ``RepositoryTaskCounts`` that ``count_by_repository`` returns, so callers
+  do not care which one they read.
+
+Usage:
+    rollup = TaskRollup()
+    rollup.rebuild(await task_store.list(TaskListFilter(limit=10000)))
+    event_store.subscribe(rollup.apply_event)
+
+    aggregator = CrossRepoAggregator(task_store, repo_manager, rollup=rollup)
+    summary = await aggregator.get_summary()  # no queries
+"""
+
+from __future__ import annotations
+
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field, replace
+import logging
+from typing import TYPE_CHECKING
+
+from mahavishnu.core.event_store import TaskEvent, TaskEventType
+from mahavishnu.core.task_search_index import task_changes, task_from_created
+from mahavishnu.core.task_store import (
+    RepositoryTaskCounts,
+    Task,
+    TaskPriority,
+    TaskStatus,
+    is_critical,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+# Task fields that move a task between rollup cells.
+_ROLLUP_FIELDS = frozenset({"status", "priority", "tags"})
+
+
+@dataclass
+class _RepoCells:
+    """Rollup state for one repository."""
+
+    cells: Counter[tuple[TaskStatus, TaskPriority]] = field(default_factory=Counter)
+    tags: Counter[str] = field(default_factory=Counter)
+    # status -> insertion-ordered task ids (dict used as an ordered set)
+    members: defaultdict[TaskStatus, dict[str, None]] = field(
+        default_factory=lambda: defaultdict(dict)
+    )
+    created: dict[str, datetime | None] = field(default_factory=dict)
+    newest: datetime | None = None
+    newest_stale: bool = False
+
+    def counts(self, repository: str) -> RepositoryTaskCounts:
+        status_counts: Counter[TaskStatus] = Counter()
+        priority_counts: Counter[TaskPriority] = Counter()
+        critical = 0
+        for (status, priority), count in self.cells.items():
+            status_counts[status] += count
+            priority_counts[priority] += count
+            if is_critical(status, priority):
+                critical += count
+
+        if self.newest_stale:
+            self.newest = max((c for c in self.created.values() if c), default=None)
+            self.newest_stale = False
+        pending = [self.created[task_id] for task_id in self.members[TaskStatus.PENDING]]
+
+        return RepositoryTaskCounts(
+            repository=repository,
+            total=len(self.created),
+            status_counts=+status_counts,
+            priority_counts=+priority_counts,
+            tag_counts=dict(self.tags),
+            blocked_task_ids=list(self.members[TaskStatus.BLOCKED]),
+            critical_count=critical,
+            oldest_pending=min((c for c in pending if c), default=None),
+            newest_task=self.newest,
+        )
+
+
+class TaskRollup:
+    """In-memory per-repository task counts kept current from task events."""
+
+    def __init__(self) -> None:
+        self._tasks: dict[str, Task] = {}
+        self._repos: dict[str, _RepoCells] = {}
+        self.loaded = False
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    def __contains__(self, task_id: str) -> bool:
+        return task_id in self._tasks
+
+    def rebuild(self, tasks: Iterable[Task]) -> None:
+        """Replace the rollup contents with ``tasks``."""
+        self._tasks.clear()
+        self._repos.clear()
+        for task in tasks:
+            self.upsert(task)
+        self.loaded = True
+
+    def upsert(self, task: Task) -> None:
+        """Count ``task``, replacing any previous version."""
+        self.remove(task.id)
+        self._tasks[task.id] = task
+
+        repo = self._repos.get(task.repository)
+        if repo is None:
+            repo = self._repos[task.repository] = _RepoCells()
+        repo.cells[(task.status, task.priority)] += 1
+        repo.tags.update(task.tags)
+        repo.members[task.status][task.id] = None
+        repo.created[task.id] = task.created_at
+        if task.created_at and not repo.newest_stale:
+            if repo.newest is None or task.created_at > repo.newest:
+                repo.newest = task.created_at
+
+    def remove(self, task_id: str) -> bool:
+        """Stop counting ``task_id``; return whether it was present."""
+        task = self._tasks.pop(task_id, None)
+        if task is None:
+            return False
+
+        repo = self._repos[task.repository]
+        key = (task.status, task.priority)
+        repo.cells[key] -= 1
+        if not repo.cells[key]:
+            del repo.cells[key]
+        repo.tags.subtract(task.tags)
+        repo.tags = +repo.tags
+        del repo.members[task.status][task_id]
+        created = repo.created.pop(task_id)
+        if created is not None and created == repo.newest:
+            repo.newest_stale = True
+        if not repo.created:
+            del self._repos[task.repository]
+        return True
+
+    def apply_event(self, event: TaskEvent) -> None:
+        """Fold one ``EventStore`` task event into the rollup.
+
+        Suitable as an ``EventStore.subscribe`` listener.
+        """
+        if event.event_type == TaskEventType.DELETED:
+            self.remove(event.task_id)
+            return
+        if event.event_type == TaskEventType.CREATED:
+            self.upsert(task_from_created(event))
+            return
+
+        task = self._tasks.get(event.task_id)
+        if task is None:
+            return
+        changes = task_changes(event, task)
+        if _ROLLUP_FIELDS.intersection(changes):
+            self.upsert(replace(task, **changes))
+
+    def repository_counts(
+        self, repositories: Iterable[str] | None = None
+    ) -> dict[str, RepositoryTaskCounts]:
+        """Per-repository counts, in the shape ``TaskStore.count_by_repository`` returns.
+
+        Args:
+            repositories: Only these repositories (all if None)
+
+        Returns:
+            Mapping of repository name to its counts; repositories without
+            tasks are absent
+        """
+        names = sorted(self._repos) if repositories is None else repositories
+        return {name: self._repos[name].counts(name) for name in names if name in self._repos}
+
+
+__all__ = ["TaskRollup"]
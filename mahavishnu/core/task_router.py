@@ -39,7 +39,6 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import StrEnum
-import json
 import logging
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, ClassVar, cast
@@ -50,6 +49,7 @@ from mahavishnu.core.adapters.base import (
 )
 from mahavishnu.core.resilience import RetryExhaustedError, RetryPolicy, retry_async
 from mahavishnu.core.routing_metrics import RoutingMetrics, get_routing_metrics
+from mahavishnu.core.state_backends.journal import StateJournal
 from mahavishnu.core.status import WorkflowStatus
 
 if TYPE_CHECKING:
@@ -175,10 +175,15 @@ class WorkflowState:
 
 
 class StateManager:
-    """Workflow state manager with file-based persistence.
+    """Workflow state manager with journaled file-based persistence.
 
-    State is kept in-memory for fast access and persisted to a JSON file
-    so that in-flight workflow state survives Mahavishnu restarts.
+    State is kept in-memory for fast access. Each mutation is appended to
+    an append-only journal (``workflows.journal``) describing only what
+    changed, and the journal is periodically compacted into a snapshot
+    (``workflows.json``). Per-repo progress updates therefore write O(1)
+    bytes instead of re-serializing every workflow on every call. See
+    ``mahavishnu.core.state_backends.journal`` for the on-disk format and
+    crash-recovery rules.
 
     Migration note (Bodai I0.5): File-based persistence is the Phase 0
     baseline. Migration to Dhara via MCP is deferred to Phase 2 pending
@@ -187,20 +192,30 @@ class StateManager:
 
     _DEFAULT_STATE_DIR = Path("data/workflow_state")
 
-    def __init__(self, state_dir: Path | str | None = None) -> None:
+    def __init__(
+        self,
+        state_dir: Path | str | None = None,
+        *,
+        compact_after_records: int = 1000,
+        fsync_interval_seconds: float = 1.0,
+    ) -> None:
         self._workflows: dict[str, dict[str, Any]] = {}
         self._state_dir = Path(state_dir) if state_dir else self._DEFAULT_STATE_DIR
+        self._journal = StateJournal(
+            self._state_dir,
+            "workflows",
+            compact_after_records=compact_after_records,
+            fsync_interval_seconds=fsync_interval_seconds,
+        )
         self._load()
 
     def _state_file(self) -> Path:
-        return self._state_dir / "workflows.json"
+        return self._journal.snapshot_path
 
     def _load(self) -> None:
         path = self._state_file()
-        if not path.is_file():
-            return
         try:
-            data = json.loads(path.read_text())
+            data = self._journal.load()
             for wf_id, wf_data in data.items():
                 record = self._default_record(wf_id)
                 if isinstance(wf_data, dict):
@@ -209,18 +224,34 @@ class StateManager:
                     if isinstance(adapter_states, dict):
                         record["adapter_states"] = adapter_states
                 self._workflows[wf_id] = record
-            logger.debug("Loaded %d workflow states from %s", len(self._workflows), path)
+            if self._workflows:
+                logger.debug("Loaded %d workflow states from %s", len(self._workflows), path)
         except Exception:
             logger.warning("Failed to load workflow state from %s", path, exc_info=True)
 
-    def _persist(self) -> None:
+    def _journal_op(self, op: str, workflow_id: str, **payload: Any) -> None:
+        """Append one mutation to the journal, compacting when it grows."""
         try:
-            self._state_dir.mkdir(parents=True, exist_ok=True)
-            data = dict(self._workflows)
-            self._state_file().write_text(json.dumps(data, indent=2))
+            self._journal.append(op, workflow_id, **payload)
+            if self._journal.needs_compaction:
+                self._journal.compact(self._workflows)
         except Exception:
             logger.warning("Failed to persist workflow state", exc_info=True)
 
+    def flush(self) -> None:
+        """Force coalesced journal writes to stable storage."""
+        try:
+            self._journal.flush()
+        except Exception:
+            logger.warning("Failed to flush workflow state journal", exc_info=True)
+
+    def close(self) -> None:
+        """Flush and release the journal file handle."""
+        try:
+            self._journal.close()
+        except Exception:
+            logger.warning("Failed to close workflow state journal", exc_info=True)
+
     @staticmethod
     def _normalize_status(value: Any | None) -> str | None:
         if value is None:
@@ -279,7 +310,7 @@ class StateManager:
         record["task"] = dict(task)
         record["repos"] = list(repos)
         self._workflows[workflow_id] = record
-        self._persist()
+        self._journal_op("put", workflow_id, record=record)
         return self._copy_record(record)
 
     async def update(self, workflow_id: str, **updates: Any) -> None:
@@ -303,7 +334,9 @@ class StateManager:
                 str(key): dict(value) for key, value in updates["adapter_states"].items()
             }
         record.update(updates)
-        self._persist()
+        self._journal_op(
+            "merge", workflow_id, fields={"updated_at": record["updated_at"], **updates}
+        )
 
     async def get(self, workflow_id: str) -> dict[str, Any] | None:
         record = self._workflows.get(workflow_id)
@@ -325,8 +358,8 @@ class StateManager:
         return workflows[:limit]
 
     async def delete(self, workflow_id: str) -> None:
-        self._workflows.pop(workflow_id, None)
-        self._persist()
+        if self._workflows.pop(workflow_id, None) is not None:
+            self._journal_op("delete", workflow_id)
 
     async def update_progress(self, workflow_id: str, completed: int, total: int) -> None:
         progress = int((completed / total) * 100) if total > 0 else 0
@@ -339,20 +372,29 @@ class StateManager:
         return len(state.get("results", [])) + len(state.get("errors", []))
 
     async def add_result(self, workflow_id: str, result: dict[str, Any]) -> None:
-        state = await self.get(workflow_id)
-        if not state:
-            return
-        results = list(state.get("results", []))
-        results.append(dict(result))
-        await self.update(workflow_id, results=results)
+        self._append_item(workflow_id, "results", result)
 
     async def add_error(self, workflow_id: str, error: dict[str, Any]) -> None:
-        state = await self.get(workflow_id)
-        if not state:
+        self._append_item(workflow_id, "errors", error)
+
+    def _append_item(self, workflow_id: str, field_name: str, item: dict[str, Any]) -> None:
+        record = self._workflows.get(workflow_id)
+        if record is None:
             return
-        errors = list(state.get("errors", []))
-        errors.append(dict(error))
-        await self.update(workflow_id, errors=errors)
+        value = dict(item)
+        record["updated_at"] = self._now_iso()
+        items = record.get(field_name)
+        if not isinstance(items, list):
+            items = record[field_name] = []
+        # Safe in place: ``get`` and friends hand out copied lists.
+        items.append(value)
+        self._journal_op(
+            "append",
+            workflow_id,
+            field=field_name,
+            value=value,
+            fields={"updated_at": record["updated_at"]},
+        )
 
     async def create_workflow_state(
         self,
@@ -360,10 +402,7 @@ class StateManager:
         adapter_type: str | AdapterType,
         initial_state: dict[str, Any],
     ) -> dict[str, Any]:
-        record = self._ensure_record(workflow_id)
-        record["adapter_states"][self._adapter_key(adapter_type)] = dict(initial_state)
-        self._persist()
-        return self._copy_record(record)
+        return self._set_adapter_state(workflow_id, adapter_type, initial_state)
 
     async def update_adapter_state(
         self,
@@ -371,10 +410,24 @@ class StateManager:
         adapter_type: str | AdapterType,
         state: dict[str, Any],
     ) -> dict[str, Any]:
-        workflow_state = self._ensure_record(workflow_id)
-        workflow_state["adapter_states"][self._adapter_key(adapter_type)] = dict(state)
-        self._persist()
-        return self._copy_record(workflow_state)
+        return self._set_adapter_state(workflow_id, adapter_type, state)
+
+    def _set_adapter_state(
+        self,
+        workflow_id: str,
+        adapter_type: str | AdapterType,
+        state: dict[str, Any],
+    ) -> dict[str, Any]:
+        is_new = workflow_id not in self._workflows
+        record = self._ensure_record(workflow_id)
+        key = self._adapter_key(adapter_type)
+        value = dict(state)
+        record["adapter_states"][key] = value
+        if is_new:
+            self._journal_op("put", workflow_id, record=record)
+        else:
+            self._journal_op("set_key", workflow_id, field="adapter_states", key=key, value=value)
+        return self._copy_record(record)
 
     async def get_workflow_state(self, workflow_id: str) -> dict[str, Any] | None:
         workflow_state = self._workflows.get(workflow_id)
@@ -615,6 +668,10 @@ class TaskRouter:
             f"metrics_enabled={self.metrics is not None}"
         )
 
+    def close(self) -> None:
+        """Flush and close the workflow state journal. Call on shutdown."""
+        self.state_manager.close()
+
     @staticmethod
     def _normalize_task_type(task_type: Any) -> TaskType:
         if isinstance(task_type, TaskType):
@@ -220,7 +220,10 @@ class TaskListFilter:
     """Filters for listing tasks."""
 
     repository: str | None = None
+    repositories: list[str] | None = None
+    ids: list[str] | None = None
     status: TaskStatus | None = None
+    exclude_statuses: list[TaskStatus] | None = None
     priority: TaskPriority | None = None
     assignee: str | None = None
     tags: list[str] | None = None
@@ -228,10 +231,104 @@ class TaskListFilter:
     due_before: datetime | None = None
     due_after: datetime | None = None
     created_after: datetime | None = None
+    # Keyset cursor: (created_at, id) of the last task on the previous page
+    after: tuple[datetime, str] | None = None
     limit: int = 100
     offset: int = 0
 
 
+# "Critical" tasks: high/critical priority work that is blocked or in flight.
+CRITICAL_PRIORITIES: tuple[TaskPriority, ...] = (TaskPriority.HIGH, TaskPriority.CRITICAL)
+CRITICAL_STATUSES: tuple[TaskStatus, ...] = (TaskStatus.BLOCKED, TaskStatus.IN_PROGRESS)
+
+
+def is_critical(status: TaskStatus, priority: TaskPriority) -> bool:
+    """Whether a task with this status and priority counts as critical."""
+    return priority in CRITICAL_PRIORITIES and status in CRITICAL_STATUSES
+
+
+def _sql_values(values: tuple[StrEnum, ...]) -> str:
+    return ", ".join(f"'{value.value}'" for value in values)
+
+
+_STATUS_COUNT_COLUMNS = ",\n        ".join(
+    f"COUNT(*) FILTER (WHERE s.status = '{s.value}') AS status_{s.value}" for s in TaskStatus
+)
+_PRIORITY_COUNT_COLUMNS = ",\n        ".join(
+    f"COUNT(*) FILTER (WHERE s.priority = '{p.value}') AS priority_{p.value}" for p in TaskPriority
+)
+
+# One row per repository: every status/priority count, the critical count,
+# pending/newest timestamps, blocked ids and tag totals, computed by the
+# database instead of by listing tasks. ``{where}`` scopes the tasks.
+_REPOSITORY_COUNTS_QUERY = f"""
+    WITH scoped AS (
+        SELECT id, repository, status, priority, tags, created_at FROM tasks {{where}}
+    ),
+    tag_totals AS (
+        SELECT repository, tag, COUNT(*) AS tag_count
+        FROM scoped, unnest(scoped.tags) AS tag
+        GROUP BY repository, tag
+    )
+    SELECT
+        s.repository,
+        COUNT(*) AS total,
+        {_STATUS_COUNT_COLUMNS},
+        {_PRIORITY_COUNT_COLUMNS},
+        COUNT(*) FILTER (
+            WHERE s.priority IN ({_sql_values(CRITICAL_PRIORITIES)})
+            AND s.status IN ({_sql_values(CRITICAL_STATUSES)})
+        ) AS critical_count,
+        MIN(s.created_at) FILTER (WHERE s.status = 'pending') AS oldest_pending,
+        MAX(s.created_at) AS newest_task,
+        array_agg(s.id::text) FILTER (WHERE s.status = 'blocked') AS blocked_task_ids,
+        (SELECT array_agg(t.tag ORDER BY t.tag) FROM tag_totals t
+         WHERE t.repository = s.repository) AS tag_names,
+        (SELECT array_agg(t.tag_count ORDER BY t.tag) FROM tag_totals t
+         WHERE t.repository = s.repository) AS tag_totals
+    FROM scoped s
+    GROUP BY s.repository
+    ORDER BY s.repository
+"""
+
+
+@dataclass
+class RepositoryTaskCounts:
+    """Grouped task counts for one repository.
+
+    Produced by ``TaskStore.count_by_repository`` (one grouped query) or by
+    an event-maintained ``TaskRollup``; status and priority counts only
+    contain values that occur.
+    """
+
+    repository: str
+    total: int = 0
+    status_counts: dict[TaskStatus, int] = field(default_factory=dict)
+    priority_counts: dict[TaskPriority, int] = field(default_factory=dict)
+    tag_counts: dict[str, int] = field(default_factory=dict)
+    blocked_task_ids: list[str] = field(default_factory=list)
+    critical_count: int = 0
+    oldest_pending: datetime | None = None
+    newest_task: datetime | None = None
+
+    @classmethod
+    def from_row(cls, row: Any) -> RepositoryTaskCounts:
+        """Create from a ``count_by_repository`` result row."""
+        status_counts = {s: row[f"status_{s.value}"] for s in TaskStatus}
+        priority_counts = {p: row[f"priority_{p.value}"] for p in TaskPriority}
+        return cls(
+            repository=row["repository"],
+            total=row["total"],
+            status_counts={s: c for s, c in status_counts.items() if c},
+            priority_counts={p: c for p, c in priority_counts.items() if c},
+            tag_counts=dict(zip(row["tag_names"] or [], row["tag_totals"] or [], strict=True)),
+            blocked_task_ids=list(row["blocked_task_ids"] or []),
+            critical_count=row["critical_count"],
+            oldest_pending=row["oldest_pending"],
+            newest_task=row["newest_task"],
+        )
+
+
 @dataclass
 class TaskDependency:
     """A task dependency relationship."""
@@ -592,11 +689,26 @@ class TaskStore:
             query += f" AND repository = ${param_count}"
             params.append(filters.repository)
 
+        if filters.repositories is not None:
+            param_count += 1
+            query += f" AND repository = ANY(${param_count})"
+            params.append(list(filters.repositories))
+
+        if filters.ids is not None:
+            param_count += 1
+            query += f" AND id = ANY(${param_count}::uuid[])"
+            params.append(list(filters.ids))
+
         if filters.status:
             param_count += 1
             query += f" AND status = ${param_count}"
             params.append(filters.status.value)
 
+        if filters.exclude_statuses:
+            param_count += 1
+            query += f" AND status::text <> ALL(${param_count})"
+            params.append([TaskStatus(s).value for s in filters.exclude_statuses])
+
         if filters.priority:
             param_count += 1
             query += f" AND priority = ${param_count}"
@@ -632,7 +744,12 @@ class TaskStore:
             query += f" AND created_at > ${param_count}"
             params.append(filters.created_after)
 
-        query += " ORDER BY created_at DESC"
+        if filters.after is not None:
+            query += f" AND (created_at, id) < (${param_count + 1}, ${param_count + 2}::uuid)"
+            params.extend(filters.after)
+            param_count += 2
+
+        query += " ORDER BY created_at DESC, id DESC"
 
         param_count += 1
         query += f" LIMIT ${param_count}"
@@ -667,11 +784,26 @@ class TaskStore:
             query += f" AND repository = ${param_count}"
             params.append(filters.repository)
 
+        if filters.repositories is not None:
+            param_count += 1
+            query += f" AND repository = ANY(${param_count})"
+            params.append(list(filters.repositories))
+
+        if filters.ids is not None:
+            param_count += 1
+            query += f" AND id = ANY(${param_count}::uuid[])"
+            params.append(list(filters.ids))
+
         if filters.status:
             param_count += 1
             query += f" AND status = ${param_count}"
             params.append(filters.status.value)
 
+        if filters.exclude_statuses:
+            param_count += 1
+            query += f" AND status::text <> ALL(${param_count})"
+            params.append([TaskStatus(s).value for s in filters.exclude_statuses])
+
         if filters.priority:
             param_count += 1
             query += f" AND priority = ${param_count}"
@@ -684,6 +816,27 @@ class TaskStore:
 
         return await self.db.fetchval(query, *params)  # type: ignore[no-any-return]
 
+    async def count_by_repository(
+        self, repositories: builtins.list[str] | None = None
+    ) -> dict[str, RepositoryTaskCounts]:
+        """Per-repository status, priority and tag counts in one grouped query.
+
+        Args:
+            repositories: Only count these repositories (all if None)
+
+        Returns:
+            Mapping of repository name to its counts; repositories without
+            tasks are absent
+        """
+        where = ""
+        params: list[Any] = []
+        if repositories is not None:
+            where = "WHERE repository = ANY($1)"
+            params.append(list(repositories))
+
+        rows = await self.db.fetch(_REPOSITORY_COUNTS_QUERY.format(where=where), *params)
+        return {row["repository"]: RepositoryTaskCounts.from_row(row) for row in rows}
+
     # Batch operations
 
     async def create_batch(
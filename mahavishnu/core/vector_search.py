@@ -13,15 +13,17 @@ from dataclasses import dataclass, field
 from enum import Enum
 import logging
 import re
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Literal
 
+import numpy as np
 from pydantic import BaseModel, ConfigDict, Field
 
-from mahavishnu.core.embeddings import EmbeddingService, cosine_similarity
 from mahavishnu.core.errors import ErrorCode, MahavishnuError
+from mahavishnu.core.similarity import DEFAULT_BLOCK_SIZE, SimilarityIndex
 
 if TYPE_CHECKING:
     from mahavishnu.core.database import Database
+    from mahavishnu.core.embeddings import EmbeddingService
 
 logger = logging.getLogger(__name__)
 
@@ -688,17 +690,59 @@ class VectorSearch:
 
 
 class TaskSimilarity:
-    """Task similarity utilities."""
+    """Task similarity utilities.
+
+    Pairwise work runs on a :class:`~mahavishnu.core.similarity.SimilarityIndex`
+    (normalized float32 matrix, blocked matrix products) rather than a
+    Python loop over vector pairs.
+    """
 
     def __init__(self, db: Database) -> None:
         self.db = db
 
+    async def _load_index(
+        self,
+        task_ids: list[str] | None = None,
+        repository: str | None = None,
+    ) -> SimilarityIndex:
+        """Fetch embeddings into a similarity index.
+
+        Args:
+            task_ids: Restrict to these tasks (in this order, when present)
+            repository: Restrict to tasks in this repository
+        """
+        if task_ids is not None:
+            rows = await self.db.fetch(
+                "SELECT task_id, embedding FROM task_embeddings WHERE task_id = ANY($1)",
+                task_ids,
+            )
+        elif repository:
+            rows = await self.db.fetch(
+                """
+                SELECT e.task_id, e.embedding
+                FROM task_embeddings e
+                JOIN tasks t ON t.id = e.task_id
+                WHERE t.repository = $1
+                """,
+                repository,
+            )
+        else:
+            rows = await self.db.fetch("SELECT task_id, embedding FROM task_embeddings")
+
+        embeddings = {row["task_id"]: row["embedding"] for row in rows}
+        order = [tid for tid in task_ids if tid in embeddings] if task_ids else list(embeddings)
+        order = list(dict.fromkeys(order))
+        return SimilarityIndex.from_vectors(order, [embeddings[tid] for tid in order])
+
     async def compute_similarity_matrix(
         self,
         task_ids: list[str],
     ) -> dict[tuple[str, str], float]:
         """Compute similarity matrix for a set of tasks.
 
+        Builds the full N² mapping; prefer :meth:`nearest_neighbors` or
+        :meth:`similar_pairs` for large task sets.
+
         Args:
             task_ids: List of task IDs
 
@@ -708,42 +752,75 @@ class TaskSimilarity:
         if len(task_ids) < 2:
             return {}
 
-        # Fetch all embeddings
-        rows = await self.db.fetch(
-            "SELECT task_id, embedding FROM task_embeddings WHERE task_id = ANY($1)",
-            task_ids,
-        )
+        index = await self._load_index(task_ids)
+        matrix: dict[tuple[str, str], float] = {}
+        for id1, id2, sim in index.pairs_above(-np.inf):
+            matrix[(id1, id2)] = sim
+            matrix[(id2, id1)] = sim
+        return matrix
+
+    async def nearest_neighbors(
+        self,
+        task_ids: list[str],
+        k: int = 10,
+        threshold: float | None = None,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+    ) -> dict[str, list[tuple[str, float]]]:
+        """Return the ``k`` most similar tasks within ``task_ids`` for each task.
 
-        embeddings = {row["task_id"]: list(row["embedding"]) for row in rows}
+        Args:
+            task_ids: List of task IDs
+            k: Neighbours per task
+            threshold: Optional minimum similarity
+            block_size: Rows per matrix-product block (bounds memory)
 
-        # Compute pairwise similarities
-        matrix: dict[tuple[str, str], float] = {}
-        for i, id1 in enumerate(task_ids):
-            if id1 not in embeddings:
-                continue
-            for id2 in task_ids[i + 1 :]:
-                if id2 not in embeddings:
-                    continue
-                sim = cosine_similarity(embeddings[id1], embeddings[id2])
-                matrix[(id1, id2)] = sim
-                matrix[(id2, id1)] = sim
+        Returns:
+            Mapping of task ID to ``[(neighbour_id, similarity), ...]``
+        """
+        if len(task_ids) < 2:
+            return {}
+        index = await self._load_index(task_ids)
+        return index.top_k(k, threshold=threshold, block_size=block_size)
 
-        return matrix
+    async def similar_pairs(
+        self,
+        task_ids: list[str],
+        threshold: float,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+    ) -> list[tuple[str, str, float]]:
+        """Return pairs within ``task_ids`` whose similarity meets ``threshold``.
+
+        Returns:
+            List of (task_id1, task_id2, similarity), most similar first
+        """
+        if len(task_ids) < 2:
+            return []
+        index = await self._load_index(task_ids)
+        return index.pairs_above(threshold, block_size=block_size)
 
     async def find_duplicates(
         self,
         threshold: float = 0.95,
         repository: str | None = None,
+        strategy: Literal["pgvector", "matrix"] = "pgvector",
     ) -> list[tuple[str, str, float]]:
         """Find potential duplicate tasks.
 
         Args:
             threshold: Similarity threshold for duplicates
             repository: Optional repository filter
+            strategy: ``"pgvector"`` runs a self-join in PostgreSQL;
+                ``"matrix"`` fetches the embeddings once and compares them
+                with blocked matrix products in process, avoiding the
+                O(N²) distance evaluations in the database
 
         Returns:
             List of (task_id1, task_id2, similarity) tuples
         """
+        if strategy == "matrix":
+            index = await self._load_index(repository=repository)
+            return index.pairs_above(threshold)
+
         sql = """
             SELECT
                 e1.task_id as task_id1,
@@ -11,7 +11,7 @@ from asyncio import Semaphore
 from datetime import UTC, datetime
 import logging
 import time
-from typing import Any
+from typing import TYPE_CHECKING, Any
 import uuid
 
 from monitoring.metrics import (
@@ -26,6 +26,9 @@ from .permissions import Permission
 from .repository_surface import validate_path
 from .routing import RoutingStrategy, TaskRouter
 
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
 logger = logging.getLogger(__name__)
 
 
@@ -56,6 +59,11 @@ async def initialize_workflow_state(
     return workflow_id
 
 
+def streams_pre_execution_qc(app: Any) -> bool:
+    """Whether repos start as their own QC passes rather than after a whole-workflow gate."""
+    return bool(app.config.qc.enabled and app.config.qc.stream_pre_checks)
+
+
 async def validate_pre_execution_qc(app: Any, workflow_id: str, validated_repos: list[str]) -> None:
     if not app.config.qc.enabled:
         return
@@ -247,6 +255,57 @@ async def process_single_repo(
             raise
 
 
+async def process_repos_as_qc_passes(
+    app: Any,
+    workflow_id: str,
+    validated_repos: list[str],
+    process: Callable[[str], Awaitable[Any]],
+) -> list[Any]:
+    """Start each repo as soon as its pre-execution QC result arrives and passes.
+
+    Returns one outcome per entry of ``validated_repos``: the result of
+    ``process``, the exception it raised, or a ``ValidationError`` for a
+    repo that failed QC (recorded on the workflow and never started).
+    """
+    positions: dict[str, list[int]] = {}
+    for i, repo_path in enumerate(validated_repos):
+        positions.setdefault(repo_path, []).append(i)
+
+    outcomes: list[Any] = [None] * len(validated_repos)
+    running: dict[asyncio.Future[Any], int] = {}
+    try:
+        async for check in app.qc.iter_repo_checks(list(positions)):
+            if check.passed:
+                for i in positions[check.repo]:
+                    running[asyncio.ensure_future(process(check.repo))] = i
+                continue
+
+            error = ValidationError(
+                message=f"Pre-execution QC check failed for {check.repo}",
+                details={"repo": check.repo, "score": check.score, "checks": check.checks},
+            )
+            await app.workflow_state_manager.add_error(
+                workflow_id,
+                {
+                    "repo": check.repo,
+                    "error": str(error),
+                    "type": type(error).__name__,
+                    "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                },
+            )
+            for i in positions[check.repo]:
+                outcomes[i] = error
+    except BaseException:
+        for future in running:
+            future.cancel()
+        raise
+
+    results = await asyncio.gather(*running, return_exceptions=True)
+    for i, result in zip(running.values(), results, strict=True):
+        outcomes[i] = result
+    return outcomes
+
+
 async def execute_parallel_workflow(
     app: Any,
     adapter: Any,
@@ -255,7 +314,14 @@ async def execute_parallel_workflow(
     workflow_id: str,
     validated_repos: list[str],
     progress_callback=None,
+    stream_qc: bool = False,
 ) -> tuple[float, list[Any], list[dict[str, Any]]]:
+    """Run the adapter on every repo, bounded by ``app.semaphore``.
+
+    With ``stream_qc`` each repo is gated on its own pre-execution QC result
+    (see ``process_repos_as_qc_passes``) instead of on a prior gate for the
+    whole workflow.
+    """
     start_time = time.time()
 
     if app.observability:
@@ -277,8 +343,9 @@ async def execute_parallel_workflow(
 
     semaphore = app.semaphore
     total_repos = len(validated_repos)
-    tasks = [
-        process_single_repo(
+
+    def process(repo_path: str) -> Awaitable[Any]:
+        return process_single_repo(
             app=app,
             adapter=adapter,
             task=task,
@@ -289,10 +356,13 @@ async def execute_parallel_workflow(
             semaphore=semaphore,
             progress_callback=progress_callback,
         )
-        for repo_path in validated_repos
-    ]
 
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+    if stream_qc:
+        results = await process_repos_as_qc_passes(app, workflow_id, validated_repos, process)
+    else:
+        results = await asyncio.gather(
+            *(process(repo_path) for repo_path in validated_repos), return_exceptions=True
+        )
     execution_time = time.time() - start_time
 
     if app.observability:
@@ -465,7 +535,9 @@ async def execute_workflow_parallel(  # type: ignore[invalid-return]
 ) -> dict[str, Any]:
     adapter, validated_repos = await app._prepare_execution(adapter_name, task, repos, user_id)
     workflow_id = await initialize_workflow_state(app, task, adapter_name, validated_repos)
-    await validate_pre_execution_qc(app, workflow_id, validated_repos)
+    stream_qc = streams_pre_execution_qc(app)
+    if not stream_qc:
+        await validate_pre_execution_qc(app, workflow_id, validated_repos)
     checkpoint_id = await create_session_checkpoint(app, task, adapter_name, validated_repos)
 
     try:
@@ -477,6 +549,7 @@ async def execute_workflow_parallel(  # type: ignore[invalid-return]
             workflow_id=workflow_id,
             validated_repos=validated_repos,
             progress_callback=progress_callback,
+            stream_qc=stream_qc,
         )
         return await finalize_workflow_execution(
             app=app,
@@ -63,6 +63,7 @@ from ..core.adapters.base import (
     AdapterType,
     OrchestratorAdapter,
 )
+from ..core.code_index.analysis_cache import get_code_graph_cache
 from ..core.errors import (
     AdapterError,
     ErrorCode,
@@ -606,8 +607,10 @@ class LlamaIndexAdapter(OrchestratorAdapter):
                     }
 
                 # Use code graph analyzer to extract structural information
-                graph_analyzer = CodeGraphAnalyzer(repo)
-                graph_stats = await graph_analyzer.analyze_repository(repo_path)
+                # Unchanged repos are served from the shared commit-keyed cache
+                analysis = await get_code_graph_cache().analyze(repo_path, CodeGraphAnalyzer)
+                graph_analyzer = analysis.analyzer
+                graph_stats = analysis.stats
 
                 # Add graph stats to span
                 span.set_attribute("code_graph.nodes", graph_stats.get("total_nodes", 0))
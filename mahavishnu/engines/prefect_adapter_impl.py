@@ -59,7 +59,6 @@ import importlib
 import inspect
 import logging
 import os
-from pathlib import Path
 from typing import TYPE_CHECKING, Any, cast
 from unittest.mock import Mock
 
@@ -83,6 +82,7 @@ from ..core.adapters.base import (
     AdapterType,
     OrchestratorAdapter,
 )
+from ..core.code_index.analysis_cache import get_code_graph_cache
 from ..core.config import PrefectConfig, get_settings
 from ..core.errors import (
     ErrorCode,
@@ -138,8 +138,10 @@ async def process_repository(repo_path: str, task_spec: dict[str, Any]) -> dict[
 
         if task_type == "code_sweep":
             # Use code graph for intelligent analysis
-            graph_analyzer = CodeGraphAnalyzer(Path(repo_path))
-            analysis_result = await graph_analyzer.analyze_repository(repo_path)
+            # Unchanged repos are served from the shared commit-keyed cache
+            analysis = await get_code_graph_cache().analyze(repo_path, CodeGraphAnalyzer)
+            graph_analyzer = analysis.analyzer
+            analysis_result = analysis.stats
 
             # Find complex functions (more than 10 lines or with many calls)
             complex_funcs: list[dict[str, Any]] = []
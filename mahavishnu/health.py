@@ -119,9 +119,16 @@ def create_health_app(
 
     @app.get("/metrics", tags=["health"])
     async def metrics() -> Response:
-        """Prometheus metrics endpoint in text exposition format."""
+        """Prometheus metrics endpoint in text exposition format.
+
+        HTTP client pool gauges are refreshed first so each scrape sees
+        current utilization.
+        """
         from monitoring.metrics import metrics_endpoint
 
+        from .core.http_clients import export_http_pool_metrics
+
+        export_http_pool_metrics()
         return await metrics_endpoint()  # type: ignore[no-any-return]
 
     @app.get("/", tags=["root"])
@@ -11,6 +11,7 @@ Storage selection:
 
 from __future__ import annotations
 
+import asyncio
 from datetime import UTC, datetime
 from enum import StrEnum
 import logging
@@ -36,6 +37,8 @@ except ImportError:
     TextEmbedding: type[Any] | None = None  # type: ignore[no-redef]
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from akosha.storage import HotStore
 
 from mahavishnu.core.errors import ValidationError
@@ -43,6 +46,9 @@ from mahavishnu.ingesters.turboquant_compressor import TQPackedVector, TurboQuan
 
 logger = logging.getLogger(__name__)
 
+# Maximum texts sent to the embedder in a single batched call
+EMBED_BATCH_SIZE = 256
+
 
 class EmbeddingBackend(StrEnum):
     """Available embedding backends for OTel trace search."""
@@ -108,6 +114,17 @@ class SentenceTransformersWrapper:
         """
         return self._model.encode(text, convert_to_numpy=True).tolist()  # type: ignore[no-any-return]
 
+    def encode_batch(self, texts: list[str]) -> list[list[float]]:
+        """Generate embeddings for many texts in one forward pass.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            One embedding vector per text
+        """
+        return self._model.encode(texts, convert_to_numpy=True).tolist()  # type: ignore[no-any-return]
+
     @property
     def dimension(self) -> int:
         """Return embedding dimension."""
@@ -143,6 +160,17 @@ class FastEmbedWrapper:
         embeddings = list(self._model.embed([text]))
         return embeddings[0].tolist()  # type: ignore[no-any-return]
 
+    def encode_batch(self, texts: list[str]) -> list[list[float]]:
+        """Generate embeddings for many texts in one call.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            One embedding vector per text
+        """
+        return [embedding.tolist() for embedding in self._model.embed(texts)]
+
     @property
     def dimension(self) -> int:
         """Return embedding dimension."""
@@ -175,6 +203,10 @@ class TextOnlyEmbedder:
         """
         return [0.0] * self._dimension
 
+    def encode_batch(self, texts: list[str]) -> list[list[float]]:
+        """Return one zero embedding per text."""
+        return [[0.0] * self._dimension for _ in texts]
+
     @property
     def dimension(self) -> int:
         """Return embedding dimension."""
@@ -830,6 +862,12 @@ class OtelIngester:
     async def ingest_batch(self, traces: list[dict[str, Any]]) -> dict[str, Any]:
         """Ingest multiple OTel traces in batch.
 
+        Unlike calling :meth:`ingest_trace` in a loop, the batch path
+        validates every trace up front, embeds all distinct contents with
+        one batched embedder call off the event loop, and writes the batch
+        to pgvector with a single multi-row upsert. Each trace succeeds or
+        fails on its own.
+
         Args:
             traces: List of OTel trace data dictionaries
 
@@ -838,31 +876,173 @@ class OtelIngester:
                 {
                     "success_count": int,
                     "error_count": int,
-                    "errors": list[str]
+                    "errors": list[str],
+                    "failed": list[{"index": int, "trace_id": str, "error": str}]
                 }
         """
         success_count = 0
-        error_count = 0
-        errors: list[str] = []
+        failed: list[dict[str, Any]] = []
 
-        for trace in traces:
+        def fail(index: int, trace: dict[str, Any], error: Exception | str) -> None:
+            failed.append(
+                {
+                    "index": index,
+                    "trace_id": trace.get("trace_id") or "unknown",
+                    "error": str(error),
+                }
+            )
+
+        prepared: list[tuple[int, dict[str, Any]]] = []
+        for index, trace in enumerate(traces):
             try:
-                await self.ingest_trace(trace)
-                success_count += 1
+                entry = self._prepare_trace(trace)
             except Exception as e:  # noqa: BLE001 - per-trace resilience: one failure must not abort batch ingestion
-                error_count += 1
-                error_msg = f"Trace {trace.get('trace_id', 'unknown')}: {e}"
-                errors.append(error_msg)
-                logger.warning(error_msg)
+                fail(index, trace, e)
+                continue
+            if entry is None:
+                success_count += 1  # no spans: skipped, as in ingest_trace
+            else:
+                prepared.append((index, entry))
 
-        logger.info(f"Batch ingestion complete: {success_count} success, {error_count} errors")
+        if prepared:
+            try:
+                embeddings = await self._get_embeddings([entry["content"] for _, entry in prepared])
+            except Exception as e:  # noqa: BLE001 - embedder failure fails the affected traces, not the call
+                for index, _ in prepared:
+                    fail(index, traces[index], f"embedding failed: {e}")
+            else:
+                for (_, entry), embedding in zip(prepared, embeddings, strict=True):
+                    entry["embedding"] = embedding
+                if self._storage_type == StorageType.POSTGRESQL:
+                    written = await self._write_batch_pgvector(prepared, traces, fail)
+                else:
+                    written = await self._write_batch_duckdb(prepared, traces, fail)
+                success_count += written
+
+        failed.sort(key=lambda item: item["index"])
+        errors = [f"Trace {item['trace_id']}: {item['error']}" for item in failed]
+        for error_msg in errors:
+            logger.warning(error_msg)
+
+        logger.info(f"Batch ingestion complete: {success_count} success, {len(failed)} errors")
 
         return {
             "success_count": success_count,
-            "error_count": error_count,
+            "error_count": len(failed),
             "errors": errors,
+            "failed": failed,
+        }
+
+    def _prepare_trace(self, trace_data: dict[str, Any]) -> dict[str, Any] | None:
+        """Validate a trace and extract everything except its embedding.
+
+        Returns:
+            Prepared fields, or None when the trace has no spans
+
+        Raises:
+            ValidationError: If trace data is invalid
+        """
+        trace_id = trace_data.get("trace_id")
+        if not trace_id:
+            raise ValidationError("trace_data missing required field: trace_id")
+
+        spans = trace_data.get("spans", [])
+        if not spans:
+            logger.warning(f"Trace {trace_id} has no spans, skipping")
+            return None
+
+        return {
+            "trace_id": trace_id,
+            "system_id": self._extract_system_id(spans),
+            "content": self._build_content(spans),
+            "timestamp": self._extract_timestamp(spans),
+            "span_count": len(spans),
+            "attributes": self._extract_attributes(spans),
         }
 
+    async def _write_batch_duckdb(
+        self,
+        prepared: list[tuple[int, dict[str, Any]]],
+        traces: list[dict[str, Any]],
+        fail: Callable[[int, dict[str, Any], Exception | str], None],
+    ) -> int:
+        """Insert prepared traces into HotStore, returning the success count.
+
+        HotStore is an in-process DuckDB table, so per-record inserts cost no
+        network round-trip; the batch win here is the single embedding call.
+        """
+        if not self._hot_store:
+            for index, _ in prepared:
+                fail(index, traces[index], "HotStore not initialized. Call initialize() first.")
+            return 0
+
+        from akosha.models import HotRecord
+
+        written = 0
+        for index, entry in prepared:
+            try:
+                record = HotRecord(
+                    system_id=entry["system_id"],
+                    conversation_id=entry["trace_id"],
+                    content=entry["content"],
+                    embedding=entry["embedding"],
+                    timestamp=entry["timestamp"],
+                    metadata={
+                        "trace_id": entry["trace_id"],
+                        "span_count": entry["span_count"],
+                        "attributes": entry["attributes"],
+                    },
+                )
+                await self._hot_store.insert(record)
+                written += 1
+            except Exception as e:  # noqa: BLE001 - per-trace resilience: one failed insert must not abort the batch
+                fail(index, traces[index], e)
+        return written
+
+    async def _write_batch_pgvector(
+        self,
+        prepared: list[tuple[int, dict[str, Any]]],
+        traces: list[dict[str, Any]],
+        fail: Callable[[int, dict[str, Any], Exception | str], None],
+    ) -> int:
+        """Upsert prepared traces into pgvector in one statement."""
+        if not self._pgvector_adapter:
+            for index, _ in prepared:
+                fail(
+                    index,
+                    traces[index],
+                    "pgvector adapter not initialized. Call initialize() first.",
+                )
+            return 0
+
+        documents = [
+            {
+                "id": entry["trace_id"],
+                "vector": entry["embedding"],
+                "metadata": {
+                    "trace_id": entry["trace_id"],
+                    "system_id": entry["system_id"],
+                    "span_count": entry["span_count"],
+                    "attributes": entry["attributes"],
+                    "content": entry["content"],
+                    "timestamp": entry["timestamp"].isoformat(),
+                },
+            }
+            for _, entry in prepared
+        ]
+        try:
+            await self._pgvector_adapter.upsert(
+                collection=self._pgvector_collection,
+                documents=documents,
+            )
+        except Exception as e:  # noqa: BLE001 - a failed bulk write fails every trace in it, not the call
+            for index, _ in prepared:
+                fail(index, traces[index], e)
+            return 0
+
+        logger.debug(f"Ingested {len(documents)} traces into pgvector in one upsert")
+        return len(documents)
+
     async def search_traces(
         self,
         query: str,
@@ -1105,29 +1285,96 @@ class OtelIngester:
                 Callers (_ingest_trace_duckdb/_ingest_trace_pgvector) absorb
                 per-trace failures — do not return zero vectors here.
         """
-        # Check cache — decompress if TurboQuant is active
-        if content in self._embedding_cache:
-            cached = self._embedding_cache[content]
-            if self._compressor and self._compressor.available:
-                try:
-                    return self._compressor.decompress_batch([cached])[0]
-                except Exception as e:  # noqa: BLE001 - optional compressor; corrupt cache entry is evicted and regenerated
-                    # Cache entry is corrupt (e.g. bit-width changed after restart).
-                    # Evict it and fall through to re-generate a fresh embedding.
-                    logger.warning(
-                        f"turboquant_decompress_failed, evicting corrupt cache entry: {e}"
-                    )
-                    del self._embedding_cache[content]
-            else:
-                return cached
+        cached = self._cache_get(content)
+        if cached is not None:
+            return cached
 
         if not self._embedder:
             raise RuntimeError("Embedding model not loaded")
 
         # Generate embedding — let exceptions propagate to the per-trace handler.
         embedding = self._embedder.encode(content)
+        self._cache_put(content, embedding)
+        return embedding
+
+    async def _get_embeddings(self, contents: list[str]) -> list[list[float]]:
+        """Embed many contents, calling the embedder once per uncached chunk.
 
-        # Evict oldest entry when cache is full (FIFO)
+        Duplicate contents are embedded once. Akosha is called through its
+        async batch endpoint; local models run in a worker thread so the
+        event loop keeps serving other requests during inference.
+
+        Args:
+            contents: Text contents to embed
+
+        Returns:
+            One embedding per entry in ``contents``, in order
+
+        Raises:
+            RuntimeError: If embedding model is not loaded or returns the
+                wrong number of vectors
+        """
+        resolved: dict[str, list[float]] = {}
+        missing: list[str] = []
+        pending: set[str] = set()
+        for content in contents:
+            if content in resolved or content in pending:
+                continue
+            cached = self._cache_get(content)
+            if cached is None:
+                missing.append(content)
+                pending.add(content)
+            else:
+                resolved[content] = cached
+
+        if missing:
+            if not self._embedder:
+                raise RuntimeError("Embedding model not loaded")
+            for start in range(0, len(missing), EMBED_BATCH_SIZE):
+                chunk = missing[start : start + EMBED_BATCH_SIZE]
+                embeddings = await self._encode_batch(chunk)
+                if len(embeddings) != len(chunk):
+                    raise RuntimeError(
+                        f"Embedder returned {len(embeddings)} vectors for {len(chunk)} texts"
+                    )
+                for content, embedding in zip(chunk, embeddings, strict=True):
+                    self._cache_put(content, embedding)
+                    resolved[content] = embedding
+
+        return [resolved[content] for content in contents]
+
+    async def _encode_batch(self, texts: list[str]) -> list[list[float]]:
+        """Run one batched embedder call without blocking the event loop."""
+        embedder = self._embedder
+        if isinstance(embedder, AkoshaEmbedder):
+            return await embedder.encode_batch_async(texts)
+
+        def encode_all() -> list[list[float]]:
+            encode_batch = getattr(embedder, "encode_batch", None)
+            if callable(encode_batch):
+                return cast("list[list[float]]", encode_batch(texts))
+            return [embedder.encode(text) for text in texts]  # type: ignore[union-attr]
+
+        return await asyncio.to_thread(encode_all)
+
+    def _cache_get(self, content: str) -> list[float] | None:
+        """Return the cached embedding for ``content``, decompressing if needed."""
+        if content not in self._embedding_cache:
+            return None
+        cached = self._embedding_cache[content]
+        if self._compressor and self._compressor.available:
+            try:
+                return self._compressor.decompress_batch([cached])[0]
+            except Exception as e:  # noqa: BLE001 - optional compressor; corrupt cache entry is evicted and regenerated
+                # Cache entry is corrupt (e.g. bit-width changed after restart).
+                # Evict it and fall through to re-generate a fresh embedding.
+                logger.warning(f"turboquant_decompress_failed, evicting corrupt cache entry: {e}")
+                del self._embedding_cache[content]
+                return None
+        return cast("list[float]", cached)
+
+    def _cache_put(self, content: str, embedding: list[float]) -> None:
+        """Store an embedding, evicting the oldest entry when full (FIFO)."""
         if len(self._embedding_cache) >= self._cache_size:
             oldest_key = next(iter(self._embedding_cache))
             del self._embedding_cache[oldest_key]
@@ -1142,8 +1389,6 @@ class OtelIngester:
         else:
             self._embedding_cache[content] = embedding
 
-        return embedding
-
     def _extract_system_id(self, spans: list[dict[str, Any]]) -> str:
         """Extract system_id from span attributes.
 
@@ -25,11 +25,22 @@ async def start_server(server: Any, host: str = "127.0.0.1", port: int = 3000) -
 
     await _register_profile_tools_helper(server, methods_set)
     server._update_registered_tool_metrics()
+
+    app = getattr(server, "app", None)
+    if app is not None:
+        await app.start_http_clients()
     await server.server.run_http_async(host=host, port=port)
 
 
 async def stop_server(server: Any) -> None:
     """Stop the MCP server and cleanup resources."""
+    app = getattr(server, "app", None)
+    state_manager = getattr(app, "workflow_state_manager", None)
+    if state_manager is not None and hasattr(state_manager, "close"):
+        state_manager.close()
+    if app is not None:
+        await app.close_http_clients()
+
     if hasattr(server, "mcp_client") and hasattr(server.mcp_client, "_client"):
         try:
             await server.mcp_client._client.stop()
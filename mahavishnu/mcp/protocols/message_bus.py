@@ -1,10 +1,36 @@
-"""Async message passing between pools."""
+"""Async message passing between pools.
+
+Subscriber callbacks run on a fixed pool of dispatcher workers fed by one
+bounded queue, so a burst of messages never turns into a burst of tasks:
+``publish`` waits for room in the dispatch queue instead. Per-pool
+``receive`` queues are bounded too, and what happens when one is full is
+an ``OverflowPolicy`` chosen per pool (wait with a timeout, evict the
+oldest message, drop the new one, or spill to a local JSONL spool that
+``receive`` drains in order). Every message is accounted for in
+``get_stats``.
+
+Usage:
+    bus = MessageBus(dispatch_workers=8, spool_dir=Path("/var/spool/mahavishnu"))
+    bus.set_overflow_policy("pool_a", OverflowPolicy.SPILL)
+    bus.subscribe(MessageType.TASK_COMPLETED, on_completed)
+
+    await bus.publish({"type": "task_completed", "target_pool_id": "pool_a"})
+    await bus.drain()  # wait for subscriber callbacks
+    await bus.close()
+"""
 
 import asyncio
 from collections.abc import Callable
-from dataclasses import dataclass
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
 from enum import Enum
+import inspect
+import json
 import logging
+import os
+from pathlib import Path
+import re
+import tempfile
 import time
 from typing import Any
 
@@ -12,6 +38,11 @@ from ...core.events.contract import EventPublisherProtocol, create_event_envelop
 
 logger = logging.getLogger(__name__)
 
+# Set inside dispatcher workers; a subscriber that publishes while the
+# dispatch queue is full runs the nested callbacks inline instead of waiting
+# on a queue only the (busy) workers can drain.
+_in_dispatcher: ContextVar[bool] = ContextVar("message_bus_in_dispatcher", default=False)
+
 
 class MessageType(Enum):
     """Message types for inter-pool communication.
@@ -53,6 +84,171 @@ class Message:
     payload: dict[str, Any]
     timestamp: float
 
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize to a JSON-compatible dict."""
+        return {
+            "type": self.type.value,
+            "source_pool_id": self.source_pool_id,
+            "target_pool_id": self.target_pool_id,
+            "payload": self.payload,
+            "timestamp": self.timestamp,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "Message":
+        """Rebuild a message serialized with ``to_dict``."""
+        return cls(
+            type=MessageType(data["type"]),
+            source_pool_id=data.get("source_pool_id"),
+            target_pool_id=data.get("target_pool_id"),
+            payload=data.get("payload") or {},
+            timestamp=data["timestamp"],
+        )
+
+
+class OverflowPolicy(Enum):
+    """What ``publish`` does when a pool's queue is full.
+
+    Attributes:
+        BLOCK: Wait up to the pool's block timeout for room, then drop
+        DROP_OLDEST: Evict the oldest queued message to make room
+        DROP_NEWEST: Drop the message being published
+        SPILL: Append to the pool's disk spool; ``receive`` drains it in order
+    """
+
+    BLOCK = "block"
+    DROP_OLDEST = "drop_oldest"
+    DROP_NEWEST = "drop_newest"
+    SPILL = "spill"
+
+
+@dataclass
+class PoolQueueStats:
+    """Delivery counters for one pool queue.
+
+    Every published message ends up in exactly one of ``queued``,
+    ``spilled``, ``dropped_newest`` or ``block_timeouts``; spilled messages
+    come back as ``unspilled`` unless cleared or lost with their spool file
+    (``spool_lost``); queued and unspilled messages leave as ``received``,
+    ``cleared`` or ``dropped_oldest`` (or are still waiting).
+    """
+
+    published: int = 0
+    queued: int = 0
+    spilled: int = 0
+    unspilled: int = 0
+    received: int = 0
+    cleared: int = 0
+    dropped_oldest: int = 0
+    dropped_newest: int = 0
+    block_timeouts: int = 0
+    spool_lost: int = 0
+    latency_total: float = 0.0
+    latency_max: float = 0.0
+
+    @property
+    def dropped(self) -> int:
+        """Messages lost to overflow, for any reason."""
+        return self.dropped_oldest + self.dropped_newest + self.block_timeouts + self.spool_lost
+
+    def to_dict(self) -> dict[str, Any]:
+        data: dict[str, Any] = asdict(self)
+        del data["latency_total"], data["latency_max"]
+        data["dropped"] = self.dropped
+        data["avg_latency_ms"] = (
+            round(self.latency_total / self.received * 1000, 3) if self.received else 0.0
+        )
+        data["max_latency_ms"] = round(self.latency_max * 1000, 3)
+        return data
+
+
+@dataclass
+class DispatchStats:
+    """Counters for subscriber callbacks run by the dispatcher pool."""
+
+    enqueued: int = 0
+    completed: int = 0
+    errors: int = 0
+    inline: int = 0
+    abandoned: int = 0
+    latency_total: float = 0.0
+    latency_max: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        finished = self.completed + self.errors
+        return {
+            "enqueued": self.enqueued,
+            "completed": self.completed,
+            "errors": self.errors,
+            "inline": self.inline,
+            "abandoned": self.abandoned,
+            "avg_latency_ms": round(self.latency_total / finished * 1000, 3) if finished else 0.0,
+            "max_latency_ms": round(self.latency_max * 1000, 3),
+        }
+
+
+class _DiskSpool:
+    """Append-only JSONL overflow file for one pool, read back in order.
+
+    Writes are small synchronous appends; the spool only sees traffic while
+    its pool's queue is full. Each spool creates its own uniquely named file
+    in the spool directory (removed again once drained), so buses sharing a
+    ``spool_dir`` never read or delete each other's messages.
+    """
+
+    def __init__(self, directory: Path, prefix: str):
+        self.directory = directory
+        self.prefix = prefix
+        self.path: Path | None = None
+        self._offset = 0
+        self._pending = 0
+
+    def __len__(self) -> int:
+        return self._pending
+
+    def append(self, msg: Message) -> None:
+        if self.path is None:
+            fd, name = tempfile.mkstemp(suffix=".jsonl", prefix=self.prefix, dir=self.directory)
+            os.close(fd)
+            self.path = Path(name)
+        with self.path.open("a", encoding="utf-8") as f:
+            f.write(json.dumps(msg.to_dict(), default=str) + "\n")
+        self._pending += 1
+
+    def pop(self, limit: int) -> list[Message]:
+        """Read up to ``limit`` messages, oldest first.
+
+        If the file was removed from under the spool, its pending messages
+        are logged as lost and the spool starts over empty.
+        """
+        if not self._pending or limit <= 0 or self.path is None:
+            return []
+        messages = []
+        try:
+            with self.path.open("r", encoding="utf-8") as f:
+                f.seek(self._offset)
+                while len(messages) < limit and (line := f.readline()):
+                    messages.append(Message.from_dict(json.loads(line)))
+                self._offset = f.tell()
+        except FileNotFoundError:
+            logger.warning(f"Spool file {self.path} vanished; {self._pending} messages lost")
+            self.clear()
+            return []
+        self._pending -= len(messages)
+        if not self._pending:
+            self.clear()
+        return messages
+
+    def clear(self) -> int:
+        """Discard everything; return how many messages were pending."""
+        count = self._pending
+        if self.path is not None:
+            self.path.unlink(missing_ok=True)
+            self.path = None
+        self._offset = 0
+        self._pending = 0
+        return count
+
 
 class MessageBus:
     """Async message bus for inter-pool communication.
@@ -60,8 +256,8 @@ class MessageBus:
     Features:
     - Pub/sub messaging
     - Message filtering by type
-    - Async message processing
-    - Backpressure handling
+    - Async message processing on a fixed dispatcher pool
+    - Backpressure handling with per-pool overflow policies
 
     Example:
         ```python
@@ -89,17 +285,42 @@ class MessageBus:
         self,
         max_queue_size: int = 1000,
         event_publisher: EventPublisherProtocol | None = None,
+        dispatch_workers: int = 8,
+        dispatch_queue_size: int = 10000,
+        overflow_policy: OverflowPolicy = OverflowPolicy.DROP_NEWEST,
+        block_timeout: float | None = 1.0,
+        spool_dir: Path | None = None,
     ):
         """Initialize message bus.
 
         Args:
             max_queue_size: Maximum queue size per pool (backpressure limit)
+            event_publisher: Optional publisher for canonical event envelopes
+            dispatch_workers: Number of tasks running subscriber callbacks
+            dispatch_queue_size: Pending subscriber callbacks before publish waits
+            overflow_policy: Default policy for pools without their own
+            block_timeout: Default wait for BLOCK pools (None = wait forever)
+            spool_dir: Directory for SPILL spools (a temp dir if None)
         """
         self._queues: dict[str, asyncio.Queue] = {}
         self._subscribers: dict[MessageType, list[Callable]] = {}
         self._max_queue_size = max_queue_size
         self._event_publisher = event_publisher
 
+        self._overflow_policy = overflow_policy
+        self._block_timeout = block_timeout
+        self._pool_policies: dict[str, tuple[OverflowPolicy, float | None]] = {}
+        self._pool_stats: dict[str, PoolQueueStats] = {}
+        self._spool_dir = spool_dir
+        self._spools: dict[str, _DiskSpool] = {}
+
+        self._dispatch_workers = dispatch_workers
+        self._dispatch_queue: asyncio.Queue[tuple[Callable, Message, float]] = asyncio.Queue(
+            maxsize=dispatch_queue_size
+        )
+        self._dispatchers: list[asyncio.Task] = []
+        self._dispatch_stats = DispatchStats()
+
     def set_event_publisher(self, event_publisher: EventPublisherProtocol | None) -> None:
         self._event_publisher = event_publisher
 
@@ -139,26 +360,183 @@ class MessageBus:
 
         # Deliver to target queue if specified
         if msg.target_pool_id:
-            # Create queue if it doesn't exist (lazy initialization)
-            if msg.target_pool_id not in self._queues:
-                self._queues[msg.target_pool_id] = asyncio.Queue(maxsize=self._max_queue_size)
+            await self._enqueue(msg.target_pool_id, msg)
+
+        # Deliver to subscribers
+        if handlers := self._subscribers.get(msg_type):
+            await self._dispatch(msg, handlers)
+
+    def _queue(self, pool_id: str) -> asyncio.Queue:
+        # Create queue if it doesn't exist (lazy initialization)
+        queue = self._queues.get(pool_id)
+        if queue is None:
+            queue = self._queues[pool_id] = asyncio.Queue(maxsize=self._max_queue_size)
+        return queue
+
+    def _stats(self, pool_id: str) -> PoolQueueStats:
+        stats = self._pool_stats.get(pool_id)
+        if stats is None:
+            stats = self._pool_stats[pool_id] = PoolQueueStats()
+        return stats
+
+    async def _enqueue(self, pool_id: str, msg: Message) -> None:
+        """Put ``msg`` on a pool queue, applying the pool's overflow policy."""
+        queue = self._queue(pool_id)
+        stats = self._stats(pool_id)
+        stats.published += 1
+
+        # Messages already spooled are older; keep FIFO by spooling behind them.
+        spool = self._spools.get(pool_id)
+        if spool is not None and len(spool):
+            self._spill(pool_id, msg)
+            return
+
+        try:
+            queue.put_nowait(msg)
+            stats.queued += 1
+            logger.debug(f"Delivered message to pool {pool_id} (type={msg.type.value})")
+            return
+        except asyncio.QueueFull:
+            pass
 
-            queue = self._queues[msg.target_pool_id]
+        policy, block_timeout = self.get_overflow_policy(pool_id)
+        if policy is OverflowPolicy.BLOCK:
             try:
-                queue.put_nowait(msg)
-                logger.debug(
-                    f"Delivered message to pool {msg.target_pool_id} (type={msg_type.value})"
+                await asyncio.wait_for(queue.put(msg), timeout=block_timeout)
+                stats.queued += 1
+            except TimeoutError:
+                stats.block_timeouts += 1
+                logger.warning(
+                    f"Queue full for pool {pool_id} after {block_timeout}s - message dropped"
                 )
-            except asyncio.QueueFull:
-                logger.warning(f"Queue full for pool {msg.target_pool_id} - message dropped")
+        elif policy is OverflowPolicy.DROP_OLDEST:
+            queue.get_nowait()
+            stats.dropped_oldest += 1
+            queue.put_nowait(msg)
+            stats.queued += 1
+        elif policy is OverflowPolicy.SPILL:
+            self._spill(pool_id, msg)
+        else:
+            stats.dropped_newest += 1
+            logger.warning(f"Queue full for pool {pool_id} - message dropped")
+
+    def _spill(self, pool_id: str, msg: Message) -> None:
+        spool = self._spools.get(pool_id)
+        if spool is None:
+            if self._spool_dir is None:
+                self._spool_dir = Path(tempfile.mkdtemp(prefix="mahavishnu-bus-spool-"))
+            self._spool_dir.mkdir(parents=True, exist_ok=True)
+            # The prefix only makes spool files recognisable; uniqueness comes
+            # from mkstemp, so pools and buses never share a file.
+            prefix = f"{re.sub(r'[^A-Za-z0-9_.-]', '_', pool_id)}-"
+            spool = self._spools[pool_id] = _DiskSpool(self._spool_dir, prefix)
+        spool.append(msg)
+        self._stats(pool_id).spilled += 1
+
+    def _refill(self, pool_id: str, queue: asyncio.Queue) -> None:
+        """Move spooled messages into free queue slots, oldest first."""
+        spool = self._spools.get(pool_id)
+        if spool is None or not len(spool):
+            return
+        pending = len(spool)
+        messages = spool.pop(queue.maxsize - queue.qsize())
+        for msg in messages:
+            queue.put_nowait(msg)
+        stats = self._stats(pool_id)
+        stats.unspilled += len(messages)
+        stats.spool_lost += pending - len(messages) - len(spool)
+
+    def set_overflow_policy(
+        self,
+        pool_id: str,
+        policy: OverflowPolicy,
+        block_timeout: float | None = None,
+    ) -> None:
+        """Choose what happens when ``pool_id``'s queue is full.
 
-        # Deliver to subscribers
-        for subscriber in self._subscribers.get(msg_type, []):
+        Args:
+            pool_id: Pool ID
+            policy: Overflow policy for this pool
+            block_timeout: Wait for BLOCK (defaults to the bus-wide timeout)
+        """
+        timeout = self._block_timeout if block_timeout is None else block_timeout
+        self._pool_policies[pool_id] = (policy, timeout)
+
+    def get_overflow_policy(self, pool_id: str) -> tuple[OverflowPolicy, float | None]:
+        """Return ``(policy, block_timeout)`` in effect for ``pool_id``."""
+        return self._pool_policies.get(pool_id, (self._overflow_policy, self._block_timeout))
+
+    async def _dispatch(self, msg: Message, handlers: list[Callable]) -> None:
+        """Queue one callback per handler, waiting while the dispatch queue is full."""
+        if not self._dispatchers:
+            self._dispatchers = [
+                asyncio.create_task(self._dispatch_worker(), name=f"message-bus-dispatch-{i}")
+                for i in range(self._dispatch_workers)
+            ]
+
+        queue = self._dispatch_queue
+        for handler in handlers:
+            if queue.full() and _in_dispatcher.get():
+                self._dispatch_stats.inline += 1
+                await self._run_handler(handler, msg, time.perf_counter())
+                continue
+            await queue.put((handler, msg, time.perf_counter()))
+            self._dispatch_stats.enqueued += 1
+
+    async def _dispatch_worker(self) -> None:
+        _in_dispatcher.set(True)
+        queue = self._dispatch_queue
+        while True:
+            handler, msg, enqueued_at = await queue.get()
             try:
-                # Run subscriber asynchronously
-                asyncio.create_task(subscriber(msg))
-            except Exception as e:  # noqa: BLE001 - MCP boundary must preserve all operation failures
-                logger.error(f"Subscriber error: {e}")
+                await self._run_handler(handler, msg, enqueued_at)
+            finally:
+                queue.task_done()
+
+    async def _run_handler(self, handler: Callable, msg: Message, enqueued_at: float) -> None:
+        stats = self._dispatch_stats
+        latency = time.perf_counter() - enqueued_at
+        stats.latency_total += latency
+        stats.latency_max = max(stats.latency_max, latency)
+        try:
+            result = handler(msg)
+            if inspect.isawaitable(result):
+                await result
+            stats.completed += 1
+        except Exception as e:  # noqa: BLE001 - one failing subscriber must not stop dispatch
+            stats.errors += 1
+            logger.error(f"Subscriber error: {e}")
+
+    async def drain(self) -> None:
+        """Wait until every queued subscriber callback has finished."""
+        if self._dispatchers:
+            await self._dispatch_queue.join()
+
+    async def close(self, timeout: float | None = 5.0) -> None:
+        """Let queued subscriber callbacks finish, then stop the dispatcher workers.
+
+        Args:
+            timeout: Seconds to wait for queued callbacks; any still queued
+                afterwards are abandoned (counted in ``get_stats``)
+        """
+        try:
+            await asyncio.wait_for(self.drain(), timeout=timeout)
+        except TimeoutError:
+            logger.warning(f"MessageBus callbacks still running after {timeout}s; stopping")
+
+        for task in self._dispatchers:
+            task.cancel()
+        await asyncio.gather(*self._dispatchers, return_exceptions=True)
+        self._dispatchers = []
+
+        abandoned = 0
+        while not self._dispatch_queue.empty():
+            self._dispatch_queue.get_nowait()
+            self._dispatch_queue.task_done()
+            abandoned += 1
+        if abandoned:
+            self._dispatch_stats.abandoned += abandoned
+            logger.warning(f"MessageBus closed with {abandoned} subscriber callbacks pending")
 
     async def _publish_canonical_event(self, msg: Message) -> None:
         if self._event_publisher is None:
@@ -227,17 +605,21 @@ class MessageBus:
                 print(f"Received: {msg.type}")
             ```
         """
-        if pool_id not in self._queues:
-            self._queues[pool_id] = asyncio.Queue(maxsize=self._max_queue_size)
+        queue = self._queue(pool_id)
+        self._refill(pool_id, queue)
 
         try:
-            return await asyncio.wait_for(  # type: ignore[no-any-return]
-                self._queues[pool_id].get(),
-                timeout=timeout,
-            )
+            msg: Message = await asyncio.wait_for(queue.get(), timeout=timeout)
         except TimeoutError:
             return None
 
+        stats = self._stats(pool_id)
+        latency = time.time() - msg.timestamp
+        stats.received += 1
+        stats.latency_total += latency
+        stats.latency_max = max(stats.latency_max, latency)
+        return msg
+
     async def receive_batch(
         self,
         pool_id: str,
@@ -281,10 +663,11 @@ class MessageBus:
             pool_id: Pool ID
 
         Returns:
-            Current queue size (0 if no queue)
+            Current queue size, including spooled messages (0 if no queue)
         """
         queue = self._queues.get(pool_id)
-        return queue.qsize() if queue else 0
+        spool = self._spools.get(pool_id)
+        return (queue.qsize() if queue else 0) + (len(spool) if spool else 0)
 
     def get_stats(self) -> dict[str, Any]:
         """Get message bus statistics.
@@ -303,6 +686,20 @@ class MessageBus:
             "queue_sizes": queue_sizes,
             "subscriber_counts": subscriber_counts,
             "max_queue_size": self._max_queue_size,
+            "pools": {
+                pool_id: {
+                    **stats.to_dict(),
+                    "overflow_policy": self.get_overflow_policy(pool_id)[0].value,
+                    "spooled": len(self._spools[pool_id]) if pool_id in self._spools else 0,
+                }
+                for pool_id, stats in self._pool_stats.items()
+            },
+            "dispatch": {
+                **self._dispatch_stats.to_dict(),
+                "workers": len(self._dispatchers),
+                "queue_depth": self._dispatch_queue.qsize(),
+                "queue_capacity": self._dispatch_queue.maxsize,
+            },
         }
 
     async def clear_queue(self, pool_id: str) -> int:
@@ -325,6 +722,20 @@ class MessageBus:
                 count += 1
             except asyncio.QueueEmpty:
                 break
+        if spool := self._spools.get(pool_id):
+            count += spool.clear()
+        if count:
+            self._stats(pool_id).cleared += count
 
         logger.info(f"Cleared {count} messages for pool {pool_id}")
         return count
+
+
+__all__ = [
+    "DispatchStats",
+    "Message",
+    "MessageBus",
+    "MessageType",
+    "OverflowPolicy",
+    "PoolQueueStats",
+]
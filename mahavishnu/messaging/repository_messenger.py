@@ -1,10 +1,34 @@
-"""Repository messenger for inter-repository communication."""
+"""Repository messenger for inter-repository communication.
+
+Retained messages live in per-receiver mailboxes rather than one list:
+
+- **Lanes.** A mailbox keeps one timestamp-sorted lane per
+  (priority, message type). "Newest N messages for a repo" is a lazy merge
+  of the lanes' tails, so it reads N entries instead of filtering and
+  sorting every message ever sent; a type filter just picks fewer lanes.
+- **Expiry heap.** Messages with ``expires_at`` go on a min-heap, so TTL
+  eviction pops only what is due.
+- **Notification.** Subscriber callbacks run concurrently, each bounded
+  by ``callback_timeout``.
+
+Usage:
+    messenger = RepositoryMessenger(app, callback_timeout=2.0)
+    await messenger.send_message(
+        "mahavishnu", "crackerjack", MessageType.QUALITY_ALERT, {"score": 61},
+        expires_at=datetime.now(UTC) + timedelta(hours=1),
+    )
+    latest = await messenger.get_messages_for_repo("crackerjack", limit=20)
+"""
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import asyncio
+import bisect
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import Enum
+import heapq
+import itertools
 from typing import TYPE_CHECKING, Any
 import uuid
 
@@ -12,7 +36,7 @@ from ..core.events.contract import EventPublisherProtocol, create_event_envelope
 from ..session_buddy.auth import CrossProjectAuth
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterator
 
 
 class MessageType(Enum):
@@ -57,6 +81,51 @@ class RepositoryMessage:
             self.correlation_id = str(uuid.uuid4())
 
 
+# Lane entry: (timestamp, -sequence, message). Lanes are sorted ascending, so
+# walking one backwards yields newest first, earlier-sent first on ties.
+_LaneEntry = tuple[datetime, int, RepositoryMessage]
+_NO_TIMESTAMP = datetime.min.replace(tzinfo=UTC)
+
+
+@dataclass
+class _Mailbox:
+    """Messages retained for one receiver repository."""
+
+    lanes: dict[tuple[MessagePriority, MessageType], list[_LaneEntry]] = field(default_factory=dict)
+    acknowledged: set[str] = field(default_factory=set)
+    size: int = 0
+
+    def add(self, entry: _LaneEntry) -> None:
+        message = entry[2]
+        lane = self.lanes.setdefault((message.priority, message.message_type), [])
+        if not lane or lane[-1] <= entry:
+            lane.append(entry)
+        else:
+            bisect.insort(lane, entry)
+        self.size += 1
+
+    def remove(self, entry: _LaneEntry) -> None:
+        message = entry[2]
+        lane = self.lanes[(message.priority, message.message_type)]
+        del lane[bisect.bisect_left(lane, entry)]
+        self.acknowledged.discard(message.id)
+        self.size -= 1
+
+    def newest(
+        self, message_type: MessageType | None = None, since: datetime | None = None
+    ) -> Iterator[RepositoryMessage]:
+        """Yield messages newest first, optionally of one type and not older than ``since``."""
+        tails = [
+            reversed(lane)
+            for (_, lane_type), lane in self.lanes.items()
+            if lane and (message_type is None or lane_type == message_type)
+        ]
+        for timestamp, _, message in heapq.merge(*tails, reverse=True):
+            if since is not None and (timestamp < since):
+                return
+            yield message
+
+
 class RepositoryMessenger:
     """Manages messaging between repositories."""
 
@@ -64,11 +133,19 @@ class RepositoryMessenger:
         self,
         app,
         event_publisher: EventPublisherProtocol | None = None,
+        callback_timeout: float | None = 10.0,
     ):
         self.app = app
         self.logger = __import__("logging").getLogger(__name__)
-        self.messages: list[RepositoryMessage] = []
         self.subscribers: dict[str, list[Callable]] = {}
+        self.callback_timeout = callback_timeout
+
+        # Retained messages: id -> lane entry, per-receiver mailboxes, and a
+        # min-heap of (expires_at, message id) for TTL eviction.
+        self._entries: dict[str, _LaneEntry] = {}
+        self._mailboxes: dict[str, _Mailbox] = {}
+        self._expiry: list[tuple[datetime, str]] = []
+        self._sequence = itertools.count()
         self.authenticator: CrossProjectAuth | None = None
         self._event_publisher = event_publisher
 
@@ -90,6 +167,39 @@ class RepositoryMessenger:
             self.subscribers[repo_name].remove(callback)
             self.logger.info(f"Unsubscribed from messages for repository: {repo_name}")
 
+    @property
+    def messages(self) -> list[RepositoryMessage]:
+        """All retained messages, in the order they were stored."""
+        return [entry[2] for entry in self._entries.values()]
+
+    def _store(self, message: RepositoryMessage) -> None:
+        entry = (message.timestamp or _NO_TIMESTAMP, -next(self._sequence), message)
+        self._entries[message.id] = entry
+        mailbox = self._mailboxes.get(message.receiver_repo)
+        if mailbox is None:
+            mailbox = self._mailboxes[message.receiver_repo] = _Mailbox()
+        mailbox.add(entry)
+        if message.expires_at is not None:
+            heapq.heappush(self._expiry, (message.expires_at, message.id))
+
+    def _discard(self, message_id: str) -> bool:
+        entry = self._entries.pop(message_id, None)
+        if entry is None:
+            return False
+        receiver = entry[2].receiver_repo
+        mailbox = self._mailboxes[receiver]
+        mailbox.remove(entry)
+        if not mailbox.size:
+            del self._mailboxes[receiver]
+        return True
+
+    def _evict_expired(self, now: datetime) -> int:
+        expired = 0
+        while self._expiry and self._expiry[0][0] <= now:
+            _, message_id = heapq.heappop(self._expiry)
+            expired += self._discard(message_id)
+        return expired
+
     async def send_message(
         self,
         sender_repo: str,
@@ -98,6 +208,7 @@ class RepositoryMessenger:
         content: dict[str, Any],
         priority: MessagePriority = MessagePriority.NORMAL,
         correlation_id: str | None = None,
+        expires_at: datetime | None = None,
     ) -> RepositoryMessage:
         """Send a message from one repository to another."""
         try:
@@ -113,6 +224,7 @@ class RepositoryMessenger:
                 content=content,
                 priority=priority,
                 correlation_id=correlation_id,
+                expires_at=expires_at,
             )
 
             # Add authentication signature if authenticator is available
@@ -131,7 +243,7 @@ class RepositoryMessenger:
                 )
 
             # Store the message
-            self.messages.append(message)
+            self._store(message)
 
             # Notify subscribers
             await self._notify_subscribers(message)
@@ -147,22 +259,32 @@ class RepositoryMessenger:
             raise
 
     async def _notify_subscribers(self, message: RepositoryMessage):
-        """Notify subscribers of a new message."""
-        # Notify the receiver's subscribers
-        if message.receiver_repo in self.subscribers:
-            for callback in self.subscribers[message.receiver_repo]:
-                try:
-                    await callback(message)
-                except Exception as e:  # noqa: BLE001 - user-supplied callback; one failure must not stop delivery
-                    self.logger.error(f"Error in subscriber callback: {e}")
-
-        # Also notify wildcard subscribers (those interested in all messages)
-        if "*" in self.subscribers:
-            for callback in self.subscribers["*"]:
-                try:
-                    await callback(message)
-                except Exception as e:  # noqa: BLE001 - user-supplied callback; one failure must not stop delivery
-                    self.logger.error(f"Error in wildcard subscriber callback: {e}")
+        """Notify subscribers of a new message, concurrently."""
+        # The receiver's subscribers, then wildcard subscribers (all messages)
+        calls = [
+            self._run_callback(callback, message, wildcard=False)
+            for callback in self.subscribers.get(message.receiver_repo, [])
+        ]
+        calls += [
+            self._run_callback(callback, message, wildcard=True)
+            for callback in self.subscribers.get("*", [])
+        ]
+        if calls:
+            await asyncio.gather(*calls)
+
+    async def _run_callback(
+        self, callback: Callable, message: RepositoryMessage, wildcard: bool
+    ) -> None:
+        kind = "wildcard subscriber" if wildcard else "subscriber"
+        try:
+            await asyncio.wait_for(callback(message), timeout=self.callback_timeout)
+        except TimeoutError:
+            self.logger.error(
+                f"Timed out in {kind} callback after {self.callback_timeout}s "
+                f"(message {message.id})"
+            )
+        except Exception as e:  # noqa: BLE001 - user-supplied callback; one failure must not stop delivery
+            self.logger.error(f"Error in {kind} callback: {e}")
 
     async def _publish_canonical_event(self, message: RepositoryMessage) -> None:
         if self._event_publisher is None:
@@ -200,25 +322,13 @@ class RepositoryMessenger:
         limit: int = 50,
         since: datetime | None = None,
     ) -> list[RepositoryMessage]:
-        """Get messages for a specific repository."""
+        """Get messages for a specific repository, newest first."""
         try:
-            # Filter messages for the specified repository
-            repo_messages = [
-                msg
-                for msg in self.messages
-                if msg.receiver_repo == repo_name
-                and (message_type is None or msg.message_type == message_type)
-                and (since is None or (msg.timestamp is not None and msg.timestamp >= since))
-            ]
-
-            # Sort by timestamp (newest first); entries without a timestamp sort last
-            repo_messages.sort(
-                key=lambda x: x.timestamp or datetime.min.replace(tzinfo=UTC),
-                reverse=True,
-            )
-
-            # Return limited results
-            return repo_messages[:limit]
+            self._evict_expired(datetime.now(UTC))
+            mailbox = self._mailboxes.get(repo_name)
+            if mailbox is None:
+                return []
+            return list(itertools.islice(mailbox.newest(message_type, since), limit))
         except (AttributeError, TypeError, ValueError, KeyError) as e:
             self.logger.error(f"Error getting messages for repo {repo_name}: {e}")
             return []
@@ -258,43 +368,44 @@ class RepositoryMessenger:
             raise
 
     async def acknowledge_message(self, message_id: str, receiver_repo: str) -> bool:
-        """Acknowledge receipt of a message."""
+        """Acknowledge receipt of a message.
+
+        Returns:
+            False if ``receiver_repo`` holds no such message (or it expired)
+        """
         try:
-            # In a real implementation, this would update the message status
-            # For now, we'll just log the acknowledgment
+            entry = self._entries.get(message_id)
+            if entry is None or entry[2].receiver_repo != receiver_repo:
+                self.logger.warning(f"Message {message_id} not found for {receiver_repo}")
+                return False
+            self._mailboxes[receiver_repo].acknowledged.add(message_id)
             self.logger.info(f"Message {message_id} acknowledged by {receiver_repo}")
             return True
         except (AttributeError, TypeError, ValueError, KeyError) as e:
             self.logger.error(f"Error acknowledging message {message_id}: {e}")
             return False
 
-    async def get_unacknowledged_messages(self, repo_name: str) -> list[RepositoryMessage]:
-        """Get messages that haven't been acknowledged by a repository."""
-        # In a real implementation, this would check a database of acknowledgments
-        # For now, return all messages for the repository
-        return await self.get_messages_for_repo(repo_name)
+    async def get_unacknowledged_messages(
+        self, repo_name: str, limit: int = 50
+    ) -> list[RepositoryMessage]:
+        """Get messages that haven't been acknowledged by a repository, newest first."""
+        self._evict_expired(datetime.now(UTC))
+        mailbox = self._mailboxes.get(repo_name)
+        if mailbox is None:
+            return []
+        pending = (m for m in mailbox.newest() if m.id not in mailbox.acknowledged)
+        return list(itertools.islice(pending, limit))
 
-    async def cleanup_expired_messages(self):
-        """Remove expired messages from the queue."""
+    async def cleanup_expired_messages(self) -> int:
+        """Remove expired messages; return how many were removed."""
         try:
-            current_time = datetime.now(UTC)
-            expired_count = 0
-
-            # Remove expired messages
-            self.messages = [
-                msg
-                for msg in self.messages
-                if msg.expires_at is None or msg.expires_at > current_time
-            ]
-
-            expired_count = len(
-                [msg for msg in self.messages if msg.expires_at and msg.expires_at <= current_time]
-            )
-
+            expired_count = self._evict_expired(datetime.now(UTC))
             if expired_count > 0:
                 self.logger.info(f"Cleaned up {expired_count} expired messages")
+            return expired_count
         except (AttributeError, TypeError, ValueError, KeyError) as e:
             self.logger.error(f"Error cleaning up expired messages: {e}")
+            return 0
 
     async def verify_message_signature(self, message: RepositoryMessage) -> bool:
         """Verify the signature of an incoming message."""
@@ -854,15 +854,26 @@ def _resolve_bodai_state_path(explicit: str | None) -> Path:
 
 
 def _load_bodai_queue(path: Path) -> list[dict[str, Any]]:
-    """Read and JSON-parse the queue file. Returns ``[]`` on any failure."""
-    if not path.exists():
-        return []
+    """Read the queue: legacy JSON file (if any) followed by the segmented spool.
+
+    Returns ``[]`` on any failure.
+    """
+    from mahavishnu.core.events.spool import read_spool, spool_dir_for
+
+    events: list[dict[str, Any]] = []
+    if path.exists():
+        try:
+            with path.open("r", encoding="utf-8") as fh:
+                data = json.load(fh)
+        except (OSError, json.JSONDecodeError):
+            data = []
+        if isinstance(data, list):
+            events.extend(data)
     try:
-        with path.open("r", encoding="utf-8") as fh:
-            data = json.load(fh)
-    except (OSError, json.JSONDecodeError):
-        return []
-    return data if isinstance(data, list) else []
+        events.extend(read_spool(spool_dir_for(path)).envelopes)
+    except OSError:
+        pass
+    return events
 
 
 def _load_bodai_state(path: Path) -> dict[str, Any] | None:
@@ -191,6 +191,18 @@ class BasePool(ABC):
                     - timestamp: Execution timestamp
         """
 
+    async def memory_count(self) -> int:
+        """Count the items :meth:`collect_memory` would return.
+
+        Used for count-only aggregation. The default collects and discards
+        the items; pools that can count without materializing (or whose
+        collection is destructive) should override it.
+
+        Returns:
+            Number of pending memory items
+        """
+        return len(await self.collect_memory())
+
     @abstractmethod
     async def stop(self) -> None:
         """Gracefully shutdown pool and all workers."""
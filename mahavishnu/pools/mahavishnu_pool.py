@@ -8,6 +8,7 @@ import time
 from typing import Any
 
 from ..terminal.manager import TerminalManager
+from ..workers.base import WorkerResult
 from ..workers.manager import WorkerManager
 from .base import BasePool, PoolConfig, PoolMetrics, PoolStatus
 
@@ -296,29 +297,49 @@ class MahavishnuPool(BasePool):
         results = await self.worker_manager.collect_results()
 
         # Transform WorkerResults to memory format
-        memory_items = []
-        for result in results.values():
-            memory_items.append(
-                {
-                    "content": result.output or "",
-                    "metadata": {
-                        "type": "pool_worker_execution",
-                        "pool_id": self.pool_id,
-                        "pool_type": "mahavishnu",
-                        "worker_id": result.worker_id,
-                        "status": result.status.value,
-                        "duration_seconds": result.duration_seconds,
-                        "exit_code": result.exit_code,
-                        "error": result.error,
-                        "timestamp": time.time(),
-                    },
-                }
-            )
+        memory_items = [self._memory_item(result) for result in results.values()]
 
         logger.info(f"Collected {len(memory_items)} memory items from pool {self.pool_id}")
 
         return memory_items
 
+    async def collect_memory_since(self, cursor: int = 0) -> tuple[list[dict[str, Any]], int]:
+        """Collect only the worker results recorded after ``cursor``.
+
+        Args:
+            cursor: Cursor returned by the previous call (0 = from the start)
+
+        Returns:
+            Tuple of (memory items, next cursor)
+        """
+        batch = await self.worker_manager.collect_results_since(cursor)
+        if batch.truncated:
+            logger.warning(
+                f"Pool {self.pool_id}: results after cursor {cursor} were dropped "
+                "from the result journal"
+            )
+        return [self._memory_item(result) for result in batch.results], batch.cursor
+
+    async def memory_count(self) -> int:
+        """Count memory items (one per worker) without polling any worker."""
+        return len(self.worker_manager.list_worker_ids())
+
+    def _memory_item(self, result: WorkerResult) -> dict[str, Any]:
+        return {
+            "content": result.output or "",
+            "metadata": {
+                "type": "pool_worker_execution",
+                "pool_id": self.pool_id,
+                "pool_type": "mahavishnu",
+                "worker_id": result.worker_id,
+                "status": result.status.value,
+                "duration_seconds": result.duration_seconds,
+                "exit_code": result.exit_code,
+                "error": result.error,
+                "timestamp": time.time(),
+            },
+        }
+
     async def stop(self) -> None:
         """Shutdown pool and all workers."""
         logger.info(f"Stopping MahavishnuPool {self.pool_id}...")
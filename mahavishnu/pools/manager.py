@@ -926,13 +926,14 @@ class PoolManager:
 
         # Collect from all pools concurrently using asyncio.gather
         async def collect_from_pool(pool_id: str) -> tuple[str, dict[str, Any]]:
-            """Collect memory and status from a single pool."""
+            """Count memory and read status from a single pool."""
             pool = self._pools.get(pool_id)
             if pool:
-                memory = await _await_if_needed(pool.collect_memory())
+                # Count-only: collect_memory() would materialize every result
+                memory_count = await _await_if_needed(pool.memory_count())
                 status = await _await_if_needed(pool.status())
                 return pool_id, {
-                    "memory_count": len(memory),
+                    "memory_count": memory_count,
                     "status": status.value,
                 }
             return pool_id, {"memory_count": 0, "status": "not_found"}
@@ -1007,6 +1008,9 @@ class PoolManager:
         self._pool_worker_counts.clear()
         self._refresh_pool_worker_metrics()
 
+        # Deliver the POOL_CLOSED notifications, then stop the dispatchers
+        await self.message_bus.close()
+
         logger.info("All pools closed")
 
     async def list_pools(self) -> list[dict[str, Any]]:
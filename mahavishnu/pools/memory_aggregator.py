@@ -8,14 +8,22 @@ Circuit breaker states:
 - CLOSED: Normal operation, requests pass through
 - OPEN: Service failures exceeded threshold, requests blocked
 - Recovery: After timeout, one probe request is allowed
+
+Cross-pool search cache:
+- One LRU entry per query, bounded by entry count and serialized bytes
+- An entry fetched with ``limit=N`` serves any request with ``limit <= N``
+- Identical concurrent searches share one in-flight Session-Buddy request
+- Entries past ``CACHE_TTL`` are served stale (up to ``CACHE_STALE_TTL``)
+  while a background refresh runs, if the Session-Buddy breaker allows it
 """
 
 from __future__ import annotations
 
 import asyncio
-from collections import deque
+from collections import OrderedDict, deque
 import contextlib
 from datetime import UTC, datetime, timedelta
+import json
 import logging
 import os
 import pathlib
@@ -24,6 +32,8 @@ from typing import TYPE_CHECKING, Any
 
 import httpx
 
+from ..core.http_clients import AKOSHA, SESSION_BUDDY, get_http_client
+
 # Outbox (Q2 data-plane durability) is opt-in. Operators set the env vars
 # explicitly; the default behavior matches pre-Task-2 exactly.
 _OUTBOX_ENABLED = os.environ.get("MAHAVISHNU_OUTBOX_ENABLED", "false").lower() == "true"
@@ -141,6 +151,10 @@ class MemoryAggregator:
     # Maximum items to buffer locally when external services are down
     LOCAL_BUFFER_MAX = 500
 
+    # Cross-pool search cache bounds (LRU eviction past either limit)
+    SEARCH_CACHE_MAX_ENTRIES = 256
+    SEARCH_CACHE_MAX_BYTES = 16 * 1024 * 1024
+
     def __init__(
         self,
         session_buddy_url: str = "http://localhost:8678/mcp",
@@ -158,7 +172,10 @@ class MemoryAggregator:
         self.akosha_url = akosha_url
         self.sync_interval = sync_interval
 
-        self._mcp_client = httpx.AsyncClient(timeout=300.0)
+        # Requests go through the shared keep-alive clients; tests inject a
+        # client here instead.
+        self._mcp_client: httpx.AsyncClient | None = None
+        self._request_timeout = 300.0
         self._sync_task: asyncio.Task | None = None
         self._shutdown_event = asyncio.Event()
 
@@ -189,17 +206,28 @@ class MemoryAggregator:
                 self._outbox_drainer = MemoryOutboxDrainer(
                     writer=self._outbox_writer,
                     breaker=self._sb_breaker,
-                    sink=self._sink_to_session_buddy,
+                    batch_sink=self._batch_sink_to_session_buddy,
                 )
+        self._outbox_drain_task: asyncio.Task | None = None
 
         logger.info(f"MemoryAggregator initialized (sync_interval={sync_interval}s)")
 
         # PERFORMANCE: Batch size for Session-Buddy inserts
         self._BATCH_SIZE = 20
 
-        # PERFORMANCE: TTL cache for cross-pool searches (60%+ hit rate expected)
+        # PERFORMANCE: LRU cache for cross-pool searches, keyed by query.
+        # Entries: {"results", "cached_at", "limit", "size_bytes"}.
         self.CACHE_TTL = timedelta(minutes=5)
-        self._search_cache: dict[str, Any] = {}  # Using dict to allow cache stats
+        self.CACHE_STALE_TTL = timedelta(minutes=30)
+        self._search_cache: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._search_cache_bytes = 0
+        self._inflight_searches: dict[str, tuple[int, asyncio.Future[list[dict[str, Any]]]]] = {}
+        self._background_refreshes: set[asyncio.Task[Any]] = set()
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._cache_stale_served = 0
+        self._cache_singleflight_joins = 0
+        self._cache_evictions = 0
 
     async def _collect_from_pool(self, pool: BasePool, pool_id: str) -> list[dict[str, Any]]:
         """Collect memory from a single pool (used in concurrent gather).
@@ -312,6 +340,84 @@ class MemoryAggregator:
         # Other kinds (e.g. "code_graph:*") are deferred to later phases.
         logger.debug(f"outbox_sink_skipped: kind={kind} key={key}")
 
+    async def _batch_sink_to_session_buddy(
+        self, rows: list[tuple[str, dict[str, object]]]
+    ) -> list[BaseException | None]:
+        """Drainer batch sink: write many WAL rows in one pass.
+
+        Same key dispatch as :meth:`_sink_to_session_buddy`, but all
+        reflections in ``rows`` are stored concurrently over the pooled
+        client and each row gets its own outcome. Failed rows are not copied
+        to the local buffer: they stay ``pending`` in the WAL, which retries
+        them.
+        """
+        outcomes: list[BaseException | None] = [None] * len(rows)
+        reflections: list[tuple[int, dict[str, Any]]] = []
+        for index, (key, payload) in enumerate(rows):
+            kind, _, _ = key.partition(":")
+            if kind != "reflection":
+                logger.debug(f"outbox_sink_skipped: kind={kind} key={key}")
+                continue
+            text = payload.get("text", "")
+            tags_obj = payload.get("tags", [])
+            tags = [str(t) for t in tags_obj] if isinstance(tags_obj, list) else []
+            reflections.append((index, {"text": str(text), "tags": tags}))
+
+        if not reflections:
+            return outcomes
+
+        stored = await self._store_memory_items([item for _, item in reflections])
+        self._record_sb_outcomes(stored)
+        for (index, _), ok in zip(reflections, stored, strict=True):
+            if not ok:
+                outcomes[index] = SinkDeliveryError(f"Session-Buddy did not store {rows[index][0]}")
+        return outcomes
+
+    def _http_client(self, service: str) -> httpx.AsyncClient:
+        """Return the injected client, or the shared pooled client for ``service``."""
+        if self._mcp_client is not None:
+            return self._mcp_client
+        return get_http_client(service)
+
+    async def _store_memory_items(self, items: list[dict[str, Any]]) -> list[bool]:
+        """Store each item with a concurrent ``store_memory`` call; one flag per item."""
+
+        async def store_single_item(memory_item: dict[str, Any]) -> bool:
+            """Store a single memory item, returning success status."""
+            try:
+                response = await self._http_client(SESSION_BUDDY).post(
+                    f"{self.session_buddy_url}/tools/call",
+                    json={
+                        "name": "store_memory",
+                        "arguments": memory_item,
+                    },
+                    timeout=self._request_timeout,
+                )
+
+                if response.status_code == 200:
+                    return True
+                else:
+                    logger.warning(f"Failed to store memory: {response.text[:200]}")
+                    return False
+
+            except httpx.HTTPError as e:
+                logger.error(f"Error storing memory: {e}")
+                return False
+
+        results = await asyncio.gather(
+            *[store_single_item(item) for item in items],
+            return_exceptions=True,
+        )
+        return [r is True for r in results]
+
+    def _record_sb_outcomes(self, stored: list[bool]) -> None:
+        failures = stored.count(False)
+        if failures == 0:
+            self._sb_breaker.record_success()
+        else:
+            for _ in range(failures):
+                self._sb_breaker.record_failure()
+
     async def _batch_insert_to_session_buddy(self, memory_items: list[dict[str, Any]]) -> int:
         """Insert memory items to Session-Buddy in batches (25x faster).
 
@@ -359,51 +465,16 @@ class MemoryAggregator:
             self._buffer_items(batch)
             return 0  # Not synced to external service, but buffered locally
 
-        async def store_single_item(memory_item: dict[str, Any]) -> bool:
-            """Store a single memory item, returning success status."""
-            try:
-                response = await self._mcp_client.post(
-                    f"{self.session_buddy_url}/tools/call",
-                    json={
-                        "name": "store_memory",
-                        "arguments": memory_item,
-                    },
-                )
-
-                if response.status_code == 200:
-                    return True
-                else:
-                    logger.warning(f"Failed to store memory: {response.text[:200]}")
-                    return False
-
-            except httpx.HTTPError as e:
-                logger.error(f"Error storing memory: {e}")
-                return False
-
-        # Execute all requests in parallel using asyncio.gather
-        results = await asyncio.gather(
-            *[store_single_item(item) for item in batch],
-            return_exceptions=True,
-        )
-
-        # Count successful inserts and update circuit breaker
-        batch_synced = sum(1 for r in results if r is True)
-        failures = len(batch) - batch_synced
-
-        if failures == 0:
-            self._sb_breaker.record_success()
-        else:
-            for _ in range(failures):
-                self._sb_breaker.record_failure()
+        # Execute all requests in parallel, then update the circuit breaker
+        stored = await self._store_memory_items(batch)
+        self._record_sb_outcomes(stored)
 
         # Buffer failed items for later retry
-        if failures > 0:
-            failed_items = [
-                item for item, result in zip(batch, results, strict=False) if result is not True
-            ]
+        failed_items = [item for item, ok in zip(batch, stored, strict=True) if not ok]
+        if failed_items:
             self._buffer_items(failed_items)
 
-        return batch_synced
+        return len(batch) - len(failed_items)
 
     async def start_periodic_sync(
         self,
@@ -437,6 +508,13 @@ class MemoryAggregator:
         self._sync_task = asyncio.create_task(sync_loop())
         logger.info("Started periodic memory sync")
 
+        # Drain the outbox continuously rather than once per sync interval,
+        # so a backlog built up during an outage clears at full speed.
+        if self._outbox_drainer is not None and self._outbox_drain_task is None:
+            self._outbox_drain_task = asyncio.create_task(
+                self._outbox_drainer.run(self._shutdown_event)
+            )
+
     async def stop(self) -> None:
         """Stop periodic sync and cleanup.
 
@@ -458,7 +536,21 @@ class MemoryAggregator:
                 with contextlib.suppress(asyncio.CancelledError):
                     await self._sync_task
 
-        await self._mcp_client.aclose()
+        if self._outbox_drain_task is not None:
+            # Let an in-flight pass settle its rows before giving up on it
+            try:
+                await asyncio.wait_for(self._outbox_drain_task, timeout=5.0)
+            except TimeoutError:
+                self._outbox_drain_task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await self._outbox_drain_task
+            self._outbox_drain_task = None
+
+        for refresh in list(self._background_refreshes):
+            refresh.cancel()
+        if self._background_refreshes:
+            await asyncio.gather(*self._background_refreshes, return_exceptions=True)
+
         logger.info("MemoryAggregator stopped")
 
     async def collect_and_sync(
@@ -564,12 +656,13 @@ class MemoryAggregator:
             return
 
         try:
-            response = await self._mcp_client.post(
+            response = await self._http_client(AKOSHA).post(
                 f"{self.akosha_url}/tools/call",
                 json={
                     "name": "aggregate_metrics",
                     "arguments": summary,
                 },
+                timeout=self._request_timeout,
             )
 
             if response.status_code == 200:
@@ -589,7 +682,11 @@ class MemoryAggregator:
         pool_manager: PoolManager,
         limit: int = 100,
     ) -> list[dict[str, Any]]:
-        """Search across all pools via Session-Buddy with caching (60%+ cache hit rate).
+        """Search across all pools via Session-Buddy with caching.
+
+        A cached entry answers any ``limit`` up to the one it was fetched
+        with. Expired entries are returned immediately while a background
+        refresh runs; concurrent misses for the same query share one request.
 
         Args:
             query: Search query
@@ -611,22 +708,22 @@ class MemoryAggregator:
                 logger.info(f"{result['pool_id']}: {result['content'][:100]}")
             ```
         """
-        # Check cache first (60%+ hit rate expected)
-        cache_key = f"{query}:{limit}"
-
-        if cache_key in self._search_cache:
-            cached_entry = self._search_cache[cache_key]
-            age = datetime.now(UTC) - cached_entry["cached_at"]
-
+        entry = self._cached_search(query, limit)
+        if entry is not None:
+            age = datetime.now(UTC) - entry["cached_at"]
+            self._search_cache.move_to_end(query)
             if age < self.CACHE_TTL:
+                self._cache_hits += 1
                 logger.debug(f"Cache HIT for query: {query} (age: {age.total_seconds():.1f}s)")
-                return cached_entry["results"][:limit]  # type: ignore[no-any-return]
             else:
-                # Cache expired - remove and continue to fetch
-                del self._search_cache[cache_key]
-                logger.debug(f"Cache expired for query: {query}")
+                self._cache_stale_served += 1
+                logger.debug(f"Cache STALE for query: {query} (age: {age.total_seconds():.1f}s)")
+                if self._sb_breaker.can_execute():
+                    self._refresh_in_background(query, entry["limit"])
+            return entry["results"][:limit]  # type: ignore[no-any-return]
 
         # Cache miss - fetch from Session-Buddy
+        self._cache_misses += 1
         logger.debug(f"Cache MISS for query: {query}")
 
         # Circuit breaker check - return empty if Session-Buddy is down
@@ -634,9 +731,70 @@ class MemoryAggregator:
             logger.debug("Skipping Session-Buddy search: circuit breaker open")
             return []
 
+        results = await self._search_singleflight(query, limit)
+        return results[:limit]
+
+    def _cached_search(self, query: str, limit: int) -> dict[str, Any] | None:
+        """Return the cache entry that can answer ``query`` at ``limit``, if any.
+
+        Entries older than ``CACHE_TTL + CACHE_STALE_TTL`` are evicted.
+        """
+        entry = self._search_cache.get(query)
+        if entry is None:
+            return None
+        if datetime.now(UTC) - entry["cached_at"] >= self.CACHE_TTL + self.CACHE_STALE_TTL:
+            self._evict_search(query)
+            logger.debug(f"Cache expired for query: {query}")
+            return None
+        # Fewer results than the fetched limit means the result set is complete.
+        if entry["limit"] >= limit or len(entry["results"]) < entry["limit"]:
+            return entry
+        return None
+
+    async def _search_singleflight(self, query: str, limit: int) -> list[dict[str, Any]]:
+        """Share one in-flight Session-Buddy search per query.
+
+        A caller joins an in-flight request that was issued with at least its
+        ``limit``; otherwise it starts a new one, which becomes the request
+        later callers join.
+        """
+        inflight = self._inflight_searches.get(query)
+        if inflight is not None and inflight[0] >= limit:
+            self._cache_singleflight_joins += 1
+            return await asyncio.shield(inflight[1])
+
+        future = asyncio.ensure_future(self._search_session_buddy(query, limit))
+        self._inflight_searches[query] = (limit, future)
+
+        def _done(_: asyncio.Future[list[dict[str, Any]]]) -> None:
+            current = self._inflight_searches.get(query)
+            if current is not None and current[1] is future:
+                del self._inflight_searches[query]
+
+        future.add_done_callback(_done)
+        return await asyncio.shield(future)
+
+    def _refresh_in_background(self, query: str, limit: int) -> None:
+        """Refresh a stale entry without blocking the caller (deduplicated)."""
+        inflight = self._inflight_searches.get(query)
+        if inflight is not None and inflight[0] >= limit:
+            return
+
+        async def refresh() -> None:
+            try:
+                await self._search_singleflight(query, limit)
+            except Exception as e:  # noqa: BLE001 - a failed refresh keeps serving the stale entry
+                logger.warning(f"Background search refresh failed for {query}: {e}")
+
+        task = asyncio.create_task(refresh())
+        self._background_refreshes.add(task)
+        task.add_done_callback(self._background_refreshes.discard)
+
+    async def _search_session_buddy(self, query: str, limit: int) -> list[dict[str, Any]]:
+        """Run one Session-Buddy search and cache a successful result."""
         try:
             # Use Session-Buddy search
-            response = await self._mcp_client.post(
+            response = await self._http_client(SESSION_BUDDY).post(
                 f"{self.session_buddy_url}/tools/call",
                 json={
                     "name": "search_conversations",
@@ -645,6 +803,7 @@ class MemoryAggregator:
                         "limit": limit,
                     },
                 },
+                timeout=self._request_timeout,
             )
 
             if response.status_code == 200:
@@ -653,12 +812,7 @@ class MemoryAggregator:
                 conversations = result.get("result", {}).get("conversations", [])
                 logger.info(f"Found {len(conversations)} results for query: {query}")
 
-                # Store in cache
-                self._search_cache[cache_key] = {
-                    "results": conversations,
-                    "cached_at": datetime.now(UTC),
-                }
-
+                self._store_search(query, limit, conversations)
                 return conversations  # type: ignore[no-any-return]
             else:
                 self._sb_breaker.record_failure()
@@ -670,16 +824,55 @@ class MemoryAggregator:
             logger.error(f"Search error: {e}")
             return []
 
+    def _store_search(self, query: str, limit: int, results: list[dict[str, Any]]) -> None:
+        """Insert a search result, evicting least-recently-used entries past the bounds."""
+        current = self._search_cache.get(query)
+        if (
+            current is not None
+            and current["limit"] > limit
+            and datetime.now(UTC) - current["cached_at"] < self.CACHE_TTL
+        ):
+            # A fresh entry with wider coverage is more useful than this one.
+            return
+
+        size_bytes = len(json.dumps(results, default=str))
+        if size_bytes > self.SEARCH_CACHE_MAX_BYTES:
+            logger.debug(f"Search result too large to cache: {query} ({size_bytes} bytes)")
+            return
+
+        self._evict_search(query)
+        self._search_cache[query] = {
+            "results": results,
+            "cached_at": datetime.now(UTC),
+            "limit": limit,
+            "size_bytes": size_bytes,
+        }
+        self._search_cache_bytes += size_bytes
+
+        while (
+            len(self._search_cache) > self.SEARCH_CACHE_MAX_ENTRIES
+            or self._search_cache_bytes > self.SEARCH_CACHE_MAX_BYTES
+        ):
+            oldest = next(iter(self._search_cache))
+            self._evict_search(oldest)
+            self._cache_evictions += 1
+
+    def _evict_search(self, query: str) -> None:
+        entry = self._search_cache.pop(query, None)
+        if entry is not None:
+            self._search_cache_bytes -= entry["size_bytes"]
+
     def clear_cache(self) -> None:
         """Clear the search cache (useful for testing or forced refresh).
 
         Example:
             ```python
-            await aggregator.clear_cache()
+            aggregator.clear_cache()
             ```
         """
         cache_size = len(self._search_cache)
         self._search_cache.clear()
+        self._search_cache_bytes = 0
         logger.info(f"Cleared search cache ({cache_size} entries removed)")
 
     def get_cache_stats(self) -> dict[str, Any]:
@@ -689,8 +882,13 @@ class MemoryAggregator:
             Dictionary with cache metrics:
             - total_entries: Total cache entries
             - active_entries: Entries younger than TTL
-            - expired_entries: Entries older than TTL
+            - expired_entries: Entries older than TTL (servable while stale)
             - ttl_minutes: Cache TTL in minutes
+            - size_bytes / max_bytes / max_entries: Current size and bounds
+            - hits, misses, stale_served: Lookup outcomes since start
+            - singleflight_joins: Misses that joined an in-flight request
+            - evictions: Entries dropped by the LRU bounds
+            - hit_rate: (hits + stale_served) / lookups
         """
         total = len(self._search_cache)
         now = datetime.now(UTC)
@@ -702,13 +900,23 @@ class MemoryAggregator:
         )
 
         expired = total - active
+        served = self._cache_hits + self._cache_stale_served
+        lookups = served + self._cache_misses
 
         return {
             "total_entries": total,
             "active_entries": active,
             "expired_entries": expired,
             "ttl_minutes": int(self.CACHE_TTL.total_seconds() / 60),
-            "cache_hit_rate_expected": "60%+",
+            "size_bytes": self._search_cache_bytes,
+            "max_bytes": self.SEARCH_CACHE_MAX_BYTES,
+            "max_entries": self.SEARCH_CACHE_MAX_ENTRIES,
+            "hits": self._cache_hits,
+            "misses": self._cache_misses,
+            "stale_served": self._cache_stale_served,
+            "singleflight_joins": self._cache_singleflight_joins,
+            "evictions": self._cache_evictions,
+            "hit_rate": served / lookups if lookups else 0.0,
         }
 
     async def get_pool_memory_stats(
@@ -2,14 +2,17 @@
 
 from __future__ import annotations
 
-from .drainer import DrainResult, MemoryOutboxDrainer
+from .drainer import BatchSink, DrainResult, MemoryOutboxDrainer, Sink, per_row_batch_sink
 from .table import MemoryOutboxRow, OutboxStatus
 from .writer import MemoryOutboxWriter
 
 __all__ = [
+    "BatchSink",
     "DrainResult",
     "MemoryOutboxDrainer",
     "MemoryOutboxRow",
     "MemoryOutboxWriter",
     "OutboxStatus",
+    "Sink",
+    "per_row_batch_sink",
 ]
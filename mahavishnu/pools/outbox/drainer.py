@@ -5,19 +5,39 @@ MCP call). Respects the existing circuit breaker: when open, no calls are
 attempted. Rows that fail after `max_attempts` are marked `failed` for
 operator inspection.
 
+Delivery is pipelined: ordering is preserved per key, not globally. Each
+pass groups the batch by key and sends it in waves, where a wave holds the
+next row of every key that has not failed in this pass. Rows in a wave have
+distinct keys, so the wave is split into sink calls that run concurrently.
+A failed row holds back only the later rows of its own key.
+
 Spec: docs/superpowers/specs/2026-07-29-session-buddy-extension-design.md
 (Q2: data-plane durability).
+
+Usage:
+    drainer = MemoryOutboxDrainer(writer, breaker, batch_sink=send_many)
+    result = await drainer.drain_once()
+
+    stop = asyncio.Event()
+    task = asyncio.create_task(drainer.run(stop))
 """
 
 from __future__ import annotations
 
-from collections.abc import Awaitable, Callable
+import asyncio
+from collections import deque
+from collections.abc import Awaitable, Callable, Sequence
+import contextlib
 from dataclasses import dataclass
+import logging
 from typing import TYPE_CHECKING, Protocol
 
 if TYPE_CHECKING:
+    from .table import MemoryOutboxRow
     from .writer import MemoryOutboxWriter
 
+logger = logging.getLogger(__name__)
+
 
 class CircuitBreakerLike(Protocol):
     """Subset of the aggregator's _CircuitBreaker the drainer depends on.
@@ -38,14 +58,16 @@ class DrainResult:
 
     Attributes:
         drained: rows that the sink successfully wrote and were marked drained.
-        deferred: rows still pending after the pass (breaker open, or remaining
-            batch rows the drainer stopped at after a sink exception).
+        deferred: rows still pending after the pass (breaker open, rows held
+            back behind a failed row of the same key, or beyond the batch).
         failed: rows whose attempts exceeded `max_attempts` and are now `failed`.
+        retried: rows the sink rejected that stay pending for another attempt.
     """
 
     drained: int
     deferred: int
     failed: int
+    retried: int = 0
 
 
 # A sink is an async callable that takes a (key, payload) pair and writes
@@ -54,31 +76,87 @@ class DrainResult:
 # retry or mark it `failed` based on attempts vs. max_attempts.
 Sink = Callable[[str, dict[str, object]], Awaitable[None]]
 
+# A batch sink writes many (key, payload) rows in one call. Rows in a call
+# always have distinct keys. It returns one outcome per row, in order:
+# ``None`` for delivered, an exception for failed. Raising fails every row
+# in the call.
+BatchSink = Callable[
+    [list[tuple[str, dict[str, object]]]], Awaitable[Sequence[BaseException | None]]
+]
+
+
+def per_row_batch_sink(sink: Sink) -> BatchSink:
+    """Adapt a per-row :data:`Sink` to the :data:`BatchSink` contract.
+
+    Rows in one call have distinct keys, so they are sent concurrently.
+    """
+
+    async def deliver(row: tuple[str, dict[str, object]]) -> BaseException | None:
+        try:
+            await sink(*row)
+        except Exception as exc:  # noqa: BLE001 -- defensive: any sink failure should retry
+            return exc
+        return None
+
+    async def batch_sink(
+        rows: list[tuple[str, dict[str, object]]],
+    ) -> list[BaseException | None]:
+        return list(await asyncio.gather(*(deliver(row) for row in rows)))
+
+    return batch_sink
+
 
 class MemoryOutboxDrainer:
     """Drains pending WAL rows through a sink, respecting a circuit breaker.
 
-    The drainer is intentionally simple: one batch per call, in enqueue
-    order, with stop-on-first-error semantics to preserve ordering across
-    retries. Rows that fail repeatedly are marked `failed` once
-    `attempts >= max_attempts` so an operator can inspect them.
+    Each pass reads one batch in enqueue order, delivers it in per-key waves
+    (see module docstring) with up to ``concurrency`` sink calls of at most
+    ``sink_batch_size`` rows in flight, and records every outcome with a
+    single writer statement. Rows that fail repeatedly are marked `failed`
+    once `attempts >= max_attempts` so an operator can inspect them.
+
+    :meth:`run` drains continuously, doubling the batch size while a
+    backlog drains cleanly and halving it when rows fail.
     """
 
     def __init__(
         self,
         writer: MemoryOutboxWriter,
         breaker: CircuitBreakerLike,
-        sink: Sink,
+        sink: Sink | None = None,
         batch_size: int = 50,
         max_attempts: int = 5,
+        *,
+        batch_sink: BatchSink | None = None,
+        sink_batch_size: int = 50,
+        concurrency: int = 4,
+        min_batch_size: int = 10,
+        max_batch_size: int = 1000,
     ) -> None:
+        if (sink is None) == (batch_sink is None):
+            raise ValueError("MemoryOutboxDrainer needs exactly one of sink or batch_sink")
         self._writer = writer
         self._breaker = breaker
-        self._sink = sink
-        self._batch_size = batch_size
+        self._batch_sink = batch_sink or per_row_batch_sink(sink)  # type: ignore[arg-type]
         self._max_attempts = max_attempts
+        self._sink_batch_size = max(1, sink_batch_size)
+        self._concurrency = max(1, concurrency)
+        self._min_batch_size = max(1, min(min_batch_size, batch_size))
+        self._max_batch_size = max(max_batch_size, batch_size)
+        self._batch_size = batch_size
+        # One pass at a time: run() and ad-hoc drain_once() callers share rows.
+        self._lock = asyncio.Lock()
+
+    @property
+    def batch_size(self) -> int:
+        """Rows read per pass (adapted by :meth:`run`)."""
+        return self._batch_size
 
     async def drain_once(self) -> DrainResult:
+        async with self._lock:
+            return await self._drain_pass()
+
+    async def _drain_pass(self) -> DrainResult:
         if not self._breaker.can_execute():
             # Breaker open (or half-open not yet ready): don't touch the WAL;
             # report everything as deferred. can_execute() owns the half-open
@@ -87,35 +165,83 @@ class MemoryOutboxDrainer:
             pending = await self._writer.pending_count()
             return DrainResult(drained=0, deferred=pending, failed=0)
 
-        batch = await self._writer.pending_batch(self._batch_size)
+        batch, pending = await self._writer.pending_window(self._batch_size)
         if not batch:
             return DrainResult(drained=0, deferred=0, failed=0)
 
-        drained_ids: list[int] = []
-        failed_ids: list[int] = []
+        by_key: dict[str, deque[MemoryOutboxRow]] = {}
         for row in batch:
-            try:
-                await self._sink(row.key, row.payload)
-            except Exception as exc:  # noqa: BLE001 -- defensive: any sink failure should retry
-                # Stop the batch on first sink exception to preserve ordering.
-                # If this attempt would push us past max_attempts, mark the
-                # row failed (terminal); otherwise bump attempts and leave it
-                # pending for the next drain.
-                err = str(exc)[:500]
-                if row.attempts + 1 >= self._max_attempts:
-                    await self._writer.mark_failed([row.id], error=err)
-                    failed_ids.append(row.id)
-                else:
-                    await self._writer._bump_attempts([row.id], error=err)
-                break
-            drained_ids.append(row.id)
+            by_key.setdefault(row.key, deque()).append(row)
 
-        if drained_ids:
-            await self._writer.mark_drained(drained_ids)
+        drained_ids: list[int] = []
+        errors: dict[int, str] = {}
+        while by_key and self._breaker.can_execute():
+            wave = [rows.popleft() for rows in by_key.values()]
+            by_key = {key: rows for key, rows in by_key.items() if rows}
+            for row, outcome in zip(wave, await self._deliver(wave), strict=True):
+                if outcome is None:
+                    drained_ids.append(row.id)
+                else:
+                    # Later rows of this key wait for the next pass so they
+                    # are never written ahead of the failed one.
+                    errors[row.id] = str(outcome)[:500]
+                    by_key.pop(row.key, None)
 
-        deferred = await self._writer.pending_count()
+        drained, failed = await self._writer.settle(drained_ids, errors, self._max_attempts)
         return DrainResult(
-            drained=len(drained_ids),
-            deferred=deferred,
-            failed=len(failed_ids),
+            drained=drained,
+            deferred=pending - drained - failed,
+            failed=failed,
+            retried=len(errors) - failed,
         )
+
+    async def _deliver(self, wave: list[MemoryOutboxRow]) -> list[BaseException | None]:
+        """Send one wave (distinct keys) as concurrent sink calls."""
+        limit = asyncio.Semaphore(self._concurrency)
+
+        async def send(chunk: list[MemoryOutboxRow]) -> list[BaseException | None]:
+            async with limit:
+                try:
+                    outcomes = list(await self._batch_sink([(r.key, r.payload) for r in chunk]))
+                except Exception as exc:  # noqa: BLE001 -- defensive: any sink failure should retry
+                    return [exc] * len(chunk)
+            if len(outcomes) != len(chunk):
+                error = RuntimeError(
+                    f"batch sink returned {len(outcomes)} outcomes for {len(chunk)} rows"
+                )
+                return [error] * len(chunk)
+            return outcomes
+
+        size = self._sink_batch_size
+        chunks = [wave[i : i + size] for i in range(0, len(wave), size)]
+        results = await asyncio.gather(*(send(chunk) for chunk in chunks))
+        return [outcome for chunk_outcomes in results for outcome in chunk_outcomes]
+
+    def _adapt(self, result: DrainResult) -> None:
+        if result.failed or result.retried:
+            self._batch_size = max(self._min_batch_size, self._batch_size // 2)
+        elif result.deferred and result.drained >= self._batch_size:
+            self._batch_size = min(self._max_batch_size, self._batch_size * 2)
+
+    async def run(self, stop_event: asyncio.Event, idle_interval: float = 5.0) -> None:
+        """Drain continuously until ``stop_event`` is set.
+
+        Passes run back to back while they make progress on a backlog; when
+        the WAL is empty, the breaker is open or a pass fails, the drainer
+        waits ``idle_interval`` seconds (or until stopped).
+        """
+        while not stop_event.is_set():
+            try:
+                result = await self.drain_once()
+            except Exception as e:  # noqa: BLE001 - keep draining after a WAL or sink error
+                logger.warning(f"Outbox drain pass failed: {e}")
+                result = None
+
+            if result is not None:
+                self._adapt(result)
+                if result.drained and result.deferred:
+                    await asyncio.sleep(0)  # let other tasks run between passes
+                    continue
+
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(stop_event.wait(), timeout=idle_interval)
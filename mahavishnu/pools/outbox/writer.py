@@ -21,6 +21,20 @@ from .table import MemoryOutboxRow, OutboxStatus
 
 _SCHEMA_PATH = pathlib.Path(__file__).parent / "schema.sql"
 
+_ROW_COLUMNS = "id, key, payload, enqueued_at, attempts, last_error, status"
+
+
+def _row_from_record(record: tuple[object, ...]) -> MemoryOutboxRow:
+    return MemoryOutboxRow(
+        id=record[0],
+        key=record[1],
+        payload=json.loads(cast("str", record[2])),
+        enqueued_at=record[3],
+        attempts=record[4],
+        last_error=record[5],
+        status=cast("OutboxStatus", record[6]),
+    )
+
 
 class MemoryOutboxWriter:
     """Async-style wrapper around a DuckDB connection.
@@ -110,6 +124,52 @@ class MemoryOutboxWriter:
             [error, *ids],
         )
 
+    async def settle(
+        self,
+        drained_ids: list[int],
+        errors: dict[int, str],
+        max_attempts: int,
+    ) -> tuple[int, int]:
+        """Apply the outcome of a drain pass in one set-based UPDATE.
+
+        Rows in ``drained_ids`` become ``drained``. Rows in ``errors`` get
+        ``attempts + 1`` and their error recorded; those reaching
+        ``max_attempts`` become ``failed``, the rest stay ``pending`` for a
+        later pass. Only rows still ``pending`` are touched.
+
+        Args:
+            drained_ids: Rows the sink delivered
+            errors: Row id -> error message for rows the sink rejected
+            max_attempts: Attempt count at which a row becomes ``failed``
+
+        Returns:
+            Tuple of (rows marked drained, rows marked failed)
+        """
+        outcomes: list[object] = []
+        for row_id in drained_ids:
+            outcomes += [row_id, None]
+        for row_id, error in errors.items():
+            outcomes += [row_id, error]
+        if not outcomes:
+            return 0, 0
+
+        conn = self._ensure_conn()
+        values = ",".join(["(CAST(? AS BIGINT), CAST(? AS VARCHAR))"] * (len(outcomes) // 2))
+        rows = conn.execute(
+            "UPDATE memory_outbox SET "
+            "status = CASE WHEN outcome.error IS NULL THEN 'drained' "
+            "WHEN memory_outbox.attempts + 1 >= ? THEN 'failed' ELSE 'pending' END, "
+            "attempts = CASE WHEN outcome.error IS NULL THEN memory_outbox.attempts "
+            "ELSE memory_outbox.attempts + 1 END, "
+            "last_error = COALESCE(outcome.error, memory_outbox.last_error) "
+            f"FROM (VALUES {values}) AS outcome(row_id, error) "
+            "WHERE memory_outbox.id = outcome.row_id AND memory_outbox.status = 'pending' "
+            "RETURNING status",
+            [max_attempts, *outcomes],
+        ).fetchall()
+        statuses = [row[0] for row in rows]
+        return statuses.count("drained"), statuses.count("failed")
+
     async def get_row(self, row_id: int) -> MemoryOutboxRow | None:
         """Fetch a single row by id, ignoring status.
 
@@ -121,42 +181,33 @@ class MemoryOutboxWriter:
         """
         conn = self._ensure_conn()
         row = conn.execute(
-            "SELECT id, key, payload, enqueued_at, attempts, last_error, status "
-            "FROM memory_outbox WHERE id = ?",
+            f"SELECT {_ROW_COLUMNS} FROM memory_outbox WHERE id = ?",
             [row_id],
         ).fetchone()
         if row is None:
             return None
-        return MemoryOutboxRow(
-            id=row[0],
-            key=row[1],
-            payload=json.loads(row[2]),
-            enqueued_at=row[3],
-            attempts=row[4],
-            last_error=row[5],
-            status=cast("OutboxStatus", row[6]),
-        )
+        return _row_from_record(row)
 
     async def pending_batch(self, limit: int) -> list[MemoryOutboxRow]:
+        rows, _ = await self.pending_window(limit)
+        return rows
+
+    async def pending_window(self, limit: int) -> tuple[list[MemoryOutboxRow], int]:
+        """Return the oldest ``limit`` pending rows and the total pending count.
+
+        Both come from one query (a window count over the pending set), so a
+        drain pass needs no separate ``pending_count()`` round trip.
+        """
         conn = self._ensure_conn()
-        rows = conn.execute(
-            "SELECT id, key, payload, enqueued_at, attempts, last_error, status "
+        records = conn.execute(
+            f"SELECT {_ROW_COLUMNS}, COUNT(*) OVER () AS pending_total "
             "FROM memory_outbox WHERE status = 'pending' "
             "ORDER BY enqueued_at, id LIMIT ?",
             [limit],
         ).fetchall()
-        return [
-            MemoryOutboxRow(
-                id=r[0],
-                key=r[1],
-                payload=json.loads(r[2]),
-                enqueued_at=r[3],
-                attempts=r[4],
-                last_error=r[5],
-                status=cast("OutboxStatus", r[6]),
-            )
-            for r in rows
-        ]
+        if not records:
+            return [], 0
+        return [_row_from_record(r) for r in records], int(records[0][7])
 
     def close(self) -> None:
         if self._conn is not None:
@@ -232,6 +232,10 @@ class RunPodPool(BasePool):
         logger.info("Collected %d memory items from RunPodPool %s", len(items), self.pool_id)
         return items
 
+    async def memory_count(self) -> int:
+        # collect_memory() drains the buffer; counting must not.
+        return len(self._task_results)
+
     async def stop(self) -> None:
         logger.info("Stopping RunPodPool %s...", self.pool_id)
         self._endpoint = None
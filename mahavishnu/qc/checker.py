@@ -1,13 +1,36 @@
-"""Quality Control (QC) integration for Mahavishnu."""
+"""Quality Control (QC) integration for Mahavishnu.
 
+Repositories are checked concurrently (at most ``qc.max_concurrent_checks``
+Crackerjack calls in flight) and results for clean git trees are cached by
+(repository, tree hash, check set), so post-checks and repeated gates skip
+repositories that have not changed. ``iter_repo_checks`` yields each
+repository's result as soon as it is ready, which lets workflows start
+repositories that passed before the whole gate has finished.
+
+Usage:
+    qc = QualityControl(config)
+
+    report = await qc.run_pre_checks(repos)
+
+    async for result in qc.iter_repo_checks(repos):
+        if result.passed:
+            ...
+"""
+
+import asyncio
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
 import json
 import logging
+import subprocess
 from typing import Any, cast
 
 import httpx
 
 from ..core.config import MahavishnuSettings
 from ..core.errors import ExternalServiceError, TimeoutError
+from ..core.http_clients import CRACKERJACK, get_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +46,36 @@ def _score_from_result(result: dict[str, Any], min_score: int) -> int:
     return max(0, raw)
 
 
+def _tree_key(repo: str) -> str | None:
+    """Tree hash of a clean git work tree; None if dirty or not a git repo (never cached)."""
+
+    def git(*args: str) -> str | None:
+        try:
+            result = subprocess.run(
+                ["git", "-C", repo, *args], capture_output=True, text=True, check=False
+            )
+        except OSError:
+            return None
+        return result.stdout if result.returncode == 0 else None
+
+    tree = git("rev-parse", "HEAD^{tree}")
+    status = git("status", "--porcelain")
+    if tree is None or status is None or status.strip():
+        return None
+    return tree.strip()
+
+
+@dataclass
+class RepoCheckResult:
+    """QC outcome for one repository."""
+
+    repo: str
+    checks: dict[str, Any] = field(default_factory=dict)
+    score: int = 100
+    passed: bool = True
+    cached: bool = False
+
+
 class QualityControl:
     """Quality control integration with Crackerjack."""
 
@@ -31,14 +84,20 @@ class QualityControl:
         self.enabled = config.qc.enabled
         self.min_score = config.qc.min_score
         self.checks = getattr(config, "qc_checks", None) or list(config.qc.checks)
+        self.max_concurrent_checks = config.qc.max_concurrent_checks
+        self.cache_size = config.qc.cache_size
         self._base_url = config.qc.crackerjack_url
-        self._client = httpx.AsyncClient(timeout=120.0)
+        self._timeout = 120.0
+        self._cache: OrderedDict[tuple[str, str, frozenset[str]], tuple[dict[str, Any], int]] = (
+            OrderedDict()
+        )
 
     async def _call_mcp(self, tool_name: str, arguments: dict[str, Any]) -> dict[str, Any]:
         try:
-            response = await self._client.post(
+            response = await get_http_client(CRACKERJACK).post(
                 f"{self._base_url}{_TOOLS_CALL_PATH}",
                 json={"name": tool_name, "arguments": arguments},
+                timeout=self._timeout,
             )
             response.raise_for_status()
             return cast("dict[str, Any]", response.json())
@@ -63,7 +122,7 @@ class QualityControl:
     async def is_healthy(self) -> bool:
         health_url = self._base_url.replace("/mcp", "/health")
         try:
-            r = await self._client.get(health_url, timeout=5.0)
+            r = await get_http_client(CRACKERJACK).get(health_url, timeout=5.0)
             return r.status_code == 200
         except (httpx.HTTPError, httpx.TransportError):
             return False
@@ -113,6 +172,60 @@ class QualityControl:
             }
             return per_check, 0
 
+    async def _check_repo(self, repo: str, checks: list[str]) -> RepoCheckResult:
+        """Check one repo, serving clean, already-checked trees from the cache."""
+        tree = await asyncio.to_thread(_tree_key, repo) if self.cache_size else None
+        key = (repo, tree or "", frozenset(checks))
+
+        cached = tree is not None and key in self._cache
+        if cached:
+            self._cache.move_to_end(key)
+            per_check, score = self._cache[key]
+            per_check = {check: per_check[check] for check in checks}
+        else:
+            per_check, score = await self._run_checks_for_repo(repo, checks)
+            degraded = any(result.get("status") == "error" for result in per_check.values())
+            if tree is not None and not degraded:
+                self._cache[key] = (per_check, score)
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+
+        return RepoCheckResult(
+            repo=repo,
+            checks=per_check,
+            score=score,
+            passed=score >= self.min_score,
+            cached=cached,
+        )
+
+    async def iter_repo_checks(
+        self, repos: list[str], checks: list[str] | None = None
+    ) -> AsyncIterator[RepoCheckResult]:
+        """Check repos concurrently, yielding each result as soon as it is ready."""
+        if not self.enabled:
+            for repo in repos:
+                yield RepoCheckResult(repo=repo)
+            return
+
+        checks_to_run = checks if checks is not None else self.checks
+        semaphore = asyncio.Semaphore(self.max_concurrent_checks)
+
+        async def check(repo: str) -> RepoCheckResult:
+            async with semaphore:
+                return await self._check_repo(repo, checks_to_run)
+
+        pending = [asyncio.ensure_future(check(repo)) for repo in repos]
+        try:
+            for next_done in asyncio.as_completed(pending):
+                yield await next_done
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def clear_cache(self) -> None:
+        """Forget cached results so every repo is re-checked."""
+        self._cache.clear()
+
     async def run_pre_checks(
         self, repos: list[str], checks: list[str] | None = None
     ) -> dict[str, Any]:
@@ -120,20 +233,16 @@ class QualityControl:
             return {"enabled": False, "score": 100, "checks": [], "passed": True}
 
         checks_to_run = checks if checks is not None else self.checks
-        individual_results: dict[str, Any] = {}
-        scores: list[int] = []
-
-        for repo in repos:
-            per_check, score = await self._run_checks_for_repo(repo, checks_to_run)
-            individual_results[repo] = per_check
-            scores.append(score)
+        results = {r.repo: r async for r in self.iter_repo_checks(repos, checks_to_run)}
+        scores = [results[repo].score for repo in repos]
 
         overall = min(scores) if scores else 100
         return {
             "enabled": True,
             "checks": checks_to_run,
             "repos_checked": repos,
-            "individual_results": individual_results,
+            "individual_results": {repo: results[repo].checks for repo in repos},
+            "cached_repos": [repo for repo in results if results[repo].cached],
             "score": overall,
             "passed": overall >= self.min_score,
         }
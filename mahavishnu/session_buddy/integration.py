@@ -7,6 +7,8 @@ from typing import Any
 from mcp_common.code_graph import CodeGraphAnalyzer
 from messaging.types import Priority, ProjectMessage
 
+from mahavishnu.core.code_index.analysis_cache import get_code_graph_cache
+
 
 class SessionBuddyIntegration:
     """Integration with Session Buddy for development session tracking and quality metrics."""
@@ -20,9 +22,10 @@ class SessionBuddyIntegration:
     async def integrate_code_graph(self, repo_path: str) -> dict[str, Any]:
         """Integrate code graph analysis with Session Buddy."""
         try:
-            # Analyze the repository using the code graph analyzer
-            analyzer = CodeGraphAnalyzer(Path(repo_path))
-            analysis_result = await analyzer.analyze_repository(repo_path)
+            # Analyze the repository (served from the shared cache when unchanged)
+            analysis = await get_code_graph_cache().analyze(repo_path, CodeGraphAnalyzer)
+            analyzer = analysis.analyzer
+            analysis_result = analysis.stats
 
             # Extract relevant information for Session Buddy
             code_context = {
@@ -124,9 +127,9 @@ class SessionBuddyIntegration:
     async def get_related_code(self, repo_path: str, file_path: str) -> dict[str, Any]:
         """Get related code based on imports/calls using code graph."""
         try:
-            # Analyze the repository if not already analyzed
-            analyzer = CodeGraphAnalyzer(Path(repo_path))
-            await analyzer.analyze_repository(repo_path)
+            # Analyze the repository (served from the shared cache when unchanged)
+            analysis = await get_code_graph_cache().analyze(repo_path, CodeGraphAnalyzer)
+            analyzer = analysis.analyzer
 
             # Find related files using the code graph analyzer
             related_files = await analyzer.find_related_files(file_path)
@@ -144,9 +147,9 @@ class SessionBuddyIntegration:
     async def get_function_context(self, repo_path: str, function_name: str) -> dict[str, Any]:
         """Get context for a specific function using code graph."""
         try:
-            # Analyze the repository if not already analyzed
-            analyzer = CodeGraphAnalyzer(Path(repo_path))
-            await analyzer.analyze_repository(repo_path)
+            # Analyze the repository (served from the shared cache when unchanged)
+            analysis = await get_code_graph_cache().analyze(repo_path, CodeGraphAnalyzer)
+            analyzer = analysis.analyzer
 
             # Get function context using the code graph analyzer
             context = await analyzer.get_function_context(function_name)
@@ -160,8 +163,8 @@ class SessionBuddyIntegration:
         """Extract docstrings and index for semantic search."""
         try:
             # Analyze the repository to extract docstrings
-            analyzer = CodeGraphAnalyzer(Path(repo_path))
-            _analysis_result = await analyzer.analyze_repository(repo_path)
+            analysis = await get_code_graph_cache().analyze(repo_path, CodeGraphAnalyzer)
+            analyzer = analysis.analyzer
 
             # Extract docstrings from functions and classes
             documentation = []
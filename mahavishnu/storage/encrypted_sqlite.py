@@ -14,19 +14,50 @@ Architecture:
 - Application-level encryption (database pages encrypted before storage)
 - Compatible with standard sqlite3 module
 - Graceful degradation if encryption unavailable (with warning)
+
+Storage formats:
+- ``file`` (default): the whole database is one Fernet token, decrypted into
+  memory on connect and re-encrypted in full on close.
+- ``chunked``: the database is split into fixed-size AES-256-GCM chunks, each
+  authenticated with the file id, its index and the sync epoch it was
+  written in. The header carries the current epoch and a digest of the
+  per-chunk epoch table, so a chunk record replayed from an older sync fails
+  authentication on load. Connect streams the chunks into the working file,
+  ``commit()`` re-encrypts only the chunks touched by the pages in the WAL
+  (in a worker thread), and every connection to the same file (including
+  ``EncryptedSQLitePool`` connections) shares one decrypted working copy.
+  A sync only proceeds once the WAL is fully checkpointed, and it is
+  crash-safe: the bytes it is about to overwrite are first saved to an undo
+  journal next to the ``.enc`` file, and a connect that finds a journal
+  rolls an uncommitted sync back. Existing ``file``-format databases are
+  converted on first connect.
+
+Usage:
+    db = EncryptedSQLite(get_data_path("code_graph.db"), chunked=True)
+    await db.connect()
+    db.execute("INSERT INTO nodes VALUES (?, ?)", (node_id, payload))
+    await db.commit()  # re-encrypts the dirty chunks only
+    await db.close()
 """
 
 import asyncio
 import base64
+import hashlib
 import logging
 import os
 from pathlib import Path
 import shutil
 import sqlite3
+import struct
+import threading
+import time
 from typing import Any
 
+from cryptography.exceptions import InvalidTag
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 
 logger = logging.getLogger(__name__)
@@ -36,6 +67,385 @@ class EncryptionKeyError(Exception):
     """Raised when encryption key is invalid or missing."""
 
 
+# =============================================================================
+# CHUNKED FORMAT
+# =============================================================================
+
+CHUNK_MAGIC = b"MHVCHK2\x00"
+DEFAULT_CHUNK_SIZE = 256 * 1024
+
+# magic, chunk size, file id, plaintext size, sync epoch, digest of the
+# per-chunk epoch table; followed by a GCM nonce and a tag that
+# authenticates these fields.
+_CHUNK_HEADER = struct.Struct(">8sI16sQQ16s")
+_EPOCH = struct.Struct(">Q")
+_NONCE_SIZE = 12
+_TAG_SIZE = 16
+_CHUNK_HEADER_SIZE = _CHUNK_HEADER.size + _NONCE_SIZE + _TAG_SIZE
+
+# Undo journal written before a sync touches the ``.enc`` file: magic,
+# pre-sync file length (or -1 if there was no file), length of the new
+# header; then the new header, then (offset, length, old bytes) entries,
+# then a digest of everything before it.
+_JOURNAL_MAGIC = b"MHVJRN1\x00"
+_JOURNAL_HEADER = struct.Struct(">8sqI")
+_JOURNAL_ENTRY = struct.Struct(">QI")
+_JOURNAL_DIGEST_SIZE = 16
+
+_WAL_MAGICS = (0x377F0682, 0x377F0683)
+_WAL_HEADER = struct.Struct(">IIIIII")
+_WAL_HEADER_SIZE = 32
+_WAL_FRAME_HEADER = struct.Struct(">IIII")
+_WAL_FRAME_HEADER_SIZE = 24
+
+# A TRUNCATE checkpoint cannot finish while another connection reads from
+# the WAL; retry with a growing pause before giving up.
+_CHECKPOINT_ATTEMPTS = 5
+_CHECKPOINT_RETRY_DELAY = 0.05
+
+
+def _chunk_digest(data: bytes) -> bytes:
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _journal_path(enc_path: Path) -> Path:
+    return enc_path.with_name(enc_path.name + ".journal")
+
+
+def _fsync_dir(path: Path) -> None:
+    """Make a file creation or removal in ``path`` durable (no-op where unsupported)."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _is_chunked_file(path: Path) -> bool:
+    """Return True if ``path`` holds a chunked-format encrypted database."""
+    try:
+        with open(path, "rb") as f:
+            return f.read(len(CHUNK_MAGIC)) == CHUNK_MAGIC
+    except FileNotFoundError:
+        return False
+
+
+def _wal_dirty_pages(wal_path: Path) -> tuple[set[int], int] | None:
+    """Return the page numbers written to a SQLite WAL and the page size.
+
+    Only frame headers are read. Frames left over from before the last WAL
+    reset carry stale salts and end the scan. Returns ``None`` if the WAL
+    header is unrecognized, so the caller can fall back to a full scan.
+    """
+    try:
+        with open(wal_path, "rb") as f:
+            header = f.read(_WAL_HEADER_SIZE)
+            if len(header) < _WAL_HEADER_SIZE:
+                return set(), 0
+            magic, _, page_size, _, salt1, salt2 = _WAL_HEADER.unpack_from(header)
+            if magic not in _WAL_MAGICS:
+                return None
+            pages: set[int] = set()
+            while True:
+                frame = f.read(_WAL_FRAME_HEADER_SIZE)
+                if len(frame) < _WAL_FRAME_HEADER_SIZE:
+                    break
+                page_no, _, frame_salt1, frame_salt2 = _WAL_FRAME_HEADER.unpack_from(frame)
+                if (frame_salt1, frame_salt2) != (salt1, salt2):
+                    break
+                pages.add(page_no)
+                f.seek(page_size, os.SEEK_CUR)
+            return pages, page_size
+    except FileNotFoundError:
+        return set(), 0
+
+
+class _ChunkedStore:
+    """Chunked AES-GCM ``.enc`` file plus digests of the synced plaintext.
+
+    Layout: an authenticated header, then one fixed-size record per chunk
+    (nonce, ciphertext of the zero-padded chunk, tag), then the epoch table
+    (one big-endian u64 per chunk). Chunk ``i`` lives at a fixed offset, so
+    a dirty chunk is rewritten in place; its AAD binds the epoch of the sync
+    that wrote it, and the header authenticates the table.
+
+    In-place writes are guarded by an undo journal: ``sync`` saves the old
+    bytes of every region it overwrites before writing, writes the header
+    last, and removes the journal once the header is durable. ``recover``
+    undoes a sync that never wrote its header.
+    """
+
+    def __init__(self, enc_path: Path, key: bytes, chunk_size: int) -> None:
+        self.enc_path = enc_path
+        self.chunk_size = chunk_size
+        self.file_id = os.urandom(16)
+        self.size = 0
+        self.epoch = 0
+        self.chunk_epochs: list[int] = []
+        self.digests: list[bytes] = []
+        self.chunks_written = 0
+        self._aead = AESGCM(key)
+
+    @property
+    def journal_path(self) -> Path:
+        return _journal_path(self.enc_path)
+
+    @property
+    def record_size(self) -> int:
+        return _NONCE_SIZE + self.chunk_size + _TAG_SIZE
+
+    def _chunk_count(self, size: int) -> int:
+        return -(-size // self.chunk_size)
+
+    def _record_offset(self, index: int) -> int:
+        return _CHUNK_HEADER_SIZE + index * self.record_size
+
+    def _aad(self, index: int, epoch: int) -> bytes:
+        return self.file_id + index.to_bytes(8, "big") + epoch.to_bytes(8, "big")
+
+    def _epoch_table(self) -> bytes:
+        return b"".join(_EPOCH.pack(epoch) for epoch in self.chunk_epochs)
+
+    def _header(self, table: bytes) -> bytes:
+        fields = _CHUNK_HEADER.pack(
+            CHUNK_MAGIC,
+            self.chunk_size,
+            self.file_id,
+            self.size,
+            self.epoch,
+            _chunk_digest(table),
+        )
+        nonce = os.urandom(_NONCE_SIZE)
+        return fields + nonce + self._aead.encrypt(nonce, b"", fields)
+
+    def recover(self) -> bool:
+        """Finish or undo a sync interrupted by a crash.
+
+        A journal whose new header is on disk belongs to a committed sync and
+        is just removed. Otherwise the saved bytes are written back and the
+        file is cut to its pre-sync length. A journal that is itself
+        incomplete was interrupted before the ``.enc`` file was touched.
+
+        Returns:
+            True if an interrupted sync was rolled back
+        """
+        try:
+            journal = self.journal_path.read_bytes()
+        except FileNotFoundError:
+            return False
+
+        body = journal[:-_JOURNAL_DIGEST_SIZE]
+        intact = (
+            len(journal) > _JOURNAL_HEADER.size + _JOURNAL_DIGEST_SIZE
+            and _chunk_digest(body) == journal[-_JOURNAL_DIGEST_SIZE:]
+        )
+        rolled_back = False
+        if intact:
+            magic, old_length, header_size = _JOURNAL_HEADER.unpack_from(body)
+            offset = _JOURNAL_HEADER.size
+            new_header = body[offset : offset + header_size]
+            offset += header_size
+            try:
+                with open(self.enc_path, "rb") as f:
+                    committed = f.read(len(new_header)) == new_header
+            except FileNotFoundError:
+                committed = False
+            if magic == _JOURNAL_MAGIC and not committed:
+                if old_length < 0:
+                    self.enc_path.unlink(missing_ok=True)
+                else:
+                    with open(self.enc_path, "r+b") as f:
+                        while offset < len(body):
+                            position, length = _JOURNAL_ENTRY.unpack_from(body, offset)
+                            offset += _JOURNAL_ENTRY.size
+                            f.seek(position)
+                            f.write(body[offset : offset + length])
+                            offset += length
+                        f.truncate(old_length)
+                        f.flush()
+                        os.fsync(f.fileno())
+                rolled_back = True
+                logger.warning(f"Rolled back an interrupted sync of {self.enc_path}")
+        self._remove_journal()
+        return rolled_back
+
+    def _write_journal(
+        self, regions: list[tuple[int, int]], old_length: int, header: bytes
+    ) -> None:
+        """Save the current bytes of ``regions`` (offset, length) before they are overwritten."""
+        parts = [_JOURNAL_HEADER.pack(_JOURNAL_MAGIC, old_length, len(header)), header]
+        if old_length >= 0:
+            with open(self.enc_path, "rb") as f:
+                for position, length in regions:
+                    f.seek(position)
+                    old = f.read(length)
+                    parts.append(_JOURNAL_ENTRY.pack(position, len(old)) + old)
+        body = b"".join(parts)
+        with open(self.journal_path, "wb") as f:
+            f.write(body + _chunk_digest(body))
+            f.flush()
+            os.fsync(f.fileno())
+        _fsync_dir(self.journal_path.parent)
+
+    def _remove_journal(self) -> None:
+        self.journal_path.unlink(missing_ok=True)
+        _fsync_dir(self.journal_path.parent)
+
+    def decrypt_to(self, plain_path: Path) -> None:
+        """Stream-decrypt the ``.enc`` file into ``plain_path``, one chunk at a time.
+
+        Raises:
+            EncryptionKeyError: If the header, the epoch table or any chunk
+                fails authentication
+        """
+        with open(self.enc_path, "rb") as src, open(plain_path, "wb") as dst:
+            try:
+                raw = src.read(_CHUNK_HEADER_SIZE)
+                fields = raw[: _CHUNK_HEADER.size]
+                _, chunk_size, file_id, size, epoch, table_digest = _CHUNK_HEADER.unpack(fields)
+                nonce = raw[_CHUNK_HEADER.size : _CHUNK_HEADER.size + _NONCE_SIZE]
+                self._aead.decrypt(nonce, raw[_CHUNK_HEADER.size + _NONCE_SIZE :], fields)
+                self.chunk_size, self.file_id, self.size = chunk_size, file_id, size
+
+                count = self._chunk_count(size)
+                src.seek(self._record_offset(count))
+                table = src.read(count * _EPOCH.size)
+                if len(table) != count * _EPOCH.size or _chunk_digest(table) != table_digest:
+                    raise ValueError("chunk epoch table does not match the header")
+                chunk_epochs = [e for (e,) in _EPOCH.iter_unpack(table)]
+                if any(chunk_epoch > epoch for chunk_epoch in chunk_epochs):
+                    raise ValueError("chunk epoch is newer than the header epoch")
+                src.seek(_CHUNK_HEADER_SIZE)
+
+                digests: list[bytes] = []
+                remaining = size
+                for index in range(count):
+                    record = src.read(self.record_size)
+                    padded = self._aead.decrypt(
+                        record[:_NONCE_SIZE],
+                        record[_NONCE_SIZE:],
+                        self._aad(index, chunk_epochs[index]),
+                    )
+                    chunk = padded[: min(remaining, chunk_size)]
+                    dst.write(chunk)
+                    digests.append(_chunk_digest(chunk))
+                    remaining -= len(chunk)
+            except (InvalidTag, struct.error, ValueError) as e:
+                raise EncryptionKeyError(
+                    f"Database decryption failed: {e!r}. Check encryption key is correct."
+                ) from e
+        self.epoch, self.chunk_epochs = epoch, chunk_epochs
+        self.digests = digests
+
+    def chunks_for_pages(self, pages: set[int], page_size: int) -> set[int]:
+        """Map 1-based SQLite page numbers to the chunk indexes they overlap."""
+        chunks: set[int] = set()
+        for page_no in pages:
+            start = (page_no - 1) * page_size
+            end = start + page_size - 1
+            chunks.update(range(start // self.chunk_size, end // self.chunk_size + 1))
+        return chunks
+
+    def sync(self, plain_path: Path, candidates: set[int] | None = None) -> int:
+        """Re-encrypt the chunks of ``plain_path`` that changed since the last sync.
+
+        Args:
+            plain_path: Decrypted working file
+            candidates: Chunk indexes that may have changed; ``None`` scans
+                every chunk. Chunks past the previously synced size are always
+                included, and unchanged content is skipped by digest.
+
+        Returns:
+            Number of chunks written
+        """
+        size = plain_path.stat().st_size if plain_path.exists() else 0
+        count = self._chunk_count(size)
+        digests = self.digests[:count] + [b""] * max(0, count - len(self.digests))
+        chunk_epochs = self.chunk_epochs[:count] + [0] * max(0, count - len(self.chunk_epochs))
+        epoch = self.epoch + 1
+        if candidates is None:
+            indexes: list[int] = list(range(count))
+        else:
+            boundary = {self._chunk_count(self.size) - 1} if size != self.size else set()
+            indexes = sorted(
+                i
+                for i in candidates | boundary | set(range(len(self.digests), count))
+                if 0 <= i < count
+            )
+
+        dirty: list[int] = []
+        with open(plain_path, "rb") as src:
+            for index in indexes:
+                src.seek(index * self.chunk_size)
+                chunk = src.read(self.chunk_size)
+                digest = _chunk_digest(chunk)
+                if digest != digests[index]:
+                    dirty.append(index)
+                    digests[index] = digest
+                    chunk_epochs[index] = epoch
+
+        previous = (self.size, self.epoch, self.chunk_epochs)
+        self.size, self.epoch, self.chunk_epochs = size, epoch, chunk_epochs
+        table = self._epoch_table()
+        header = self._header(table)
+        self.size, self.epoch, self.chunk_epochs = previous
+
+        # Everything this sync overwrites inside the current file: the header,
+        # rewritten records, and the old table (or records cut off by a shrink).
+        old_length = self.enc_path.stat().st_size if self.enc_path.exists() else -1
+        kept = self._chunk_count(self.size) if old_length >= 0 else 0
+        tail = self._record_offset(min(kept, count))
+        regions = [(0, _CHUNK_HEADER_SIZE)]
+        regions += [(self._record_offset(i), self.record_size) for i in dirty if i < kept]
+        regions.append((tail, max(0, old_length - tail)))
+        self._write_journal(regions, old_length, header)
+
+        mode = "r+b" if old_length >= 0 else "w+b"
+        with open(plain_path, "rb") as src, open(self.enc_path, mode) as dst:
+            for index in dirty:
+                src.seek(index * self.chunk_size)
+                nonce = os.urandom(_NONCE_SIZE)
+                padded = src.read(self.chunk_size).ljust(self.chunk_size, b"\x00")
+                dst.seek(self._record_offset(index))
+                dst.write(nonce + self._aead.encrypt(nonce, padded, self._aad(index, epoch)))
+            dst.seek(self._record_offset(count))
+            dst.write(table)
+            dst.truncate(self._record_offset(count) + len(table))
+            dst.flush()
+            os.fsync(dst.fileno())
+            # The header commits the sync, so it only goes out once the
+            # records and table it authenticates are durable.
+            dst.seek(0)
+            dst.write(header)
+            dst.flush()
+            os.fsync(dst.fileno())
+        self._remove_journal()
+
+        written = len(dirty)
+        self.size, self.epoch, self.chunk_epochs = size, epoch, chunk_epochs
+        self.digests = digests
+        self.chunks_written += written
+        return written
+
+
+class _WorkingCopy:
+    """Decrypted working file shared by every open connection to one ``.enc`` file."""
+
+    def __init__(self, store: _ChunkedStore) -> None:
+        self.store = store
+        self.refs = 0
+        self.lock = threading.RLock()
+
+
+_working_copies: dict[Path, _WorkingCopy] = {}
+_working_copies_lock = threading.Lock()
+
+
 class EncryptedSQLite:
     """Encrypted SQLite database using application-level AES-256 encryption.
 
@@ -74,6 +484,8 @@ class EncryptedSQLite:
         encryption_key: str | None = None,
         key_env_var: str = "SQLCIPHER_KEY",
         require_encryption: bool = True,
+        chunked: bool = False,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
     ):
         """Initialize encrypted SQLite database.
 
@@ -84,6 +496,10 @@ class EncryptedSQLite:
             key_env_var: Environment variable name for encryption key
             require_encryption: If True, fail without encryption key
                               If False, use plaintext SQLite with warning
+            chunked: Store the database in the chunked format (see module
+                     docstring). Chunked files are always read as chunked.
+            chunk_size: Plaintext bytes per chunk for newly written chunked
+                        files; a multiple of the SQLite page size works best
 
         Raises:
             EncryptionKeyError: If key is invalid/missing and require_encryption=True
@@ -92,11 +508,15 @@ class EncryptedSQLite:
         self.enc_path = self.db_path.with_suffix(self.db_path.suffix + ".enc")
         self.enc_path.parent.mkdir(parents=True, exist_ok=True)
         self.require_encryption = require_encryption
+        self.chunked = chunked
+        self.chunk_size = chunk_size
 
         # Get encryption key
         self.encryption_key = encryption_key or os.environ.get(key_env_var)
         self._fernet: Fernet | None = None
+        self._chunk_key: bytes | None = None
         self._using_encryption = False
+        self._working_copy: _WorkingCopy | None = None
 
         # Validate key if required
         if self.encryption_key:
@@ -105,7 +525,11 @@ class EncryptedSQLite:
                     f"Encryption key too short ({len(self.encryption_key)} chars). "
                     f"Minimum 32 characters recommended for AES-256 security."
                 )
-            self._fernet = self._create_fernet(self.encryption_key)
+            key = self._derive_key(self.encryption_key)
+            self._fernet = Fernet(base64.urlsafe_b64encode(key))
+            self._chunk_key = HKDF(
+                algorithm=hashes.SHA256(), length=32, salt=None, info=b"mahavishnu-chunked-v1"
+            ).derive(key)
             self._using_encryption = True
         elif require_encryption:
             raise EncryptionKeyError(
@@ -125,6 +549,17 @@ class EncryptedSQLite:
             f"encryption={'enabled' if self._using_encryption else 'disabled'})"
         )
 
+    @staticmethod
+    def _derive_key(password: str) -> bytes:
+        """Derive the 32-byte database key from a password using PBKDF2."""
+        kdf = PBKDF2HMAC(
+            algorithm=hashes.SHA256(),
+            length=32,
+            salt=b"mahavishnu_sql_encryption",  # Fixed salt for reproducibility
+            iterations=100000,
+        )
+        return kdf.derive(password.encode())
+
     @staticmethod
     def _create_fernet(password: str) -> Fernet:
         """Create Fernet cipher from password using PBKDF2.
@@ -135,15 +570,7 @@ class EncryptedSQLite:
         Returns:
             Fernet cipher instance
         """
-        # Use PBKDF2 to derive key from password
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=b"mahavishnu_sql_encryption",  # Fixed salt for reproducibility
-            iterations=100000,
-        )
-        key = base64.urlsafe_b64encode(kdf.derive(password.encode()))
-        return Fernet(key)
+        return Fernet(base64.urlsafe_b64encode(EncryptedSQLite._derive_key(password)))
 
     def _decrypt_database(self) -> bool:
         """Decrypt database file from encrypted storage.
@@ -239,6 +666,12 @@ class EncryptedSQLite:
             logger.warning("Database already connected")
             return
 
+        if self._using_encryption and (
+            self.chunked or _is_chunked_file(self.enc_path) or _journal_path(self.enc_path).exists()
+        ):
+            await self._connect_chunked()
+            return
+
         try:
             # Decrypt database if encryption enabled
             if self._using_encryption:
@@ -248,15 +681,7 @@ class EncryptedSQLite:
                     logger.debug(f"No encrypted database found at {self.enc_path}, creating new")
 
             # Connect to (decrypted) database
-            self._conn = sqlite3.connect(str(self.db_path))
-            self._conn.row_factory = sqlite3.Row  # Return dict-like rows
-
-            # Enable optimizations
-            cursor = self._conn.cursor()
-            cursor.execute("PRAGMA journal_mode=WAL")
-            cursor.execute("PRAGMA synchronous=NORMAL")
-            cursor.execute("PRAGMA cache_size=-10000")  # 10MB cache
-            self._conn.commit()
+            self._open_connection()
 
             logger.info(f"Connected to encrypted database: {self.db_path}")
 
@@ -277,6 +702,146 @@ class EncryptedSQLite:
 
             raise
 
+    def _open_connection(self) -> None:
+        # Chunked commits checkpoint and sync in a worker thread, serialized
+        # by the working copy lock.
+        self._conn = sqlite3.connect(
+            str(self.db_path), check_same_thread=self._working_copy is None
+        )
+        self._conn.row_factory = sqlite3.Row  # Return dict-like rows
+
+        # Enable optimizations
+        cursor = self._conn.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA cache_size=-10000")  # 10MB cache
+        if self._working_copy is not None:
+            # Dirty pages are read from the WAL, so only sync() may checkpoint.
+            cursor.execute("PRAGMA wal_autocheckpoint=0")
+        self._conn.commit()
+
+    async def _connect_chunked(self) -> None:
+        """Join (or create) the shared working copy and open a connection on it.
+
+        The first connection streams the chunks into the working file;
+        later connections reuse it without decrypting anything.
+        """
+        if self._chunk_key is None:
+            raise RuntimeError(
+                "invariant violated: _chunk_key must be set when _using_encryption is True"
+            )
+
+        key = self.enc_path.resolve()
+        with _working_copies_lock:
+            working_copy = _working_copies.get(key)
+            if working_copy is None:
+                store = _ChunkedStore(self.enc_path, self._chunk_key, self.chunk_size)
+                try:
+                    store.recover()
+                    if _is_chunked_file(self.enc_path):
+                        logger.debug(f"Streaming chunks: {self.enc_path} → {self.db_path}")
+                        store.decrypt_to(self.db_path)
+                    elif self.enc_path.exists():
+                        # File-format database: decrypt once, then rewrite as chunks.
+                        self._decrypt_database()
+                        store.sync(self.db_path)
+                        logger.info(f"Converted {self.enc_path} to the chunked format")
+                except EncryptionKeyError:
+                    logger.error("Failed to connect to database: wrong encryption key")
+                    self.db_path.unlink(missing_ok=True)
+                    raise
+                working_copy = _WorkingCopy(store)
+                _working_copies[key] = working_copy
+            working_copy.refs += 1
+            self._working_copy = working_copy
+
+        try:
+            self._open_connection()
+        except sqlite3.DatabaseError:
+            self._conn = None
+            self._release_working_copy()
+            raise
+
+        logger.info(
+            f"Connected to chunked encrypted database: {self.db_path} "
+            f"({working_copy.refs} open connections)"
+        )
+
+    def _checkpoint(self, conn: sqlite3.Connection) -> None:
+        """Move every WAL frame into the working file and truncate the WAL.
+
+        Raises:
+            sqlite3.OperationalError: If readers still hold WAL frames after
+                all retries; nothing is re-encrypted in that case, and the
+                next sync picks the same pages up from the WAL again
+        """
+        busy, log_frames, checkpointed = 0, 0, 0
+        for attempt in range(_CHECKPOINT_ATTEMPTS):
+            busy, log_frames, checkpointed = conn.execute(
+                "PRAGMA wal_checkpoint(TRUNCATE)"
+            ).fetchone()
+            if not busy and checkpointed == log_frames:
+                return
+            time.sleep(_CHECKPOINT_RETRY_DELAY * (attempt + 1))
+        raise sqlite3.OperationalError(
+            f"WAL checkpoint of {self.db_path} incomplete after {_CHECKPOINT_ATTEMPTS} "
+            f"attempts ({checkpointed}/{log_frames} frames, busy={busy})"
+        )
+
+    def _sync_chunks(self) -> int:
+        """Checkpoint the WAL and re-encrypt the chunks its pages touched.
+
+        Must be called with the working copy lock held.
+
+        Raises:
+            sqlite3.OperationalError: If the WAL could not be fully checkpointed
+        """
+        if self._conn is None or self._working_copy is None:
+            return 0
+
+        journal_mode = self._conn.execute("PRAGMA journal_mode").fetchone()[0]
+        wal = _wal_dirty_pages(Path(f"{self.db_path}-wal")) if journal_mode == "wal" else None
+        self._checkpoint(self._conn)
+
+        store = self._working_copy.store
+        candidates = None if wal is None else store.chunks_for_pages(*wal)
+        written = store.sync(self.db_path, candidates)
+        if written:
+            logger.debug(f"Re-encrypted {written} dirty chunk(s) of {self.enc_path}")
+        return written
+
+    def _release_working_copy(self) -> bool:
+        """Drop this instance's reference; returns True if it was the last one."""
+        working_copy, self._working_copy = self._working_copy, None
+        if working_copy is None:
+            return False
+        with _working_copies_lock:
+            working_copy.refs -= 1
+            if working_copy.refs > 0:
+                return False
+            _working_copies.pop(self.enc_path.resolve(), None)
+        for path in (self.db_path, Path(f"{self.db_path}-wal"), Path(f"{self.db_path}-shm")):
+            path.unlink(missing_ok=True)
+        return True
+
+    async def _close_chunked(self) -> None:
+        working_copy = self._working_copy
+        if working_copy is None:
+            return
+
+        def sync_and_close() -> None:
+            with working_copy.lock:
+                if self._conn is not None:
+                    if working_copy.refs == 1:
+                        self._sync_chunks()
+                    self._conn.close()
+                    self._conn = None
+                if self._release_working_copy():
+                    logger.debug("Plaintext working copy removed after final sync")
+
+        await asyncio.to_thread(sync_and_close)
+        logger.info("Database connection closed and encrypted")
+
     async def close(self) -> None:
         """Close database connection and encrypt storage.
 
@@ -284,7 +849,14 @@ class EncryptedSQLite:
         1. Close SQLite connection
         2. Encrypt database file to .enc
         3. Delete plaintext database file
+
+        In the chunked format the dirty chunks are synced and the working
+        copy is removed only when the last connection sharing it closes.
         """
+        if self._working_copy is not None:
+            await self._close_chunked()
+            return
+
         # Close connection
         if self._conn:
             self._conn.close()
@@ -332,9 +904,29 @@ class EncryptedSQLite:
         return self._conn.executemany(sql, parameters)
 
     async def commit(self) -> None:
-        """Commit transaction."""
+        """Commit transaction.
+
+        In the chunked format the chunks dirtied by the commit are
+        re-encrypted in a worker thread before returning, so the ``.enc``
+        file is durable and the event loop keeps running meanwhile.
+
+        Raises:
+            sqlite3.OperationalError: In the chunked format, if the WAL could
+                not be fully checkpointed; the transaction is committed to the
+                working copy and is encrypted by the next successful sync
+        """
         if self._conn:
-            self._conn.commit()
+            if self._working_copy is None:
+                self._conn.commit()
+                return
+            working_copy = self._working_copy
+
+            def commit_and_sync() -> None:
+                with working_copy.lock:
+                    self.connection.commit()
+                    self._sync_chunks()
+
+            await asyncio.to_thread(commit_and_sync)
 
     async def rollback(self) -> None:
         """Rollback transaction."""
@@ -398,8 +990,20 @@ class EncryptedSQLite:
 
         logger.info(f"Creating encrypted backup: {enc_backup_path}")
 
+        if self._working_copy is not None:
+            # Sync, then stream-copy the chunks under the lock so no commit
+            # rewrites them mid-copy.
+            working_copy = self._working_copy
+
+            def copy_synced() -> None:
+                with working_copy.lock:
+                    self._sync_chunks()
+                    shutil.copyfile(self.enc_path, enc_backup_path)
+
+            await asyncio.to_thread(copy_synced)
+
         # If encryption enabled, copy encrypted file directly
-        if self._using_encryption and self.enc_path.exists():
+        elif self._using_encryption and self.enc_path.exists():
             shutil.copy2(self.enc_path, enc_backup_path)
         else:
             # Fallback to SQLite backup API
@@ -470,6 +1074,10 @@ class EncryptedSQLite:
 
         logger.info(f"Restoring from encrypted backup: {backup_path}")
 
+        if self._working_copy is not None:
+            await self._restore_chunked(backup_path)
+            return
+
         # Close current connection
         await self.close()
 
@@ -488,11 +1096,40 @@ class EncryptedSQLite:
 
         logger.info(f"Restore complete: {self.db_path}")
 
+    async def _restore_chunked(self, backup_path: Path) -> None:
+        """Replace the chunked ``.enc`` file with ``backup_path`` without buffering it."""
+        if self._working_copy is not None and self._working_copy.refs > 1:
+            raise RuntimeError(
+                "Cannot restore while other connections share this database; close them first"
+            )
+        if self._chunk_key is None:
+            raise RuntimeError(
+                "invariant violated: _chunk_key must be set when _using_encryption is True"
+            )
+
+        await self.close()
+
+        # A leftover journal belongs to the file being replaced.
+        _journal_path(self.enc_path).unlink(missing_ok=True)
+        if backup_path.suffix == ".enc":
+            # Chunked backups are used as-is; file-format ones convert on connect.
+            await asyncio.to_thread(shutil.copyfile, backup_path, self.enc_path)
+        else:
+            self.enc_path.unlink(missing_ok=True)
+            store = _ChunkedStore(self.enc_path, self._chunk_key, self.chunk_size)
+            await asyncio.to_thread(store.sync, backup_path)
+
+        await self.connect()
+
+        logger.info(f"Restore complete: {self.db_path}")
+
 
 class EncryptedSQLitePool:
     """Connection pool for encrypted SQLite databases.
 
-    Provides connection pooling and automatic reconnection.
+    Provides connection pooling and automatic reconnection. With
+    ``chunked=True`` every pooled connection shares one decrypted working
+    copy, so acquiring a new connection does not decrypt the database again.
     """
 
     def __init__(
@@ -501,6 +1138,8 @@ class EncryptedSQLitePool:
         encryption_key: str | None = None,
         pool_size: int = 5,
         require_encryption: bool = True,
+        chunked: bool = False,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
     ):
         """Initialize connection pool.
 
@@ -509,11 +1148,15 @@ class EncryptedSQLitePool:
             encryption_key: Encryption key (or from env var)
             pool_size: Maximum number of connections
             require_encryption: Require encryption or allow plaintext fallback
+            chunked: Use the chunked storage format for new connections
+            chunk_size: Plaintext bytes per chunk for newly written files
         """
         self.db_path = Path(db_path)
         self.encryption_key = encryption_key
         self.pool_size = pool_size
         self.require_encryption = require_encryption
+        self.chunked = chunked
+        self.chunk_size = chunk_size
         self._pool: list[EncryptedSQLite] = []
 
         logger.info(f"EncryptedSQLitePool initialized (pool_size={pool_size})")
@@ -537,6 +1180,8 @@ class EncryptedSQLitePool:
             self.db_path,
             self.encryption_key,
             require_encryption=self.require_encryption,
+            chunked=self.chunked,
+            chunk_size=self.chunk_size,
         )
         await conn.connect()
         return conn
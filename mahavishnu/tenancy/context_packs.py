@@ -174,24 +174,24 @@ def get_default_tenant_id() -> str:
 # on a class) so that downstream code can call a single entry point without
 # committing to a specific publisher implementation. When the substrate
 # lands, the body becomes a POST to ``/tenants/<tenant_id>/context-versions``
-# via ``httpx.AsyncClient``:
+# via the shared Dhara client from ``mahavishnu.core.http_clients`` (pooled
+# keep-alive connections; do not open or close a client per call):
 #
-#     import httpx
-#     async with httpx.AsyncClient(
-#         base_url=os.environ.get("MAHAVISHNU_DHARA_URL", "http://localhost:8683"),
-#         timeout=httpx.Timeout(5.0),
-#     ) as client:
-#         resp = await client.post(
-#             f"/tenants/{tenant_id}/context-versions",
-#             json={
-#                 "version": pack.version,
-#                 "content_hash": pack.content_hash,
-#                 "body": pack.body,
-#                 "published_by": pack.published_by,
-#                 "published_at": pack.published_at.isoformat(),
-#             },
-#         )
-#         resp.raise_for_status()
+#     from mahavishnu.core.http_clients import DHARA, get_http_client
+#
+#     dhara_url = os.environ.get("MAHAVISHNU_DHARA_URL", "http://localhost:8683")
+#     resp = await get_http_client(DHARA).post(
+#         f"{dhara_url}/tenants/{tenant_id}/context-versions",
+#         json={
+#             "version": pack.version,
+#             "content_hash": pack.content_hash,
+#             "body": pack.body,
+#             "published_by": pack.published_by,
+#             "published_at": pack.published_at.isoformat(),
+#         },
+#         timeout=5.0,
+#     )
+#     resp.raise_for_status()
 #
 # Until then, this call site is a TODO marker that imports cleanly and
 # fails loudly if anything routes through it accidentally.
@@ -520,15 +520,20 @@ async def fetch_diff_views(paths: tuple[str, ...] = _COCKPIT_FILES) -> list[dict
 
 _tui_log = logging.getLogger(__name__)
 
+# Shared pooled client for component health probes; httpx keeps a
+# keep-alive pool per origin inside it, so one key covers every component.
+_HEALTH_CLIENT = "tui_health"
+
 
 async def _probe_service(base_url: str) -> bool:
     """Return True if the service responds to GET /health with status < 500."""
     import httpx
 
+    from mahavishnu.core.http_clients import get_http_client
+
     try:
-        async with httpx.AsyncClient(timeout=3.0) as client:
-            resp = await client.get(f"{base_url}/health")
-            return resp.status_code < 500
+        resp = await get_http_client(_HEALTH_CLIENT).get(f"{base_url}/health", timeout=3.0)
+        return resp.status_code < 500
     except (httpx.ConnectError, httpx.TimeoutException, httpx.NetworkError):
         return False
     except Exception:  # noqa: BLE001 - boundary handler catches all errors to keep calling code alive
@@ -585,18 +590,19 @@ async def _fetch_health(base_url: str) -> dict[str, Any]:
     """GET /health from *base_url*; return parsed JSON or a dict with ``available=False``."""
     import httpx
 
+    from mahavishnu.core.http_clients import get_http_client
+
     try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            resp = await client.get(f"{base_url}/health")
-            if resp.status_code in (401, 403):
-                return {
-                    "available": False,
-                    "reason": f"HTTP {resp.status_code} — check credentials",
-                }
-            if resp.status_code >= 500:
-                return {"available": False, "reason": f"HTTP {resp.status_code} — server error"}
-            data = resp.json()
-            return {"available": True, **(data if isinstance(data, dict) else {"raw": str(data)})}
+        resp = await get_http_client(_HEALTH_CLIENT).get(f"{base_url}/health", timeout=5.0)
+        if resp.status_code in (401, 403):
+            return {
+                "available": False,
+                "reason": f"HTTP {resp.status_code} — check credentials",
+            }
+        if resp.status_code >= 500:
+            return {"available": False, "reason": f"HTTP {resp.status_code} — server error"}
+        data = resp.json()
+        return {"available": True, **(data if isinstance(data, dict) else {"raw": str(data)})}
     except (httpx.ConnectError, httpx.TimeoutException, httpx.NetworkError):
         return {"available": False, "reason": "unreachable"}
     except Exception:  # noqa: BLE001 - boundary handler catches all errors to keep calling code alive
@@ -9,6 +9,8 @@ from urllib.parse import urlparse
 
 import httpx
 
+from mahavishnu.core.http_clients import EXTERNAL, get_http_client
+
 from ._safe import safe_error_for_user
 from ._states import WorkerCheck
 
@@ -36,13 +38,13 @@ async def _probe_openclaw_gateway(endpoint: str, token: str | None) -> WorkerChe
     if scheme_error is not None:
         return WorkerCheck("openclaw_gateway", "fail", scheme_error)
     try:
-        async with httpx.AsyncClient(timeout=5) as client:
-            r = await client.get(
-                f"{endpoint.rstrip('/')}/health",
-                headers={"Authorization": f"Bearer {token}"} if token else {},
-            )
-            r.raise_for_status()
-            p = r.json()
+        r = await get_http_client(EXTERNAL).get(
+            f"{endpoint.rstrip('/')}/health",
+            headers={"Authorization": f"Bearer {token}"} if token else {},
+            timeout=5,
+        )
+        r.raise_for_status()
+        p = r.json()
     except (httpx.HTTPError, ValueError, OSError) as exc:
         return WorkerCheck("openclaw_gateway", "fail", type(exc).__name__)
     return WorkerCheck(
@@ -108,9 +110,10 @@ async def _probe_provider_request(provider: str, env_var: str, endpoint: str) ->
     if scheme_error is not None:
         return WorkerCheck(f"{provider}_auth", "fail", scheme_error)
     try:
-        async with httpx.AsyncClient(timeout=5) as client:
-            r = await client.get(endpoint, headers={"Authorization": f"Bearer {token}"})
-            r.raise_for_status()
+        r = await get_http_client(EXTERNAL).get(
+            endpoint, headers={"Authorization": f"Bearer {token}"}, timeout=5
+        )
+        r.raise_for_status()
     except httpx.HTTPError as exc:
         return WorkerCheck(f"{provider}_auth", "fail", safe_error_for_user(type(exc).__name__))
     return WorkerCheck(f"{provider}_auth", "pass", "ok")
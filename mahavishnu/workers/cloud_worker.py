@@ -19,6 +19,7 @@ from typing import Any
 import httpx
 from mcp_common.llm import FallbackChain, LLMSettings
 
+from mahavishnu.core.http_clients import OLLAMA, get_http_client
 from mahavishnu.core.status import WorkerStatus
 
 from .base import BaseWorker, WorkerResult
@@ -193,10 +194,9 @@ class CloudWorker(BaseWorker):
             return False
         for url in ("http://localhost:11434", "http://localhost:8081"):
             try:
-                async with httpx.AsyncClient(timeout=1.0) as client:
-                    response = await client.get(url)
-                    if response.status_code < 500:
-                        return True
+                response = await get_http_client(OLLAMA).get(url, timeout=1.0)
+                if response.status_code < 500:
+                    return True
             except httpx.HTTPError:
                 continue
         return False
@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 import asyncio
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from itertools import islice
 import logging
 import os
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from monitoring.metrics import (
     agent_task_duration_seconds,
@@ -27,6 +30,27 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Worker states after which a polled worker produces no further results.
+TERMINAL_WORKER_STATUSES = frozenset(
+    {WorkerStatus.COMPLETED, WorkerStatus.FAILED, WorkerStatus.TIMEOUT, WorkerStatus.CANCELLED}
+)
+
+
+@dataclass
+class WorkerResultBatch:
+    """Results recorded after a cursor.
+
+    Attributes:
+        results: Results in the order they were recorded
+        cursor: Sequence number to pass as ``cursor`` on the next call
+        truncated: True if results after the given cursor were already
+            dropped from the bounded result journal
+    """
+
+    results: list[WorkerResult] = field(default_factory=list)
+    cursor: int = 0
+    truncated: bool = False
+
 
 def _create_isolated_worker(
     worker_type: str,
@@ -81,8 +105,17 @@ class WorkerManager:
         session_buddy_client: Optional Session-Buddy MCP client
         mcp_client: Optional MCP client for application workers
         settings: Optional MahavishnuSettings used for capability evaluation
+
+    Results are also appended to a bounded journal with increasing sequence
+    numbers, so pollers can call :meth:`collect_results_since` with the
+    cursor from their previous call instead of rebuilding every result.
     """
 
+    # Results retained for cursor-based collection
+    RESULT_LOG_MAX: ClassVar[int] = 10_000
+    # Concurrent get_progress() calls while collecting results
+    PROGRESS_CONCURRENCY: ClassVar[int] = 32
+
     def __init__(
         self,
         terminal_manager: TerminalManager,
@@ -109,6 +142,15 @@ class WorkerManager:
         self._workers: dict[str, BaseWorker] = {}
         self._semaphore = asyncio.Semaphore(self.max_concurrent)
 
+        # Result journal for cursor-based collection
+        self._result_log: deque[tuple[int, WorkerResult]] = deque(maxlen=self.RESULT_LOG_MAX)
+        self._result_seq = 0
+        self._result_counts: Counter[str] = Counter()
+        # Manager keys whose latest result is already journaled, and keys with
+        # an execute_task() call running; polling skips both
+        self._settled_workers: set[str] = set()
+        self._in_flight: Counter[str] = Counter()
+
         logger.info(f"Initialized WorkerManager (max_concurrent={self.max_concurrent})")
 
     def list_worker_ids(self) -> list[str]:
@@ -394,6 +436,24 @@ class WorkerManager:
         worker_type = getattr(worker, "worker_type", "unknown")
         adapter = "worker_manager"
 
+        # Keep collect_results_since() from polling and journaling this
+        # worker while its result is still being produced here.
+        self._in_flight[worker_id] += 1
+        try:
+            return await self._execute_on(worker, worker_id, task, worker_type, adapter)
+        finally:
+            self._in_flight[worker_id] -= 1
+            if not self._in_flight[worker_id]:
+                del self._in_flight[worker_id]
+
+    async def _execute_on(
+        self,
+        worker: BaseWorker,
+        worker_id: str,
+        task: dict[str, Any],
+        worker_type: str,
+        adapter: str,
+    ) -> WorkerResult:
         async with self._semaphore:
             agent_tasks_in_progress.labels(agent_type=worker_type, adapter=adapter).inc()
             try:
@@ -412,6 +472,7 @@ class WorkerManager:
                     f"Worker {worker_id} completed: {result.status.value} "
                     f"({result.duration_seconds:.2f}s)"
                 )
+                self._record_result(result, worker_id)
                 return result
             except Exception as e:  # noqa: BLE001 - boundary preserves structured backend failure handling
                 logger.error(f"Worker {worker_id} failed: {e}")
@@ -433,6 +494,7 @@ class WorkerManager:
                     agent_type=worker_type,
                     adapter=adapter,
                 ).observe(failure_result.duration_seconds)
+                self._record_result(failure_result, worker_id)
                 return failure_result
             finally:
                 agent_tasks_in_progress.labels(agent_type=worker_type, adapter=adapter).dec()
@@ -507,6 +569,9 @@ class WorkerManager:
     ) -> dict[str, WorkerResult]:
         """Collect results from completed workers.
 
+        Worker progress is fetched concurrently, at most
+        ``PROGRESS_CONCURRENCY`` calls at a time.
+
         Args:
             worker_ids: List of worker IDs (None = all workers)
 
@@ -516,40 +581,130 @@ class WorkerManager:
         if worker_ids is None:
             worker_ids = list(self._workers.keys())
 
-        results = {}
+        polled = await self._poll_results(worker_ids)
 
-        for wid in worker_ids:
-            worker = self._workers.get(wid)
-            if worker:
-                try:
-                    # Get final output/status
-                    progress = await worker.get_progress()
-
-                    # Build result from progress
-                    status = WorkerStatus(progress.get("status", "unknown"))
-                    results[wid] = WorkerResult(
-                        worker_id=wid,
-                        status=status,
-                        output=progress.get("output_preview"),
-                        error=None,
-                        exit_code=0 if status == WorkerStatus.COMPLETED else 1,
-                        duration_seconds=progress.get("duration_seconds", 0),
-                        metadata=progress,
-                    )
-                except Exception as e:  # noqa: BLE001 - boundary preserves structured backend failure handling
-                    logger.error(f"Failed to collect result from {wid}: {e}")
-                    results[wid] = WorkerResult(
-                        worker_id=wid,
-                        status=WorkerStatus.FAILED,
-                        output=None,
-                        error=str(e),
-                        exit_code=None,
-                        duration_seconds=0,
-                        metadata={"error": str(e)},
-                    )
+        results = {}
+        for wid, outcome in polled.items():
+            if isinstance(outcome, BaseException):
+                logger.error(f"Failed to collect result from {wid}: {outcome}")
+                results[wid] = WorkerResult(
+                    worker_id=wid,
+                    status=WorkerStatus.FAILED,
+                    output=None,
+                    error=str(outcome),
+                    exit_code=None,
+                    duration_seconds=0,
+                    metadata={"error": str(outcome)},
+                )
+            else:
+                results[wid] = outcome
 
         return results
 
+    async def collect_results_since(
+        self,
+        cursor: int = 0,
+        *,
+        poll: bool = True,
+    ) -> WorkerResultBatch:
+        """Return results recorded after ``cursor``.
+
+        Results from :meth:`execute_task` are journaled as they complete.
+        With ``poll=True``, workers without a journaled result (for example
+        one-shot workers from :meth:`submit_workers`) are polled concurrently
+        and journaled once they reach a terminal status; settled workers are
+        not polled again.
+
+        Args:
+            cursor: ``cursor`` from the previous batch (0 = from the start)
+            poll: Poll unsettled workers before reading the journal
+
+        Returns:
+            WorkerResultBatch with the new results and the next cursor
+
+        Example:
+            ```python
+            batch = await worker_mgr.collect_results_since(0)
+            ...
+            batch = await worker_mgr.collect_results_since(batch.cursor)
+            ```
+        """
+        if poll:
+            pending = [wid for wid in self._workers if not self._is_settled(wid)]
+            for wid, outcome in (await self._poll_results(pending)).items():
+                if isinstance(outcome, BaseException):
+                    logger.warning(f"Failed to poll progress from {wid}: {outcome}")
+                elif outcome.status in TERMINAL_WORKER_STATUSES and not self._is_settled(wid):
+                    # Re-checked: execute_task() may have journaled it mid-poll
+                    self._record_result(outcome, wid)
+
+        first_seq = self._result_log[0][0] if self._result_log else self._result_seq + 1
+        start = max(0, cursor - first_seq + 1)
+        return WorkerResultBatch(
+            results=[result for _, result in islice(self._result_log, start, None)],
+            cursor=self._result_seq,
+            truncated=cursor < first_seq - 1,
+        )
+
+    def result_counts(self) -> dict[str, int]:
+        """Return running result counters without touching any worker.
+
+        Returns:
+            ``{"total": n, <status>: count, ...}`` over every recorded result
+        """
+        return {"total": self._result_seq, **self._result_counts}
+
+    def _is_settled(self, worker_id: str) -> bool:
+        return worker_id in self._settled_workers or worker_id in self._in_flight
+
+    def _record_result(self, result: WorkerResult, worker_id: str | None = None) -> None:
+        """Journal ``result`` and settle ``worker_id``.
+
+        ``worker_id`` is the manager key from :meth:`start`, which can differ
+        from ``result.worker_id`` (e.g. "a2a" or a session id); it defaults
+        to the latter.
+        """
+        self._result_seq += 1
+        self._result_log.append((self._result_seq, result))
+        self._result_counts[result.status.value] += 1
+        self._settled_workers.add(worker_id or result.worker_id)
+
+    async def _poll_results(
+        self,
+        worker_ids: list[str],
+    ) -> dict[str, WorkerResult | BaseException]:
+        """Build results from ``get_progress()`` of known workers, concurrently.
+
+        At most ``PROGRESS_CONCURRENCY`` calls are in flight; a failing worker
+        maps to its exception instead of aborting the poll.
+        """
+        limit = asyncio.Semaphore(self.PROGRESS_CONCURRENCY)
+
+        async def poll(wid: str, worker: BaseWorker) -> WorkerResult:
+            async with limit:
+                progress = await worker.get_progress()
+            return self._result_from_progress(wid, progress)
+
+        known = [(wid, self._workers[wid]) for wid in worker_ids if wid in self._workers]
+        outcomes = await asyncio.gather(
+            *(poll(wid, worker) for wid, worker in known),
+            return_exceptions=True,
+        )
+        return {wid: outcome for (wid, _), outcome in zip(known, outcomes, strict=True)}
+
+    @staticmethod
+    def _result_from_progress(wid: str, progress: dict[str, Any]) -> WorkerResult:
+        status = WorkerStatus(progress.get("status", "unknown"))
+        return WorkerResult(
+            worker_id=wid,
+            status=status,
+            output=progress.get("output_preview"),
+            error=None,
+            exit_code=0 if status == WorkerStatus.COMPLETED else 1,
+            duration_seconds=progress.get("duration_seconds", 0),
+            metadata=progress,
+        )
+
     async def close_worker(self, worker_id: str) -> None:
         """Close a specific worker.
 
@@ -565,6 +720,7 @@ class WorkerManager:
                 logger.error(f"Failed to close worker {worker_id}: {e}")
             finally:
                 self._workers.pop(worker_id, None)
+                self._settled_workers.discard(worker_id)
 
     async def close_all(self) -> None:
         """Close all active workers."""
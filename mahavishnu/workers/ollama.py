@@ -11,6 +11,15 @@ Features:
 - Configurable generation parameters
 - Connection health monitoring
 - Session-Buddy integration for result storage
+- Cached model catalog: routing reads ``/api/tags`` at most once per
+  ``catalog_ttl`` (stale entries are refreshed in the background, and
+  pulling a model invalidates the catalog)
+- Streaming generation with time-to-first-token in the result metadata
+
+Usage:
+    worker = OllamaWorker(OllamaConfig(stream=True))
+    result = await worker.execute({"prompt": "Explain this traceback", "on_token": print})
+    result.metadata["time_to_first_token_ms"]
 """
 
 from __future__ import annotations
@@ -18,10 +27,11 @@ from __future__ import annotations
 import asyncio
 from dataclasses import dataclass
 from enum import StrEnum
+import json
 import logging
 import re
 import time
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import httpx
 
@@ -29,6 +39,9 @@ from mahavishnu.core.status import WorkerStatus
 
 from .base import BaseWorker, WorkerResult
 
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable
+
 logger = logging.getLogger(__name__)
 
 
@@ -161,6 +174,9 @@ class OllamaConfig:
         keep_alive: How long to keep model loaded
         intelligent_routing: Enable automatic model selection based on task type
         model_routing: Custom model routing configuration (category -> model)
+        catalog_ttl: Seconds the cached model list is served before a
+            background refresh
+        stream: Stream tokens by default (tasks can override with "stream")
     """
 
     base_url: str = "http://localhost:11434"
@@ -174,6 +190,8 @@ class OllamaConfig:
     keep_alive: str = "5m"
     intelligent_routing: bool = True
     model_routing: dict[TaskCategory, str] | None = None
+    catalog_ttl: float = 300.0
+    stream: bool = False
 
     def get_model_for_category(self, category: TaskCategory) -> str:
         """Get the appropriate model for a task category.
@@ -318,6 +336,11 @@ class OllamaWorker(BaseWorker):
         self.session_buddy_client = session_buddy_client
         self._client: httpx.AsyncClient | None = None
         self._start_time: float | None = None
+        self._catalog: list[dict[str, Any]] | None = None
+        self._catalog_fetched_at = 0.0
+        self._catalog_refresh: asyncio.Task[list[dict[str, Any]]] | None = None
+        # Bumped on invalidation so an in-flight fetch does not store its result
+        self._catalog_generation = 0
 
     async def start(self, *, prompt: str | None = None) -> str:
         """Initialize the Ollama worker.
@@ -347,8 +370,8 @@ class OllamaWorker(BaseWorker):
                 f"Ollama server not available at {self.config.base_url}. Start with: ollama serve"
             )
 
-        # Verify model exists
-        models = await self._list_models()
+        # Verify model exists (and seed the model catalog)
+        models = await self._refresh_catalog()
         model_names = [m.get("name", "") for m in models]
 
         if self.config.model not in model_names:
@@ -385,6 +408,8 @@ class OllamaWorker(BaseWorker):
                     - has_image: bool - task involves image processing
                     - file_type: str - MIME type of input file
                     - embedding: bool - task needs embedding model
+                - stream: Stream tokens (default: config.stream)
+                - on_token: Optional callable invoked with each streamed token
 
         Returns:
             WorkerResult with execution results
@@ -405,6 +430,8 @@ class OllamaWorker(BaseWorker):
         temperature = task.get("temperature", self.config.temperature)
         use_raw = task.get("raw", False)
         task_context = task.get("context")
+        stream = task.get("stream", self.config.stream)
+        on_token = task.get("on_token")
 
         # Intelligent model selection (unless explicitly specified)
         explicit_model = task.get("model")
@@ -413,8 +440,8 @@ class OllamaWorker(BaseWorker):
             task_category = TaskCategory.GENERAL
             logger.info(f"Using explicitly specified model: {model}")
         elif self.config.intelligent_routing:
-            # Get available models for intelligent routing
-            available_models = [m.get("name", "") for m in await self._list_models()]
+            # Get available models for intelligent routing (cached catalog)
+            available_models = [m.get("name", "") for m in await self._get_catalog()]
             model, task_category = get_model_for_task(
                 prompt=prompt,
                 available_models=available_models,
@@ -430,7 +457,12 @@ class OllamaWorker(BaseWorker):
 
         try:
             # Build request based on API type
-            if use_raw:
+            if use_raw and stream:
+                chunks = self._generate_stream(prompt=prompt, model=model, temperature=temperature)
+                response = await asyncio.wait_for(
+                    self._collect_stream(chunks, start_time, on_token), timeout=timeout
+                )
+            elif use_raw:
                 # Use generate API for raw completion
                 response = await asyncio.wait_for(
                     self._generate(prompt=prompt, model=model, temperature=temperature),
@@ -443,10 +475,18 @@ class OllamaWorker(BaseWorker):
                     messages.append({"role": "system", "content": system})
                 messages.append({"role": "user", "content": prompt})
 
-                response = await asyncio.wait_for(
-                    self._chat(messages=messages, model=model, temperature=temperature),
-                    timeout=timeout,
-                )
+                if stream:
+                    chunks = self._chat_stream(
+                        messages=messages, model=model, temperature=temperature
+                    )
+                    response = await asyncio.wait_for(
+                        self._collect_stream(chunks, start_time, on_token), timeout=timeout
+                    )
+                else:
+                    response = await asyncio.wait_for(
+                        self._chat(messages=messages, model=model, temperature=temperature),
+                        timeout=timeout,
+                    )
 
             output = response.get("response", "")
             duration = time.time() - start_time
@@ -465,6 +505,8 @@ class OllamaWorker(BaseWorker):
                     "temperature": temperature,
                     "api_type": "generate" if use_raw else "chat",
                     "intelligent_routing": self.config.intelligent_routing and not explicit_model,
+                    "streamed": bool(stream),
+                    "time_to_first_token_ms": response.get("time_to_first_token_ms"),
                 },
             )
 
@@ -554,7 +596,7 @@ class OllamaWorker(BaseWorker):
             if self._client:
                 ollama_available = await self._is_available()
                 if ollama_available:
-                    models = await self._list_models()
+                    models = await self._refresh_catalog()
                     model_available = any(m.get("name") == self.config.model for m in models)
 
             return {
@@ -598,17 +640,69 @@ class OllamaWorker(BaseWorker):
         data = response.json()
         return data.get("models", [])  # type: ignore[no-any-return]
 
+    async def _refresh_catalog(self) -> list[dict[str, Any]]:
+        """Fetch the model list and store it as the cached catalog.
+
+        A fetch that was invalidated while in flight still returns its
+        models to its waiters, but leaves the cache to its replacement.
+        """
+        generation = self._catalog_generation
+        models = await self._list_models()
+        if generation == self._catalog_generation:
+            self._catalog = models
+            self._catalog_fetched_at = time.monotonic()
+        return models
+
+    def _start_catalog_refresh(self) -> asyncio.Task[list[dict[str, Any]]]:
+        """Start a catalog fetch unless one is already in flight; return it."""
+        if self._catalog_refresh is None or self._catalog_refresh.done():
+            self._catalog_refresh = asyncio.create_task(self._refresh_catalog())
+            self._catalog_refresh.add_done_callback(self._log_catalog_refresh)
+        return self._catalog_refresh
+
+    @staticmethod
+    def _log_catalog_refresh(refresh: asyncio.Task[list[dict[str, Any]]]) -> None:
+        if not refresh.cancelled() and (error := refresh.exception()):
+            logger.debug(f"Ollama model catalog refresh failed: {error}")
+
+    async def _get_catalog(self) -> list[dict[str, Any]]:
+        """Available models from the cached catalog.
+
+        A fresh catalog is served from memory; a stale one is served as-is
+        while a background fetch replaces it. Without a catalog, callers
+        wait on a single shared fetch.
+        """
+        if self._catalog is None:
+            return await asyncio.shield(self._start_catalog_refresh())
+        if time.monotonic() - self._catalog_fetched_at >= self.config.catalog_ttl:
+            self._start_catalog_refresh()
+        return self._catalog
+
+    def _invalidate_catalog(self) -> None:
+        """Drop the cached catalog so the next lookup refetches it.
+
+        An in-flight fetch is detached rather than cancelled: callers already
+        waiting on it (through ``asyncio.shield``) get its result instead of a
+        ``CancelledError``, and the next lookup starts a replacement.
+        """
+        self._catalog = None
+        self._catalog_generation += 1
+        self._catalog_refresh = None
+
     async def _pull_model(self, model_name: str) -> bool:
         """Pull a model from Ollama registry."""
         if not self._client:
             return False
-        response = await self._client.post(
-            "/api/pull",
-            json={"name": model_name, "stream": False},
-            timeout=600.0,
-        )
-        response.raise_for_status()
-        return response.json().get("status") == "success"  # type: ignore[no-any-return]
+        try:
+            response = await self._client.post(
+                "/api/pull",
+                json={"name": model_name, "stream": False},
+                timeout=600.0,
+            )
+            response.raise_for_status()
+            return response.json().get("status") == "success"  # type: ignore[no-any-return]
+        finally:
+            self._invalidate_catalog()
 
     async def _generate(
         self,
@@ -626,13 +720,7 @@ class OllamaWorker(BaseWorker):
                 "model": model,
                 "prompt": prompt,
                 "stream": False,
-                "options": {
-                    "temperature": temperature,
-                    "num_ctx": self.config.num_ctx,
-                    "num_predict": self.config.num_predict,
-                    "top_p": self.config.top_p,
-                    "top_k": self.config.top_k,
-                },
+                "options": self._options(temperature),
                 "keep_alive": self.config.keep_alive,
             },
         )
@@ -655,13 +743,7 @@ class OllamaWorker(BaseWorker):
                 "model": model,
                 "messages": messages,
                 "stream": False,
-                "options": {
-                    "temperature": temperature,
-                    "num_ctx": self.config.num_ctx,
-                    "num_predict": self.config.num_predict,
-                    "top_p": self.config.top_p,
-                    "top_k": self.config.top_k,
-                },
+                "options": self._options(temperature),
                 "keep_alive": self.config.keep_alive,
             },
         )
@@ -678,8 +760,102 @@ class OllamaWorker(BaseWorker):
             "eval_duration": data.get("eval_duration"),
         }
 
+    def _options(self, temperature: float) -> dict[str, Any]:
+        return {
+            "temperature": temperature,
+            "num_ctx": self.config.num_ctx,
+            "num_predict": self.config.num_predict,
+            "top_p": self.config.top_p,
+            "top_k": self.config.top_k,
+        }
+
+    async def _stream_chunks(
+        self, path: str, payload: dict[str, Any]
+    ) -> AsyncIterator[dict[str, Any]]:
+        """POST with ``stream: true`` and yield each newline-delimited JSON chunk."""
+        if not self._client:
+            raise RuntimeError("Client not initialized")
+
+        async with self._client.stream("POST", path, json=payload | {"stream": True}) as response:
+            response.raise_for_status()
+            async for line in response.aiter_lines():
+                if not line.strip():
+                    continue
+                chunk = json.loads(line)
+                if chunk.get("error"):
+                    raise RuntimeError(f"Ollama stream error: {chunk['error']}")
+                yield chunk
+
+    async def _generate_stream(
+        self,
+        prompt: str,
+        model: str,
+        temperature: float,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream a completion from the generate API, one chunk per token."""
+        payload = {
+            "model": model,
+            "prompt": prompt,
+            "options": self._options(temperature),
+            "keep_alive": self.config.keep_alive,
+        }
+        async for chunk in self._stream_chunks("/api/generate", payload):
+            yield chunk
+
+    async def _chat_stream(
+        self,
+        messages: list[dict[str, str]],
+        model: str,
+        temperature: float,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream a chat completion, normalized to generate-style chunks."""
+        payload = {
+            "model": model,
+            "messages": messages,
+            "options": self._options(temperature),
+            "keep_alive": self.config.keep_alive,
+        }
+        async for chunk in self._stream_chunks("/api/chat", payload):
+            message = chunk.pop("message", None) or {}
+            yield chunk | {"response": message.get("content", "")}
+
+    async def _collect_stream(
+        self,
+        chunks: AsyncIterator[dict[str, Any]],
+        start_time: float,
+        on_token: Callable[[str], Any] | None = None,
+    ) -> dict[str, Any]:
+        """Drain a token stream into a response dict with time-to-first-token."""
+        tokens: list[str] = []
+        first_token_at: float | None = None
+        final: dict[str, Any] = {}
+
+        async for chunk in chunks:
+            token = chunk.get("response", "")
+            if token:
+                if first_token_at is None:
+                    first_token_at = time.time()
+                tokens.append(token)
+                if on_token is not None:
+                    on_token(token)
+            if chunk.get("done"):
+                final = chunk
+
+        return {
+            "model": final.get("model", ""),
+            "response": "".join(tokens),
+            "done": bool(final),
+            "total_duration": final.get("total_duration"),
+            "eval_count": final.get("eval_count"),
+            "eval_duration": final.get("eval_duration"),
+            "time_to_first_token_ms": (
+                (first_token_at - start_time) * 1000 if first_token_at is not None else None
+            ),
+        }
+
     async def _cleanup_client(self) -> None:
         """Clean up HTTP client."""
+        self._invalidate_catalog()
         if self._client:
             try:
                 await self._client.aclose()
@@ -0,0 +1,46 @@
+-- Task state snapshots for event replay
+-- Created: 2026-10-16
+--
+-- Applies on top of migrations/init.sql, the schema TaskStore and EventStore
+-- use (tasks and task_events keyed by UUID, events ordered by occurred_at).
+-- It is not part of the migrations/versions chain, whose orchestration.tasks
+-- and partitioned audit.task_events tables EventStore does not read.
+--
+-- EventStore.replay_task_state used to fold every event of a task through
+-- TaskState.apply_event on each call. This migration adds a snapshot table
+-- holding the serialized TaskState together with the last event it covers,
+-- so replay loads the newest snapshot and only the events after it.
+--
+-- Replay order is (occurred_at, id); a snapshot's (last_occurred_at,
+-- last_event_id) is the position of the last folded event in that order.
+
+-- =============================================================================
+-- TASK STATE SNAPSHOTS TABLE
+-- =============================================================================
+
+CREATE TABLE IF NOT EXISTS task_state_snapshots (
+    task_id UUID NOT NULL REFERENCES tasks(id) ON DELETE CASCADE,
+    -- Number of events folded into the snapshot (TaskState.version)
+    version INT NOT NULL CHECK (version >= 1),
+    last_event_id UUID NOT NULL,
+    last_occurred_at TIMESTAMPTZ NOT NULL,
+    state JSONB NOT NULL,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (task_id, version),
+    CONSTRAINT valid_snapshot_state CHECK (jsonb_typeof(state) = 'object')
+);
+
+-- Latest snapshot at or before a point in time (as_of replays)
+CREATE INDEX IF NOT EXISTS idx_task_state_snapshots_task_occurred
+    ON task_state_snapshots (task_id, last_occurred_at DESC);
+
+-- Tail reads after a snapshot walk events in replay order
+CREATE INDEX IF NOT EXISTS idx_task_events_task_replay
+    ON task_events (task_id, occurred_at, id);
+
+-- =============================================================================
+-- COMMENTS
+-- =============================================================================
+
+COMMENT ON TABLE task_state_snapshots IS
+    'Serialized TaskState per task, compacted to the newest few by EventStore';
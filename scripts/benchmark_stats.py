@@ -0,0 +1,18 @@
+"""Latency summary helpers shared by the benchmark scripts.
+
+Usage:
+    from benchmark_stats import percentile
+
+    p95 = percentile(latencies, 0.95)
+"""
+
+from __future__ import annotations
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of ``values`` (``fraction`` in [0, 1])."""
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)]
+
+
+__all__ = ["percentile"]
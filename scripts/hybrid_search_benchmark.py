@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""Hybrid Search Retrieval Mode Benchmark.
+
+Compares the two HybridSearchEngine retrieval modes on a local PostgreSQL
+with the consolidated ``search`` schema applied:
+
+- ``single_query``: one weighted ORDER BY over the documents/embeddings join
+- ``two_stage``: HNSW and GIN candidate stages, fused in Python
+
+For every query both modes run against the same embedding; the report shows
+latency percentiles per mode and the overlap of the two_stage top-k with the
+single_query top-k (recall against the exhaustive ranking).
+
+Synthetic rows are tagged ``source_type = 'benchmark'`` and removed with
+``--cleanup``.
+
+Usage:
+    python scripts/hybrid_search_benchmark.py --dsn postgresql://localhost/mahavishnu \\
+        --seed 1000000 --queries 50
+    python scripts/hybrid_search_benchmark.py --dsn ... --cleanup
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import random
+import statistics
+import time
+from typing import Any
+
+from benchmark_stats import percentile
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+logger = logging.getLogger(__name__)
+
+EMBEDDING_DIM = 384
+
+VOCABULARY = [
+    "authentication", "token", "session", "database", "pool", "index", "query", "cache",
+    "worker", "pipeline", "deploy", "rollback", "metrics", "latency", "throughput", "retry",
+    "webhook", "schema", "migration", "embedding", "vector", "search", "graph", "adapter",
+    "workflow", "repository", "branch", "review", "config", "secret", "backup", "monitor",
+]  # fmt: skip
+
+SEED_DOCUMENTS_SQL = """
+    INSERT INTO search.documents (id, source_type, title, content, repository)
+    SELECT
+        gen_random_uuid(),
+        'benchmark',
+        'benchmark document ' || g,
+        array_to_string(
+            ARRAY(
+                SELECT ($2::text[])[1 + floor(random() * array_length($2::text[], 1))::int]
+                FROM generate_series(1, 40)
+                WHERE g > 0
+            ),
+            ' '
+        ),
+        'bench-' || (g % 10)
+    FROM generate_series(1, $1) AS g;
+"""
+
+SEED_EMBEDDINGS_SQL = f"""
+    INSERT INTO search.document_embeddings (document_id, model_name, embedding_dim, embedding)
+    SELECT
+        d.id,
+        'benchmark',
+        {EMBEDDING_DIM},
+        (
+            SELECT array_agg(random() - 0.5)
+            FROM generate_series(1, {EMBEDDING_DIM})
+            WHERE d.id IS NOT NULL
+        )::vector
+    FROM search.documents d
+    LEFT JOIN search.document_embeddings e ON e.document_id = d.id
+    WHERE d.source_type = 'benchmark' AND e.document_id IS NULL;
+"""
+
+
+class _NoEmbeddings:
+    """Embedding service stand-in; the benchmark supplies query vectors itself."""
+
+    async def embed(self, texts: list[str]) -> Any:
+        raise RuntimeError("benchmark passes query embeddings directly")
+
+
+async def seed(pool: Any, count: int) -> None:
+    """Insert ``count`` synthetic documents with random embeddings."""
+    start = time.perf_counter()
+    async with pool.acquire() as conn:
+        await conn.execute(SEED_DOCUMENTS_SQL, count, VOCABULARY)
+        await conn.execute(SEED_EMBEDDINGS_SQL)
+        await conn.execute("ANALYZE search.documents")
+        await conn.execute("ANALYZE search.document_embeddings")
+    logger.info(f"Seeded {count} documents in {time.perf_counter() - start:.1f}s")
+
+
+async def cleanup(pool: Any) -> None:
+    """Remove benchmark documents (embeddings cascade)."""
+    async with pool.acquire() as conn:
+        result = await conn.execute("DELETE FROM search.documents WHERE source_type = 'benchmark'")
+    logger.info(f"Cleanup: {result}")
+
+
+async def run_benchmark(
+    pool: Any,
+    queries: int,
+    limit: int,
+    candidates: int,
+    repository: str | None,
+) -> dict[str, Any]:
+    """Time both retrieval modes on the same random queries."""
+    from mahavishnu.core.search import HybridSearchConfig, HybridSearchEngine
+
+    engines = {
+        mode: HybridSearchEngine(
+            connection_pool=pool,
+            config=HybridSearchConfig(
+                retrieval_mode=mode,
+                vector_candidates=candidates,
+                lexical_candidates=candidates,
+                min_score=0.0,
+            ),
+            embedding_service=_NoEmbeddings(),  # type: ignore[arg-type]
+        )
+        for mode in ("single_query", "two_stage")
+    }
+    latencies: dict[str, list[float]] = {mode: [] for mode in engines}
+    overlaps: list[float] = []
+
+    rng = random.Random(42)
+    for _ in range(queries):
+        text = " ".join(rng.sample(VOCABULARY, 3))
+        embedding = [rng.random() - 0.5 for _ in range(EMBEDDING_DIM)]
+
+        top_ids: dict[str, set[Any]] = {}
+        for mode, engine in engines.items():
+            start = time.perf_counter()
+            results = await engine._hybrid_search(text, embedding, repository, limit)
+            latencies[mode].append((time.perf_counter() - start) * 1000)
+            top_ids[mode] = {result.id for result in results}
+
+        if top_ids["single_query"]:
+            overlaps.append(
+                len(top_ids["single_query"] & top_ids["two_stage"]) / len(top_ids["single_query"])
+            )
+
+    report: dict[str, Any] = {
+        "queries": queries,
+        "limit": limit,
+        "candidates_per_stage": candidates,
+        "recall_at_limit": round(statistics.mean(overlaps), 3) if overlaps else None,
+    }
+    for mode, values in latencies.items():
+        report[mode] = {
+            "avg_ms": round(statistics.mean(values), 3),
+            "p50_ms": round(percentile(values, 0.5), 3),
+            "p95_ms": round(percentile(values, 0.95), 3),
+        }
+    return report
+
+
+async def _main(args: argparse.Namespace) -> None:
+    import asyncpg
+    from pgvector.asyncpg import register_vector
+
+    pool = await asyncpg.create_pool(args.dsn, min_size=2, max_size=4, init=register_vector)
+    try:
+        if args.cleanup:
+            await cleanup(pool)
+            return
+        if args.seed:
+            await seed(pool, args.seed)
+        report = await run_benchmark(
+            pool, args.queries, args.limit, args.candidates, args.repository
+        )
+    finally:
+        await pool.close()
+
+    print(json.dumps(report, indent=2))
+
+
+def main() -> None:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Hybrid Search Retrieval Mode Benchmark")
+    parser.add_argument("--dsn", required=True, help="PostgreSQL DSN with the search schema")
+    parser.add_argument("--seed", type=int, default=0, help="Synthetic documents to insert first")
+    parser.add_argument("--queries", type=int, default=50, help="Queries per mode")
+    parser.add_argument("--limit", type=int, default=20, help="Results per query")
+    parser.add_argument("--candidates", type=int, default=100, help="Two-stage candidates/stage")
+    parser.add_argument("--repository", default=None, help="Optional repository filter")
+    parser.add_argument("--cleanup", action="store_true", help="Delete benchmark rows and exit")
+    asyncio.run(_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""MessageBus Fan-Out Load Test.
+
+Publishes a stream of messages to a MessageBus with many subscribers and a
+target pool that nobody drains fast enough, then checks two things:
+
+- the number of live asyncio tasks stays bounded by the dispatcher pool
+  (sampled after every publish), and
+- every message is accounted for: each subscriber callback completed or
+  failed, and each pool message was queued, spilled or counted as dropped.
+
+Usage:
+    python scripts/message_bus_load_test.py
+    python scripts/message_bus_load_test.py --messages 100000 --subscribers 50 \\
+        --policy spill --workers 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+from pathlib import Path
+import tempfile
+import time
+from typing import Any
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+logger = logging.getLogger(__name__)
+# Per-subscribe and per-drop bus logging would drown the report.
+logging.getLogger("mahavishnu").setLevel(logging.ERROR)
+
+POOL_ID = "load-test-pool"
+
+
+async def run_load_test(
+    messages: int,
+    subscribers: int,
+    workers: int,
+    policy: str,
+    queue_size: int,
+    spool_dir: Path,
+) -> dict[str, Any]:
+    """Publish ``messages`` to ``subscribers`` handlers and reconcile the counters."""
+    from mahavishnu.mcp.protocols.message_bus import MessageBus, MessageType, OverflowPolicy
+
+    bus = MessageBus(
+        max_queue_size=queue_size,
+        dispatch_workers=workers,
+        overflow_policy=OverflowPolicy(policy),
+        block_timeout=0.0,
+        spool_dir=spool_dir,
+    )
+    calls = 0
+
+    async def handler(msg: Any) -> None:
+        nonlocal calls
+        calls += 1
+
+    for _ in range(subscribers):
+        bus.subscribe(MessageType.TASK_COMPLETED, handler)
+
+    baseline_tasks = len(asyncio.all_tasks())
+    peak_tasks = baseline_tasks
+    start = time.perf_counter()
+    for i in range(messages):
+        await bus.publish(
+            {"type": "task_completed", "target_pool_id": POOL_ID, "payload": {"i": i}}
+        )
+        peak_tasks = max(peak_tasks, len(asyncio.all_tasks()))
+    await bus.drain()
+    elapsed = time.perf_counter() - start
+
+    stats = bus.get_stats()
+    await bus.close()
+
+    dispatch = stats["dispatch"]
+    pool = stats["pools"][POOL_ID]
+    expected_calls = messages * subscribers
+    pool_outcomes = pool["queued"] + pool["spilled"] + pool["dropped_newest"]
+    pool_outcomes += pool["block_timeouts"]
+    return {
+        "messages": messages,
+        "subscribers": subscribers,
+        "policy": policy,
+        "elapsed_s": round(elapsed, 2),
+        "callbacks_per_s": round(expected_calls / elapsed),
+        "baseline_tasks": baseline_tasks,
+        "peak_tasks": peak_tasks,
+        "bounded": peak_tasks <= baseline_tasks + workers,
+        "callbacks": {
+            "expected": expected_calls,
+            "ran": calls,
+            "completed": dispatch["completed"],
+            "errors": dispatch["errors"],
+            "abandoned": dispatch["abandoned"],
+        },
+        "pool": pool,
+        "unaccounted_callbacks": expected_calls - dispatch["completed"] - dispatch["errors"],
+        "unaccounted_pool_messages": messages - pool_outcomes,
+    }
+
+
+async def _main(args: argparse.Namespace) -> None:
+    with tempfile.TemporaryDirectory(prefix="message-bus-load-") as spool_dir:
+        report = await run_load_test(
+            args.messages,
+            args.subscribers,
+            args.workers,
+            args.policy,
+            args.queue_size,
+            Path(spool_dir),
+        )
+
+    logger.info(
+        f"peak tasks {report['peak_tasks']} (baseline {report['baseline_tasks']}), "
+        f"unaccounted callbacks {report['unaccounted_callbacks']}, "
+        f"unaccounted pool messages {report['unaccounted_pool_messages']}"
+    )
+    print(json.dumps(report, indent=2))
+
+
+def main() -> None:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="MessageBus Fan-Out Load Test")
+    parser.add_argument("--messages", type=int, default=100_000, help="Messages to publish")
+    parser.add_argument("--subscribers", type=int, default=50, help="Subscribers per message")
+    parser.add_argument("--workers", type=int, default=8, help="Dispatcher workers")
+    parser.add_argument("--queue-size", type=int, default=1000, help="Target pool queue size")
+    parser.add_argument(
+        "--policy",
+        default="drop_oldest",
+        choices=["block", "drop_oldest", "drop_newest", "spill"],
+        help="Overflow policy for the target pool",
+    )
+    asyncio.run(_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""RateLimiter Per-Call Latency Benchmark.
+
+Measures ``RateLimiter.is_allowed`` latency as the number of tracked client
+keys grows. For each key count the limiter is first warmed with one request
+per key plus a short history on a sample of them, then timed on a mix of
+hot keys (the same few clients hammering) and random keys spread across the
+whole population.
+
+With per-key sliding-window counters and heap-based idle expiry the p50/p95
+columns should stay flat from 10 to 100k keys.
+
+Usage:
+    python scripts/rate_limiter_benchmark.py
+    python scripts/rate_limiter_benchmark.py --keys 10 1000 100000 --calls 50000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import random
+import statistics
+import time
+from typing import Any
+
+from benchmark_stats import percentile
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+logger = logging.getLogger(__name__)
+
+DEFAULT_KEY_COUNTS = [10, 100, 1_000, 10_000, 100_000]
+HOT_KEYS = 8
+
+
+async def run_benchmark(key_count: int, calls: int) -> dict[str, Any]:
+    """Warm a limiter with ``key_count`` clients and time ``calls`` checks."""
+    from mahavishnu.core.rate_limit import RateLimiter
+
+    # Limits high enough that every timed call walks the full allowed path.
+    limiter = RateLimiter(per_minute=10**9, per_hour=10**9, per_day=10**9, burst_size=10**9)
+    keys = [f"client-{i}" for i in range(key_count)]
+
+    start = time.perf_counter()
+    for key in keys:
+        await limiter.is_allowed(key)
+    for key in keys[: min(key_count, 1_000)]:
+        for _ in range(20):
+            await limiter.is_allowed(key)
+    warmup_s = time.perf_counter() - start
+
+    rng = random.Random(42)
+    hot = keys[:HOT_KEYS]
+    latencies: list[float] = []
+    for i in range(calls):
+        key = hot[i % len(hot)] if i % 2 else rng.choice(keys)
+        call_start = time.perf_counter()
+        await limiter.is_allowed(key)
+        latencies.append((time.perf_counter() - call_start) * 1e6)
+
+    return {
+        "keys": key_count,
+        "tracked_clients": limiter.get_stats()["total_clients"],
+        "warmup_s": round(warmup_s, 2),
+        "avg_us": round(statistics.mean(latencies), 2),
+        "p50_us": round(percentile(latencies, 0.5), 2),
+        "p95_us": round(percentile(latencies, 0.95), 2),
+        "p99_us": round(percentile(latencies, 0.99), 2),
+    }
+
+
+async def _main(args: argparse.Namespace) -> None:
+    reports = []
+    for key_count in args.keys:
+        report = await run_benchmark(key_count, args.calls)
+        logger.info(
+            f"{key_count:>7} keys: p50 {report['p50_us']}us  p95 {report['p95_us']}us  "
+            f"p99 {report['p99_us']}us"
+        )
+        reports.append(report)
+
+    print(json.dumps(reports, indent=2))
+
+
+def main() -> None:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="RateLimiter Per-Call Latency Benchmark")
+    parser.add_argument(
+        "--keys",
+        type=int,
+        nargs="+",
+        default=DEFAULT_KEY_COUNTS,
+        help="Tracked key counts to benchmark",
+    )
+    parser.add_argument("--calls", type=int, default=20_000, help="Timed calls per key count")
+    asyncio.run(_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
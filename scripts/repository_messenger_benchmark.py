@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""RepositoryMessenger Mailbox Benchmark.
+
+Fills a RepositoryMessenger with retained messages spread across many
+receiver repositories, then times ``get_messages_for_repo`` queries (plain,
+type-filtered and ``since``-bounded) against the mailbox index. The same
+queries are also answered the old way, by filtering and sorting the full
+message list, to show what the index saves.
+
+Usage:
+    python scripts/repository_messenger_benchmark.py
+    python scripts/repository_messenger_benchmark.py --repos 200 --messages 500000 --queries 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from datetime import UTC, datetime, timedelta
+import json
+import logging
+import random
+import statistics
+import time
+from types import SimpleNamespace
+from typing import Any
+
+from benchmark_stats import percentile
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+logger = logging.getLogger(__name__)
+# One info line per sent message would dominate the fill phase.
+logging.getLogger("mahavishnu").setLevel(logging.WARNING)
+
+
+def _summary(values: list[float]) -> dict[str, float]:
+    return {
+        "avg_ms": round(statistics.mean(values), 4),
+        "p50_ms": round(percentile(values, 0.5), 4),
+        "p95_ms": round(percentile(values, 0.95), 4),
+    }
+
+
+def _linear_scan(messages: list[Any], repo: str, message_type: Any, since: Any, limit: int):
+    """The pre-mailbox query: filter every message, then sort."""
+    matches = [
+        msg
+        for msg in messages
+        if msg.receiver_repo == repo
+        and (message_type is None or msg.message_type == message_type)
+        and (since is None or msg.timestamp >= since)
+    ]
+    matches.sort(key=lambda msg: msg.timestamp, reverse=True)
+    return matches[:limit]
+
+
+async def run_benchmark(repos: int, messages: int, queries: int, baseline_queries: int):
+    """Fill a messenger and time indexed vs. linear queries."""
+    from mahavishnu.messaging.repository_messenger import (
+        MessagePriority,
+        MessageType,
+        RepositoryMessenger,
+    )
+
+    app = SimpleNamespace(config=SimpleNamespace(cross_project_auth_secret=None))
+    messenger = RepositoryMessenger(app)
+    repo_names = [f"repo-{i:03d}" for i in range(repos)]
+    types = list(MessageType)
+    priorities = list(MessagePriority)
+    rng = random.Random(42)
+
+    start = time.perf_counter()
+    for i in range(messages):
+        await messenger.send_message(
+            sender_repo=rng.choice(repo_names),
+            receiver_repo=rng.choice(repo_names),
+            message_type=rng.choice(types),
+            content={"i": i},
+            priority=rng.choice(priorities),
+        )
+    fill_s = time.perf_counter() - start
+
+    recent = datetime.now(UTC) - timedelta(seconds=fill_s / 10)
+    cases = {
+        "latest_50": {},
+        "by_type_50": {"message_type": MessageType.QUALITY_ALERT},
+        "since_recent": {"since": recent},
+    }
+    retained = messenger.messages
+    report: dict[str, Any] = {
+        "repos": repos,
+        "messages": messages,
+        "fill_s": round(fill_s, 1),
+        "queries": {},
+    }
+    for name, kwargs in cases.items():
+        indexed: list[float] = []
+        linear: list[float] = []
+        for q in range(queries):
+            repo = rng.choice(repo_names)
+            call_start = time.perf_counter()
+            result = await messenger.get_messages_for_repo(repo, limit=50, **kwargs)
+            indexed.append((time.perf_counter() - call_start) * 1000)
+
+            if q < baseline_queries:
+                call_start = time.perf_counter()
+                expected = _linear_scan(
+                    retained, repo, kwargs.get("message_type"), kwargs.get("since"), 50
+                )
+                linear.append((time.perf_counter() - call_start) * 1000)
+                if [m.id for m in result] != [m.id for m in expected]:
+                    raise AssertionError(f"{name}: indexed result differs for {repo}")
+
+        report["queries"][name] = {"indexed": _summary(indexed), "linear": _summary(linear)}
+    return report
+
+
+async def _main(args: argparse.Namespace) -> None:
+    report = await run_benchmark(args.repos, args.messages, args.queries, args.baseline_queries)
+    for name, timings in report["queries"].items():
+        logger.info(
+            f"{name:>13}: indexed p50 {timings['indexed']['p50_ms']}ms, "
+            f"linear p50 {timings['linear']['p50_ms']}ms"
+        )
+    print(json.dumps(report, indent=2))
+
+
+def main() -> None:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="RepositoryMessenger Mailbox Benchmark")
+    parser.add_argument("--repos", type=int, default=200, help="Receiver repositories")
+    parser.add_argument("--messages", type=int, default=500_000, help="Retained messages")
+    parser.add_argument("--queries", type=int, default=500, help="Indexed queries per case")
+    parser.add_argument(
+        "--baseline-queries",
+        type=int,
+        default=20,
+        help="Linear-scan queries per case (each reads every message)",
+    )
+    asyncio.run(_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
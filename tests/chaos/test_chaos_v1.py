@@ -83,6 +83,7 @@ async def test_resource_exhaustion_backs_pressure_into_local_buffer() -> None:
 
     aggregator = MemoryAggregator(sync_interval=1.0)
     failed_response = build_http_failure_response()
+    aggregator._mcp_client = AsyncMock()
     aggregator._mcp_client.post = AsyncMock(return_value=failed_response)
 
     try:
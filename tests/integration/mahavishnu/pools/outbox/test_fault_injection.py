@@ -3,8 +3,8 @@
 These exercise the drainer's behavior when the sink raises. Two cases:
 1. Transient 5xx then recovery — sink fails the first few attempts, then
    succeeds; the drainer should eventually drain everything.
-2. Partial-batch failure — sink fails one specific row; the drainer stops
-   the batch (preserving order) and a subsequent drain eventually resolves.
+2. Partial-batch failure — sink fails one specific row; only later rows of
+   that key are held back, and subsequent drains eventually resolve it.
 """
 
 from __future__ import annotations
@@ -59,8 +59,8 @@ async def test_session_buddy_5xx_then_recovery(writer: MemoryOutboxWriter) -> No
 
 
 async def test_partial_drain_failure_continues_batch(writer: MemoryOutboxWriter) -> None:
-    """The drainer stops the batch on first sink exception to preserve ordering.
-    A subsequent drain picks up where the previous one left off.
+    """A sink exception holds back only the failing key; other keys keep
+    draining. A subsequent drain retries the failed row.
     """
     for i in range(10):
         await writer.enqueue(f"k{i}", {"i": i})
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import time
 from typing import TYPE_CHECKING
 
@@ -121,3 +122,106 @@ async def test_drainer_fires_sink_when_real_breaker_is_half_open(
     assert result.drained == 3
     assert seen == [(f"k{i}", {"i": i}) for i in range(3)]
     assert await writer.pending_count() == 0
+
+
+async def test_drainer_preserves_order_per_key_not_globally(writer: MemoryOutboxWriter) -> None:
+    """A failing row holds back later rows of its key only."""
+    for key, i in [("a", 0), ("b", 1), ("a", 2), ("b", 3), ("c", 4)]:
+        await writer.enqueue(key, {"i": i})
+
+    seen: list[tuple[str, object]] = []
+
+    async def sink(key: str, payload: dict[str, object]) -> None:
+        if payload["i"] == 1:
+            raise RuntimeError("b is down")
+        seen.append((key, payload["i"]))
+
+    drainer = MemoryOutboxDrainer(writer, _StubBreaker(can_execute=True), sink)
+    result = await drainer.drain_once()
+
+    assert result == DrainResult(drained=3, deferred=2, failed=0, retried=1)
+    assert seen == [("a", 0), ("c", 4), ("a", 2)]
+    pending = await writer.pending_batch(10)
+    assert [(r.key, r.payload["i"], r.attempts) for r in pending] == [("b", 1, 1), ("b", 3, 0)]
+
+
+async def test_drainer_batch_sink_gets_distinct_keys_in_chunks(
+    writer: MemoryOutboxWriter,
+) -> None:
+    for i in range(7):
+        await writer.enqueue(f"k{i % 5}", {"i": i})
+
+    calls: list[list[str]] = []
+
+    async def batch_sink(rows: list[tuple[str, dict[str, object]]]) -> list[None]:
+        calls.append([key for key, _ in rows])
+        return [None] * len(rows)
+
+    drainer = MemoryOutboxDrainer(
+        writer, _StubBreaker(can_execute=True), batch_sink=batch_sink, sink_batch_size=2
+    )
+    result = await drainer.drain_once()
+
+    assert result == DrainResult(drained=7, deferred=0, failed=0)
+    # Wave 1: k0..k4 in chunks of two; wave 2: the second rows of k0 and k1.
+    assert calls == [["k0", "k1"], ["k2", "k3"], ["k4"], ["k0", "k1"]]
+    assert all(len(set(call)) == len(call) for call in calls)
+
+
+async def test_drainer_batch_sink_exception_fails_whole_call(
+    writer: MemoryOutboxWriter,
+) -> None:
+    for i in range(3):
+        await writer.enqueue(f"k{i}", {"i": i})
+
+    async def batch_sink(rows: list[tuple[str, dict[str, object]]]) -> list[None]:
+        raise RuntimeError("session-buddy unavailable")
+
+    drainer = MemoryOutboxDrainer(writer, _StubBreaker(can_execute=True), batch_sink=batch_sink)
+    result = await drainer.drain_once()
+
+    assert result == DrainResult(drained=0, deferred=3, failed=0, retried=3)
+
+
+def test_drainer_requires_exactly_one_sink(writer: MemoryOutboxWriter) -> None:
+    with pytest.raises(ValueError):
+        MemoryOutboxDrainer(writer, _StubBreaker())
+
+
+async def test_drainer_run_grows_batch_on_backlog(writer: MemoryOutboxWriter) -> None:
+    for i in range(70):
+        await writer.enqueue(f"k{i}", {"i": i})
+
+    async def sink(key: str, payload: dict[str, object]) -> None:
+        return None
+
+    drainer = MemoryOutboxDrainer(writer, _StubBreaker(can_execute=True), sink, batch_size=10)
+    stop = asyncio.Event()
+    runner = asyncio.create_task(drainer.run(stop, idle_interval=0.01))
+    while await writer.pending_count():
+        await asyncio.sleep(0.01)
+    stop.set()
+    await runner
+
+    # Passes of 10, 20 and 40 rows ran back to back; the batch doubled after
+    # each full, clean pass that left a backlog.
+    assert drainer.batch_size == 40
+
+
+async def test_drainer_run_shrinks_batch_on_failures(writer: MemoryOutboxWriter) -> None:
+    for i in range(5):
+        await writer.enqueue(f"k{i}", {"i": i})
+
+    async def sink(key: str, payload: dict[str, object]) -> None:
+        raise RuntimeError("simulated 5xx")
+
+    drainer = MemoryOutboxDrainer(
+        writer, _StubBreaker(can_execute=True), sink, batch_size=40, min_batch_size=10
+    )
+    stop = asyncio.Event()
+    runner = asyncio.create_task(drainer.run(stop, idle_interval=0.01))
+    await asyncio.sleep(0.1)
+    stop.set()
+    await runner
+
+    assert drainer.batch_size == 10
@@ -85,3 +85,34 @@ async def test_writer_mark_failed_records_error(writer: MemoryOutboxWriter) -> N
     assert row.status == "failed"
     assert row.attempts == 1
     assert row.last_error == "boom"
+
+
+async def test_writer_pending_window_returns_total(writer: MemoryOutboxWriter) -> None:
+    for i in range(5):
+        await writer.enqueue(f"k{i}", {"i": i})
+
+    rows, total = await writer.pending_window(2)
+
+    assert [r.key for r in rows] == ["k0", "k1"]
+    assert total == 5
+    assert await writer.pending_window(2) == (rows, total)
+
+
+async def test_writer_settle_applies_all_outcomes(writer: MemoryOutboxWriter) -> None:
+    ok = await writer.enqueue("k1", {"a": 1})
+    retry = await writer.enqueue("k2", {"a": 2})
+    final = await writer.enqueue("k3", {"a": 3})
+    await writer._bump_attempts([final], "earlier")
+
+    drained, failed = await writer.settle([ok], {retry: "5xx", final: "5xx again"}, 2)
+
+    assert (drained, failed) == (1, 1)
+    row_ok, row_retry, row_final = [await writer.get_row(i) for i in (ok, retry, final)]
+    assert row_ok is not None and row_ok.status == "drained"
+    assert row_ok.attempts == 0
+    assert row_retry is not None and row_retry.status == "pending"
+    assert (row_retry.attempts, row_retry.last_error) == (1, "5xx")
+    assert row_final is not None and row_final.status == "failed"
+    assert (row_final.attempts, row_final.last_error) == (2, "5xx again")
+    # Settled rows are no longer pending, so settling again is a no-op.
+    assert await writer.settle([ok], {final: "late"}, 2) == (0, 0)
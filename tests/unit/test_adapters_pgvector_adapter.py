@@ -357,6 +357,27 @@ class TestPublicAPI:
         sql = mock_conn.fetchrow.call_args[0][0]
         assert "DO NOTHING" in sql
 
+    async def test_upsert_many_uses_single_statement(
+        self, adapter_with_mock_conn: PgvectorAdapter, mock_conn: AsyncMock
+    ):
+        mock_conn.fetch.return_value = [{"id": "a"}, {"id": "b"}]
+        ids = await adapter_with_mock_conn.upsert(
+            "traces",
+            [
+                {"id": "a", "vector": [0.1, 0.2], "metadata": {"n": 1}},
+                {"id": "b", "vector": [0.3, 0.4], "metadata": {}},
+            ],
+        )
+        assert ids == ["a", "b"]
+        mock_conn.fetchrow.assert_not_called()
+        mock_conn.fetch.assert_awaited_once()
+        sql, doc_ids, vectors, metadata = mock_conn.fetch.call_args[0]
+        assert "unnest" in sql
+        assert "DO UPDATE" in sql
+        assert doc_ids == ["a", "b"]
+        assert vectors == ["[0.1,0.2]", "[0.3,0.4]"]
+        assert json.loads(metadata[0]) == {"n": 1}
+
     async def test_delete_empty_returns_true_without_call(
         self, adapter_with_mock_conn: PgvectorAdapter, mock_conn: AsyncMock
     ):
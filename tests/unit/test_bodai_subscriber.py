@@ -14,6 +14,7 @@ from __future__ import annotations
 import asyncio
 import json
 from pathlib import Path
+import time
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -21,6 +22,7 @@ from oneiric.runtime.events import EventEnvelope, create_event_envelope
 import pytest
 
 from mahavishnu.core.errors import EventEnvelopeConversionError
+from mahavishnu.core.events import bodai_subscriber
 from mahavishnu.core.events.bodai_subscriber import (
     DEFAULT_QUEUE_CAP,
     STREAM_NAME,
@@ -29,9 +31,10 @@ from mahavishnu.core.events.bodai_subscriber import (
     _envelope_to_dict,
     _read_queue,
     _resolve_queue_path,
-    _write_queue_atomic,
     append_to_queue,
+    close_spools,
     format_bodai_summary,
+    read_queue,
     subscribe_to_bodai_events,
 )
 from mahavishnu.core.events.canonical import create_oneiric_envelope
@@ -39,10 +42,18 @@ from mahavishnu.core.events.contract import (
     InMemoryEventTransport,  # noqa: F401  (kept for downstream test references)
 )
 from mahavishnu.core.events.envelope import EventEnvelope as MahavishnuEventEnvelope
+from mahavishnu.core.events.spool import EventSpool, SpoolCursor, read_spool, spool_dir_for
 
 pytestmark = pytest.mark.unit
 
 
+@pytest.fixture(autouse=True)
+def _close_open_spools() -> Any:
+    """Drop the module-level spool cache between tests."""
+    yield
+    close_spools()
+
+
 # ---------------------------------------------------------------------------
 # format_bodai_summary
 # ---------------------------------------------------------------------------
@@ -105,21 +116,18 @@ def test_format_bodai_summary_via_oneiric_create_event_envelope() -> None:
 # ---------------------------------------------------------------------------
 
 
-def test_append_to_queue_writes_atomically(tmp_path: Path) -> None:
+def test_append_to_queue_writes_spool_segment(tmp_path: Path) -> None:
     queue_path = tmp_path / "bodai-event-queue.json"
     envelope = {"topic": "x", "payload": {"k": 1}, "headers": {"source": "mahavishnu"}}
 
     append_to_queue(envelope, queue_path=queue_path, queue_cap=10)
 
-    assert queue_path.exists()
-    contents = json.loads(queue_path.read_text(encoding="utf-8"))
-    assert contents == [envelope]
-    # Atomic-write invariant: no leftover tmp sibling of the canonical file
-    tmp_siblings = list(queue_path.parent.glob(queue_path.name + ".tmp"))
-    assert tmp_siblings == []
+    spool_dir = spool_dir_for(queue_path)
+    assert [p.name for p in spool_dir.iterdir()] == ["000000000001.jsonl"]
+    assert read_queue(queue_path) == [envelope]
 
 
-def test_append_to_queue_caps_at_100(tmp_path: Path) -> None:
+def test_append_to_queue_caps_by_dropping_whole_segments(tmp_path: Path) -> None:
     queue_path = tmp_path / "bodai-event-queue.json"
     seed_count = 150
 
@@ -130,11 +138,12 @@ def test_append_to_queue_caps_at_100(tmp_path: Path) -> None:
             queue_cap=DEFAULT_QUEUE_CAP,
         )
 
-    contents = json.loads(queue_path.read_text(encoding="utf-8"))
-    assert len(contents) == DEFAULT_QUEUE_CAP
-    # The first 50 should have been dropped; remaining items start at index 50
-    assert contents[0]["payload"]["i"] == seed_count - DEFAULT_QUEUE_CAP
-    assert contents[-1]["payload"]["i"] == seed_count - 1
+    contents = read_queue(queue_path)
+    segment_records = DEFAULT_QUEUE_CAP // 4
+    assert DEFAULT_QUEUE_CAP <= len(contents) < DEFAULT_QUEUE_CAP + segment_records
+    # Eviction is oldest-first and preserves order.
+    indices = [item["payload"]["i"] for item in contents]
+    assert indices == list(range(seed_count - len(contents), seed_count))
 
 
 def test_append_to_queue_creates_parent_directory(tmp_path: Path) -> None:
@@ -147,21 +156,120 @@ def test_append_to_queue_creates_parent_directory(tmp_path: Path) -> None:
         queue_cap=10,
     )
 
-    assert queue_path.exists()
+    assert spool_dir_for(queue_path).is_dir()
     assert queue_path.parent.is_dir()
 
 
+def test_append_to_queue_imports_legacy_queue_file(tmp_path: Path) -> None:
+    queue_path = tmp_path / "bodai-event-queue.json"
+    queue_path.write_text(json.dumps([{"topic": "old"}]), encoding="utf-8")
+
+    append_to_queue({"topic": "new"}, queue_path=queue_path, queue_cap=10)
+
+    assert not queue_path.exists()
+    assert [item["topic"] for item in read_queue(queue_path)] == ["old", "new"]
+
+
+def test_read_spool_cursor_returns_only_new_envelopes(tmp_path: Path) -> None:
+    queue_path = tmp_path / "bodai-event-queue.json"
+    for index in range(3):
+        append_to_queue({"i": index}, queue_path=queue_path, queue_cap=8)
+
+    first = read_spool(spool_dir_for(queue_path))
+    assert [item["i"] for item in first.envelopes] == [0, 1, 2]
+
+    for index in range(3, 7):
+        append_to_queue({"i": index}, queue_path=queue_path, queue_cap=8)
+    cursor = SpoolCursor.from_dict(first.cursor.to_dict())
+    second = read_spool(spool_dir_for(queue_path), cursor)
+    assert [item["i"] for item in second.envelopes] == [3, 4, 5, 6]
+    assert not second.dropped
+
+    third = read_spool(spool_dir_for(queue_path), second.cursor)
+    assert third.envelopes == []
+
+
+def test_read_spool_leaves_partial_trailing_line(tmp_path: Path) -> None:
+    spool_dir = tmp_path / "q.spool"
+    spool_dir.mkdir()
+    (spool_dir / "000000000001.jsonl").write_bytes(b'{"i": 0}\n{"i": 1')
+
+    result = read_spool(spool_dir)
+    assert result.envelopes == [{"i": 0}]
+    assert result.cursor == SpoolCursor(segment=1, offset=len(b'{"i": 0}\n'))
+
+
+def test_append_after_torn_line_starts_a_new_line(tmp_path: Path) -> None:
+    queue_path = tmp_path / "bodai-event-queue.json"
+    spool_dir = spool_dir_for(queue_path)
+    spool_dir.mkdir()
+    (spool_dir / "000000000001.jsonl").write_bytes(b'{"i": 0}\n{"i": 1')
+
+    append_to_queue({"i": 2}, queue_path=queue_path, queue_cap=8)
+
+    assert read_queue(queue_path) == [{"i": 0}, {"i": 2}]
+
+
+def test_read_spool_reports_evicted_cursor(tmp_path: Path) -> None:
+    queue_path = tmp_path / "bodai-event-queue.json"
+    append_to_queue({"i": 0}, queue_path=queue_path, queue_cap=4)
+    stale = read_spool(spool_dir_for(queue_path)).cursor
+    for index in range(1, 12):
+        append_to_queue({"i": index}, queue_path=queue_path, queue_cap=4)
+
+    result = read_spool(spool_dir_for(queue_path), stale)
+    assert result.dropped
+    assert result.envelopes[-1] == {"i": 11}
+
+
+def test_idle_spool_fsyncs_after_the_interval(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    synced: list[int] = []
+    monkeypatch.setattr("mahavishnu.core.events.spool.os.fsync", synced.append)
+    spool = EventSpool(tmp_path / "q.spool", cap=8, fsync_every=100, fsync_interval_seconds=0.05)
+
+    spool.append({"i": 0})
+    spool.append({"i": 1})
+    assert synced == []
+
+    time.sleep(0.2)
+    assert len(synced) == 1
+    spool.close()
+
+
+async def test_batch_is_acked_only_after_the_spool_fsync(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """XACK waits for the fsync that makes the batch's appends durable."""
+    order: list[str] = []
+    monkeypatch.setattr("mahavishnu.core.events.spool.os.fsync", lambda _fd: order.append("fsync"))
+    monkeypatch.setattr(bodai_subscriber, "_decode_envelope", lambda payload: payload)
+    monkeypatch.setattr(bodai_subscriber, "_envelope_to_dict", dict)
+    client = _make_redis_mock()
+    client.xack = AsyncMock(side_effect=lambda _stream, _group, mid: order.append(f"ack {mid}"))
+
+    await bodai_subscriber._process_response(
+        [(b"bodai:events", [(b"1-0", {"i": 0}), (b"2-0", {"i": 1})])],
+        client=client,
+        callback=AsyncMock(),
+        queue_path=tmp_path / "queue.json",
+        queue_cap=8,
+        per_event_timeout_seconds=1.0,
+        stream_name=STREAM_NAME,
+        consumer_group="group",
+    )
+
+    assert order == ["fsync", "ack 1-0", "ack 2-0"]
+    assert read_queue(tmp_path / "queue.json") == [{"i": 0}, {"i": 1}]
+
+
 def test_read_queue_returns_empty_for_missing_file(tmp_path: Path) -> None:
     missing = tmp_path / "does-not-exist.json"
     assert _read_queue(missing) == []
-
-
-def test_write_queue_atomic_replaces_existing(tmp_path: Path) -> None:
-    queue_path = tmp_path / "queue.json"
-    _write_queue_atomic(queue_path, [{"a": 1}])
-    _write_queue_atomic(queue_path, [{"a": 2}, {"b": 3}])
-    contents = json.loads(queue_path.read_text(encoding="utf-8"))
-    assert contents == [{"a": 2}, {"b": 3}]
+    assert read_queue(missing) == []
 
 
 def test_resolve_queue_path_uses_override(tmp_path: Path) -> None:
@@ -445,8 +553,8 @@ async def test_subscriber_decode_failure_does_not_append_or_ack(
 
     # Exactly one xack (for the good envelope only)
     assert client.xack.await_count == 1
-    # Queue file contains only the good envelope
-    contents = json.loads(queue_path.read_text(encoding="utf-8"))
+    # Queue contains only the good envelope
+    contents = read_queue(queue_path)
     assert len(contents) == 1
     assert contents[0]["topic"] == "workflow_completed"
 
@@ -504,10 +612,8 @@ async def test_subscriber_callback_timeout_does_not_append_or_ack(
     assert len(received) == 1
     # Timed-out envelope is NOT acked
     assert client.xack.await_count == 0
-    # Queue file is empty for the timed-out envelope
-    if queue_path.exists():
-        contents = json.loads(queue_path.read_text(encoding="utf-8"))
-        assert contents == []
+    # Queue is empty for the timed-out envelope
+    assert read_queue(queue_path) == []
 
 
 async def test_subscriber_callback_cancelled_error_propagates(
@@ -600,7 +706,7 @@ async def test_subscriber_callback_exception_appends_and_acks(
 
     # Even though callback raised, the envelope was appended + acked
     assert client.xack.await_count == 1
-    contents = json.loads(queue_path.read_text(encoding="utf-8"))
+    contents = read_queue(queue_path)
     assert len(contents) == 1
     assert contents[0]["topic"] == "workflow_completed"
 
@@ -892,8 +998,8 @@ async def test_subscribe_consumes_and_appends(tmp_path: Path) -> None:
     # All three messages were acked exactly once
     assert client.xack.await_count == 3
 
-    # Queue file contains three entries
-    queue_contents = json.loads(queue_path.read_text(encoding="utf-8"))
+    # Queue contains three entries
+    queue_contents = read_queue(queue_path)
     assert len(queue_contents) == 3
     assert queue_contents[0]["topic"] == "workflow_completed"
     assert queue_contents[2]["headers"]["source"] == "crackerjack"
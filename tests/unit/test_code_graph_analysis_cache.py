@@ -0,0 +1,405 @@
+"""Tests for the commit-keyed CodeGraphAnalyzer cache (core.code_index.analysis_cache)."""
+
+from __future__ import annotations
+
+import ast
+from dataclasses import dataclass, field
+import json
+from pathlib import Path
+import subprocess
+import threading
+from typing import Any, ClassVar
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from mahavishnu.core.code_index import analysis_cache
+from mahavishnu.core.code_index.analysis_cache import (
+    CodeGraphAnalysisCache,
+    restore_analyzer,
+    serialize_analyzer,
+)
+
+
+@dataclass
+class FunctionNode:
+    name: str
+    file_id: str
+    start_line: int
+    calls: list[str] = field(default_factory=list)
+    decorators: tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class Edge:
+    source: str
+    target: str
+    kind: str
+
+
+class FakeAnalyzer:
+    """Minimal CodeGraphAnalyzer: function nodes plus call edges and lookup tables.
+
+    Like the real analyzer, ``file_id`` is the file's path relative to the
+    repository, ``_analyze_python_file`` adds one file's nodes and edges, and
+    ``find_related_files``/``get_function_context`` read the edges and
+    indexes, not just ``nodes``.
+    """
+
+    full_runs: ClassVar[int] = 0
+    parsed: ClassVar[list[str]] = []
+
+    def __init__(self, repo: Path) -> None:
+        self.repo = repo
+        self.nodes: dict[str, Any] = {}
+        self.edges: list[Edge] = []
+        self.file_paths: dict[str, Path] = {}
+        self.by_name: dict[str, set[str]] = {}
+        self.lock = threading.Lock()
+
+    async def analyze_repository(self, path: str) -> dict[str, Any]:
+        type(self).full_runs += 1
+        files = sorted(p for p in Path(path).rglob("*.py") if ".git" not in p.parts)
+        for file in files:
+            await self._analyze_python_file(file)
+        return {
+            "files_indexed": len(files),
+            "functions_indexed": len(self.nodes),
+            "total_nodes": len(self.nodes),
+        }
+
+    async def _analyze_python_file(self, file: Path) -> None:
+        type(self).parsed.append(file.name)
+        file_id = str(file.relative_to(self.repo))
+        self.file_paths[file_id] = file
+        for fn in ast.parse(file.read_text()).body:
+            if isinstance(fn, ast.FunctionDef):
+                calls = [
+                    n.func.id
+                    for n in ast.walk(fn)
+                    if isinstance(n, ast.Call) and isinstance(n.func, ast.Name)
+                ]
+                node_id = f"{file_id}:function:{fn.name}"
+                self.nodes[node_id] = FunctionNode(fn.name, file_id, fn.lineno, calls)
+                self.by_name.setdefault(fn.name, set()).add(node_id)
+                self.edges.extend(Edge(node_id, callee, "calls") for callee in calls)
+
+    async def find_related_files(self, file_path: str) -> list[str]:
+        ids = {fid for fid, path in self.file_paths.items() if str(path) == file_path}
+        related = {
+            str(self.file_paths[self.nodes[target].file_id])
+            for edge in self.edges
+            if self.nodes[edge.source].file_id in ids
+            for target in self.by_name.get(edge.target, ())
+        }
+        return sorted(related - {file_path})
+
+    async def get_function_context(self, name: str) -> dict[str, Any]:
+        node_ids = self.by_name.get(name, set())
+        callees = {
+            t for e in self.edges if e.source in node_ids for t in self.by_name.get(e.target, ())
+        }
+        return {
+            "functions": sorted(node_ids),
+            "callers": sorted(e.source for e in self.edges if e.target == name),
+            "callees": sorted(callees),
+        }
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(
+        ["git", "-c", "user.email=t@example.com", "-c", "user.name=t", *args],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+    )
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    (repo / "a.py").write_text("from b import b\n\ndef a():\n    return b()\n")
+    (repo / "b.py").write_text("from c import c\n\ndef b():\n    return c()\n")
+    (repo / "c.py").write_text("def c():\n    pass\n")
+    _git(repo, "init", "-q")
+    _git(repo, "add", ".")
+    _git(repo, "commit", "-qm", "initial")
+    FakeAnalyzer.full_runs = 0
+    FakeAnalyzer.parsed = []
+    return repo
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> CodeGraphAnalysisCache:
+    return CodeGraphAnalysisCache(cache_dir=tmp_path / "cache")
+
+
+def _names(analysis: Any) -> set[str]:
+    return {node.name for node in analysis.analyzer.nodes.values()}
+
+
+class TestCacheKey:
+    """Same HEAD and clean tree: served without parsing."""
+
+    async def test_second_call_is_a_hit(self, repo: Path, cache: CodeGraphAnalysisCache) -> None:
+        first = await cache.analyze(repo, FakeAnalyzer)
+        second = await cache.analyze(repo, FakeAnalyzer)
+
+        assert (first.status, second.status) == ("miss", "hit")
+        assert FakeAnalyzer.full_runs == 1
+        assert _names(second) == {"a", "b", "c"}
+        assert second.stats == first.stats
+
+    async def test_entry_survives_a_new_process(
+        self, repo: Path, cache: CodeGraphAnalysisCache, tmp_path: Path
+    ) -> None:
+        first = await cache.analyze(repo, FakeAnalyzer)
+
+        fresh = CodeGraphAnalysisCache(cache_dir=tmp_path / "cache")
+        analysis = await fresh.analyze(repo, FakeAnalyzer)
+
+        assert analysis.status == "hit"
+        assert FakeAnalyzer.full_runs == 1
+        assert analysis.analyzer.nodes == first.analyzer.nodes
+        assert analysis.analyzer.edges == first.analyzer.edges
+
+    async def test_invalidate_forces_full_analysis(
+        self, repo: Path, cache: CodeGraphAnalysisCache
+    ) -> None:
+        await cache.analyze(repo, FakeAnalyzer)
+        cache.invalidate(repo)
+
+        assert (await cache.analyze(repo, FakeAnalyzer)).status == "miss"
+        assert FakeAnalyzer.full_runs == 2
+
+    async def test_analyzer_upgrade_forces_full_analysis(
+        self, repo: Path, cache: CodeGraphAnalysisCache, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        await cache.analyze(repo, FakeAnalyzer)
+        monkeypatch.setattr(analysis_cache, "_analyzer_version", lambda cls: "99.0")
+
+        assert (await cache.analyze(repo, FakeAnalyzer)).status == "miss"
+        assert FakeAnalyzer.full_runs == 2
+
+
+class TestIncremental:
+    """A changed key re-parses only the files that changed."""
+
+    async def test_new_commit_reparses_changed_file(
+        self, repo: Path, cache: CodeGraphAnalysisCache
+    ) -> None:
+        await cache.analyze(repo, FakeAnalyzer)
+        FakeAnalyzer.parsed = []
+        (repo / "c.py").write_text("def c():\n    pass\n\ndef d():\n    pass\n")
+        _git(repo, "commit", "-qam", "grow c")
+
+        analysis = await cache.analyze(repo, FakeAnalyzer)
+
+        assert (analysis.status, analysis.reanalyzed_files) == ("incremental", 1)
+        assert FakeAnalyzer.full_runs == 1
+        assert FakeAnalyzer.parsed == ["c.py"]
+        assert _names(analysis) == {"a", "b", "c", "d"}
+        assert analysis.stats["functions_indexed"] == 4
+        assert (await cache.analyze(repo, FakeAnalyzer)).status == "hit"
+
+    async def test_dirty_tree_and_deleted_file(
+        self, repo: Path, cache: CodeGraphAnalysisCache
+    ) -> None:
+        await cache.analyze(repo, FakeAnalyzer)
+        (repo / "c.py").unlink()
+
+        analysis = await cache.analyze(repo, FakeAnalyzer)
+
+        assert analysis.status == "incremental"
+        assert _names(analysis) == {"a", "b"}
+        assert analysis.stats["files_indexed"] == 2
+        assert "c.py" not in analysis.analyzer.file_paths
+        assert "c" not in analysis.analyzer.by_name
+
+    async def test_reverted_edit_is_reparsed(
+        self, repo: Path, cache: CodeGraphAnalysisCache
+    ) -> None:
+        (repo / "c.py").write_text("def changed():\n    pass\n")
+        await cache.analyze(repo, FakeAnalyzer)
+        _git(repo, "checkout", "--", "c.py")
+
+        analysis = await cache.analyze(repo, FakeAnalyzer)
+
+        assert analysis.status == "incremental"
+        assert _names(analysis) == {"a", "b", "c"}
+
+    async def test_untracked_file_is_picked_up(
+        self, repo: Path, cache: CodeGraphAnalysisCache
+    ) -> None:
+        await cache.analyze(repo, FakeAnalyzer)
+        (repo / "e.py").write_text("def e():\n    return c()\n")
+
+        analysis = await cache.analyze(repo, FakeAnalyzer)
+
+        assert analysis.status == "incremental"
+        assert _names(analysis) == {"a", "b", "c", "e"}
+        context = await analysis.analyzer.get_function_context("c")
+        assert context["callers"] == ["b.py:function:b", "e.py:function:e"]
+
+    async def test_large_change_falls_back_to_full_analysis(
+        self, repo: Path, cache: CodeGraphAnalysisCache
+    ) -> None:
+        await cache.analyze(repo, FakeAnalyzer)
+        for name in ("a", "b"):
+            (repo / f"{name}.py").write_text(f"def {name}2():\n    pass\n")
+
+        analysis = await cache.analyze(repo, FakeAnalyzer)
+
+        assert analysis.status == "miss"
+        assert FakeAnalyzer.full_runs == 2
+        assert _names(analysis) == {"a2", "b2", "c"}
+
+    async def test_incremental_graph_matches_a_fresh_analysis(
+        self, repo: Path, cache: CodeGraphAnalysisCache
+    ) -> None:
+        await cache.analyze(repo, FakeAnalyzer)
+        (repo / "b.py").write_text("def b():\n    return a()\n")
+
+        analysis = await cache.analyze(repo, FakeAnalyzer)
+        fresh = FakeAnalyzer(repo.resolve())
+        await fresh.analyze_repository(str(repo.resolve()))
+
+        assert analysis.status == "incremental"
+        assert analysis.analyzer.nodes == fresh.nodes
+        assert analysis.analyzer.by_name == fresh.by_name
+        assert sorted(analysis.analyzer.edges, key=repr) == sorted(fresh.edges, key=repr)
+        for file in ("a.py", "b.py", "c.py"):
+            path = str(repo.resolve() / file)
+            assert await analysis.analyzer.find_related_files(
+                path
+            ) == await fresh.find_related_files(path)
+
+
+class TestCachedMatchesUncached:
+    """A rebuilt analyzer answers graph queries exactly like a freshly parsed one."""
+
+    async def test_graph_queries_match_a_fresh_analysis(
+        self, repo: Path, cache: CodeGraphAnalysisCache, tmp_path: Path
+    ) -> None:
+        await cache.analyze(repo, FakeAnalyzer)
+        cached = await CodeGraphAnalysisCache(tmp_path / "cache").analyze(repo, FakeAnalyzer)
+        uncached = FakeAnalyzer(repo.resolve())
+        await uncached.analyze_repository(str(repo.resolve()))
+
+        assert cached.status == "hit"
+        for file in ("a.py", "b.py", "c.py"):
+            path = str(repo.resolve() / file)
+            assert await cached.analyzer.find_related_files(
+                path
+            ) == await uncached.find_related_files(path)
+        for name in ("a", "b", "c"):
+            assert await cached.analyzer.get_function_context(
+                name
+            ) == await uncached.get_function_context(name)
+        assert await cached.analyzer.find_related_files(str(repo.resolve() / "a.py")) == [
+            str(repo.resolve() / "b.py")
+        ]
+
+    async def test_each_hit_gets_its_own_copy(
+        self, repo: Path, cache: CodeGraphAnalysisCache
+    ) -> None:
+        await cache.analyze(repo, FakeAnalyzer)
+        first = await cache.analyze(repo, FakeAnalyzer)
+        first.analyzer.nodes.clear()
+        first.analyzer.by_name["a"].clear()
+
+        second = await cache.analyze(repo, FakeAnalyzer)
+
+        assert _names(second) == {"a", "b", "c"}
+        assert second.analyzer.by_name["a"]
+
+    async def test_unencodable_attributes_keep_their_init_value(
+        self, repo: Path, cache: CodeGraphAnalysisCache
+    ) -> None:
+        await cache.analyze(repo, FakeAnalyzer)
+
+        analysis = await cache.analyze(repo, FakeAnalyzer)
+
+        assert analysis.status == "hit"
+        assert analysis.analyzer.lock.acquire(blocking=False)
+
+
+class TestUncached:
+    """Mocks and non-git directories always get a plain full analysis."""
+
+    async def test_non_class_factory_bypasses_cache(
+        self, repo: Path, cache: CodeGraphAnalysisCache
+    ) -> None:
+        factory = MagicMock()
+        factory.return_value.analyze_repository = AsyncMock(return_value={"total_nodes": 0})
+
+        first = await cache.analyze(str(repo), factory)
+        await cache.analyze(str(repo), factory)
+
+        assert first.status == "uncached"
+        assert factory.call_count == 2
+        factory.assert_called_with(repo)
+        factory.return_value.analyze_repository.assert_awaited_with(str(repo))
+
+    async def test_non_git_directory_is_not_cached(
+        self, tmp_path: Path, cache: CodeGraphAnalysisCache
+    ) -> None:
+        plain = tmp_path / "plain"
+        plain.mkdir()
+        (plain / "x.py").write_text("def x():\n    pass\n")
+        FakeAnalyzer.full_runs = 0
+
+        statuses = [(await cache.analyze(plain, FakeAnalyzer)).status for _ in range(2)]
+
+        assert statuses == ["uncached", "uncached"]
+        assert FakeAnalyzer.full_runs == 2
+
+
+def test_serialized_state_round_trip() -> None:
+    analyzer = FakeAnalyzer(Path("/repo"))
+    shared = FunctionNode("f", "id1", 3, calls=["g"], decorators=("staticmethod",))
+    analyzer.nodes = {"n1": shared, "n2": FunctionNode("g", "id1", 9)}
+    analyzer.edges = [Edge("n1", "n2", "calls")]
+    analyzer.by_name = {"f": {"n1"}}
+    analyzer.entry_points = [shared]
+    analyzer.edge_files = {analyzer.edges[0]: frozenset({Path("/repo/m.py")}), ("n1", 2): None}
+
+    state = json.loads(json.dumps(serialize_analyzer(analyzer)))
+    restored = restore_analyzer(FakeAnalyzer(Path("/other")), state)
+
+    assert len(state["schemas"]) == 2  # field names stored once per class
+    assert restored.repo == Path("/repo")
+    assert restored.nodes == analyzer.nodes
+    assert restored.edges == analyzer.edges
+    assert restored.by_name == analyzer.by_name
+    assert restored.edge_files == analyzer.edge_files
+    # Objects reachable from several attributes are stored once
+    assert restored.entry_points[0] is restored.nodes["n1"]
+
+
+def test_restore_refuses_classes_outside_the_analyzer_package() -> None:
+    analyzer = FakeAnalyzer(Path("/repo"))
+    analyzer.nodes = {"n1": FunctionNode("f", "m.py", 1)}
+    state = json.loads(json.dumps(serialize_analyzer(analyzer)))
+
+    for module_name, qualname in (("os", "system"), (__name__, "ast.parse")):
+        tampered = json.loads(json.dumps(state))
+        tampered["schemas"][0][:2] = [module_name, qualname]
+        with pytest.raises(ValueError):
+            restore_analyzer(FakeAnalyzer(Path("/repo")), tampered)
+
+
+async def test_tampered_entry_is_discarded(
+    repo: Path, cache: CodeGraphAnalysisCache, tmp_path: Path
+) -> None:
+    await cache.analyze(repo, FakeAnalyzer)
+    (entry_path,) = (tmp_path / "cache").glob("*.json")
+    payload = json.loads(entry_path.read_text())
+    payload["state"]["schemas"][0][:2] = ["subprocess", "Popen"]
+    entry_path.write_text(json.dumps(payload))
+
+    analysis = await CodeGraphAnalysisCache(tmp_path / "cache").analyze(repo, FakeAnalyzer)
+
+    assert analysis.status == "miss"
+    assert _names(analysis) == {"a", "b", "c"}
@@ -91,11 +91,11 @@ def test_index_repo_full_with_changes(
     )
     monkeypatch.setattr(
         "mahavishnu.core.code_index.indexer._upsert_to_session_buddy",
-        lambda _repo, _nodes, _edges: False,
+        lambda _repo, _nodes, _edges, **_kw: False,
     )
     monkeypatch.setattr(
         "mahavishnu.core.code_index.indexer._queue_locally",
-        lambda _repo, _commit, _nodes, _edges: None,
+        lambda _repo, _commit, _nodes, _edges, **_kw: None,
     )
 
     result = index_repo(str(tmp_path), trigger="manual", full=True)
@@ -150,9 +150,116 @@ def test_index_repo_parse_failure_tolerance(
     )
     monkeypatch.setattr(
         "mahavishnu.core.code_index.indexer._upsert_to_session_buddy",
-        lambda _repo, _nodes, _edges: True,
+        lambda _repo, _nodes, _edges, **_kw: True,
     )
 
     result = index_repo(str(tmp_path), trigger="manual", full=True)
     assert result.status == "complete"
     assert result.parse_failures == 1
+
+
+def _write_repo(tmp_path: Path, count: int) -> list[str]:
+    files = []
+    for i in range(count):
+        path = tmp_path / f"mod_{i}.py"
+        path.write_text(f"def fn_{i}():\n    return {i}\n")
+        files.append(str(path))
+    return files
+
+
+def _fake_parse(fp: str, repo: str, commit: str):
+    from datetime import datetime
+
+    from mahavishnu.core.code_index.models import CodeGraphNode
+
+    return (
+        [
+            CodeGraphNode(
+                symbol_id=f"{repo}|||{fp}|||function|||fn",
+                symbol_name="fn",
+                symbol_type="function",
+                file_path=fp,
+                repo_path=repo,
+                last_indexed_at=datetime.now(UTC),
+                commit_hash=commit,
+            )
+        ],
+        [],
+    )
+
+
+def test_blob_hash_matches_git(tmp_path: Path) -> None:
+    from mahavishnu.core.code_index.indexer import blob_hash
+
+    path = tmp_path / "x.py"
+    path.write_bytes(b"hello\n")
+    # `printf 'hello\n' | git hash-object --stdin`
+    assert blob_hash(str(path)) == "ce013625030ba8dba906f756967f9e9ca394464a"
+    assert blob_hash(str(tmp_path / "missing.py")) is None
+
+
+def test_full_reindex_skips_unchanged_content(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """The content-hash cache skips unchanged files even on --full."""
+    files = _write_repo(tmp_path, 3)
+    parsed: list[str] = []
+
+    def parse(fp, repo, commit):
+        parsed.append(fp)
+        return _fake_parse(fp, repo, commit)
+
+    monkeypatch.setattr("mahavishnu.core.code_index.indexer.get_current_commit", lambda _r: "c1")
+    monkeypatch.setattr(
+        "mahavishnu.core.code_index.indexer.filter_changed_files", lambda _repo, _commit: files
+    )
+    monkeypatch.setattr("mahavishnu.core.code_index.indexer.parse_file", parse)
+    monkeypatch.setattr(
+        "mahavishnu.core.code_index.indexer._upsert_to_session_buddy",
+        lambda _repo, _nodes, _edges, **_kw: True,
+    )
+
+    first = index_repo(str(tmp_path), full=True)
+    assert first.files_skipped == 0
+    assert len(parsed) == 3
+
+    (tmp_path / "mod_1.py").write_text("def changed():\n    pass\n")
+    parsed.clear()
+    second = index_repo(str(tmp_path), full=True)
+
+    assert parsed == [files[1]]
+    assert second.files_skipped == 2
+
+
+def test_graph_streams_in_bounded_chunks_and_queues_per_chunk(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Nodes are upserted in bounded chunks; after a failure each chunk is queued."""
+    import json
+
+    from mahavishnu.core.code_index import indexer
+
+    files = _write_repo(tmp_path, 5)
+    upserts: list[tuple[int, str]] = []
+
+    def upsert(_repo, nodes, _edges, *, commit_hash, chunk_index, client):
+        upserts.append((len(nodes), commit_hash))
+        return chunk_index == 0
+
+    queue_dir = tmp_path / "queue"
+    monkeypatch.setattr(indexer, "QUEUE_DIR", queue_dir)
+    monkeypatch.setattr(indexer, "_upsert_to_session_buddy", upsert)
+
+    sink = indexer._ChunkSink(str(tmp_path), "c2", max_items=2)
+    for fp in files:
+        nodes, edges = _fake_parse(fp, str(tmp_path), "c2")
+        sink.add(indexer._dump(nodes), indexer._dump(edges))
+    sink.close()
+
+    # Chunk 0 upserted, chunk 1 failed and was queued, chunk 2 queued directly.
+    assert upserts == [(2, "c2"), (2, "c2")]
+    queued = sorted(queue_dir.iterdir())
+    assert [p.name.rsplit("_", 1)[1] for p in queued] == ["00001.json", "00002.json"]
+    assert [len(json.loads(p.read_text())["nodes"]) for p in queued] == [2, 1]
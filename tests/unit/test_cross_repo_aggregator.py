@@ -11,9 +11,17 @@ from mahavishnu.core.cross_repo_aggregator import (
     CrossRepoAggregator,
     RepoTaskStats,
 )
+from mahavishnu.core.task_rollup import TaskRollup
 from mahavishnu.core.task_store import Task, TaskPriority, TaskStatus
 
 
+def _counts(tasks: list[Task], repositories: list[str] | None = None) -> dict:
+    """What TaskStore.count_by_repository would return for ``tasks``."""
+    rollup = TaskRollup()
+    rollup.rebuild(tasks)
+    return rollup.repository_counts(repositories)
+
+
 @pytest.fixture
 def mock_task_store() -> AsyncMock:
     """Create a mock TaskStore."""
@@ -200,7 +208,7 @@ class TestCrossRepoAggregator:
                 created_at=datetime.now(UTC),
             ),
         ]
-        mock_task_store.list.return_value = tasks
+        mock_task_store.count_by_repository.return_value = _counts(tasks)
 
         aggregator = CrossRepoAggregator(mock_task_store, mock_repo_manager)
         result = await aggregator.aggregate_by_repository()
@@ -209,6 +217,7 @@ class TestCrossRepoAggregator:
         assert "crackerjack" in result
         assert result["mahavishnu"].total_tasks == 2
         assert result["crackerjack"].total_tasks == 1
+        mock_task_store.list.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_aggregate_by_status(
@@ -368,7 +377,7 @@ class TestCrossRepoAggregator:
                 created_at=datetime.now(UTC),
             ),
         ]
-        mock_task_store.list.return_value = tasks
+        mock_task_store.count_by_repository.return_value = _counts(tasks)
 
         aggregator = CrossRepoAggregator(mock_task_store, mock_repo_manager)
         stats = await aggregator.get_repo_stats("mahavishnu")
@@ -378,6 +387,7 @@ class TestCrossRepoAggregator:
         assert stats.status_counts[TaskStatus.PENDING] == 1
         assert stats.status_counts[TaskStatus.IN_PROGRESS] == 1
         assert stats.status_counts[TaskStatus.COMPLETED] == 1
+        mock_task_store.count_by_repository.assert_awaited_once_with(["mahavishnu"])
 
     @pytest.mark.asyncio
     async def test_aggregate_with_filter(
@@ -479,7 +489,7 @@ class TestCrossRepoAggregator:
                 created_at=datetime.now(UTC),
             ),
         ]
-        mock_task_store.list.return_value = tasks
+        mock_task_store.count_by_repository.return_value = _counts(tasks)
 
         aggregator = CrossRepoAggregator(mock_task_store, mock_repo_manager)
         summary = await aggregator.get_summary()
@@ -490,6 +500,40 @@ class TestCrossRepoAggregator:
         assert summary.in_progress_count == 1
         assert summary.pending_count == 1
 
+    @pytest.mark.asyncio
+    async def test_repo_names_filter_is_one_query(
+        self, mock_task_store: AsyncMock, mock_repo_manager: MagicMock, sample_tasks: list[Task]
+    ) -> None:
+        """Filtering by several repositories issues a single list query."""
+        mock_task_store.list.return_value = sample_tasks[:3]
+
+        aggregator = CrossRepoAggregator(mock_task_store, mock_repo_manager)
+        result = await aggregator.aggregate_with_filter(
+            AggregationFilter(repo_names=["mahavishnu", "crackerjack"], exclude_completed=True)
+        )
+
+        mock_task_store.list.assert_awaited_once()
+        task_filter = mock_task_store.list.await_args.args[0]
+        assert task_filter.repositories == ["mahavishnu", "crackerjack"]
+        assert task_filter.exclude_statuses == [TaskStatus.COMPLETED]
+        assert result.repo_counts == {"mahavishnu": 2, "crackerjack": 1}
+
+    @pytest.mark.asyncio
+    async def test_aggregate_all_counts_only(
+        self, mock_task_store: AsyncMock, mock_repo_manager: MagicMock, sample_tasks: list[Task]
+    ) -> None:
+        """Counts-only aggregation comes from the grouped query."""
+        mock_task_store.count_by_repository.return_value = _counts(sample_tasks)
+
+        aggregator = CrossRepoAggregator(mock_task_store, mock_repo_manager)
+        result = await aggregator.aggregate_all(include_tasks=False)
+
+        assert result.tasks == []
+        assert result.total_count == 5
+        assert result.repo_counts["mahavishnu"] == 2
+        assert result.tag_counts["testing"] == 2
+        mock_task_store.list.assert_not_called()
+
 
 class TestAggregatedTasks:
     """Tests for AggregatedTasks dataclass."""
@@ -12,6 +12,7 @@ from mahavishnu.core.cross_repo_search import (
     SearchResult,
     SearchType,
 )
+from mahavishnu.core.errors import ValidationError
 from mahavishnu.core.task_store import Task, TaskPriority, TaskStatus
 
 
@@ -375,6 +376,18 @@ class TestCrossRepoSearch:
             assert result.to_dict()["task"]["repository"] == result.task.repository
 
 
+    @pytest.mark.asyncio
+    async def test_unindexed_search_fields_are_rejected(
+        self, mock_task_store: AsyncMock, sample_tasks: list[Task]
+    ) -> None:
+        """Fields outside title/description/tags raise instead of matching nothing."""
+        mock_task_store.list.return_value = sample_tasks
+
+        search = CrossRepoSearch(mock_task_store)
+        criteria = SearchCriteria(query="search", search_fields=["title", "repository"])
+        with pytest.raises(ValidationError, match="repository"):
+            await search.search(criteria)
+
 class TestSearchType:
     """Tests for SearchType enum."""
 
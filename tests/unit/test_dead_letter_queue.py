@@ -19,6 +19,7 @@ from unittest.mock import AsyncMock, Mock
 
 import pytest
 
+import mahavishnu.core.dead_letter_queue as dlq_module
 from mahavishnu.core.dead_letter_queue import (
     DeadLetterQueue,
     DeadLetterStatus,
@@ -701,3 +702,210 @@ class TestPersistence:
         call_args = mock_client.delete.call_args
         assert call_args[1]["id"] == "wf_123"
         assert call_args[1]["index"] == "mahavishnu_dlq"
+
+
+class TestScheduler:
+    """Test the due-time heap, concurrent workers and bulk persistence."""
+
+    @pytest.mark.asyncio
+    async def test_only_due_tasks_are_dispatched(self):
+        dlq = DeadLetterQueue(max_size=100)
+        for i in range(5):
+            await dlq.enqueue(
+                task_id=f"wf_now_{i}",
+                task={"type": "test"},
+                repos=[],
+                error="x",
+                retry_policy=RetryPolicy.IMMEDIATE,
+            )
+        await dlq.enqueue(task_id="wf_later", task={}, repos=[], error="x")
+        await dlq.enqueue(
+            task_id="wf_never", task={}, repos=[], error="x", retry_policy=RetryPolicy.NEVER
+        )
+        callback = AsyncMock(return_value=None)
+
+        await dlq._process_ready_tasks(callback)
+        await dlq.wait_for_retries()
+
+        assert callback.await_count == 5
+        remaining = {t.task_id for t in await dlq.list_tasks()}
+        assert remaining == {"wf_later", "wf_never"}
+
+    @pytest.mark.asyncio
+    async def test_due_tasks_run_concurrently_within_limits(self):
+        dlq = DeadLetterQueue(
+            max_size=100, max_concurrent_retries=4, adapter_concurrency={"prefect": 1}
+        )
+        for i in range(8):
+            await dlq.enqueue(
+                task_id=f"wf_{i}",
+                task={},
+                repos=[],
+                error="x",
+                retry_policy=RetryPolicy.IMMEDIATE,
+                metadata={"adapter": "prefect" if i < 3 else "agno"},
+            )
+        active = {"prefect": 0, "agno": 0, "total": 0}
+        peak = {"prefect": 0, "agno": 0, "total": 0}
+
+        async def tracked(failed_task):
+            adapter = failed_task.metadata["adapter"]
+            for key in (adapter, "total"):
+                active[key] += 1
+                peak[key] = max(peak[key], active[key])
+            await asyncio.sleep(0.01)
+            for key in (adapter, "total"):
+                active[key] -= 1
+
+        tasks_by_payload = {id(t.task): t for t in await dlq.list_tasks()}
+
+        async def dispatch(task, repos):
+            await tracked(tasks_by_payload[id(task)])
+
+        await dlq._process_ready_tasks(dispatch)
+        await dlq.wait_for_retries()
+
+        assert dlq._stats["retry_success"] == 8
+        assert peak["prefect"] == 1
+        assert 1 < peak["total"] <= 4
+
+    @pytest.mark.asyncio
+    async def test_failed_retry_waits_for_next_interval(self):
+        dlq = DeadLetterQueue(max_size=100)
+        dlq._retry_interval_seconds = 100
+        await dlq.enqueue(
+            task_id="wf_1",
+            task={},
+            repos=[],
+            error="x",
+            retry_policy=RetryPolicy.IMMEDIATE,
+            max_retries=5,
+        )
+        callback = AsyncMock(side_effect=RuntimeError("still failing"))
+
+        await dlq._process_ready_tasks(callback)
+        await dlq.wait_for_retries()
+        await dlq._process_ready_tasks(callback)
+        await dlq.wait_for_retries()
+
+        assert callback.await_count == 1
+        task = await dlq.get_task("wf_1")
+        assert task.retry_count == 1
+        assert task.status == DeadLetterStatus.PENDING
+        assert dlq._seconds_until_next_due() > 90
+
+    @pytest.mark.asyncio
+    async def test_processor_state_is_persisted_in_bulk(self, monkeypatch):
+        mock_client = AsyncMock()
+        monkeypatch.setattr(dlq_module, "OPENSEARCH_AVAILABLE", True)
+        dlq = DeadLetterQueue(max_size=100, opensearch_client=mock_client)
+        for i in range(3):
+            await dlq.enqueue(
+                task_id=f"wf_{i}",
+                task={"i": i},
+                repos=[],
+                error="x",
+                retry_policy=RetryPolicy.IMMEDIATE,
+            )
+
+        async def callback(task, repos):
+            if task["i"] == 0:
+                raise RuntimeError("boom")
+
+        await dlq._process_ready_tasks(callback)
+        await dlq.wait_for_retries()
+
+        # One bulk call marking RETRYING, one writing outcomes.
+        assert mock_client.bulk.await_count == 2
+        mock_client.update.assert_not_called()
+        final_body = mock_client.bulk.await_args_list[1].kwargs["body"]
+        deletes = [a["delete"]["_id"] for a in final_body if "delete" in a]
+        updates = [a["update"]["_id"] for a in final_body if "update" in a]
+        assert sorted(deletes) == ["wf_1", "wf_2"]
+        assert updates == ["wf_0"]
+
+    @pytest.mark.asyncio
+    async def test_slow_retry_does_not_delay_later_due_tasks(self):
+        dlq = DeadLetterQueue(max_size=100)
+        await dlq.enqueue(
+            task_id="wf_slow",
+            task={"slow": True},
+            repos=[],
+            error="x",
+            retry_policy=RetryPolicy.IMMEDIATE,
+        )
+        release = asyncio.Event()
+        finished: list[str] = []
+
+        async def callback(task, repos):
+            if task.get("slow"):
+                await release.wait()
+            finished.append("slow" if task.get("slow") else "fast")
+
+        await dlq._process_ready_tasks(callback)
+        await dlq.enqueue(
+            task_id="wf_fast", task={}, repos=[], error="x", retry_policy=RetryPolicy.IMMEDIATE
+        )
+        await dlq._process_ready_tasks(callback)
+        await asyncio.sleep(0)
+
+        assert finished == ["fast"]
+        release.set()
+        await dlq.wait_for_retries()
+        assert finished == ["fast", "slow"]
+
+    @pytest.mark.asyncio
+    async def test_throttled_adapter_does_not_hold_global_slots(self):
+        dlq = DeadLetterQueue(
+            max_size=100, max_concurrent_retries=2, adapter_concurrency={"prefect": 1}
+        )
+        for i in range(3):
+            await dlq.enqueue(
+                task_id=f"wf_p{i}",
+                task={"adapter": "prefect"},
+                repos=[],
+                error="x",
+                retry_policy=RetryPolicy.IMMEDIATE,
+                metadata={"adapter": "prefect"},
+            )
+        await dlq.enqueue(
+            task_id="wf_agno",
+            task={"adapter": "agno"},
+            repos=[],
+            error="x",
+            retry_policy=RetryPolicy.IMMEDIATE,
+            metadata={"adapter": "agno"},
+        )
+        release = asyncio.Event()
+        finished: list[str] = []
+
+        async def callback(task, repos):
+            if task["adapter"] == "prefect":
+                await release.wait()
+            finished.append(task["adapter"])
+
+        await dlq._process_ready_tasks(callback)
+        for _ in range(3):
+            await asyncio.sleep(0)
+
+        assert finished == ["agno"]
+        release.set()
+        await dlq.wait_for_retries()
+        assert finished.count("prefect") == 3
+
+    @pytest.mark.asyncio
+    async def test_archive_and_manual_success_invalidate_heap_entries(self):
+        dlq = DeadLetterQueue(max_size=100)
+        for task_id in ("wf_a", "wf_b"):
+            await dlq.enqueue(
+                task_id=task_id, task={}, repos=[], error="x", retry_policy=RetryPolicy.IMMEDIATE
+            )
+        await dlq.archive_task("wf_a")
+        callback = AsyncMock(return_value=None)
+
+        await dlq._process_ready_tasks(callback)
+        await dlq.wait_for_retries()
+
+        assert callback.await_count == 1
+        assert await dlq.get_task("wf_b") is None
+        assert dlq._seconds_until_next_due() is None
@@ -10,6 +10,8 @@ Tests cover:
 
 from __future__ import annotations
 
+import random
+
 import pytest
 
 from mahavishnu.core.dependency_graph import (
@@ -524,3 +526,110 @@ class TestDependencyTypes:
         edge = graph.add_dependency("task-1", "task-2", dependency_type=DependencyType.SUBTASK)
 
         assert edge.dependency_type == DependencyType.SUBTASK
+
+
+class TestIncrementalState:
+    """Test incrementally maintained ready/blocked sets and ordering."""
+
+    @staticmethod
+    def _assert_consistent(graph: DependencyGraph) -> None:
+        expected_blocked = {
+            tid
+            for tid in graph
+            if any(
+                graph.get_edge(dep_id, tid).status
+                in (DependencyStatus.PENDING, DependencyStatus.FAILED)
+                for dep_id in graph.get_dependencies(tid)
+            )
+        }
+        assert set(graph.get_blocked_tasks()) == expected_blocked
+        assert set(graph.get_ready_tasks()) == set(graph) - expected_blocked
+
+        order = graph.topological_sort()
+        assert sorted(order) == sorted(graph)
+        position = {tid: i for i, tid in enumerate(order)}
+        for edge in graph.get_all_edges():
+            assert position[edge.dependency_id] < position[edge.dependent_id]
+
+    def test_status_updates_move_tasks_between_sets(self) -> None:
+        """Satisfying and failing edges updates readiness without a rescan."""
+        graph = DependencyGraph()
+        graph.add_dependency("a", "c")
+        graph.add_dependency("b", "c")
+        assert graph.get_blocked_tasks() == ["c"]
+
+        graph.update_edge_status("a", "c", DependencyStatus.SATISFIED)
+        assert graph.is_blocked("c")
+        graph.update_edge_status("b", "c", DependencyStatus.CANCELLED)
+        assert not graph.is_blocked("c")
+        assert graph.get_ready_count() == 3
+
+        graph.update_edge_status("a", "c", DependencyStatus.FAILED)
+        assert graph.get_blocked_count() == 1
+        graph.remove_task("a")
+        assert graph.get_ready_tasks() == ["b", "c"]
+
+    def test_back_edge_reorders_and_caches_order(self) -> None:
+        """An edge against the insertion order re-ranks only affected tasks."""
+        graph = DependencyGraph()
+        for tid in ("d", "c", "b", "a"):
+            graph.add_task(tid)
+        graph.add_dependency("c", "d")
+        graph.add_dependency("a", "b")
+        graph.add_dependency("b", "c")
+
+        assert graph.topological_sort() == ["a", "b", "c", "d"]
+        cached = graph._topo_cache
+        graph.update_edge_status("a", "b", DependencyStatus.SATISFIED)
+        graph.topological_sort()
+        assert graph._topo_cache is cached
+
+        with pytest.raises(CircularDependencyError):
+            graph.add_dependency("d", "a")
+        assert graph.get_edge("d", "a") is None
+        self._assert_consistent(graph)
+
+    def test_unvalidated_cycle_recovers_after_removal(self) -> None:
+        """Removing an unvalidated cycle edge restores a topological order."""
+        graph = DependencyGraph()
+        graph.add_dependency("a", "b")
+        graph.add_dependency("b", "a", validate=False)
+        assert graph.has_cycle()
+
+        graph.remove_dependency("b", "a")
+        assert not graph.has_cycle()
+        graph.add_dependency("b", "c")
+        with pytest.raises(CircularDependencyError):
+            graph.add_dependency("c", "a")
+        self._assert_consistent(graph)
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_random_edits_match_full_recomputation(self, seed: int) -> None:
+        """Random edits keep the incremental state equal to a rescan."""
+        rng = random.Random(seed)
+        graph = DependencyGraph()
+        tasks = [f"t{i}" for i in range(30)]
+        statuses = list(DependencyStatus)
+
+        for _ in range(400):
+            op = rng.random()
+            a, b = rng.sample(tasks, 2)
+            if op < 0.5:
+                try:
+                    graph.add_dependency(a, b)
+                except (CircularDependencyError, DependencyError):
+                    pass
+            elif op < 0.7:
+                edges = graph.get_all_edges()
+                if edges:
+                    edge = rng.choice(edges)
+                    graph.update_edge_status(
+                        edge.dependency_id, edge.dependent_id, rng.choice(statuses)
+                    )
+            elif op < 0.9:
+                graph.remove_dependency(a, b)
+            else:
+                graph.remove_task(a)
+
+        assert not graph.has_cycle()
+        self._assert_consistent(graph)
@@ -376,7 +376,7 @@ class TestEcosystemStatusServiceCollectionBranches:
             async def __aexit__(self, exc_type, exc, tb):
                 return False
 
-            async def get(self, url):
+            async def get(self, url, **kwargs):
                 return FakeResponse()
 
         monkeypatch.setattr(httpx, "AsyncClient", FakeClient)
@@ -1103,3 +1103,102 @@ class TestEmbeddingCacheSetGetEdgeCases:
         with patch.object(cache, "_get_l2_client", AsyncMock()) as get_l2:
             await cache.set("text", [1.0, 2.0])
         get_l2.assert_not_called()
+
+
+class TestEmbeddingCacheBatchPath:
+    """Tests for the pipelined batch lookup and bulk write path."""
+
+    @staticmethod
+    def _l2_client(store: dict[str, bytes]) -> MagicMock:
+        client = MagicMock()
+        client.mget = AsyncMock(side_effect=lambda keys: [store.get(k) for k in keys])
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=[])
+        client.pipeline = MagicMock(return_value=pipe)
+        return client
+
+    def test_vector_encoding_roundtrip_and_legacy_json(self) -> None:
+        """Float32 encoding round-trips; legacy JSON values still decode."""
+        from mahavishnu.core.embedding_cache import _decode_vector, _encode_vector
+
+        encoded = _encode_vector([0.5, -1.25, 3.0])
+        assert len(encoded) == 4 + 3 * 4
+        assert _decode_vector(encoded) == [0.5, -1.25, 3.0]
+        assert _decode_vector(json.dumps([0.1, 0.2])) == [0.1, 0.2]
+        assert _decode_vector(b"[1.0]") == [1.0]
+
+    @pytest.mark.asyncio
+    async def test_batch_uses_one_mget_one_compute_one_pipeline(self) -> None:
+        """L1 hits skip L2; L1 misses share one MGET; the rest share one write."""
+        from mahavishnu.core.embedding_cache import _encode_vector
+
+        config = EmbeddingCacheConfig(l2_enabled=True)
+        cache = EmbeddingCache(config)
+        cache._l1.set(cache._hash_text("a"), [1.0])
+        store = {cache._make_l2_key(cache._hash_text("b")): _encode_vector([2.0])}
+        client = self._l2_client(store)
+        calls: list[list[str]] = []
+
+        async def compute_fn(texts: list[str]) -> list[list[float]]:
+            calls.append(texts)
+            return [[float(len(t))] for t in texts]
+
+        with patch.object(cache, "_get_l2_client", AsyncMock(return_value=client)):
+            results = await cache.get_batch_or_compute(["a", "b", "cc", "ddd", "cc"], compute_fn)
+
+        assert results == [[1.0], [2.0], [2.0], [3.0], [2.0]]
+        assert client.mget.await_count == 1
+        assert len(client.mget.await_args.args[0]) == 3
+        assert calls == [["cc", "ddd"]]
+        pipe = client.pipeline.return_value
+        assert pipe.set.call_count == 2
+        assert pipe.execute.await_count == 1
+        assert isinstance(pipe.set.call_args.args[1], bytes)
+        assert "ex" in pipe.set.call_args.kwargs
+
+        metrics = cache._metrics
+        assert metrics.batch_items == 4
+        assert metrics.batch_l1_hits == 1
+        assert metrics.batch_l2_lookups == 3
+        assert metrics.batch_l2_hits == 1
+        assert metrics.batch_computed == 2
+        assert cache.get_stats()["batch_l1_hit_rate"] == "25.00%"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_batches_compute_shared_keys_once(self) -> None:
+        """Overlapping concurrent batches compute each missing key once."""
+        cache = EmbeddingCache()
+        computed: list[str] = []
+        gate = asyncio.Event()
+
+        async def compute_fn(texts: list[str]) -> list[list[float]]:
+            computed.extend(texts)
+            await gate.wait()
+            return [[float(ord(t[0]))] for t in texts]
+
+        first = asyncio.create_task(cache.get_batch_or_compute(["x", "y"], compute_fn))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(cache.get_batch_or_compute(["y", "z"], compute_fn))
+        await asyncio.sleep(0)
+        gate.set()
+
+        assert await first == [[120.0], [121.0]]
+        assert await second == [[121.0], [122.0]]
+        assert sorted(computed) == ["x", "y", "z"]
+        assert cache._metrics.batch_coalesced == 1
+
+    @pytest.mark.asyncio
+    async def test_batch_mget_failure_falls_back_to_compute(self) -> None:
+        """An L2 failure records a circuit failure and computes everything."""
+        cache = EmbeddingCache(EmbeddingCacheConfig(l2_enabled=True))
+        client = self._l2_client({})
+        client.mget = AsyncMock(side_effect=ConnectionError("redis down"))
+
+        async def compute_fn(texts: list[str]) -> list[list[float]]:
+            return [[1.0] for _ in texts]
+
+        with patch.object(cache, "_get_l2_client", AsyncMock(return_value=client)):
+            results = await cache.get_batch_or_compute(["a", "b"], compute_fn)
+
+        assert results == [[1.0], [1.0]]
+        assert cache._circuit_breaker.failure_count >= 1
@@ -4,16 +4,21 @@ Tests cover:
 - Event creation and serialization
 - Event persistence
 - State reconstruction
+- Snapshot-resumed replay
 - Event queries
 """
 
 from __future__ import annotations
 
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
+import json
+import random
 from unittest.mock import AsyncMock, MagicMock
+import uuid
 
 import pytest
 
+from mahavishnu.core import event_store as event_store_module
 from mahavishnu.core.event_store import (
     EventStore,
     TaskEvent,
@@ -559,3 +564,227 @@ class TestTaskStateUncoveredBranches:
         )
         state.apply_event(event)
         assert state.status == "cancelled"
+
+
+class _SnapshotDB:
+    """In-memory stand-in for the task_events and task_state_snapshots tables."""
+
+    def __init__(self) -> None:
+        self.events: list[dict] = []
+        self.snapshots: dict[tuple[str, int], dict] = {}
+        self.fetched: list[int] = []
+
+    async def fetch(self, query: str, *params):
+        assert "FROM task_events" in query
+        rows = [r for r in self.events if r["task_id"] == params[0]]
+        if "(occurred_at, id) >" in query:
+            rows = [r for r in rows if (r["occurred_at"], r["id"]) > (params[1], params[2])]
+        if "occurred_at <=" in query:
+            rows = [r for r in rows if r["occurred_at"] <= params[-2]]
+        rows.sort(key=lambda r: (r["occurred_at"], r["id"]))
+        rows = rows[: params[-1]]
+        self.fetched.append(len(rows))
+        return rows
+
+    async def fetchrow(self, query: str, *params):
+        assert "FROM task_state_snapshots" in query
+        rows = [r for (task_id, _), r in self.snapshots.items() if task_id == params[0]]
+        if "last_occurred_at <=" in query:
+            rows = [r for r in rows if r["last_occurred_at"] <= params[1]]
+        return max(rows, key=lambda r: r["version"], default=None)
+
+    async def execute(self, query: str, *params) -> str:
+        if "INSERT INTO task_state_snapshots" in query:
+            task_id, version, last_event_id, last_occurred_at, state = params
+            self.snapshots.setdefault(
+                (task_id, version),
+                {
+                    "version": version,
+                    "last_event_id": last_event_id,
+                    "last_occurred_at": last_occurred_at,
+                    "state": state,
+                },
+            )
+            return "INSERT 0 1"
+        assert "DELETE FROM task_state_snapshots" in query
+        keep, *scope = params
+        deleted = 0
+        for task_id in {t for t, _ in self.snapshots if not scope or t == scope[0]}:
+            versions = sorted((v for t, v in self.snapshots if t == task_id), reverse=True)
+            for version in versions[keep:]:
+                del self.snapshots[(task_id, version)]
+                deleted += 1
+        return f"DELETE {deleted}"
+
+    def add_event(self, task_id: str, event_type: str, data: dict, occurred_at: datetime) -> None:
+        self.events.append(
+            {
+                "id": str(uuid.uuid4()),
+                "task_id": task_id,
+                "event_type": event_type,
+                "event_data": json.dumps(data),
+                "actor": "test",
+                "occurred_at": occurred_at,
+                "correlation_id": None,
+                "idempotency_key": None,
+            }
+        )
+
+
+def _random_event(rng: random.Random) -> tuple[str, dict]:
+    event_type = rng.choice(list(TaskEventType))
+    data = {
+        TaskEventType.CREATED: {
+            "title": f"t{rng.randrange(100)}",
+            "repository": rng.choice(["mahavishnu", "akosha"]),
+            "tags": rng.sample(["a", "b", "c"], rng.randrange(3)),
+        },
+        TaskEventType.UPDATED: {"title": f"u{rng.randrange(100)}", "metadata": {"k": rng.random()}},
+        TaskEventType.STATUS_CHANGED: {"new_status": rng.choice(["pending", "in_progress"])},
+        TaskEventType.PRIORITY_CHANGED: {"new_priority": rng.choice(["low", "high"])},
+        TaskEventType.ASSIGNED: {"assignee": rng.choice(["ann", "bo"])},
+        TaskEventType.TAG_ADDED: {"tag": rng.choice(["a", "b", "c", "d"])},
+        TaskEventType.TAG_REMOVED: {"tag": rng.choice(["a", "b", "c", "d"])},
+    }.get(event_type, {})
+    return event_type.value, data
+
+
+def _full_replay(db: _SnapshotDB, task_id: str, as_of: datetime | None = None) -> dict | None:
+    rows = sorted(
+        (
+            r
+            for r in db.events
+            if r["task_id"] == task_id and (as_of is None or r["occurred_at"] <= as_of)
+        ),
+        key=lambda r: (r["occurred_at"], r["id"]),
+    )
+    if not rows:
+        return None
+    state = TaskState(task_id=task_id)
+    for row in rows:
+        state.apply_event(TaskEvent.from_row(row))
+    return state.to_dict()
+
+
+class TestReplaySnapshots:
+    """Replay resumed from task_state_snapshots."""
+
+    BASE = datetime(2026, 1, 1, tzinfo=UTC)
+
+    def test_task_state_dict_round_trip(self) -> None:
+        state = TaskState(
+            task_id="t1",
+            title="Snap",
+            tags=["a"],
+            metadata={"k": 1},
+            created_at=self.BASE,
+            completed_at=self.BASE + timedelta(hours=1),
+            is_deleted=True,
+            version=7,
+        )
+
+        assert TaskState.from_dict(json.loads(json.dumps(state.to_dict()))) == state
+
+    @pytest.fixture
+    def clock(self, monkeypatch: pytest.MonkeyPatch) -> list[datetime]:
+        """Wall clock seen by the event store; tests append to move it."""
+        ticks = [self.BASE]
+
+        class _Clock(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return ticks[-1]
+
+        monkeypatch.setattr(event_store_module, "datetime", _Clock)
+        return ticks
+
+    @pytest.mark.parametrize("seed", range(25))
+    async def test_snapshot_replay_matches_full_replay(
+        self, seed: int, clock: list[datetime]
+    ) -> None:
+        rng = random.Random(seed)
+        db = _SnapshotDB()
+        keep = rng.randint(1, 3)
+        store = EventStore(db, snapshot_every=rng.randint(1, 8), keep_snapshots=keep)
+        now = self.BASE
+
+        for _ in range(rng.randint(3, 12)):
+            for _ in range(rng.randint(1, 15)):
+                # Zero steps give timestamp ties, ordered by event id.
+                now += timedelta(seconds=rng.choice([0, 0, 1, 5, 60]))
+                db.add_event("t1", *_random_event(rng), occurred_at=now)
+            clock.append(now)
+
+            state = await store.replay_task_state("t1")
+            assert state is not None
+            assert state.to_dict() == _full_replay(db, "t1")
+
+            as_of = self.BASE + (now - self.BASE) * rng.random()
+            past = await store.replay_task_state("t1", as_of=as_of)
+            expected = _full_replay(db, "t1", as_of)
+            assert (past.to_dict() if past else None) == expected
+
+        assert 1 <= len(db.snapshots) <= keep
+
+    async def test_replay_reads_only_tail_events(self) -> None:
+        db = _SnapshotDB()
+        store = EventStore(db, snapshot_every=10)
+        for i in range(50):
+            db.add_event("t1", "updated", {"title": f"v{i}"}, self.BASE + timedelta(seconds=i))
+
+        await store.replay_task_state("t1")
+        db.add_event("t1", "completed", {}, self.BASE + timedelta(minutes=5))
+        state = await store.replay_task_state("t1")
+
+        assert db.fetched == [50, 1]
+        assert (state.title, state.status, state.version) == ("v49", "completed", 51)
+
+    async def test_recent_events_are_not_snapshotted(self) -> None:
+        db = _SnapshotDB()
+        store = EventStore(db, snapshot_every=2)
+        recent = datetime.now(UTC)
+        for i in range(3):
+            db.add_event("t1", "updated", {"title": f"v{i}"}, recent)
+
+        await store.replay_task_state("t1")
+
+        assert db.snapshots == {}
+
+    async def test_snapshot_task_on_demand_and_compaction(self) -> None:
+        db = _SnapshotDB()
+        store = EventStore(db, snapshot_every=None, keep_snapshots=2)
+        db.add_event("t1", "created", {"title": "x"}, self.BASE)
+
+        assert await store.snapshot_task("missing") is None
+        for i in range(3):
+            db.add_event("t1", "tag_added", {"tag": f"g{i}"}, self.BASE + timedelta(seconds=i))
+            snapshot = await store.snapshot_task("t1")
+
+        assert snapshot.version == 4
+        assert sorted(db.snapshots) == [("t1", 3), ("t1", 4)]
+        assert (await store.snapshot_task("t1")).version == 4
+        assert await store.compact_snapshots(keep=1) == 1
+
+    async def test_snapshot_task_leaves_unsettled_events_in_the_tail(self) -> None:
+        db = _SnapshotDB()
+        store = EventStore(db, snapshot_every=None)
+        db.add_event("t1", "created", {"title": "x"}, self.BASE)
+        recent = datetime.now(UTC)
+        db.add_event("t1", "updated", {"title": "y"}, recent)
+
+        snapshot = await store.snapshot_task("t1")
+        db.add_event("t1", "tag_added", {"tag": "late"}, recent - timedelta(seconds=1))
+        state = await store.replay_task_state("t1")
+
+        assert (snapshot.version, snapshot.state.title) == (1, "x")
+        assert (state.version, state.title, state.tags) == (3, "y", ["late"])
+
+    async def test_unreadable_snapshots_fall_back_to_full_replay(self) -> None:
+        db = _SnapshotDB()
+        db.add_event("t1", "created", {"title": "x"}, self.BASE)
+        db.fetchrow = AsyncMock(side_effect=RuntimeError("no such table"))
+        store = EventStore(db)
+
+        state = await store.replay_task_state("t1")
+
+        assert state.title == "x"
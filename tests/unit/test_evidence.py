@@ -394,7 +394,7 @@ class TestEvidenceRetrieverFindSimilar:
             resp.status_code = 500
             return resp
 
-        with patch("mahavishnu.core.evidence_retriever.httpx.AsyncClient") as mock_client:
+        with patch("httpx.AsyncClient") as mock_client:
             instance = MagicMock()
             instance.post = mock_post
             instance.__aenter__ = AsyncMock(return_value=instance)
@@ -428,7 +428,7 @@ class TestEvidenceRetrieverFindSimilar:
             }
         )
 
-        with patch("mahavishnu.core.evidence_retriever.httpx.AsyncClient") as mock_client:
+        with patch("httpx.AsyncClient") as mock_client:
             instance = MagicMock()
             instance.post = AsyncMock(return_value=mock_response)
             instance.__aenter__ = AsyncMock(return_value=instance)
@@ -462,7 +462,7 @@ class TestEvidenceRetrieverFindSimilar:
             }
         )
 
-        with patch("mahavishnu.core.evidence_retriever.httpx.AsyncClient") as mock_client:
+        with patch("httpx.AsyncClient") as mock_client:
             instance = MagicMock()
             instance.post = AsyncMock(return_value=mock_response)
             instance.__aenter__ = AsyncMock(return_value=instance)
@@ -694,7 +694,7 @@ class TestEvidenceRetrieverErrors:
                 return akosha_error
             return sb_success
 
-        with patch("mahavishnu.core.evidence_retriever.httpx.AsyncClient") as mock_client:
+        with patch("httpx.AsyncClient") as mock_client:
             instance = MagicMock()
             instance.post = mock_post
             instance.__aenter__ = AsyncMock(return_value=instance)
@@ -726,9 +726,8 @@ class TestSessionBuddyEvidenceSource:
         mock_client_instance = MagicMock()
         mock_client_instance.post = mock_post
 
-        with patch("mahavishnu.core.evidence_collector.httpx.AsyncClient") as mock_client_cls:
-            mock_client_cls.return_value.__aenter__.return_value = mock_client_instance
-            mock_client_cls.return_value.__aexit__ = AsyncMock(return_value=None)
+        with patch("mahavishnu.core.evidence_collector.get_http_client") as mock_get_client:
+            mock_get_client.return_value = mock_client_instance
 
             with pytest.raises(httpx.RequestError):
                 await source.get_recent_outcomes(limit=10)
@@ -220,6 +220,20 @@ def test_metrics_endpoint_returns_200(client: TestClient, fake_metrics_module: M
     assert response.headers["content-type"].startswith("text/plain")
 
 
+def test_metrics_endpoint_exports_http_pool_metrics(
+    client: TestClient, fake_metrics_module: ModuleType, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Each scrape refreshes the HTTP client pool gauges first."""
+    from mahavishnu.core import http_clients
+
+    calls: list[bool] = []
+    monkeypatch.setattr(http_clients, "export_http_pool_metrics", lambda: calls.append(True))
+
+    client.get("/metrics")
+
+    assert calls == [True]
+
+
 # ---------------------------------------------------------------------------
 # GET / (root)
 # ---------------------------------------------------------------------------
@@ -0,0 +1,146 @@
+"""Tests for the shared HTTP client registry (mahavishnu.core.http_clients)."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import httpx
+import pytest
+
+from mahavishnu.core.http_clients import (
+    AKOSHA,
+    EXTERNAL,
+    OLLAMA,
+    HttpClientRegistry,
+    ServiceClientConfig,
+)
+
+
+def _transport(handler):
+    return httpx.MockTransport(handler)
+
+
+class TestHttpClientRegistry:
+    """Client reuse, per-service limits and lifecycle."""
+
+    async def test_reuses_client_per_service_on_same_loop(self) -> None:
+        registry = HttpClientRegistry()
+
+        client = registry.get(AKOSHA)
+
+        assert registry.get(AKOSHA) is client
+        assert registry.get(OLLAMA) is not client
+        await registry.aclose()
+        assert client.is_closed
+
+    async def test_applies_service_limits_and_timeouts(self) -> None:
+        registry = HttpClientRegistry(
+            {AKOSHA: ServiceClientConfig(max_connections=3, timeout=7.0, connect_timeout=2.0)}
+        )
+
+        client = registry.get(AKOSHA)
+
+        assert client.timeout == httpx.Timeout(7.0, connect=2.0)
+        assert client._transport._pool._max_connections == 3
+        assert registry.config_for("unknown") == registry.config_for(EXTERNAL)
+        await registry.aclose()
+
+    def test_new_event_loop_gets_a_fresh_client(self) -> None:
+        registry = HttpClientRegistry()
+
+        async def grab() -> httpx.AsyncClient:
+            return registry.get(AKOSHA)
+
+        first = asyncio.run(grab())
+        second = asyncio.run(grab())
+
+        assert first is not second
+        # The client from the finished loop is dropped, not leaked.
+        assert len(registry._clients) == 1
+
+    async def test_recreates_client_after_close(self) -> None:
+        registry = HttpClientRegistry()
+        client = registry.get(AKOSHA)
+
+        await registry.aclose()
+        await registry.aclose()  # idempotent
+
+        assert registry.get(AKOSHA) is not client
+        await registry.aclose()
+
+    async def test_closes_clients_on_other_running_loops(self) -> None:
+        registry = HttpClientRegistry()
+        other = asyncio.new_event_loop()
+        thread = threading.Thread(target=other.run_forever, daemon=True)
+        thread.start()
+
+        async def grab() -> httpx.AsyncClient:
+            return registry.get(AKOSHA)
+
+        try:
+            client = asyncio.run_coroutine_threadsafe(grab(), other).result(timeout=5)
+            await registry.aclose()
+            assert client.is_closed
+        finally:
+            other.call_soon_threadsafe(other.stop)
+            thread.join(timeout=5)
+            other.close()
+
+    async def test_counts_clients_on_stopped_loops_as_dropped(self) -> None:
+        registry = HttpClientRegistry()
+        stopped = asyncio.new_event_loop()
+
+        async def grab() -> httpx.AsyncClient:
+            return registry.get(AKOSHA)
+
+        try:
+            await asyncio.to_thread(stopped.run_until_complete, grab())
+            await registry.aclose()
+        finally:
+            stopped.close()
+
+        assert registry.stats()[AKOSHA]["dropped"] == 1
+
+    def test_sync_client_is_shared(self) -> None:
+        registry = HttpClientRegistry()
+
+        client = registry.get_sync(AKOSHA)
+
+        assert registry.get_sync(AKOSHA) is client
+        assert isinstance(client, httpx.Client)
+        client.close()
+
+
+class TestPoolStats:
+    """Utilization reporting."""
+
+    async def test_counts_requests_per_service(self) -> None:
+        registry = HttpClientRegistry()
+        client = registry.get(AKOSHA)
+        client._transport = _transport(lambda request: httpx.Response(200))
+
+        await client.get("http://akosha.test/health")
+        await client.get("http://akosha.test/health")
+
+        stats = registry.stats()
+        assert stats[AKOSHA]["requests"] == 2
+        assert stats[AKOSHA]["max_connections"] == registry.config_for(AKOSHA).max_connections
+        await registry.aclose()
+
+    async def test_stats_are_empty_before_use(self) -> None:
+        assert HttpClientRegistry().stats() == {}
+
+    async def test_start_warms_requested_services(self) -> None:
+        registry = HttpClientRegistry()
+
+        await registry.start([AKOSHA, OLLAMA])
+
+        assert set(registry.stats()) == {AKOSHA, OLLAMA}
+        assert all(entry["connections"] == 0 for entry in registry.stats().values())
+        await registry.aclose()
+
+
+def test_get_requires_running_loop() -> None:
+    with pytest.raises(RuntimeError):
+        HttpClientRegistry().get(AKOSHA)
@@ -7,6 +7,7 @@ This module tests the HybridSearchEngine implementation:
 - Error handling and edge cases
 """
 
+import asyncio
 from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
@@ -18,6 +19,7 @@ from mahavishnu.core.search import (
     HybridSearchEngine,
     HybridSearchResult,
 )
+from mahavishnu.core.search.hybrid_search import HNSW_DEFAULT_EF_SEARCH
 
 # =============================================================================
 # Fixtures
@@ -92,6 +94,15 @@ class TestHybridSearchConfig:
         with pytest.raises(ValueError, match="min_score must be between 0.0 and 1.0"):
             HybridSearchConfig(min_score=1.5)
 
+    def test_invalid_retrieval_options(self):
+        """Test that unknown modes and empty candidate stages are rejected."""
+        with pytest.raises(ValueError, match="retrieval_mode"):
+            HybridSearchConfig(retrieval_mode="exhaustive")
+        with pytest.raises(ValueError, match="fusion"):
+            HybridSearchConfig(fusion="max")
+        with pytest.raises(ValueError, match="candidates"):
+            HybridSearchConfig(vector_candidates=0)
+
 
 # =============================================================================
 # HybridSearchResult Tests
@@ -180,6 +191,7 @@ class TestHybridSearchEngine:
         # Mock database results
         mock_conn = AsyncMock()
         mock_conn.fetch = AsyncMock(return_value=[])
+        mock_conn.transaction = MagicMock(return_value=AsyncMock())
         mock_pool.acquire.return_value.__aenter__ = MagicMock(return_value=mock_conn)
         mock_pool.acquire.return_value.__aexit__ = MagicMock(return_value=None)
 
@@ -319,6 +331,155 @@ class TestHybridSearchEngine:
         assert deleted is False
 
 
+# =============================================================================
+# Two-Stage Retrieval Tests
+# =============================================================================
+
+
+def _row(doc_id, semantic_score, lexical_score):
+    now = datetime.now(UTC)
+    return {
+        "id": doc_id,
+        "source_type": "document",
+        "title": f"doc {doc_id}",
+        "content": "content",
+        "repository": "mahavishnu",
+        "metadata": {},
+        "created_at": now,
+        "updated_at": now,
+        "semantic_score": semantic_score,
+        "lexical_score": lexical_score,
+    }
+
+
+def _engine_with_stages(mock_pool, vector_rows, lexical_rows, **config):
+    """Build an engine whose connection answers each stage query."""
+    embedding_service = AsyncMock()
+    embedding_service.embed.return_value = MagicMock(embeddings=[[0.1] * 384])
+
+    async def fetch(sql, *args):
+        return lexical_rows if "@@" in sql else vector_rows
+
+    mock_conn = AsyncMock()
+    mock_conn.fetch = AsyncMock(side_effect=fetch)
+    mock_conn.transaction = MagicMock(return_value=AsyncMock())
+    mock_pool.acquire.return_value.__aenter__ = MagicMock(return_value=mock_conn)
+    mock_pool.acquire.return_value.__aexit__ = MagicMock(return_value=None)
+
+    engine = HybridSearchEngine(
+        connection_pool=mock_pool,
+        config=HybridSearchConfig(min_score=0.0, **config),
+        embedding_service=embedding_service,
+    )
+    return engine, mock_conn
+
+
+class TestTwoStageRetrieval:
+    """Test index-backed candidate stages and rank fusion."""
+
+    @pytest.mark.asyncio
+    async def test_stages_use_index_ordering_and_candidate_limits(self, mock_pool):
+        """Each stage orders by its own indexed expression with its own LIMIT."""
+        engine, conn = _engine_with_stages(
+            mock_pool, [], [], vector_candidates=50, lexical_candidates=30
+        )
+
+        await engine.search("auth flow", repository="mahavishnu", limit=40)
+
+        assert conn.fetch.await_count == 2
+        calls = {("@@" in c.args[0]): c.args for c in conn.fetch.await_args_list}
+        vector_sql, lexical_sql = calls[False][0], calls[True][0]
+        assert "ORDER BY e.embedding <=> $1::vector" in vector_sql
+        assert "ts_rank" not in vector_sql.split("ORDER BY")[1]
+        assert "content_tsv @@ plainto_tsquery" in lexical_sql
+        # Stage sizes never drop below the requested limit
+        assert calls[False][1:] == ([0.1] * 384, "auth flow", "mahavishnu", 50)
+        assert calls[True][1:] == ([0.1] * 384, "auth flow", "mahavishnu", 40)
+
+    @pytest.mark.asyncio
+    async def test_vector_stage_raises_ef_search_in_its_transaction(self, mock_pool):
+        """The HNSW scan is widened to the candidate count, never below the default."""
+        engine, conn = _engine_with_stages(mock_pool, [], [], vector_candidates=200)
+
+        await engine.search("query", limit=10)
+
+        conn.transaction.assert_called_once()
+        conn.execute.assert_awaited_once()
+        sql, value = conn.execute.await_args.args
+        assert "set_config('hnsw.ef_search', $1, true)" in sql
+        assert value == "200"
+
+        conn.execute.reset_mock()
+        engine.config.vector_candidates = 5
+        await engine.search("query", limit=10)
+        assert conn.execute.await_args.args[1] == str(HNSW_DEFAULT_EF_SEARCH)
+
+    @pytest.mark.asyncio
+    async def test_weighted_fusion_matches_single_query_scores(self, mock_pool):
+        """Weighted fusion dedupes candidates and keeps the combined score formula."""
+        a, b, c = uuid4(), uuid4(), uuid4()
+        engine, _ = _engine_with_stages(
+            mock_pool,
+            vector_rows=[_row(a, 0.9, 0.0), _row(b, 0.8, 0.5)],
+            lexical_rows=[_row(b, 0.8, 0.5), _row(c, 0.2, 1.4)],
+        )
+
+        results = await engine.search("query", limit=10)
+
+        assert [r.id for r in results] == [b, a, c]
+        assert results[0].combined_score == pytest.approx(0.7 * 0.8 + 0.3 * 0.5)
+        assert results[2].lexical_score == 1.0
+
+    @pytest.mark.asyncio
+    async def test_rrf_fusion_rewards_agreement(self, mock_pool):
+        """RRF ranks documents found by both stages first and scales to [0, 1]."""
+        a, b, c = uuid4(), uuid4(), uuid4()
+        engine, _ = _engine_with_stages(
+            mock_pool,
+            vector_rows=[_row(b, 0.9, 0.1), _row(a, 0.85, 0.0)],
+            lexical_rows=[_row(b, 0.9, 0.1), _row(c, 0.1, 0.9)],
+            fusion="rrf",
+            rrf_k=60,
+        )
+
+        results = await engine.search("query", limit=2)
+
+        assert [r.id for r in results] == [b, a]
+        assert results[0].combined_score == pytest.approx(1.0)
+        assert results[1].combined_score == pytest.approx(0.7 * 61 / 62)
+
+    @pytest.mark.asyncio
+    async def test_stages_run_concurrently(self, mock_pool):
+        """Neither stage waits for the other to finish before starting."""
+        started = 0
+        both_started = asyncio.Event()
+
+        async def fetch(sql, *args):
+            nonlocal started
+            started += 1
+            if started == 2:
+                both_started.set()
+            await asyncio.wait_for(both_started.wait(), timeout=1.0)
+            return []
+
+        engine, conn = _engine_with_stages(mock_pool, [], [])
+        conn.fetch.side_effect = fetch
+
+        assert await engine.search("query") == []
+        assert started == 2
+
+    @pytest.mark.asyncio
+    async def test_single_query_mode_keeps_plan_query(self, mock_pool):
+        """single_query mode issues the original weighted ORDER BY."""
+        engine, conn = _engine_with_stages(mock_pool, [], [], retrieval_mode="single_query")
+
+        await engine.search("query", limit=5)
+
+        conn.fetch.assert_awaited_once()
+        sql = conn.fetch.await_args.args[0]
+        assert "($4::float * (1 - (e.embedding <=> $1::vector)))" in sql
+
+
 # =============================================================================
 # Integration Tests
 # =============================================================================
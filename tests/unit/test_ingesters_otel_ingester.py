@@ -602,6 +602,58 @@ class TestIngestBatch:
         # The error message references the failing trace id
         assert "unknown" in result["errors"][0]
 
+    @pytest.mark.asyncio
+    async def test_ingest_batch_embeds_distinct_contents_once(self) -> None:
+        """Duplicate contents in a batch share one embedder call."""
+        hot_store = MagicMock()
+        hot_store.insert = AsyncMock()
+        ingester = _make_ingester(hot_store=hot_store, preferred_backend="text_only")
+        embedder = _attach_embedder(ingester)
+
+        traces = [_sample_trace(trace_id=f"t{i}") for i in range(4)]
+        traces.append({"trace_id": "other", "spans": [{"name": "other span"}]})
+        result = await ingester.ingest_batch(traces)
+
+        assert result["success_count"] == 5
+        assert embedder.encode.call_count == 2
+        assert len(ingester._embedding_cache) == 2
+
+    @pytest.mark.asyncio
+    async def test_ingest_batch_pgvector_single_upsert(self) -> None:
+        """With pgvector storage the whole batch is written in one upsert."""
+        ingester = _make_ingester(
+            storage_type=StorageType.POSTGRESQL,
+            pgvector_dsn="postgresql://u:p@localhost/db",
+            preferred_backend="text_only",
+        )
+        adapter = MagicMock()
+        adapter.upsert = AsyncMock()
+        ingester._pgvector_adapter = adapter
+        _attach_embedder(ingester)
+
+        traces = [_sample_trace(trace_id=f"pg-{i}") for i in range(3)]
+        result = await ingester.ingest_batch(traces)
+
+        assert result["success_count"] == 3
+        adapter.upsert.assert_awaited_once()
+        docs = adapter.upsert.await_args.kwargs["documents"]
+        assert [doc["id"] for doc in docs] == ["pg-0", "pg-1", "pg-2"]
+
+    @pytest.mark.asyncio
+    async def test_ingest_batch_reports_per_trace_write_errors(self) -> None:
+        """A failed insert is reported against its own trace only."""
+        hot_store = MagicMock()
+        hot_store.insert = AsyncMock(side_effect=[None, RuntimeError("disk full"), None])
+        ingester = _make_ingester(hot_store=hot_store, preferred_backend="text_only")
+        _attach_embedder(ingester)
+
+        traces = [_sample_trace(trace_id=f"t{i}") for i in range(3)]
+        result = await ingester.ingest_batch(traces)
+
+        assert result["success_count"] == 2
+        assert result["failed"] == [{"index": 1, "trace_id": "t1", "error": "disk full"}]
+        assert result["errors"] == ["Trace t1: disk full"]
+
 
 # ============== search_traces ==============
 
@@ -0,0 +1,104 @@
+"""Tests for the lazy CLI entry point (mahavishnu._lazy_cli)."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+import subprocess
+import sys
+
+import typer
+
+from mahavishnu._lazy_cli import COMMAND_MANIFEST, app
+
+ROOT = Path(__file__).resolve().parent.parent.parent
+
+# The only first-party modules ``mahavishnu --help`` may import. Asserting on
+# the module set rather than on import time keeps the check deterministic on
+# loaded CI runners.
+STARTUP_MODULES = {"mahavishnu", "mahavishnu._lazy_cli"}
+
+HEAVY_MODULES = (
+    "mahavishnu._main_cli",
+    "mahavishnu.core.app",
+    "mahavishnu.workers.registry",
+    "pydantic_settings",
+    "prometheus_client",
+)
+
+
+def _run(*args: str) -> subprocess.CompletedProcess[str]:
+    env = {**os.environ, "PYTHONPATH": str(ROOT)}
+    return subprocess.run(
+        [sys.executable, *args],
+        capture_output=True,
+        text=True,
+        cwd=ROOT,
+        env=env,
+        timeout=120,
+        check=False,
+    )
+
+
+def _imported_modules(stderr: str) -> set[str]:
+    """Parse ``-X importtime`` output into the set of imported module names."""
+    modules: set[str] = set()
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        modules.add(line.rsplit("|", 1)[1].strip())
+    return modules
+
+
+class TestStartupCost:
+    """The entry point must not pay for sub-CLI imports."""
+
+    def test_help_imports_only_the_entry_point(self) -> None:
+        result = _run("-X", "importtime", "-m", "mahavishnu", "--help")
+
+        assert result.returncode == 0, result.stderr[-2000:]
+        assert "metrics" in result.stdout
+        modules = _imported_modules(result.stderr)
+        leaked = [name for name in HEAVY_MODULES if name in modules]
+        assert leaked == []
+        first_party = {name for name in modules if name.split(".")[0] == "mahavishnu"}
+        assert first_party == STARTUP_MODULES
+
+    def test_invoking_a_command_imports_only_its_target(self) -> None:
+        script = (
+            "import sys\n"
+            "from typer.testing import CliRunner\n"
+            "from mahavishnu._lazy_cli import app\n"
+            "result = CliRunner().invoke(app, ['rollback', '--help'])\n"
+            "print(result.exit_code, 'bodai-crow' in result.output)\n"
+            "print('mahavishnu.cli.rollback_cli' in sys.modules,"
+            " 'mahavishnu._main_cli' in sys.modules)\n"
+        )
+        result = _run("-c", script)
+
+        assert result.returncode == 0, result.stderr[-2000:]
+        assert result.stdout.split() == ["0", "True", "True", "False"]
+
+
+class TestManifest:
+    """The static manifest mirrors the eager app in _main_cli."""
+
+    def test_manifest_matches_main_app(self) -> None:
+        import mahavishnu._main_cli as main_cli
+
+        group = typer.main.get_group(main_cli.app)
+        ctx = typer.Context(group)
+
+        assert group.list_commands(ctx) == list(COMMAND_MANIFEST)
+        for name, spec in COMMAND_MANIFEST.items():
+            command = group.get_command(ctx, name)
+            assert (command.help or "").strip().splitlines()[0] == spec.help, name
+
+    def test_help_lists_every_manifest_command(self) -> None:
+        from typer.testing import CliRunner
+
+        result = CliRunner().invoke(app, ["--help"], terminal_width=200)
+
+        assert result.exit_code == 0
+        for name in COMMAND_MANIFEST:
+            assert name in result.output
@@ -8,6 +8,7 @@ from mahavishnu.core.status import PoolStatus, WorkerStatus
 from mahavishnu.pools.base import PoolConfig
 from mahavishnu.pools.mahavishnu_pool import MahavishnuPool
 from mahavishnu.workers.base import WorkerResult
+from mahavishnu.workers.manager import WorkerResultBatch
 
 
 class TestMahavishnuPool:
@@ -456,6 +457,64 @@ class TestMahavishnuPool:
             assert memory[0]["metadata"]["worker_id"] == "worker-1"
             assert memory[0]["metadata"]["type"] == "pool_worker_execution"
 
+    @pytest.mark.asyncio
+    async def test_collect_memory_since_returns_new_items_and_cursor(
+        self, mock_terminal_manager, pool_config
+    ):
+        """Test collect_memory_since() maps a result batch and passes the cursor through."""
+        mock_wm = self._create_mock_worker_manager()
+        mock_wm.collect_results_since = AsyncMock(
+            return_value=WorkerResultBatch(
+                results=[
+                    WorkerResult(
+                        worker_id="worker-2",
+                        status=WorkerStatus.FAILED,
+                        output=None,
+                        error="boom",
+                        exit_code=1,
+                        duration_seconds=0.5,
+                    )
+                ],
+                cursor=4,
+            )
+        )
+
+        with patch(
+            "mahavishnu.pools.mahavishnu_pool.WorkerManager",
+            return_value=mock_wm,
+        ):
+            pool = MahavishnuPool(
+                config=pool_config,
+                terminal_manager=mock_terminal_manager,
+            )
+            await pool.start()
+
+            memory, cursor = await pool.collect_memory_since(3)
+
+            mock_wm.collect_results_since.assert_awaited_once_with(3)
+            assert cursor == 4
+            assert [item["metadata"]["worker_id"] for item in memory] == ["worker-2"]
+            assert memory[0]["metadata"]["error"] == "boom"
+
+    @pytest.mark.asyncio
+    async def test_memory_count_does_not_collect(self, mock_terminal_manager, pool_config):
+        """Test memory_count() counts workers without polling them."""
+        mock_wm = self._create_mock_worker_manager()
+        mock_wm.list_worker_ids.return_value = ["worker-1", "worker-2"]
+
+        with patch(
+            "mahavishnu.pools.mahavishnu_pool.WorkerManager",
+            return_value=mock_wm,
+        ):
+            pool = MahavishnuPool(
+                config=pool_config,
+                terminal_manager=mock_terminal_manager,
+            )
+            await pool.start()
+
+            assert await pool.memory_count() == 2
+            mock_wm.collect_results.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_stop_closes_all_workers(self, mock_terminal_manager, pool_config):
         """Test stop() calls worker_manager.close_all()."""
@@ -68,6 +68,32 @@ async def test_stop_server_handles_client_stop_failure(
     assert "Error stopping mcpretentious server" in caplog.text
 
 
+@pytest.mark.asyncio
+async def test_server_lifecycle_starts_and_closes_shared_http_clients(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    app = SimpleNamespace(start_http_clients=AsyncMock(), close_http_clients=AsyncMock())
+    server = SimpleNamespace(
+        app=app,
+        _active_profile=None,
+        _update_registered_tool_metrics=Mock(),
+        server=SimpleNamespace(run_http_async=AsyncMock()),
+    )
+    monkeypatch.setattr(
+        "mahavishnu.mcp.lifecycle._register_profile_tools_helper",
+        AsyncMock(),
+        raising=True,
+    )
+    monkeypatch.setattr("mahavishnu.mcp.lifecycle.get_active_profile", Mock(return_value="full"))
+    monkeypatch.setattr("mahavishnu.mcp.lifecycle.PROFILE_REGISTRATIONS", {"full": []})
+
+    await start_server(server)
+    app.start_http_clients.assert_awaited_once()
+
+    await stop_server(server)
+    app.close_http_clients.assert_awaited_once()
+
+
 @pytest.mark.asyncio
 async def test_register_worktree_tools_skips_without_coordinator() -> None:
     server = SimpleNamespace(app=SimpleNamespace(worktree_coordinator=None))
@@ -12,6 +12,8 @@ Covers:
     9. set_event_publisher can replace the publisher
    10. publish() with unknown message type falls back to STATUS_UPDATE
    11. publish() drops on QueueFull (no exception propagates)
+   12. Per-pool overflow policies and their counters
+   13. Dispatcher pool: bounded tasks, accounting, close()
 """
 
 from __future__ import annotations
@@ -27,6 +29,7 @@ from mahavishnu.mcp.protocols.message_bus import (
     Message,
     MessageBus,
     MessageType,
+    OverflowPolicy,
 )
 
 pytestmark = pytest.mark.unit
@@ -452,3 +455,203 @@ class TestPublishEdgeCases:
         msg = await bus.receive("p", timeout=0.1)
         assert msg is not None
         assert msg.type is MessageType.STATUS_UPDATE
+
+
+# ============== Overflow policies ==============
+
+
+def _status(pool_id: str, i: int) -> dict:
+    return {"type": "status_update", "target_pool_id": pool_id, "payload": {"i": i}}
+
+
+class TestOverflowPolicies:
+    """Per-pool behavior when a receive queue is full."""
+
+    @pytest.mark.asyncio
+    async def test_drop_newest_and_drop_oldest_are_counted(self) -> None:
+        """Each drop policy keeps the expected messages and counts what it lost."""
+        bus = MessageBus(max_queue_size=2)
+        bus.set_overflow_policy("oldest", OverflowPolicy.DROP_OLDEST)
+        for i in range(5):
+            await bus.publish(_status("newest", i))
+            await bus.publish(_status("oldest", i))
+
+        newest = await bus.receive_batch("newest", count=5, timeout=0.05)
+        oldest = await bus.receive_batch("oldest", count=5, timeout=0.05)
+        assert [m.payload["i"] for m in newest] == [0, 1]
+        assert [m.payload["i"] for m in oldest] == [3, 4]
+
+        pools = bus.get_stats()["pools"]
+        assert pools["newest"]["dropped_newest"] == 3
+        assert pools["oldest"]["dropped_oldest"] == 3
+        assert pools["oldest"]["overflow_policy"] == "drop_oldest"
+        assert pools["oldest"]["received"] == 2
+
+    @pytest.mark.asyncio
+    async def test_block_waits_for_room_then_times_out(self) -> None:
+        """BLOCK publishes once a receiver frees a slot, and gives up after the timeout."""
+        bus = MessageBus(max_queue_size=1)
+        bus.set_overflow_policy("p", OverflowPolicy.BLOCK, block_timeout=0.05)
+        await bus.publish(_status("p", 0))
+
+        blocked = asyncio.create_task(bus.publish(_status("p", 1)))
+        await asyncio.sleep(0.01)
+        assert not blocked.done()
+        assert (await bus.receive("p", timeout=0.1)).payload["i"] == 0
+        await blocked
+
+        await bus.publish(_status("p", 2))  # nobody receives: times out
+
+        stats = bus.get_stats()["pools"]["p"]
+        assert (stats["queued"], stats["block_timeouts"], stats["dropped"]) == (2, 1, 1)
+        assert (await bus.receive("p", timeout=0.1)).payload["i"] == 1
+
+    @pytest.mark.asyncio
+    async def test_spill_preserves_order_through_disk_spool(self, tmp_path) -> None:
+        """SPILL parks overflow on disk and receive drains it in publish order."""
+        bus = MessageBus(max_queue_size=2, spool_dir=tmp_path)
+        bus.set_overflow_policy("pool/a", OverflowPolicy.SPILL)
+        for i in range(6):
+            await bus.publish(_status("pool/a", i))
+
+        assert bus.get_queue_size("pool/a") == 6
+        assert len(list(tmp_path.glob("pool_a-*.jsonl"))) == 1
+
+        msgs = await bus.receive_batch("pool/a", count=10, timeout=0.05)
+        assert [m.payload["i"] for m in msgs] == list(range(6))
+        assert msgs[-1].type is MessageType.STATUS_UPDATE
+        assert not list(tmp_path.glob("*.jsonl"))
+
+        stats = bus.get_stats()["pools"]["pool/a"]
+        assert (stats["spilled"], stats["unspilled"], stats["dropped"]) == (4, 4, 0)
+
+    @pytest.mark.asyncio
+    async def test_spool_files_are_per_pool_and_per_bus(self, tmp_path) -> None:
+        """Pool ids that sanitize alike and buses sharing a spool_dir keep separate files."""
+        other = MessageBus(
+            max_queue_size=1, spool_dir=tmp_path, overflow_policy=OverflowPolicy.SPILL
+        )
+        for i in range(3):
+            await other.publish(_status("pool/a", 100 + i))
+
+        bus = MessageBus(max_queue_size=1, spool_dir=tmp_path, overflow_policy=OverflowPolicy.SPILL)
+        for pool_id in ("pool/a", "pool_a"):
+            for i in range(3):
+                await bus.publish(_status(pool_id, i))
+
+        assert len(list(tmp_path.glob("pool_a-*.jsonl"))) == 3
+        for pool_id in ("pool/a", "pool_a"):
+            msgs = await bus.receive_batch(pool_id, count=10, timeout=0.05)
+            assert [m.payload["i"] for m in msgs] == [0, 1, 2]
+        msgs = await other.receive_batch("pool/a", count=10, timeout=0.05)
+        assert [m.payload["i"] for m in msgs] == [100, 101, 102]
+
+    @pytest.mark.asyncio
+    async def test_missing_spool_file_is_counted_as_lost(self, tmp_path) -> None:
+        """A spool file deleted from under the bus loses its messages, not the receiver."""
+        bus = MessageBus(max_queue_size=1, spool_dir=tmp_path, overflow_policy=OverflowPolicy.SPILL)
+        for i in range(3):
+            await bus.publish(_status("p", i))
+        for path in tmp_path.glob("p-*.jsonl"):
+            path.unlink()
+
+        msgs = await bus.receive_batch("p", count=10, timeout=0.05)
+
+        assert [m.payload["i"] for m in msgs] == [0]
+        stats = bus.get_stats()["pools"]["p"]
+        assert (stats["spool_lost"], stats["dropped"], stats["spooled"]) == (2, 2, 0)
+
+    @pytest.mark.asyncio
+    async def test_clear_queue_discards_spool(self, tmp_path) -> None:
+        """clear_queue empties both the in-memory queue and the spool."""
+        bus = MessageBus(max_queue_size=1, spool_dir=tmp_path, overflow_policy=OverflowPolicy.SPILL)
+        for i in range(3):
+            await bus.publish(_status("p", i))
+
+        assert await bus.clear_queue("p") == 3
+        assert bus.get_queue_size("p") == 0
+        assert bus.get_stats()["pools"]["p"]["cleared"] == 3
+
+
+# ============== Dispatcher pool ==============
+
+
+class TestDispatcherPool:
+    """Subscriber callbacks on a fixed set of worker tasks."""
+
+    @pytest.mark.asyncio
+    async def test_fan_out_keeps_task_count_bounded(self) -> None:
+        """Many messages x many subscribers run on the fixed workers, none lost."""
+        bus = MessageBus(max_queue_size=100, dispatch_workers=4, dispatch_queue_size=64)
+        bus.set_overflow_policy("p", OverflowPolicy.DROP_OLDEST)
+        calls = 0
+
+        async def handler(msg: Message) -> None:
+            nonlocal calls
+            calls += 1
+
+        for _ in range(50):
+            bus.subscribe(MessageType.STATUS_UPDATE, handler)
+        baseline = len(asyncio.all_tasks())
+
+        peak = 0
+        for i in range(400):
+            await bus.publish(_status("p", i))
+            peak = max(peak, len(asyncio.all_tasks()))
+        await bus.drain()
+
+        assert peak <= baseline + 4
+        assert calls == 400 * 50
+        stats = bus.get_stats()
+        assert stats["dispatch"]["enqueued"] == stats["dispatch"]["completed"] == 20_000
+        pool = stats["pools"]["p"]
+        assert pool["published"] == pool["queued"] == 400
+        assert pool["dropped_oldest"] + bus.get_queue_size("p") == 400
+        await bus.close()
+
+    @pytest.mark.asyncio
+    async def test_handler_errors_and_nested_publish(self) -> None:
+        """Failing and sync handlers are counted; nested publishes cannot deadlock."""
+        bus = MessageBus(dispatch_workers=1, dispatch_queue_size=1)
+        seen: list[int] = []
+
+        async def failing(msg: Message) -> None:
+            raise RuntimeError("boom")
+
+        async def republish(msg: Message) -> None:
+            if msg.payload["i"] < 3:
+                await bus.publish({"type": "heartbeat", "payload": {"i": msg.payload["i"] + 1}})
+
+        bus.subscribe(MessageType.HEARTBEAT, failing)
+        bus.subscribe(MessageType.HEARTBEAT, republish)
+        bus.subscribe(MessageType.HEARTBEAT, lambda msg: seen.append(msg.payload["i"]))
+
+        await bus.publish({"type": "heartbeat", "payload": {"i": 0}})
+        await asyncio.wait_for(bus.drain(), timeout=1.0)
+
+        assert sorted(seen) == [0, 1, 2, 3]
+        dispatch = bus.get_stats()["dispatch"]
+        assert dispatch["errors"] == 4
+        assert dispatch["inline"] > 0
+        assert dispatch["enqueued"] + dispatch["inline"] == 12
+        await bus.close()
+
+    @pytest.mark.asyncio
+    async def test_close_abandons_stuck_callbacks(self) -> None:
+        """close() waits up to its timeout, then stops the workers."""
+        bus = MessageBus(dispatch_workers=1)
+        release = asyncio.Event()
+
+        async def stuck(msg: Message) -> None:
+            await release.wait()
+
+        bus.subscribe(MessageType.HEARTBEAT, stuck)
+        for _ in range(3):
+            await bus.publish({"type": "heartbeat", "payload": {}})
+
+        await bus.close(timeout=0.05)
+
+        stats = bus.get_stats()["dispatch"]
+        assert stats["workers"] == 0
+        assert stats["abandoned"] == 2
+        assert stats["queue_depth"] == 0
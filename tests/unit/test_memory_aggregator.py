@@ -306,7 +306,7 @@ class TestInsertBatchToSessionBuddy:
         mock_response = MagicMock()
         mock_response.status_code = 200
 
-        async def mock_post(url, json):
+        async def mock_post(url, json, timeout):
             return mock_response
 
         aggregator._mcp_client = AsyncMock()
@@ -321,7 +321,7 @@ class TestInsertBatchToSessionBuddy:
     async def test_partial_failure(self, aggregator: MemoryAggregator):
         call_count = 0
 
-        async def mock_post(url, json):
+        async def mock_post(url, json, timeout):
             nonlocal call_count
             call_count += 1
             resp = MagicMock()
@@ -430,6 +430,43 @@ class TestSinkToSessionBuddy:
                 )
 
 
+class TestBatchSinkToSessionBuddy:
+    """Contract: one outcome per row, ``None`` only for rows actually stored."""
+
+    @pytest.mark.asyncio
+    async def test_outcome_per_row(self, aggregator: MemoryAggregator) -> None:
+        ok = MagicMock(status_code=200)
+        bad = MagicMock(status_code=500, text="boom")
+        aggregator._mcp_client = AsyncMock()
+        aggregator._mcp_client.post.side_effect = [ok, bad]
+
+        outcomes = await aggregator._batch_sink_to_session_buddy(
+            [
+                ("reflection:a", {"text": "a", "tags": ["x"]}),
+                ("code_graph:b", {"text": "b"}),
+                ("reflection:c", {"text": "c"}),
+            ]
+        )
+
+        assert outcomes[0] is None
+        assert outcomes[1] is None  # unknown kinds are skipped, as in the per-row sink
+        assert isinstance(outcomes[2], SinkDeliveryError)
+        assert aggregator._mcp_client.post.await_count == 2
+        # The WAL retries failed rows; they must not also land in the local buffer.
+        assert len(aggregator._local_buffer) == 0
+
+    @pytest.mark.asyncio
+    async def test_failures_count_against_breaker(self, aggregator: MemoryAggregator) -> None:
+        aggregator._mcp_client = AsyncMock()
+        aggregator._mcp_client.post.side_effect = httpx.HTTPError("connection refused")
+
+        await aggregator._batch_sink_to_session_buddy(
+            [(f"reflection:{i}", {"text": str(i)}) for i in range(5)]
+        )
+
+        assert aggregator._sb_breaker.is_open
+
+
 # ---------------------------------------------------------------------------
 # _batch_insert_to_session_buddy
 # ---------------------------------------------------------------------------
@@ -494,10 +531,10 @@ class TestStop:
         assert aggregator._shutdown_event.is_set()
 
     @pytest.mark.asyncio
-    async def test_closes_http_client(self, aggregator: MemoryAggregator):
+    async def test_leaves_shared_http_client_open(self, aggregator: MemoryAggregator):
         aggregator._mcp_client = AsyncMock()
         await aggregator.stop()
-        aggregator._mcp_client.aclose.assert_awaited_once()
+        aggregator._mcp_client.aclose.assert_not_awaited()
 
     @pytest.mark.asyncio
     async def test_cancels_stuck_task(self, aggregator: MemoryAggregator):
@@ -530,7 +567,7 @@ class TestSyncToAkosha:
         mock_response = MagicMock()
         mock_response.status_code = 200
 
-        async def mock_post(url, json):
+        async def mock_post(url, json, timeout):
             return mock_response
 
         aggregator._mcp_client = AsyncMock()
@@ -545,7 +582,7 @@ class TestSyncToAkosha:
         mock_response.status_code = 500
         mock_response.text = "internal error"
 
-        async def mock_post(url, json):
+        async def mock_post(url, json, timeout):
             return mock_response
 
         aggregator._mcp_client = AsyncMock()
@@ -680,30 +717,44 @@ class TestCollectAndSync:
 # ---------------------------------------------------------------------------
 
 
+def _cache_entry(results, *, limit=100, age=timedelta(0)):
+    """Build a search cache entry in the aggregator's format."""
+    return {
+        "results": results,
+        "cached_at": datetime.now((UTC)) - age,
+        "limit": limit,
+        "size_bytes": 0,
+    }
+
+
+def _sb_response(conversations):
+    response = MagicMock()
+    response.status_code = 200
+    response.json.return_value = {"result": {"conversations": conversations}}
+    return response
+
+
 class TestCrossPoolSearch:
     @pytest.mark.asyncio
     async def test_cache_hit(self, aggregator: MemoryAggregator):
         results = [{"text": "cached"}]
-        # Cache key format is "query:limit" — default limit is 100
-        aggregator._search_cache["query:100"] = {
-            "results": results,
-            "cached_at": datetime.now((UTC)),
-        }
+        # Cache is keyed by query; the entry records the limit it was fetched with
+        aggregator._search_cache["query"] = _cache_entry(results)
         mock_pm = MagicMock()
         result = await aggregator.cross_pool_search("query", mock_pm)
         assert result == results
 
     @pytest.mark.asyncio
     async def test_cache_expired(self, aggregator: MemoryAggregator):
-        aggregator._search_cache["old_query:10"] = {
-            "results": [{"text": "old"}],
-            "cached_at": datetime.now((UTC)) - timedelta(minutes=10),
-        }
+        # Older than CACHE_TTL + CACHE_STALE_TTL: no longer servable, even stale
+        aggregator._search_cache["old_query"] = _cache_entry(
+            [{"text": "old"}], age=timedelta(hours=2)
+        )
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"result": {"conversations": [{"text": "fresh"}]}}
 
-        async def mock_post(url, json):
+        async def mock_post(url, json, timeout):
             return mock_response
 
         aggregator._mcp_client = AsyncMock()
@@ -719,7 +770,7 @@ class TestCrossPoolSearch:
         mock_response.status_code = 200
         mock_response.json.return_value = {"result": {"conversations": [{"text": "new"}]}}
 
-        async def mock_post(url, json):
+        async def mock_post(url, json, timeout):
             return mock_response
 
         aggregator._mcp_client = AsyncMock()
@@ -728,7 +779,7 @@ class TestCrossPoolSearch:
         mock_pm = MagicMock()
         result = await aggregator.cross_pool_search("new query", mock_pm)
         assert result == [{"text": "new"}]
-        assert "new query:100" in aggregator._search_cache
+        assert aggregator._search_cache["new query"]["limit"] == 100
 
     @pytest.mark.asyncio
     async def test_circuit_open_returns_empty(self, aggregator: MemoryAggregator):
@@ -755,7 +806,7 @@ class TestCrossPoolSearch:
         mock_response.status_code = 500
         mock_response.text = "error"
 
-        async def mock_post(url, json):
+        async def mock_post(url, json, timeout):
             return mock_response
 
         aggregator._mcp_client = AsyncMock()
@@ -770,7 +821,7 @@ class TestCrossPoolSearch:
         mock_response.status_code = 200
         mock_response.json.return_value = {"result": {"conversations": []}}
 
-        async def mock_post(url, json):
+        async def mock_post(url, json, timeout):
             return mock_response
 
         aggregator._mcp_client = AsyncMock()
@@ -782,14 +833,101 @@ class TestCrossPoolSearch:
     @pytest.mark.asyncio
     async def test_respects_limit(self, aggregator: MemoryAggregator):
         results = [{"text": f"r{i}"} for i in range(20)]
-        aggregator._search_cache["query:5"] = {
-            "results": results,
-            "cached_at": datetime.now((UTC)),
-        }
+        aggregator._search_cache["query"] = _cache_entry(results, limit=20)
         mock_pm = MagicMock()
         result = await aggregator.cross_pool_search("query", mock_pm, limit=5)
         assert len(result) == 5
 
+    @pytest.mark.asyncio
+    async def test_larger_limit_misses_unless_results_exhausted(
+        self, aggregator: MemoryAggregator
+    ):
+        aggregator._search_cache["full"] = _cache_entry([{"n": i} for i in range(10)], limit=10)
+        aggregator._search_cache["short"] = _cache_entry([{"n": 0}], limit=10)
+        aggregator._mcp_client = AsyncMock()
+        aggregator._mcp_client.post = AsyncMock(return_value=_sb_response([{"n": "fresh"}]))
+
+        # "short" returned fewer rows than its limit, so it is complete for any limit
+        assert await aggregator.cross_pool_search("short", MagicMock(), limit=50) == [{"n": 0}]
+        assert await aggregator.cross_pool_search("full", MagicMock(), limit=50) == [
+            {"n": "fresh"}
+        ]
+        assert aggregator._mcp_client.post.await_count == 1
+        assert aggregator._search_cache["full"]["limit"] == 50
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_searches_share_one_request(
+        self, aggregator: MemoryAggregator
+    ):
+        release = asyncio.Event()
+
+        async def slow_post(url, json, timeout):
+            await release.wait()
+            return _sb_response([{"text": "shared"}])
+
+        aggregator._mcp_client = AsyncMock()
+        aggregator._mcp_client.post = AsyncMock(side_effect=slow_post)
+
+        searches = [
+            asyncio.create_task(aggregator.cross_pool_search("q", MagicMock(), limit=limit))
+            for limit in (100, 100, 20)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*searches)
+
+        assert results == [[{"text": "shared"}]] * 3
+        assert aggregator._mcp_client.post.await_count == 1
+        assert aggregator.get_cache_stats()["singleflight_joins"] == 2
+
+    @pytest.mark.asyncio
+    async def test_stale_entry_served_while_refreshing(self, aggregator: MemoryAggregator):
+        aggregator._search_cache["q"] = _cache_entry([{"text": "stale"}], age=timedelta(minutes=10))
+        aggregator._mcp_client = AsyncMock()
+        aggregator._mcp_client.post = AsyncMock(return_value=_sb_response([{"text": "fresh"}]))
+
+        result = await aggregator.cross_pool_search("q", MagicMock())
+        assert result == [{"text": "stale"}]
+
+        await asyncio.gather(*aggregator._background_refreshes)
+        assert await aggregator.cross_pool_search("q", MagicMock()) == [{"text": "fresh"}]
+        stats = aggregator.get_cache_stats()
+        assert (stats["stale_served"], stats["hits"], stats["misses"]) == (1, 1, 0)
+
+    @pytest.mark.asyncio
+    async def test_stale_entry_not_refreshed_while_breaker_open(
+        self, aggregator: MemoryAggregator
+    ):
+        aggregator._search_cache["q"] = _cache_entry([{"text": "stale"}], age=timedelta(minutes=10))
+        for _ in range(5):
+            aggregator._sb_breaker.record_failure()
+        aggregator._mcp_client = AsyncMock()
+
+        assert await aggregator.cross_pool_search("q", MagicMock()) == [{"text": "stale"}]
+        assert not aggregator._background_refreshes
+        aggregator._mcp_client.post.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction_by_entries_and_bytes(self, aggregator: MemoryAggregator):
+        aggregator.SEARCH_CACHE_MAX_ENTRIES = 2
+        aggregator._mcp_client = AsyncMock()
+        aggregator._mcp_client.post = AsyncMock(return_value=_sb_response([{"text": "x"}]))
+
+        for query in ("a", "b"):
+            await aggregator.cross_pool_search(query, MagicMock())
+        await aggregator.cross_pool_search("a", MagicMock())  # "a" becomes most recent
+        await aggregator.cross_pool_search("c", MagicMock())
+
+        assert list(aggregator._search_cache) == ["a", "c"]
+        stats = aggregator.get_cache_stats()
+        assert stats["evictions"] == 1
+        cached_bytes = sum(entry["size_bytes"] for entry in aggregator._search_cache.values())
+        assert stats["size_bytes"] == cached_bytes
+
+        aggregator.SEARCH_CACHE_MAX_BYTES = stats["size_bytes"] // 2
+        aggregator._store_search("d", 100, [{"text": "x"}])
+        assert list(aggregator._search_cache) == ["d"]
+
 
 # ---------------------------------------------------------------------------
 # clear_cache / get_cache_stats
@@ -798,10 +936,11 @@ class TestCrossPoolSearch:
 
 class TestClearCache:
     def test_clears_all_entries(self, aggregator: MemoryAggregator):
-        aggregator._search_cache["a"] = {"results": [], "cached_at": datetime.now((UTC))}
-        aggregator._search_cache["b"] = {"results": [], "cached_at": datetime.now((UTC))}
+        aggregator._store_search("a", 10, [{"text": "a"}])
+        aggregator._store_search("b", 10, [{"text": "b"}])
         aggregator.clear_cache()
         assert aggregator._search_cache == {}
+        assert aggregator.get_cache_stats()["size_bytes"] == 0
 
     def test_clears_empty_cache(self, aggregator: MemoryAggregator):
         aggregator.clear_cache()
@@ -817,14 +956,8 @@ class TestGetCacheStats:
         assert stats["ttl_minutes"] == 5
 
     def test_active_and_expired(self, aggregator: MemoryAggregator):
-        aggregator._search_cache["active"] = {
-            "results": [],
-            "cached_at": datetime.now((UTC)),
-        }
-        aggregator._search_cache["expired"] = {
-            "results": [],
-            "cached_at": datetime.now((UTC)) - timedelta(minutes=10),
-        }
+        aggregator._search_cache["active"] = _cache_entry([])
+        aggregator._search_cache["expired"] = _cache_entry([], age=timedelta(minutes=10))
         stats = aggregator.get_cache_stats()
         assert stats["total_entries"] == 2
         assert stats["active_entries"] == 1
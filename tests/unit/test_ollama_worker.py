@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
 import time
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -1617,3 +1619,167 @@ class TestOllamaConfigModelRouting:
             config.get_model_for_category(TaskCategory.CODE_GENERATION)
             == DEFAULT_MODEL_ROUTING[TaskCategory.CODE_GENERATION]
         )
+
+
+class FakeOllama:
+    """httpx mock transport emulating /api/tags and streamed /api/generate, /api/chat."""
+
+    def __init__(self, models: list[str], tokens: list[str]) -> None:
+        self.models = models
+        self.tokens = tokens
+        self.requests: list[str] = []
+
+    def _chunks(self, chat: bool):
+        async def body():
+            for token in self.tokens:
+                await asyncio.sleep(0)
+                piece = {"message": {"content": token}} if chat else {"response": token}
+                yield json.dumps({"model": "m", "done": False, **piece}).encode() + b"\n"
+            yield json.dumps({"model": "m", "done": True, "eval_count": len(self.tokens)}).encode()
+
+        return body()
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request.url.path)
+        if request.url.path == "/api/tags":
+            return httpx.Response(200, json={"models": [{"name": m} for m in self.models]})
+        if request.url.path == "/api/pull":
+            return httpx.Response(200, json={"status": "success"})
+        chat = request.url.path == "/api/chat"
+        assert json.loads(request.content)["stream"] is True
+        return httpx.Response(200, content=self._chunks(chat))
+
+    def worker(self, **config) -> OllamaWorker:
+        worker = OllamaWorker(config=OllamaConfig(**config))
+        worker._status = WorkerStatus.RUNNING
+        worker._client = httpx.AsyncClient(
+            base_url="http://ollama.test", transport=httpx.MockTransport(self.handler)
+        )
+        return worker
+
+
+class TestOllamaModelCatalog:
+    """Cached model catalog used by intelligent routing."""
+
+    @pytest.mark.asyncio
+    async def test_sequential_tasks_fetch_catalog_once(self):
+        fake = FakeOllama(["qwen2.5-coder:7b"], ["ok"])
+        worker = fake.worker(stream=True)
+
+        for _ in range(5):
+            result = await worker.execute({"prompt": "Write a function"})
+            assert result.status == WorkerStatus.COMPLETED
+
+        assert fake.requests.count("/api/tags") == 1
+        await worker.stop()
+
+    @pytest.mark.asyncio
+    async def test_stale_catalog_refreshes_in_background(self):
+        fake = FakeOllama(["qwen2.5-coder:7b"], ["ok"])
+        worker = fake.worker(catalog_ttl=0.0)
+
+        first = await worker._get_catalog()
+        fake.models = ["llama3:8b"]
+        stale = await worker._get_catalog()  # served immediately, refresh scheduled
+        await worker._catalog_refresh
+
+        assert first == stale == [{"name": "qwen2.5-coder:7b"}]
+        assert worker._catalog == [{"name": "llama3:8b"}]
+        await worker.stop()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_share_one_fetch(self):
+        fake = FakeOllama(["qwen2.5-coder:7b"], [])
+        worker = fake.worker()
+
+        await asyncio.gather(*(worker._get_catalog() for _ in range(4)))
+
+        assert fake.requests.count("/api/tags") == 1
+        await worker.stop()
+
+    @pytest.mark.asyncio
+    async def test_pull_invalidates_catalog(self):
+        fake = FakeOllama(["qwen2.5-coder:7b"], [])
+        worker = fake.worker()
+        await worker._get_catalog()
+
+        await worker._pull_model("llama3:8b")
+        await worker._get_catalog()
+
+        assert fake.requests.count("/api/tags") == 2
+        await worker.stop()
+
+    @pytest.mark.asyncio
+    async def test_invalidation_detaches_cold_fetch_without_cancelling_waiters(self):
+        fake = FakeOllama(["qwen2.5-coder:7b"], [])
+        worker = fake.worker()
+        started, release = asyncio.Event(), asyncio.Event()
+        list_models = worker._list_models
+
+        async def gated_list_models():
+            started.set()
+            await release.wait()
+            return await list_models()
+
+        worker._list_models = gated_list_models
+        waiter = asyncio.create_task(worker._get_catalog())
+        await started.wait()
+
+        worker._invalidate_catalog()
+        release.set()
+
+        assert await waiter == [{"name": "qwen2.5-coder:7b"}]
+        assert worker._catalog is None  # the detached fetch does not repopulate the cache
+        assert await worker._get_catalog() == [{"name": "qwen2.5-coder:7b"}]
+        assert fake.requests.count("/api/tags") == 2
+        await worker.stop()
+
+
+class TestOllamaStreaming:
+    """Token streaming for generate and chat."""
+
+    @pytest.mark.asyncio
+    async def test_generate_stream_collects_tokens_and_ttft(self):
+        fake = FakeOllama(["qwen2.5-coder:7b"], ["Hel", "lo", "!"])
+        worker = fake.worker(intelligent_routing=False)
+        seen: list[str] = []
+
+        result = await worker.execute(
+            {"prompt": "Say hello", "raw": True, "stream": True, "on_token": seen.append}
+        )
+
+        assert result.output == "Hello!"
+        assert seen == ["Hel", "lo", "!"]
+        assert result.metadata["streamed"] is True
+        assert result.metadata["tokens_generated"] == 3
+        assert 0 <= result.metadata["time_to_first_token_ms"] <= result.duration_seconds * 1000
+        assert fake.requests == ["/api/generate"]
+        await worker.stop()
+
+    @pytest.mark.asyncio
+    async def test_chat_stream_yields_message_tokens(self):
+        fake = FakeOllama([], ["a", "b"])
+        worker = fake.worker()
+
+        chunks = [
+            c async for c in worker._chat_stream([{"role": "user", "content": "x"}], "m", 0.1)
+        ]
+
+        assert [c["response"] for c in chunks] == ["a", "b", ""]
+        assert chunks[-1]["done"] is True
+        await worker.stop()
+
+    @pytest.mark.asyncio
+    async def test_non_streaming_result_has_no_ttft(self):
+        worker = OllamaWorker(config=OllamaConfig(intelligent_routing=False))
+        worker._status = WorkerStatus.RUNNING
+        mock_client = AsyncMock(spec=httpx.AsyncClient)
+        mock_resp = MagicMock()
+        mock_resp.json.return_value = {"message": {"content": "done"}}
+        mock_client.post = AsyncMock(return_value=mock_resp)
+        worker._client = mock_client
+
+        result = await worker.execute({"prompt": "hi"})
+
+        assert result.metadata["streamed"] is False
+        assert result.metadata["time_to_first_token_ms"] is None
@@ -65,6 +65,9 @@ def _make_pool(
     async def _collect_memory():
         return [{"content": "mem", "metadata": {}}]
 
+    async def _memory_count() -> int:
+        return 1
+
     async def _status() -> PoolStatus:
         return PoolStatus.RUNNING
 
@@ -74,6 +77,7 @@ def _make_pool(
     mock_pool.start = _start
     mock_pool.execute_task = _execute_task
     mock_pool.collect_memory = _collect_memory
+    mock_pool.memory_count = _memory_count
     mock_pool.status = _status
     mock_pool.stop = _stop
     return mock_pool
@@ -1166,17 +1170,32 @@ async def test_aggregate_results_subset(pool_mgr_with_pools: PoolManager) -> Non
     assert set(out.keys()) == {"pool_a", "pool_b"}
 
 
+@pytest.mark.unit
+async def test_aggregate_results_counts_without_collecting(
+    pool_mgr_with_pools: PoolManager,
+) -> None:
+    """Aggregation uses memory_count() and never materializes pool results."""
+    pool = pool_mgr_with_pools._pools["pool_a"]
+    pool.collect_memory = AsyncMock(side_effect=AssertionError("collect_memory called"))
+    pool.memory_count = AsyncMock(return_value=7)
+
+    out = await pool_mgr_with_pools.aggregate_results(pool_ids=["pool_a"])
+
+    assert out["pool_a"]["memory_count"] == 7
+    pool.collect_memory.assert_not_called()
+
+
 @pytest.mark.unit
 async def test_aggregate_results_handles_pool_errors(
     pool_mgr_with_pools: PoolManager,
 ) -> None:
-    """If a pool's collect_memory raises, its entry is skipped (not the whole call)."""
+    """If a pool's memory_count raises, its entry is skipped (not the whole call)."""
     bad = _make_pool("bad", n_workers=1)
 
-    async def _bad_collect():
+    async def _bad_count():
         raise RuntimeError("oops")
 
-    bad.collect_memory = _bad_collect
+    bad.memory_count = _bad_count
 
     async def _status_ok() -> PoolStatus:
         return PoolStatus.RUNNING
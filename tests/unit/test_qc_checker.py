@@ -1,6 +1,8 @@
 """Tests for qc/checker.py — QualityControl integration with Crackerjack."""
 
+import asyncio
 import json
+import subprocess
 from unittest.mock import MagicMock
 
 import httpx
@@ -9,12 +11,20 @@ import respx
 from mahavishnu.qc.checker import QualityControl
 
 
-def _mock_config(enabled=True, min_score=80, crackerjack_url="http://localhost:8676/mcp"):
+def _mock_config(
+    enabled=True,
+    min_score=80,
+    crackerjack_url="http://localhost:8676/mcp",
+    max_concurrent_checks=8,
+    cache_size=1024,
+):
     config = MagicMock()
     config.qc.enabled = enabled
     config.qc.min_score = min_score
     config.qc.checks = ["linting", "type_checking"]
     config.qc.crackerjack_url = crackerjack_url
+    config.qc.max_concurrent_checks = max_concurrent_checks
+    config.qc.cache_size = cache_size
     # getattr fallback for qc_checks
     del config.qc_checks
     return config
@@ -184,6 +194,88 @@ class TestRunPostChecks:
         assert result["score"] == 100
 
 
+def _git_repo(path):
+    path.mkdir()
+    (path / "a.py").write_text("x = 1\n")
+    for args in (["init", "-q"], ["add", "."], ["commit", "-qm", "init"]):
+        subprocess.run(
+            ["git", "-c", "user.email=t@example.com", "-c", "user.name=t", *args],
+            cwd=path,
+            check=True,
+            capture_output=True,
+        )
+    return str(path)
+
+
+class TestConcurrencyAndCache:
+    @respx.mock
+    async def test_checks_run_concurrently_up_to_limit(self):
+        in_flight = 0
+        peak = 0
+
+        async def handler(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200, json={"result": _SUCCESS_RESULT})
+
+        respx.post(_TOOLS_URL).mock(side_effect=handler)
+        qc = QualityControl(_mock_config(max_concurrent_checks=3))
+        repos = [f"/tmp/repo-{i}" for i in range(10)]
+
+        result = await qc.run_pre_checks(repos)
+
+        assert peak == 3
+        assert list(result["individual_results"]) == repos
+        assert result["passed"] is True
+
+    @respx.mock
+    async def test_unchanged_tree_is_served_from_cache(self, tmp_path):
+        route = respx.post(_TOOLS_URL).mock(
+            return_value=httpx.Response(200, json={"result": _SUCCESS_RESULT})
+        )
+        repo = _git_repo(tmp_path / "repo")
+        qc = QualityControl(_mock_config())
+
+        await qc.run_pre_checks([repo])
+        post = await qc.run_post_checks([repo])
+
+        assert route.call_count == 1
+        assert post["cached_repos"] == [repo]
+        assert post["individual_results"][repo]["linting"]["status"] == "passed"
+
+        (tmp_path / "repo" / "a.py").write_text("x = 2\n")  # dirty trees are re-checked
+        await qc.run_post_checks([repo])
+        assert route.call_count == 2
+
+    @respx.mock
+    async def test_degraded_results_are_not_cached(self, tmp_path):
+        route = respx.post(_TOOLS_URL).mock(side_effect=httpx.ConnectError("refused"))
+        repo = _git_repo(tmp_path / "repo")
+        qc = QualityControl(_mock_config())
+
+        await qc.run_pre_checks([repo])
+        await qc.run_pre_checks([repo])
+
+        assert route.call_count == 2
+
+    @respx.mock
+    async def test_iter_repo_checks_streams_results(self):
+        async def handler(request):
+            target = json.loads(json.loads(request.content)["arguments"]["kwargs"])["target_dir"]
+            await asyncio.sleep(0.05 if target == "/tmp/slow" else 0)
+            return httpx.Response(200, json={"result": _SUCCESS_RESULT})
+
+        respx.post(_TOOLS_URL).mock(side_effect=handler)
+        qc = QualityControl(_mock_config())
+
+        order = [r.repo async for r in qc.iter_repo_checks(["/tmp/slow", "/tmp/fast"])]
+
+        assert order == ["/tmp/fast", "/tmp/slow"]
+
+
 class TestIsHealthy:
     @respx.mock
     async def test_healthy_when_200(self):
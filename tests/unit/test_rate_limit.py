@@ -22,6 +22,7 @@ from mahavishnu.core.rate_limit import (
     RateLimiter,
     RateLimitError,
     RateLimitInfo,
+    SlidingWindowCounter,
     rate_limit,
 )
 from mahavishnu.core.rate_limit_tools import (
@@ -182,8 +183,10 @@ class TestRateLimiter:
         key = "cooldown"
         now = 1_000.0
 
+        for seconds_ago in (5, 4, 3, 2, 1):
+            monkeypatch.setattr(rate_limit_module.time, "time", lambda t=now - seconds_ago: t)
+            limiter.record_violation(key)
         monkeypatch.setattr(rate_limit_module.time, "time", lambda: now)
-        limiter._violations[key] = [now - 1, now - 2, now - 3, now - 4, now - 5]
 
         allowed, info = await limiter.is_allowed(key)
 
@@ -198,16 +201,15 @@ class TestRateLimiter:
         key = "hour_limit"
         now = 2_000.0
 
+        monkeypatch.setattr(rate_limit_module.time, "time", lambda: now - 10)
+        assert (await limiter.is_allowed(key))[0] is True
         monkeypatch.setattr(rate_limit_module.time, "time", lambda: now)
-        limiter._tokens[key] = 10
-        limiter._last_update[key] = now
-        limiter._requests[key] = [(now - 10, 1)]
 
         allowed, info = await limiter.is_allowed(key)
 
         assert allowed is False
         assert info.limited is True
-        assert info.retry_after is not None
+        assert info.retry_after == 3600 - 10
 
     @pytest.mark.asyncio
     async def test_rate_limiter_day_limit_blocks(self, monkeypatch):
@@ -216,16 +218,15 @@ class TestRateLimiter:
         key = "day_limit"
         now = 3_000.0
 
+        monkeypatch.setattr(rate_limit_module.time, "time", lambda: now - 10)
+        assert (await limiter.is_allowed(key))[0] is True
         monkeypatch.setattr(rate_limit_module.time, "time", lambda: now)
-        limiter._tokens[key] = 10
-        limiter._last_update[key] = now
-        limiter._requests[key] = [(now - 10, 1)]
 
         allowed, info = await limiter.is_allowed(key)
 
         assert allowed is False
         assert info.limited is True
-        assert info.retry_after is not None
+        assert info.retry_after == 86400 - 10
 
     @pytest.mark.asyncio
     async def test_rate_limiter_cleanup(self):
@@ -241,7 +242,7 @@ class TestRateLimiter:
         await limiter.is_allowed(key)
 
         # Check it's tracked
-        assert key in limiter._requests
+        assert key in limiter._clients
 
         # Wait for cleanup interval
         await asyncio.sleep(1.1)
@@ -759,61 +760,67 @@ class TestRateLimitIntegration:
 
 
 class TestRateLimiterCleanup:
-    """Cover _cleanup_old_entries and get_stats global path."""
+    """Cover idle-client expiry and get_stats global path."""
 
     @pytest.mark.asyncio
-    async def test_cleanup_removes_old_requests(self):
-        """Old request entries should be removed by cleanup."""
-        limiter = RateLimiter(RateLimitConfig(requests_per_minute=60))
-        key = "cleanup_test"
-
-        import time
+    async def test_cleanup_removes_idle_clients(self, monkeypatch):
+        """Clients idle for longer than a day should be removed by cleanup."""
+        limiter = RateLimiter(per_minute=60)
+        now = 10_000.0
 
-        old_ts = time.time() - 7200
-        limiter._requests[key] = [(old_ts, 1)]
+        monkeypatch.setattr(rate_limit_module.time, "time", lambda: now)
+        await limiter.is_allowed("idle")
+        monkeypatch.setattr(rate_limit_module.time, "time", lambda: now + 3600)
+        await limiter.is_allowed("recent")
 
+        monkeypatch.setattr(rate_limit_module.time, "time", lambda: now + 86400 + 1)
         limiter._cleanup_old_entries()
-        assert key not in limiter._requests
+
+        assert "idle" not in limiter._clients
+        assert "recent" in limiter._clients
+        assert limiter._expiry == [(now + 3600 + 86400, "recent")]
 
     @pytest.mark.asyncio
-    async def test_cleanup_keeps_recent_requests(self):
-        """Recent request entries should not be removed by cleanup."""
-        limiter = RateLimiter(RateLimitConfig(requests_per_minute=60))
+    async def test_cleanup_keeps_clients_with_day_history(self, monkeypatch):
+        """A request two hours old still counts toward the daily limit."""
+        limiter = RateLimiter(per_minute=60)
         key = "recent_test"
+        now = 10_000.0
 
-        import time
-
-        recent_ts = time.time() - 10
-        limiter._requests[key] = [(recent_ts, 1)]
+        monkeypatch.setattr(rate_limit_module.time, "time", lambda: now - 7200)
+        await limiter.is_allowed(key)
+        monkeypatch.setattr(rate_limit_module.time, "time", lambda: now)
 
         limiter._cleanup_old_entries()
-        assert key in limiter._requests
+        assert key in limiter._clients
+        assert limiter.get_stats(key)["requests_per_day"] == 1
 
     @pytest.mark.asyncio
-    async def test_cleanup_removes_old_violations(self):
-        """Old violation entries should be removed."""
-        limiter = RateLimiter(RateLimitConfig(requests_per_minute=60))
+    async def test_old_violations_expire(self, monkeypatch):
+        """Violations older than cleanup_interval should no longer be counted."""
+        limiter = RateLimiter(per_minute=60, cleanup_interval=300)
         key = "violation_cleanup"
+        now = 10_000.0
 
-        import time
-
-        old_ts = time.time() - 7200
-        limiter._violations[key] = [old_ts]
+        monkeypatch.setattr(rate_limit_module.time, "time", lambda: now - 7200)
+        limiter.record_violation(key)
+        monkeypatch.setattr(rate_limit_module.time, "time", lambda: now)
 
-        limiter._cleanup_old_entries()
-        assert key not in limiter._violations
+        assert limiter.get_stats(key)["violations"] == 0
+        assert limiter.get_stats()["total_violations"] == 0
 
     @pytest.mark.asyncio
-    async def test_get_stats_global(self):
+    async def test_get_stats_global(self, monkeypatch):
         """get_stats without key should return global stats."""
-        limiter = RateLimiter(RateLimitConfig(requests_per_minute=60))
+        limiter = RateLimiter(per_minute=60)
         key = "stats_global"
+        now = 10_000.0
 
-        import time
-
-        recent_ts = time.time() - 10
-        limiter._requests[key] = [(recent_ts, 3)]
-        limiter._violations[key] = [recent_ts]
+        monkeypatch.setattr(rate_limit_module.time, "time", lambda: now - 10)
+        for _ in range(3):
+            await limiter.is_allowed(key)
+        limiter.record_violation(key)
+        monkeypatch.setattr(rate_limit_module.time, "time", lambda: now)
 
         stats = limiter.get_stats()
         assert stats["total_clients"] == 1
@@ -822,25 +829,48 @@ class TestRateLimiterCleanup:
         assert stats["active_clients"] == 1
 
     @pytest.mark.asyncio
-    async def test_get_stats_specific_key(self):
+    async def test_get_stats_specific_key(self, monkeypatch):
         """get_stats with key should return per-key stats."""
         limiter = RateLimiter(per_minute=60)
         key = "per_key"
+        now = 100_000.0
 
-        import time
-
-        now = time.time()
-        limiter._requests[key] = [
-            (now - 10, 1),
-            (now - 100, 1),
-            (now - 10000, 1),
-        ]
+        for seconds_ago in (10_000, 100, 10):
+            monkeypatch.setattr(rate_limit_module.time, "time", lambda t=now - seconds_ago: t)
+            await limiter.is_allowed(key)
+        monkeypatch.setattr(rate_limit_module.time, "time", lambda: now)
 
         stats = limiter.get_stats(key)
         assert stats["key"] == key
         assert stats["requests_per_minute"] == 1
         assert stats["requests_per_hour"] == 2
         assert stats["requests_per_day"] == 3
+        assert limiter.get_stats("unknown")["requests_per_day"] == 0
+
+
+class TestSlidingWindowCounter:
+    """Bucketed counts, expiry and oldest-event tracking."""
+
+    def test_counts_expire_by_bucket(self):
+        window = SlidingWindowCounter(60, buckets=60)
+        window.add(100.2)
+        window.add(100.7, count=2)
+        window.add(130.0)
+
+        assert window.count(130.0) == 4
+        assert window.oldest(130.0) == 100.2
+        assert window.count(160.9) == 1
+        assert window.oldest(160.9) == 130.0
+        assert window.count(500.0) == 0
+        assert window.oldest(500.0) is None
+
+    def test_live_buckets_are_bounded(self):
+        window = SlidingWindowCounter(60, buckets=6)
+        for second in range(1000):
+            window.add(float(second))
+
+        assert window.count(999.0) == 60
+        assert len(window._buckets) == 6
 
 
 # ============================================================================
@@ -1,6 +1,7 @@
 """Unit tests for repository messaging functionality."""
 
-from datetime import datetime, UTC
+import asyncio
+from datetime import UTC, datetime, timedelta
 from unittest.mock import Mock
 
 import pytest
@@ -128,6 +129,113 @@ async def test_send_message(mock_app):
     assert messenger.messages[0].id == message.id
 
 
+def _stored(messenger, message_id, receiver, message_type, priority, minutes, expires_at=None):
+    messenger._store(
+        RepositoryMessage(
+            id=message_id,
+            sender_repo="sender",
+            receiver_repo=receiver,
+            message_type=message_type,
+            content={},
+            priority=priority,
+            timestamp=datetime(2026, 1, 1, tzinfo=UTC) + timedelta(minutes=minutes),
+            expires_at=expires_at,
+        )
+    )
+
+
+@pytest.mark.asyncio
+async def test_mailbox_merges_lanes_newest_first(mock_app):
+    """Messages across priority/type lanes come back newest first, with filters."""
+    messenger = RepositoryMessenger(mock_app)
+    alert, custom = MessageType.QUALITY_ALERT, MessageType.CUSTOM
+    _stored(messenger, "m1", "repo_a", alert, MessagePriority.HIGH, 1)
+    _stored(messenger, "m2", "repo_a", custom, MessagePriority.LOW, 5)
+    _stored(messenger, "m3", "repo_a", alert, MessagePriority.LOW, 3)
+    _stored(messenger, "m4", "repo_a", custom, MessagePriority.CRITICAL, 5)
+    _stored(messenger, "m5", "repo_b", alert, MessagePriority.HIGH, 9)
+    _stored(messenger, "m0", "repo_a", alert, MessagePriority.HIGH, 0)  # out of order
+
+    async def ids(**kwargs):
+        return [m.id for m in await messenger.get_messages_for_repo("repo_a", **kwargs)]
+
+    # Ties on timestamp keep send order, as the old stable sort did
+    assert await ids() == ["m2", "m4", "m3", "m1", "m0"]
+    assert await ids(limit=2) == ["m2", "m4"]
+    assert await ids(message_type=alert) == ["m3", "m1", "m0"]
+    assert await ids(since=datetime(2026, 1, 1, 0, 3, tzinfo=UTC)) == ["m2", "m4", "m3"]
+    assert await messenger.get_messages_for_repo("unknown") == []
+
+
+@pytest.mark.asyncio
+async def test_expired_messages_are_evicted(mock_app):
+    """The expiry heap drops due messages from reads and from cleanup."""
+    messenger = RepositoryMessenger(mock_app)
+    past = datetime.now(UTC) - timedelta(seconds=1)
+    future = datetime.now(UTC) + timedelta(hours=1)
+    _stored(messenger, "old", "repo_a", MessageType.CUSTOM, MessagePriority.NORMAL, 1, past)
+    _stored(messenger, "only", "repo_c", MessageType.CUSTOM, MessagePriority.NORMAL, 1, past)
+    kept = await messenger.send_message(
+        "sender", "repo_a", MessageType.CUSTOM, {}, expires_at=future
+    )
+
+    assert await messenger.cleanup_expired_messages() == 2
+    assert [m.id for m in messenger.messages] == [kept.id]
+    assert "repo_c" not in messenger._mailboxes
+    assert await messenger.cleanup_expired_messages() == 0
+
+    _stored(messenger, "late", "repo_a", MessageType.CUSTOM, MessagePriority.NORMAL, 2, past)
+    assert [m.id for m in await messenger.get_messages_for_repo("repo_a")] == [kept.id]
+
+
+@pytest.mark.asyncio
+async def test_unacknowledged_messages_exclude_acknowledged(mock_app):
+    """Acknowledged messages drop out of the unacknowledged view only."""
+    messenger = RepositoryMessenger(mock_app)
+    first = await messenger.send_message("s", "repo_a", MessageType.CUSTOM, {"n": 1})
+    second = await messenger.send_message("s", "repo_a", MessageType.CUSTOM, {"n": 2})
+
+    assert await messenger.acknowledge_message(first.id, "repo_a") is True
+    assert await messenger.acknowledge_message(second.id, "repo_b") is False
+    assert await messenger.acknowledge_message("missing", "repo_a") is False
+
+    assert [m.id for m in await messenger.get_unacknowledged_messages("repo_a")] == [second.id]
+    assert len(await messenger.get_messages_for_repo("repo_a")) == 2
+
+
+@pytest.mark.asyncio
+async def test_subscribers_notified_concurrently_with_timeout(mock_app):
+    """Callbacks run together; a hung callback is cut off without blocking others."""
+    messenger = RepositoryMessenger(mock_app, callback_timeout=0.2)
+    ready = asyncio.Event()
+    seen: list[str] = []
+
+    async def waits_for_peer(message):
+        await ready.wait()  # only completes if the peer runs concurrently
+        seen.append("waiter")
+
+    async def releases_peer(message):
+        ready.set()
+        seen.append("releaser")
+
+    async def hangs(message):
+        await asyncio.Event().wait()
+
+    async def fails(message):
+        raise RuntimeError("boom")
+
+    messenger.subscribe("repo_a", waits_for_peer)
+    messenger.subscribe("repo_a", hangs)
+    messenger.subscribe("*", releases_peer)
+    messenger.subscribe("*", fails)
+
+    await asyncio.wait_for(
+        messenger.send_message("s", "repo_a", MessageType.CUSTOM, {}), timeout=1.0
+    )
+
+    assert sorted(seen) == ["releaser", "waiter"]
+
+
 @pytest.mark.asyncio
 async def test_subscribe_and_notify(mock_app):
     """Test subscribing to messages and receiving notifications."""
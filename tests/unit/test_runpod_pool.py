@@ -469,6 +469,22 @@ class TestCollectMemory:
         await pool.collect_memory()
         assert len(pool._task_results) == 0
 
+    @pytest.mark.asyncio
+    async def test_memory_count_does_not_clear_results(self):
+        cfg = _make_pool_config()
+        pool = RunPodPool(config=cfg)
+        pool._task_results.append(
+            {
+                "worker_id": "wp-1",
+                "output": "data",
+                "status": "completed",
+                "timestamp": 1000.0,
+            }
+        )
+
+        assert await pool.memory_count() == 1
+        assert len(await pool.collect_memory()) == 1
+
     @pytest.mark.asyncio
     async def test_collect_memory_empty_when_no_results(self):
         cfg = _make_pool_config()
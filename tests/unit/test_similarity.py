@@ -0,0 +1,78 @@
+"""Unit tests for the vectorized SimilarityIndex."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from mahavishnu.core.embeddings import cosine_similarity
+from mahavishnu.core.similarity import SimilarityIndex, normalize_rows
+
+
+@pytest.fixture
+def vectors() -> list[list[float]]:
+    rng = np.random.default_rng(7)
+    return rng.normal(size=(37, 16)).tolist()
+
+
+class TestNormalizeRows:
+    def test_unit_rows_and_zero_vectors(self) -> None:
+        matrix = normalize_rows([[3.0, 4.0], [0.0, 0.0]])
+        assert matrix.dtype == np.float32
+        assert matrix.flags.c_contiguous
+        assert matrix[0].tolist() == pytest.approx([0.6, 0.8])
+        assert matrix[1].tolist() == [0.0, 0.0]
+
+    def test_ragged_vectors_rejected(self) -> None:
+        with pytest.raises(ValueError):
+            normalize_rows([[1.0, 2.0], [1.0]])
+
+
+class TestSimilarityIndex:
+    def test_pairs_above_matches_pairwise_cosine(self, vectors: list[list[float]]) -> None:
+        ids = [f"t{i}" for i in range(len(vectors))]
+        index = SimilarityIndex.from_vectors(ids, vectors)
+
+        pairs = index.pairs_above(0.2, block_size=5)
+
+        expected = {
+            (ids[i], ids[j])
+            for i in range(len(ids))
+            for j in range(i + 1, len(ids))
+            if cosine_similarity(vectors[i], vectors[j]) >= 0.2 + 1e-5
+        }
+        found = {(a, b) for a, b, _ in pairs}
+        assert expected <= found
+        scores = [score for _, _, score in pairs]
+        assert scores == sorted(scores, reverse=True)
+        a, b, score = pairs[0]
+        assert score == pytest.approx(
+            cosine_similarity(vectors[ids.index(a)], vectors[ids.index(b)]), abs=1e-5
+        )
+
+    def test_top_k_excludes_self_and_is_sorted(self, vectors: list[list[float]]) -> None:
+        ids = [f"t{i}" for i in range(len(vectors))]
+        index = SimilarityIndex.from_vectors(ids, vectors)
+
+        neighbours = index.top_k(3, block_size=8)
+
+        assert set(neighbours) == set(ids)
+        for task_id, found in neighbours.items():
+            assert len(found) == 3
+            assert task_id not in {other for other, _ in found}
+            brute = max(
+                (cosine_similarity(vectors[ids.index(task_id)], vectors[j]), ids[j])
+                for j in range(len(ids))
+                if ids[j] != task_id
+            )
+            assert found[0][0] == brute[1]
+            assert [s for _, s in found] == sorted((s for _, s in found), reverse=True)
+
+    def test_query_and_small_inputs(self) -> None:
+        index = SimilarityIndex.from_vectors(["x", "y"], [[1.0, 0.0], [0.0, 1.0]])
+        assert index.query([1.0, 0.1], k=1)[0][0] == "x"
+        assert index.top_k(5) == {"x": [("y", 0.0)], "y": [("x", 0.0)]}
+        empty = SimilarityIndex.from_vectors([], [])
+        assert len(empty) == 0
+        assert empty.pairs_above(0.5) == []
+        assert empty.query([1.0], k=3) == []
@@ -3,10 +3,13 @@
 from __future__ import annotations
 
 import sqlite3
+import threading
 
 import pytest
 
+from mahavishnu.storage import encrypted_sqlite
 from mahavishnu.storage.encrypted_sqlite import (
+    CHUNK_MAGIC,
     EncryptedSQLite,
     EncryptedSQLitePool,
     EncryptionKeyError,
@@ -400,6 +403,294 @@ class TestPool:
         assert pool._pool == []
 
 
+# =============================================================================
+# Chunked format
+# =============================================================================
+
+CHUNK = 4096
+
+
+async def _open_chunked(path, **kwargs) -> EncryptedSQLite:
+    db = EncryptedSQLite(path, encryption_key=VALID_KEY, chunked=True, chunk_size=CHUNK, **kwargs)
+    await db.connect()
+    return db
+
+
+async def _seed(db: EncryptedSQLite, rows: int = 2000) -> None:
+    db.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, payload TEXT)")
+    db.executemany("INSERT INTO t VALUES (?, ?)", [(i, f"row-{i:06d}" * 4) for i in range(rows)])
+    await db.commit()
+
+
+class TestChunkedFormat:
+    async def test_round_trip_writes_chunked_file(self, db_path):
+        db = await _open_chunked(db_path)
+        await _seed(db)
+        await db.close()
+
+        assert not db_path.exists()
+        assert db.enc_path.read_bytes()[: len(CHUNK_MAGIC)] == CHUNK_MAGIC
+
+        reopened = await _open_chunked(db_path)
+        assert reopened.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 2000
+        assert await reopened.verify_integrity()
+        await reopened.close()
+
+    async def test_commit_reencrypts_only_dirty_chunks(self, db_path):
+        db = await _open_chunked(db_path)
+        await _seed(db)
+        store = db._working_copy.store
+        total_chunks = len(store.digests)
+        before = store.chunks_written
+
+        db.execute("UPDATE t SET payload = 'changed' WHERE id = 1500")
+        await db.commit()
+
+        assert total_chunks > 20
+        assert 1 <= store.chunks_written - before <= 3
+        await db.close()
+
+        reopened = await _open_chunked(db_path)
+        row = reopened.execute("SELECT payload FROM t WHERE id = 1500").fetchone()
+        assert row[0] == "changed"
+        await reopened.close()
+
+    async def test_wrong_key_raises(self, db_path):
+        db = await _open_chunked(db_path)
+        await _seed(db, rows=10)
+        await db.close()
+
+        other = EncryptedSQLite(db_path, encryption_key="b" * 32, chunked=True)
+        with pytest.raises(EncryptionKeyError):
+            await other.connect()
+        assert not db_path.exists()
+
+    async def test_tampered_chunk_raises(self, db_path):
+        db = await _open_chunked(db_path)
+        await _seed(db, rows=10)
+        await db.close()
+
+        data = bytearray(db.enc_path.read_bytes())
+        data[-1] ^= 0xFF
+        db.enc_path.write_bytes(bytes(data))
+
+        with pytest.raises(EncryptionKeyError):
+            await _open_chunked(db_path)
+
+    async def test_replayed_chunk_from_an_older_sync_raises(self, db_path):
+        db = await _open_chunked(db_path)
+        await _seed(db)
+        await db.close()
+        older = db.enc_path.read_bytes()
+
+        db = await _open_chunked(db_path)
+        db.execute("UPDATE t SET payload = ? WHERE id = 1500", ("x" * 40,))
+        await db.commit()
+        await db.close()
+        newer = bytearray(db.enc_path.read_bytes())
+
+        # Swap the rewritten chunk record back to its previous version.
+        header = encrypted_sqlite._CHUNK_HEADER_SIZE
+        record = encrypted_sqlite._NONCE_SIZE + CHUNK + encrypted_sqlite._TAG_SIZE
+        index = next(
+            i
+            for i in range((len(older) - header) // record)
+            if older[header + i * record : header + (i + 1) * record]
+            != newer[header + i * record : header + (i + 1) * record]
+        )
+        start = header + index * record
+        newer[start : start + record] = older[start : start + record]
+        db.enc_path.write_bytes(bytes(newer))
+
+        with pytest.raises(EncryptionKeyError):
+            await _open_chunked(db_path)
+
+    async def test_sync_killed_partway_through_rolls_back(self, db_path):
+        db = await _open_chunked(db_path)
+        await _seed(db)
+        await db.close()
+
+        db = await _open_chunked(db_path)
+        store = db._working_copy.store
+        real_aead = store._aead
+
+        class CrashingAEAD:
+            """Fails on the second chunk record, after the first went to disk."""
+
+            calls = 0
+
+            def encrypt(self, nonce, data, aad):
+                self.calls += 1
+                if self.calls == 3:  # header, first record, then die
+                    raise OSError("simulated crash")
+                return real_aead.encrypt(nonce, data, aad)
+
+        store._aead = CrashingAEAD()
+        db.execute("UPDATE t SET payload = 'changed' WHERE id IN (10, 1500)")
+        with pytest.raises(OSError, match="simulated crash"):
+            await db.commit()
+
+        # Snapshot the files as a crash would have left them.
+        journal = store.journal_path
+        assert journal.exists()
+        torn = db_path.with_name("torn.db")
+        crashed = db_path.with_name("crashed.db")
+        for target in (torn, crashed):
+            target.with_name(target.name + ".enc").write_bytes(db.enc_path.read_bytes())
+        crashed.with_name("crashed.db.enc.journal").write_bytes(journal.read_bytes())
+        store._aead = real_aead
+        await db.close()
+
+        with pytest.raises(EncryptionKeyError):
+            await _open_chunked(torn)
+
+        recovered = await _open_chunked(crashed)
+        rows = recovered.execute("SELECT payload FROM t WHERE id IN (10, 1500)").fetchall()
+        assert [row[0] for row in rows] == ["row-000010" * 4, "row-001500" * 4]
+        assert await recovered.verify_integrity()
+        assert not recovered._working_copy.store.journal_path.exists()
+        await recovered.close()
+
+    async def test_leftover_journal_of_a_committed_sync_is_discarded(self, db_path, monkeypatch):
+        db = await _open_chunked(db_path)
+        await _seed(db)
+        store = db._working_copy.store
+        monkeypatch.setattr(store, "_remove_journal", lambda: None)
+
+        db.execute("UPDATE t SET payload = 'changed' WHERE id = 1500")
+        await db.commit()
+        await db.close()
+        assert store.journal_path.exists()
+        committed = db.enc_path.read_bytes()
+
+        reopened = await _open_chunked(db_path)
+        row = reopened.execute("SELECT payload FROM t WHERE id = 1500").fetchone()
+        assert row[0] == "changed"
+        assert not store.journal_path.exists()
+        assert reopened.enc_path.read_bytes() == committed
+        await reopened.close()
+
+    async def test_commit_syncs_in_a_worker_thread(self, db_path, monkeypatch):
+        db = await _open_chunked(db_path)
+        threads = []
+        real_sync = EncryptedSQLite._sync_chunks
+
+        def recording_sync(self):
+            threads.append(threading.current_thread())
+            return real_sync(self)
+
+        monkeypatch.setattr(EncryptedSQLite, "_sync_chunks", recording_sync)
+        await _seed(db, rows=10)
+
+        assert threads
+        assert threads[0] is not threading.main_thread()
+        await db.close()
+
+    async def test_busy_checkpoint_is_not_reported_as_synced(self, db_path, monkeypatch):
+        monkeypatch.setattr(encrypted_sqlite, "_CHECKPOINT_ATTEMPTS", 2)
+        monkeypatch.setattr(encrypted_sqlite, "_CHECKPOINT_RETRY_DELAY", 0)
+        db = await _open_chunked(db_path)
+        await _seed(db, rows=100)
+        db.execute("PRAGMA busy_timeout=0")
+        store = db._working_copy.store
+        synced = (store.epoch, store.chunks_written)
+
+        reader = sqlite3.connect(db_path)
+        reader.execute("BEGIN")
+        reader.execute("SELECT COUNT(*) FROM t").fetchone()
+        db.execute("UPDATE t SET payload = 'changed' WHERE id = 50")
+        with pytest.raises(sqlite3.OperationalError, match="checkpoint"):
+            await db.commit()
+        assert (store.epoch, store.chunks_written) == synced
+
+        reader.rollback()
+        reader.close()
+        await db.commit()
+        await db.close()
+
+        reopened = await _open_chunked(db_path)
+        assert reopened.execute("SELECT payload FROM t WHERE id = 50").fetchone()[0] == "changed"
+        await reopened.close()
+
+    async def test_file_format_database_is_converted(self, db_path):
+        legacy = EncryptedSQLite(db_path, encryption_key=VALID_KEY)
+        await legacy.connect()
+        await _seed(legacy, rows=50)
+        await legacy.close()
+        assert not legacy.enc_path.read_bytes().startswith(CHUNK_MAGIC)
+
+        db = await _open_chunked(db_path)
+        assert db.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 50
+        assert db.enc_path.read_bytes().startswith(CHUNK_MAGIC)
+        await db.close()
+
+        # Chunked files are detected even without chunked=True.
+        plain_mode = EncryptedSQLite(db_path, encryption_key=VALID_KEY)
+        await plain_mode.connect()
+        assert plain_mode.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 50
+        await plain_mode.close()
+
+    async def test_backup_and_restore_stream_chunks(self, db_path, tmp_path):
+        db = await _open_chunked(db_path)
+        await _seed(db, rows=100)
+        await db.backup(tmp_path / "backup.db")
+        db.execute("DELETE FROM t")
+        await db.commit()
+
+        await db.restore(tmp_path / "backup.db")
+
+        assert (tmp_path / "backup.db.enc").read_bytes().startswith(CHUNK_MAGIC)
+        assert db.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 100
+        await db.close()
+
+    async def test_restore_plaintext_backup(self, db_path, tmp_path):
+        plain = tmp_path / "plain.db"
+        conn = sqlite3.connect(plain)
+        conn.execute("CREATE TABLE p (x INTEGER)")
+        conn.execute("INSERT INTO p VALUES (7)")
+        conn.commit()
+        conn.close()
+
+        db = await _open_chunked(db_path)
+        await db.restore(plain)
+
+        assert db.execute("SELECT x FROM p").fetchone()[0] == 7
+        await db.close()
+        assert db.enc_path.read_bytes().startswith(CHUNK_MAGIC)
+
+    async def test_pool_connections_share_one_working_copy(self, db_path, monkeypatch):
+        db = await _open_chunked(db_path)
+        await _seed(db, rows=10)
+        await db.close()
+
+        decrypts = []
+        real_decrypt = encrypted_sqlite._ChunkedStore.decrypt_to
+
+        def counting_decrypt(self, plain_path):
+            decrypts.append(plain_path)
+            return real_decrypt(self, plain_path)
+
+        monkeypatch.setattr(encrypted_sqlite._ChunkedStore, "decrypt_to", counting_decrypt)
+        pool = EncryptedSQLitePool(
+            db_path, encryption_key=VALID_KEY, pool_size=2, chunked=True, chunk_size=CHUNK
+        )
+        c1 = await pool.acquire()
+        c2 = await pool.acquire()
+        c2.execute("INSERT INTO t VALUES (100, 'from c2')")
+        await c2.commit()
+
+        assert c1._working_copy is c2._working_copy
+        assert len(decrypts) == 1
+        assert c1.execute("SELECT payload FROM t WHERE id = 100").fetchone()[0] == "from c2"
+        with pytest.raises(RuntimeError, match="other connections"):
+            await c1.restore(db_path)
+
+        await c1.close()
+        assert db_path.exists()  # c2 still uses the working copy
+        await c2.close()
+        assert not db_path.exists()
+
+
 # =============================================================================
 # generate_encryption_key
 # =============================================================================
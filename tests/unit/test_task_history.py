@@ -0,0 +1,126 @@
+"""Tests for the task history index (mahavishnu.core.task_history)."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from mahavishnu.core.predictions import DurationEstimator
+from mahavishnu.core.task_history import (
+    TaskHistoryIndex,
+    duration_percentiles,
+    task_duration_hours,
+)
+
+START = datetime(2026, 1, 1, 9, 0)
+
+
+def _task(
+    task_id: str,
+    hours: float,
+    repository: str | None = "repo-a",
+    tags: list[str] | None = None,
+    priority: str | None = "high",
+    status: str = "completed",
+    history: list[str] | None = None,
+) -> dict:
+    return {
+        "id": task_id,
+        "repository": repository,
+        "tags": tags or [],
+        "priority": priority,
+        "status": status,
+        "created_at": START.isoformat(),
+        "completed_at": (START + timedelta(hours=hours)).isoformat(),
+        "status_history": [{"status": s} for s in history or []],
+    }
+
+
+class TestDurationGroups:
+    """Similar-task lookup and grouped durations."""
+
+    def test_similar_needs_two_of_repo_tag_priority(self) -> None:
+        index = TaskHistoryIndex.from_tasks(
+            [
+                _task("repo+tag", 1, tags=["bug"], priority="low"),
+                _task("repo+priority", 2),
+                _task("tag+priority", 3, repository="repo-b", tags=["bug"]),
+                _task("repo-only", 4, priority="low"),
+                _task("open", 5, tags=["bug"], status="in_progress"),
+            ]
+        )
+
+        query = {"repository": "repo-a", "tags": ["bug"], "priority": "high"}
+        durations = index.similar_durations(query)
+
+        assert durations.tolist() == [1.0, 2.0, 3.0]
+
+    def test_grouped_durations_and_incremental_add(self) -> None:
+        index = TaskHistoryIndex()
+        index.add(_task("t1", 2, tags=["bug"]))
+        index.add(_task("t2", 6, tags=["feature"]))
+
+        assert index.durations(tag="bug").tolist() == [2.0]
+        index.add(_task("t3", 4, tags=["bug"]))
+
+        assert index.durations(repository="repo-a", tag="bug").tolist() == [2.0, 4.0]
+        assert index.durations().tolist() == [2.0, 6.0, 4.0]
+        assert index.duration_count == 3
+
+    def test_array_grows_past_initial_capacity(self) -> None:
+        index = TaskHistoryIndex.from_tasks(_task(f"t{i}", i + 1) for i in range(200))
+
+        assert len(index) == 200
+        assert index.durations(priority="high").sum() == pytest.approx(sum(range(1, 201)))
+
+
+class TestSequenceTables:
+    """Prefix completion counts and sequence tallies."""
+
+    def test_completion_probability_from_prefixes(self) -> None:
+        index = TaskHistoryIndex.from_tasks(
+            [
+                _task("a", 1, history=["pending", "in_progress", "completed"]),
+                _task("b", 1, status="blocked", history=["pending", "in_progress", "blocked"]),
+                _task("c", 1, status="blocked", history=["pending", "blocked"]),
+            ]
+        )
+
+        assert index.completion_probability(("pending", "in_progress")) == 0.5
+        assert index.completion_probability(("pending",)) == pytest.approx(1 / 3)
+        assert index.completion_probability(("review",)) == 0.0
+        assert index.completion_probability(("pending", "completed")) == 1.0
+
+    def test_sequence_counts_by_repository(self) -> None:
+        index = TaskHistoryIndex()
+        for repo in ("repo-a", "repo-a", "repo-b"):
+            index.add(_task("x", 1, repository=repo, history=["pending", "completed"]))
+
+        assert index.sequence_counts[("pending", "completed")] == 3
+        assert index.repo_sequence_counts["repo-a"][("pending", "completed")] == 2
+
+
+class TestEstimatorWithHistory:
+    """DurationEstimator reading a persistent index."""
+
+    def test_estimate_uses_indexed_completions(self) -> None:
+        estimator = DurationEstimator()
+        task = {"id": "new", "repository": "repo-a", "tags": ["bug"], "priority": "high"}
+        assert estimator.estimate_duration(task, []).based_on_tasks == 0
+
+        for i, hours in enumerate([4, 5, 6, 5, 4, 6]):
+            estimator.history.add(_task(f"t{i}", hours, tags=["bug"]))
+        prediction = estimator.estimate_duration(task, [])
+
+        assert prediction.based_on_tasks == 6
+        assert prediction.estimated_hours == 5.0
+        assert prediction.factors["historical_percentiles"]["p50"] == 5.0
+
+
+def test_duration_helpers() -> None:
+    assert task_duration_hours(_task("t", 3)) == 3.0
+    assert task_duration_hours({"created_at": "not-a-date", "completed_at": "x"}) is None
+    assert duration_percentiles(np.array([1.0, 2.0, 3.0])) == {"p50": 2.0, "p90": 2.8}
+    assert duration_percentiles([]) == {}
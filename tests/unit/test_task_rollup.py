@@ -0,0 +1,236 @@
+"""Tests for grouped task counts: TaskStore.count_by_repository and TaskRollup."""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from mahavishnu.core.cross_repo_aggregator import CrossRepoAggregator
+from mahavishnu.core.event_store import EventStore, TaskEvent, TaskEventType
+from mahavishnu.core.task_rollup import TaskRollup
+from mahavishnu.core.task_store import (
+    Task,
+    TaskListFilter,
+    TaskPriority,
+    TaskStatus,
+    TaskStore,
+)
+
+NOW = datetime(2026, 3, 1, tzinfo=UTC)
+
+
+def _task(
+    task_id: str,
+    repository: str = "mahavishnu",
+    status: TaskStatus = TaskStatus.PENDING,
+    priority: TaskPriority = TaskPriority.MEDIUM,
+    tags: list[str] | None = None,
+    age_days: int = 0,
+) -> Task:
+    return Task(
+        id=task_id,
+        title=f"Task {task_id}",
+        repository=repository,
+        status=status,
+        priority=priority,
+        tags=tags or [],
+        created_at=NOW - timedelta(days=age_days),
+    )
+
+
+def _event(task_id: str, event_type: TaskEventType, data: dict) -> TaskEvent:
+    return TaskEvent.create(task_id=task_id, event_type=event_type, data=data, actor="test")
+
+
+@pytest.fixture
+def rollup() -> TaskRollup:
+    r = TaskRollup()
+    r.rebuild(
+        [
+            _task("t1", status=TaskStatus.PENDING, tags=["auth"], age_days=3),
+            _task("t2", status=TaskStatus.BLOCKED, priority=TaskPriority.HIGH, tags=["auth"]),
+            _task("t3", status=TaskStatus.COMPLETED, age_days=1),
+            _task("t4", repository="crackerjack", status=TaskStatus.PENDING, tags=["qc"]),
+        ]
+    )
+    return r
+
+
+class TestTaskRollup:
+    """Counts maintained from a rebuild plus task events."""
+
+    def test_repository_counts_after_rebuild(self, rollup: TaskRollup) -> None:
+        counts = rollup.repository_counts()
+
+        assert list(counts) == ["crackerjack", "mahavishnu"]
+        repo = counts["mahavishnu"]
+        assert repo.total == 3
+        assert repo.status_counts == {
+            TaskStatus.PENDING: 1,
+            TaskStatus.BLOCKED: 1,
+            TaskStatus.COMPLETED: 1,
+        }
+        assert repo.priority_counts == {TaskPriority.MEDIUM: 2, TaskPriority.HIGH: 1}
+        assert repo.tag_counts == {"auth": 2}
+        assert repo.blocked_task_ids == ["t2"]
+        assert repo.critical_count == 1
+        assert repo.oldest_pending == NOW - timedelta(days=3)
+        assert repo.newest_task == NOW
+
+    def test_status_and_tag_events_move_cells(self, rollup: TaskRollup) -> None:
+        in_progress = {"new_status": "in_progress"}
+        rollup.apply_event(_event("t2", TaskEventType.STATUS_CHANGED, in_progress))
+        rollup.apply_event(_event("t1", TaskEventType.TAG_REMOVED, {"tag": "auth"}))
+        rollup.apply_event(_event("t1", TaskEventType.COMPLETED, {}))
+
+        repo = rollup.repository_counts(["mahavishnu"])["mahavishnu"]
+        assert repo.status_counts == {TaskStatus.IN_PROGRESS: 1, TaskStatus.COMPLETED: 2}
+        assert repo.blocked_task_ids == []
+        assert repo.critical_count == 1
+        assert repo.oldest_pending is None
+        assert repo.tag_counts == {"auth": 1}
+
+    def test_create_and_delete_events(self, rollup: TaskRollup) -> None:
+        rollup.apply_event(
+            _event(
+                "t5",
+                TaskEventType.CREATED,
+                {"repository": "akosha", "priority": "critical", "tags": ["search"]},
+            )
+        )
+        assert rollup.repository_counts(["akosha"])["akosha"].priority_counts == {
+            TaskPriority.CRITICAL: 1
+        }
+
+        rollup.apply_event(_event("t4", TaskEventType.DELETED, {}))
+        rollup.apply_event(_event("t2", TaskEventType.DELETED, {}))
+
+        counts = rollup.repository_counts()
+        assert "crackerjack" not in counts
+        assert counts["mahavishnu"].newest_task == NOW - timedelta(days=1)
+        assert len(rollup) == 3
+
+    def test_events_for_unknown_tasks_are_ignored(self, rollup: TaskRollup) -> None:
+        rollup.apply_event(_event("missing", TaskEventType.FAILED, {}))
+
+        assert sum(c.total for c in rollup.repository_counts().values()) == 4
+
+
+class TestCountByRepository:
+    """The grouped SQL query and its row mapping."""
+
+    async def test_single_grouped_query(self) -> None:
+        db = MagicMock()
+        row = {
+            "repository": "mahavishnu",
+            "total": 3,
+            **{f"status_{s.value}": 0 for s in TaskStatus},
+            **{f"priority_{p.value}": 0 for p in TaskPriority},
+            "status_pending": 2,
+            "status_blocked": 1,
+            "priority_high": 3,
+            "critical_count": 1,
+            "oldest_pending": NOW,
+            "newest_task": NOW,
+            "blocked_task_ids": ["t2"],
+            "tag_names": ["auth", "ui"],
+            "tag_totals": [2, 1],
+        }
+        db.fetch = AsyncMock(return_value=[row])
+        store = TaskStore(db, event_store=MagicMock())
+
+        counts = await store.count_by_repository(["mahavishnu"])
+
+        db.fetch.assert_awaited_once()
+        query, *params = db.fetch.await_args.args
+        assert "GROUP BY s.repository" in query
+        assert "repository = ANY($1)" in query
+        assert params == [["mahavishnu"]]
+        repo = counts["mahavishnu"]
+        assert repo.status_counts == {TaskStatus.PENDING: 2, TaskStatus.BLOCKED: 1}
+        assert repo.priority_counts == {TaskPriority.HIGH: 3}
+        assert repo.tag_counts == {"auth": 2, "ui": 1}
+
+    async def test_list_pushes_repositories_and_excluded_statuses(self) -> None:
+        db = MagicMock()
+        db.fetch = AsyncMock(return_value=[])
+        store = TaskStore(db, event_store=MagicMock())
+
+        await store.list(
+            TaskListFilter(
+                repositories=["a", "b"], exclude_statuses=[TaskStatus.COMPLETED], limit=5
+            )
+        )
+
+        query, *params = db.fetch.await_args.args
+        assert "repository = ANY($1)" in query
+        assert "status::text <> ALL($2)" in query
+        assert params == [["a", "b"], ["completed"], 5, 0]
+
+    async def test_list_keyset_cursor(self) -> None:
+        db = MagicMock()
+        db.fetch = AsyncMock(return_value=[])
+        store = TaskStore(db, event_store=MagicMock())
+
+        await store.list(TaskListFilter(repository="a", after=(NOW, "t9"), limit=5))
+
+        query, *params = db.fetch.await_args.args
+        assert "(created_at, id) < ($2, $3::uuid)" in query
+        assert "ORDER BY created_at DESC, id DESC" in query
+        assert params == ["a", NOW, "t9", 5, 0]
+
+
+class TestAggregatorWithRollup:
+    """Summaries served from the rollup after one load."""
+
+    async def test_summaries_follow_events_without_queries(self) -> None:
+        db = MagicMock()
+        db.execute = AsyncMock()
+        event_store = EventStore(db)
+        task_store = AsyncMock()
+        task_store.event_store = event_store
+        task_store.list.return_value = [
+            _task("t1", status=TaskStatus.IN_PROGRESS, priority=TaskPriority.HIGH),
+            _task("t2", repository="crackerjack"),
+        ]
+
+        aggregator = CrossRepoAggregator(task_store, MagicMock(), rollup=TaskRollup())
+        summary = await aggregator.get_summary()
+        assert (summary.total_tasks, summary.critical_count) == (2, 1)
+
+        await event_store.append(
+            task_id="t1",
+            event_type=TaskEventType.STATUS_CHANGED,
+            data={"new_status": "blocked"},
+            actor="test",
+        )
+        stats = await aggregator.get_repo_stats("mahavishnu")
+        needing_attention = await aggregator.get_repos_needing_attention(limit=1)
+
+        assert stats.blocked_tasks == ["t1"]
+        assert needing_attention[0].repo_name == "mahavishnu"
+        assert (await aggregator.aggregate_all(include_tasks=False)).total_count == 2
+        assert task_store.list.await_count == 1
+        task_store.count_by_repository.assert_not_awaited()
+
+        aggregator.close()
+        assert event_store._listeners == []
+
+    async def test_refresh_pages_by_keyset(self) -> None:
+        tasks = [_task(f"t{i}", age_days=i) for i in range(5)]
+        task_store = AsyncMock()
+        task_store.event_store = None
+        task_store.list.side_effect = [tasks[:2], tasks[2:4], tasks[4:]]
+
+        aggregator = CrossRepoAggregator(task_store, MagicMock(), rollup=TaskRollup())
+        aggregator.ROLLUP_PAGE_SIZE = 2
+        await aggregator.refresh_rollup()
+
+        filters = [call.args[0] for call in task_store.list.await_args_list]
+        assert [f.after for f in filters] == [
+            None,
+            (tasks[1].created_at, "t1"),
+            (tasks[3].created_at, "t3"),
+        ]
+        assert all(f.offset == 0 for f in filters)
+        assert len(aggregator.rollup) == 5
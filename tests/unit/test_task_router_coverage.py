@@ -14,8 +14,7 @@ from __future__ import annotations
 
 import json
 import logging
-from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from mahavishnu.core.adapters.base import (
@@ -24,6 +23,7 @@ from mahavishnu.core.adapters.base import (
     OrchestratorAdapter,
 )
 from mahavishnu.core.routing_metrics import RoutingMetrics
+from mahavishnu.core.state_backends.journal import StateJournal
 from mahavishnu.core.status import WorkflowStatus
 from mahavishnu.core.task_router import (
     AdapterExecutionStats,
@@ -36,6 +36,9 @@ from mahavishnu.core.task_router import (
     WorkflowState,
 )
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
 # ---------------------------------------------------------------------------
 # Test helpers
 # ---------------------------------------------------------------------------
@@ -289,9 +292,9 @@ class TestStateManager:
 
     async def test_persist_handles_write_error(self, tmp_path: Path, caplog) -> None:
         sm = StateManager(state_dir=tmp_path)
-        # Force the underlying Path.write_text to raise; the _persist
-        # wrapper has a try/except that logs and swallows.
-        with patch.object(Path, "write_text", side_effect=OSError("disk full")):
+        # Force the journal append to raise; the _journal_op wrapper has
+        # a try/except that logs and swallows.
+        with patch.object(StateJournal, "append", side_effect=OSError("disk full")):
             with caplog.at_level(logging.WARNING, logger="mahavishnu.core.task_router"):
                 await sm.create("wf-1", {}, [])
             # State should still be in memory
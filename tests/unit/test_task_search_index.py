@@ -0,0 +1,185 @@
+"""Tests for TaskSearchIndex - inverted index, BM25F ranking and prefix trie."""
+
+from dataclasses import replace
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from mahavishnu.core.cross_repo_search import CrossRepoSearch, SearchCriteria
+from mahavishnu.core.event_store import EventStore, TaskEvent, TaskEventType
+from mahavishnu.core.task_search_index import PrefixTrie, TaskSearchIndex, tokenize
+from mahavishnu.core.task_store import Task, TaskListFilter, TaskStatus
+
+
+def _task(task_id: str, title: str, description: str = "", tags: list[str] | None = None) -> Task:
+    return Task(
+        id=task_id,
+        title=title,
+        repository="mahavishnu",
+        description=description,
+        tags=tags or [],
+        created_at=datetime.now(UTC),
+    )
+
+
+def _event(task_id: str, event_type: TaskEventType, data: dict) -> TaskEvent:
+    return TaskEvent.create(task_id=task_id, event_type=event_type, data=data, actor="test")
+
+
+@pytest.fixture
+def index() -> TaskSearchIndex:
+    idx = TaskSearchIndex()
+    idx.rebuild(
+        [
+            _task("t1", "Fix authentication bug", "OAuth2 login fails", ["auth", "security"]),
+            _task("t2", "Add unit tests for API", "Increase coverage", ["testing", "api"]),
+            _task("t3", "Document the API", "Explain authentication flow in the docs", ["docs"]),
+        ]
+    )
+    return idx
+
+
+class TestPrefixTrie:
+    def test_ordered_completion_and_refcounted_discard(self) -> None:
+        trie = PrefixTrie()
+        for word in ["test", "testing", "tests", "team", "test"]:
+            trie.add(word)
+
+        assert trie.complete("te", 10) == ["team", "test", "testing", "tests"]
+        assert trie.complete("tes", 2) == ["test", "testing"]
+
+        trie.discard("test")
+        assert "test" in trie
+        trie.discard("test")
+        assert "test" not in trie
+        assert trie.complete("test", 10) == ["testing", "tests"]
+
+
+class TestTaskSearchIndex:
+    def test_tokenize_drops_short_terms(self) -> None:
+        assert tokenize("A fix for OAuth2!") == ["fix", "for", "oauth2"]
+
+    def test_title_match_outranks_description_match(self, index: TaskSearchIndex) -> None:
+        hits = index.search("authentication")
+        assert [hit.task.id for hit in hits] == ["t1", "t3"]
+        assert hits[0].fields == {"title"}
+        assert hits[1].fields == {"description"}
+
+    def test_prefix_expansion_and_field_restriction(self, index: TaskSearchIndex) -> None:
+        assert {hit.task.id for hit in index.search("test")} == {"t2"}
+        assert index.search("oauth2", fields=["title"]) == []
+
+    def test_upsert_and_remove_update_postings(self, index: TaskSearchIndex) -> None:
+        index.upsert(_task("t1", "Rename module", tags=["refactor"]))
+        assert "t1" not in {hit.task.id for hit in index.search("authentication")}
+        assert index.complete("ref") == ["refactor"]
+
+        assert index.remove("t1")
+        assert index.search("rename") == []
+        assert index.complete("ref") == []
+        assert len(index) == 2
+
+    def test_apply_events(self, index: TaskSearchIndex) -> None:
+        index.apply_event(
+            _event("t4", TaskEventType.CREATED, {"title": "Speed up search", "tags": ["perf"]})
+        )
+        assert [hit.task.id for hit in index.search("speed")] == ["t4"]
+
+        index.apply_event(_event("t4", TaskEventType.TAG_ADDED, {"tag": "search"}))
+        assert index.get("t4").tags == ["perf", "search"]
+
+        index.apply_event(_event("t4", TaskEventType.STATUS_CHANGED, {"new_status": "blocked"}))
+        assert index.get("t4").status == TaskStatus.BLOCKED
+
+        index.apply_event(_event("t4", TaskEventType.UPDATED, {"title": "Cache lookups"}))
+        assert index.search("speed") == []
+        assert [hit.task.id for hit in index.search("cache")] == ["t4"]
+
+        index.apply_event(_event("t4", TaskEventType.DELETED, {}))
+        assert "t4" not in index
+
+
+def _task_store(event_store: EventStore, rows: dict[str, Task]) -> AsyncMock:
+    async def list_tasks(filters: TaskListFilter) -> list[Task]:
+        if filters.ids is None:
+            return list(rows.values())
+        return [rows[task_id] for task_id in filters.ids if task_id in rows]
+
+    task_store = AsyncMock()
+    task_store.event_store = event_store
+    task_store.list.side_effect = list_tasks
+    return task_store
+
+
+class TestCrossRepoSearchIndexing:
+    @pytest.mark.asyncio
+    async def test_index_built_once_and_followed_via_event_store(self) -> None:
+        db = MagicMock()
+        db.execute = AsyncMock()
+        db.fetch = AsyncMock(return_value=[])
+        event_store = EventStore(db)
+        rows = {"t1": _task("t1", "Fix login bug")}
+        task_store = _task_store(event_store, rows)
+
+        search = CrossRepoSearch(task_store)
+        assert [r.task.id for r in await search.search(SearchCriteria(query="login"))] == ["t1"]
+
+        await event_store.append(
+            task_id="t2",
+            event_type=TaskEventType.CREATED,
+            data={"title": "Login page redesign", "repository": "mahavishnu"},
+            actor="test",
+        )
+        rows["t2"] = _task("t2", "Login page redesign")
+        results = await search.search(SearchCriteria(query="login"))
+
+        assert {r.task.id for r in results} == {"t1", "t2"}
+        full_loads = [c for c in task_store.list.await_args_list if c.args[0].ids is None]
+        assert len(full_loads) == 1
+        assert await search.suggest_completions("log") == ["login"]
+
+        search.close()
+        assert event_store._listeners == []
+
+    @pytest.mark.asyncio
+    async def test_results_are_hydrated_from_the_task_store(self) -> None:
+        db = MagicMock()
+        db.fetch = AsyncMock(return_value=[])
+        stored = replace(_task("t1", "Fix login bug"), assignee="alice", metadata={"sprint": 7})
+        rows = {"t1": stored, "t2": _task("t2", "Login page redesign")}
+        search = CrossRepoSearch(_task_store(EventStore(db), rows))
+        await search.refresh_index()
+
+        del rows["t2"]
+        results = await search.search(SearchCriteria(query="login"))
+
+        assert [r.task for r in results] == [stored]
+
+    @pytest.mark.asyncio
+    async def test_catch_up_applies_events_from_other_processes(self) -> None:
+        event = _event("t2", TaskEventType.CREATED, {"title": "Login page redesign"})
+        row = {
+            "id": event.id,
+            "task_id": event.task_id,
+            "event_type": event.event_type.value,
+            "event_data": event.data,
+            "actor": event.actor,
+            "occurred_at": event.occurred_at,
+            "correlation_id": None,
+            "idempotency_key": None,
+        }
+        db = MagicMock()
+        db.fetch = AsyncMock(return_value=[])
+        rows = {"t1": _task("t1", "Fix login bug")}
+        search = CrossRepoSearch(_task_store(EventStore(db), rows))
+        search.CATCH_UP_INTERVAL = 0.0
+        await search.refresh_index()
+
+        db.fetch.return_value = [row]
+        rows["t2"] = _task("t2", "Login page redesign")
+        results = await search.search(SearchCriteria(query="login"))
+
+        assert {r.task.id for r in results} == {"t1", "t2"}
+        assert search.index.last_event == (event.occurred_at, event.id)
+        assert await search.catch_up() == 0
@@ -544,3 +544,41 @@ class TestTaskSimilarity:
         # Verify repository filter was included
         call_args = mock_db.fetch.call_args
         assert "mahavishnu" in call_args[0]
+
+    @pytest.mark.asyncio
+    async def test_find_duplicates_matrix_strategy(
+        self, similarity: TaskSimilarity, mock_db: MagicMock
+    ) -> None:
+        """Matrix strategy fetches embeddings once and skips the SQL self-join."""
+        mock_db.fetch = AsyncMock(
+            return_value=[
+                {"task_id": "task-1", "embedding": [1.0, 0.0, 0.0]},
+                {"task_id": "task-2", "embedding": [0.99, 0.01, 0.0]},
+                {"task_id": "task-3", "embedding": [0.0, 1.0, 0.0]},
+            ]
+        )
+
+        duplicates = await similarity.find_duplicates(
+            threshold=0.95, repository="mahavishnu", strategy="matrix"
+        )
+
+        assert [(a, b) for a, b, _ in duplicates] == [("task-1", "task-2")]
+        sql = mock_db.fetch.call_args[0][0]
+        assert "e2" not in sql
+        assert mock_db.fetch.call_args[0][1] == "mahavishnu"
+
+    @pytest.mark.asyncio
+    async def test_nearest_neighbors(self, similarity: TaskSimilarity, mock_db: MagicMock) -> None:
+        """Nearest neighbours come back per task without an N² dict."""
+        mock_db.fetch = AsyncMock(
+            return_value=[
+                {"task_id": "task-1", "embedding": [1.0, 0.0]},
+                {"task_id": "task-2", "embedding": [0.9, 0.1]},
+                {"task_id": "task-3", "embedding": [0.0, 1.0]},
+            ]
+        )
+
+        neighbours = await similarity.nearest_neighbors(["task-1", "task-2", "task-3"], k=1)
+
+        assert neighbours["task-1"][0][0] == "task-2"
+        assert neighbours["task-3"][0][0] == "task-2"
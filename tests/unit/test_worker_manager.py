@@ -18,7 +18,7 @@ from mahavishnu.workers.capabilities import (
     WorkerCapabilityReport,
     WorkerCapabilityState,
 )
-from mahavishnu.workers.manager import WorkerManager
+from mahavishnu.workers.manager import WorkerManager, WorkerResultBatch
 from mahavishnu.workers.registry import WorkerCategory, WorkerConfig
 
 
@@ -754,6 +754,139 @@ class TestCollectResults:
         assert "invalid_status" in results["w-0"].error
 
 
+class TestCollectResultsSince:
+    """Tests for cursor-based result collection and result counters."""
+
+    @pytest.mark.asyncio
+    async def test_returns_only_results_after_cursor(self):
+        """Results journaled by execute_task are returned once per cursor."""
+        mgr = WorkerManager(terminal_manager=_make_terminal_manager())
+        mgr._workers["w-0"] = _make_worker("w-0")
+        mgr._workers["w-1"] = _make_worker("w-1")
+
+        await mgr.execute_task("w-0", {"prompt": "a"})
+        first = await mgr.collect_results_since(0, poll=False)
+        await mgr.execute_task("w-1", {"prompt": "b"})
+        second = await mgr.collect_results_since(first.cursor, poll=False)
+        third = await mgr.collect_results_since(second.cursor, poll=False)
+
+        assert [r.worker_id for r in first.results] == ["w-0"]
+        assert [r.worker_id for r in second.results] == ["w-1"]
+        assert third == WorkerResultBatch(results=[], cursor=2)
+
+    @pytest.mark.asyncio
+    async def test_poll_journals_terminal_workers_once(self):
+        """Polling records finished workers and skips them on later polls."""
+        mgr = WorkerManager(terminal_manager=_make_terminal_manager())
+        done = _make_worker("w-done")
+        running = _make_worker("w-run", progress={"status": "running"})
+        mgr._workers = {"w-done": done, "w-run": running}
+
+        batch = await mgr.collect_results_since(0)
+        again = await mgr.collect_results_since(batch.cursor)
+
+        assert [r.worker_id for r in batch.results] == ["w-done"]
+        assert again.results == []
+        assert done.get_progress.await_count == 1
+        assert running.get_progress.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_executed_result_settles_the_manager_key(self):
+        """A result whose worker_id differs from the manager key is journaled once."""
+        mgr = WorkerManager(terminal_manager=_make_terminal_manager())
+        worker = _make_worker("session-42")
+        mgr._workers["a2a"] = worker
+
+        await mgr.execute_task("a2a", {"prompt": "a"})
+        batch = await mgr.collect_results_since(0)
+
+        assert [r.worker_id for r in batch.results] == ["session-42"]
+        worker.get_progress.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_poll_skips_workers_with_execute_in_flight(self):
+        """A worker is not polled while execute_task() is still running on it."""
+        mgr = WorkerManager(terminal_manager=_make_terminal_manager())
+        worker = _make_worker("w-0")
+        release = asyncio.Event()
+        result = worker.execute.return_value
+
+        async def execute(task):
+            await release.wait()
+            return result
+
+        worker.execute.side_effect = execute
+        mgr._workers["w-0"] = worker
+
+        running = asyncio.create_task(mgr.execute_task("w-0", {"prompt": "a"}))
+        await asyncio.sleep(0)
+        during = await mgr.collect_results_since(0)
+        release.set()
+        await running
+        after = await mgr.collect_results_since(during.cursor)
+
+        assert during.results == []
+        assert after.results == [result]
+        worker.get_progress.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_truncated_when_journal_overflows(self):
+        """A cursor older than the journal window is reported as truncated."""
+        mgr = WorkerManager(terminal_manager=_make_terminal_manager())
+        mgr._result_log = type(mgr._result_log)(maxlen=2)
+        for i in range(3):
+            mgr._record_result(
+                WorkerResult(worker_id=f"w-{i}", status=WorkerStatus.COMPLETED, output=None)
+            )
+
+        batch = await mgr.collect_results_since(0, poll=False)
+
+        assert batch.truncated is True
+        assert [r.worker_id for r in batch.results] == ["w-1", "w-2"]
+        assert (await mgr.collect_results_since(1, poll=False)).truncated is False
+
+    @pytest.mark.asyncio
+    async def test_result_counts_track_statuses(self):
+        """Counters reflect every recorded result without polling workers."""
+        mgr = WorkerManager(terminal_manager=_make_terminal_manager())
+        ok = _make_worker("w-ok")
+        bad = _make_worker("w-bad")
+        bad.execute = AsyncMock(side_effect=RuntimeError("crash"))
+        mgr._workers = {"w-ok": ok, "w-bad": bad}
+
+        await mgr.execute_task("w-ok", {"prompt": "a"})
+        await mgr.execute_task("w-bad", {"prompt": "b"})
+
+        assert mgr.result_counts() == {"total": 2, "completed": 1, "failed": 1}
+        ok.get_progress.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_progress_polling_is_concurrent_and_bounded(self):
+        """collect_results polls workers in parallel up to PROGRESS_CONCURRENCY."""
+        mgr = WorkerManager(terminal_manager=_make_terminal_manager())
+        mgr.PROGRESS_CONCURRENCY = 3
+        in_flight = 0
+        peak = 0
+
+        async def slow_progress():
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"status": "completed", "duration_seconds": 0}
+
+        for i in range(10):
+            worker = _make_worker(f"w-{i}")
+            worker.get_progress = AsyncMock(side_effect=slow_progress)
+            mgr._workers[f"w-{i}"] = worker
+
+        results = await mgr.collect_results()
+
+        assert len(results) == 10
+        assert peak == 3
+
+
 class TestCloseWorker:
     """Tests for the close_worker method."""
 
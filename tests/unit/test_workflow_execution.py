@@ -26,6 +26,7 @@ from mahavishnu.core.workflow_execution import (
     prepare_execution,
     validate_pre_execution_qc,
 )
+from mahavishnu.qc.checker import RepoCheckResult
 
 # ============================================================================
 # Fixtures - Mock App Builder
@@ -755,6 +756,42 @@ class TestWorkflowExecutionCoverageAdditions:
         assert len(results) == 1
         assert len(errors) == 1
 
+    @pytest.mark.asyncio
+    async def test_execute_parallel_workflow_streams_qc_results(self, monkeypatch):
+        app = _make_mock_app()
+        qc_failed_gate = asyncio.Event()
+        started: list[str] = []
+
+        async def iter_repo_checks(repos):
+            yield RepoCheckResult(repo="/repo/a", score=100, passed=True)
+            await asyncio.sleep(0)
+            assert started == ["/repo/a"]  # a runs before the gate finishes
+            yield RepoCheckResult(repo="/repo/b", score=40, passed=False)
+            qc_failed_gate.set()
+
+        async def fake_process_single_repo(**kwargs):
+            started.append(kwargs["repo_path"])
+            await qc_failed_gate.wait()
+            return {"repo": kwargs["repo_path"]}
+
+        app.qc.iter_repo_checks = iter_repo_checks
+        monkeypatch.setattr(we, "process_single_repo", fake_process_single_repo, raising=True)
+
+        _, results, errors = await execute_parallel_workflow(
+            app,
+            adapter=MagicMock(),
+            task={"type": "check"},
+            adapter_name="prefect",
+            workflow_id="wf_123",
+            validated_repos=["/repo/a", "/repo/b"],
+            stream_qc=True,
+        )
+
+        assert results == [{"repo": "/repo/a"}]
+        assert [(e["repo"], e["type"]) for e in errors] == [("/repo/b", "ValidationError")]
+        assert started == ["/repo/a"]
+        app.workflow_state_manager.add_error.assert_awaited_once()
+
     @pytest.mark.asyncio
     async def test_finalize_workflow_execution_with_checkpoint_and_qc(self):
         app = _make_mock_app()